@@ -3,6 +3,7 @@ import dataclasses
 import datetime
 import enum
 import functools
+import hashlib
 import importlib.util
 import inspect
 import io
@@ -34,6 +35,7 @@ from typing import (
     NamedTuple,
     Protocol,
     TypedDict,
+    TypeVar,
     cast,
 )
 
@@ -138,6 +140,7 @@ def is_async_callable(obj: Any) -> bool:
 
 
 from . import utils
+from .media_cache import CachedMedia
 from .types.callback import (
     BaseButton,
     Button,
@@ -156,6 +159,8 @@ from .types.templates import (
     _BaseMediaParams,
 )
 
+_MediaT = TypeVar("_MediaT", bound=Media)
+
 
 def resolve_buttons_param(
     buttons: (Iterable[Button] | BaseButton),
@@ -562,6 +567,53 @@ def get_media_from_media_id_or_obj_or_url(
     )
 
 
+def media_digest(content: object) -> str | None:
+    """
+    Internal method to get the sha256 (hex) of media content, or ``None`` if the content can't be read twice (e.g. a
+    bytes generator).
+    """
+    if isinstance(content, bytes):
+        return hashlib.sha256(content).hexdigest()
+    if isinstance(content, GeneratorStreamer) or not all(
+        hasattr(content, attr) for attr in ("read", "seek", "tell")
+    ):
+        return None
+    file_obj = cast(BinaryIO, content)
+    digest = hashlib.sha256()
+    try:
+        start = file_obj.tell()
+        while chunk := file_obj.read(DOWNLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+        file_obj.seek(start)
+    except (OSError, ValueError):  # not seekable
+        return None
+    return digest.hexdigest()
+
+
+def media_from_cache(
+    *,
+    media_cls: type[_MediaT],
+    wa: "WhatsApp",
+    cached: CachedMedia,
+    phone_id: str,
+    filename: str,
+) -> _MediaT:
+    """
+    Internal method to get the media of a :class:`~pywa.media_cache.MediaCache` entry.
+    """
+    media = media_cls(
+        _client=wa,
+        _id=cached.media_id,
+        uploaded_to=phone_id,
+        filename=filename,
+        ttl_minutes=cached.ttl_minutes,
+    )
+    media.uploaded_at = datetime.datetime.fromtimestamp(
+        cached.uploaded_at, datetime.timezone.utc
+    )
+    return media
+
+
 def internal_upload_media(
     *,
     media: str
@@ -650,13 +702,25 @@ def internal_upload_media(
         or media_types_default_mime_types.get(media_type, "text/plain")
     )
     try:
+        digest = (
+            media_digest(media_info.content) if wa._media_cache is not None else None
+        )
+        if digest is not None and (cached := wa._media_cache.get(digest, phone_id)):
+            logger.debug("Using the already uploaded media %s", cached.media_id)
+            return media_from_cache(
+                media_cls=Media,
+                wa=wa,
+                cached=cached,
+                phone_id=phone_id,
+                filename=final_filename,
+            )
         logger.debug(
             "Uploading media to WhatsApp servers: filename=%s, mime_type=%s, length=%s",
             final_filename,
             final_mimetype,
             media_info.length,
         )
-        return Media(
+        media = Media(
             _client=wa,
             _id=wa.api.upload_media(
                 phone_id=phone_id,
@@ -672,6 +736,9 @@ def internal_upload_media(
             filename=final_filename,
             ttl_minutes=ttl_minutes,
         )
+        if digest is not None:
+            wa._media_cache.set(digest, phone_id, media.id, ttl_minutes=ttl_minutes)
+        return media
 
     finally:
         try:
@@ -698,6 +765,26 @@ def filter_not_uploaded_comps(
     return not_uploaded
 
 
+def group_comps_by_example(
+    comps: Iterable[_BaseMediaHeaderComponent],
+) -> list[list[_BaseMediaHeaderComponent]]:
+    """
+    Internal method to group media components by their example (e.g. the same image in the header of all the carousel
+    cards), so every example is uploaded once. Examples that can't be compared by value (file objects, generators)
+    are grouped by identity.
+    """
+    groups: dict[object, list[_BaseMediaHeaderComponent]] = {}
+    for comp in comps:
+        example = comp._example
+        key = (
+            example
+            if isinstance(example, (str, int, bytes, pathlib.PurePath))
+            else ("id", id(example))
+        )
+        groups.setdefault(key, []).append(comp)
+    return list(groups.values())
+
+
 def upload_template_media_components(
     *,
     wa: "WhatsApp",
@@ -719,14 +806,12 @@ def upload_template_media_components(
             executor.submit(
                 upload_comps_example,
                 wa=wa,
-                example=example,
-                comps=list(comps),
+                example=comps[0]._example,
+                comps=comps,
                 app_id=app_id,
                 stop_event=stop_event,
             )
-            for example, comps in itertools.groupby(
-                not_uploaded, key=lambda x: x._example
-            )
+            for comps in group_comps_by_example(not_uploaded)
         ]
         for future in futures.as_completed(tasks):
             future.result()
@@ -809,20 +894,29 @@ def internal_upload_file(
         if final_filename is None:
             raise ValueError("Could not determine a filename for the file upload.")
         final_mimetype = mime_type or media_info.mime_type or fallback_mime_type
+        resolved_app_id = resolve_arg(
+            wa=wa,
+            value=app_id,
+            method_arg="app_id",
+            client_arg="app_id",
+        )
+        digest = (
+            media_digest(media_info.content) if wa._media_cache is not None else None
+        )
+        if digest is not None and (
+            cached := wa._media_cache.get_handle(digest, resolved_app_id)
+        ):
+            logger.debug("Using the already uploaded file handle %s", cached.media_id)
+            return cached.media_id, source
         logger.debug(
             "Uploading file to Resumable Upload API: filename=%s, mime_type=%s, length=%s",
             final_filename,
             final_mimetype,
             media_info.length,
         )
-        return wa.api.upload_file(
+        handle = wa.api.upload_file(
             upload_session_id=wa.api.create_upload_session(
-                app_id=resolve_arg(
-                    wa=wa,
-                    value=app_id,
-                    method_arg="app_id",
-                    client_arg="app_id",
-                ),
+                app_id=resolved_app_id,
                 file_name=final_filename,
                 file_length=media_info.length,
                 file_type=final_mimetype,
@@ -833,7 +927,10 @@ def internal_upload_file(
             ),
             file_offset=0,
             content_length=media_info.length,
-        )["h"], source
+        )["h"]
+        if digest is not None:
+            wa._media_cache.set_handle(digest, resolved_app_id, handle)
+        return handle, source
 
     except Exception as e:
         raise ValueError(
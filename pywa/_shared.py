@@ -0,0 +1,34 @@
+"""Internal helpers that are shared by the rate limiter and the subsystems of the client."""
+
+from __future__ import annotations
+
+
+class _TokenBucket:
+    """A token bucket that can go into debt: callers reserve a token and wait until it is actually available."""
+
+    __slots__ = ("burst", "rate", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: float, now: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = now
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait(self) -> float:
+        """The time until a token is available (after :meth:`refill`)."""
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+
+_PHONE_NUMBER_FORMATTING = str.maketrans("", "", " +-().")
+
+
+def _normalize_recipient(recipient: str | int) -> str:
+    """Get the recipient without the formatting of a phone number (e.g. ``+1 (555) 123-4567`` -> ``15551234567``)."""
+    recipient = str(recipient).strip()
+    if (digits := recipient.translate(_PHONE_NUMBER_FORMATTING)).isdigit():
+        return digits
+    return recipient
@@ -2,29 +2,181 @@
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import contextlib
+import copy
+import functools
+import inspect
+import json
 import logging
 import pathlib
-from collections.abc import Iterator
+import time
+from collections.abc import Callable, Iterator
 from contextlib import _GeneratorContextManager
-from typing import TYPE_CHECKING, Any, BinaryIO, TypedDict, cast
+from typing import TYPE_CHECKING, Any, BinaryIO, TypedDict, TypeVar, cast
 
 import httpx
 
 import pywa
 
+from . import utils
+from .batch import _current_call as _current_batch_call
+from .circuit_breaker import CircuitBreaker
 from .errors import WhatsAppError
+from .receipts import ReceiptAggregator
+from .response_cache import ResponseCache
+from .scheduler import OutboundScheduler
+from .service_windows import ServiceWindowTracker
 
 if TYPE_CHECKING:
     from ._helpers import GeneratorStreamer
 
 _logger = logging.getLogger(__name__)
 
+_F = TypeVar("_F", bound=Callable)
+
 
 class _UnpauseTemplateResult(TypedDict):
     success: bool
     reason: str | None
 
 
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "DELETE"})
+
+
+def _is_replayable(kwargs: dict) -> bool:
+    """Whether the body of the request can be sent again (streams are consumed by the first attempt)."""
+    bodies = [
+        file[1] if isinstance(file, tuple) else file
+        for file in (kwargs.get("files") or {}).values()
+    ]
+    bodies.append(kwargs.get("content"))
+    return all(body is None or isinstance(body, (bytes, str)) for body in bodies)
+
+
+def _cached(kind: str, id_param: str) -> Callable[[_F], _F]:
+    """
+    Cache the response of the decorated read in the ``response_cache`` of the API (if any).
+
+    Args:
+        kind: The kind of the read (a key of :attr:`~pywa.response_cache.ResponseCache.ttls`).
+        id_param: The parameter with the ID of the object that is read.
+    """
+
+    def decorator(func: _F) -> _F:
+        signature = inspect.signature(func)
+
+        def cache_key(self: GraphAPI, args: tuple, kwargs: dict) -> tuple | None:
+            if self._response_cache is None or _current_batch_call.get() is not None:
+                return None
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+            key = (
+                kind,
+                str(arguments[id_param]),
+                tuple(
+                    (name, value)
+                    for name, value in arguments.items()
+                    if name not in ("self", id_param)
+                ),
+            )
+            try:
+                hash(key)
+            except TypeError:
+                return None
+            return key
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(self: GraphAPI, *args, **kwargs):
+                if (key := cache_key(self, args, kwargs)) is None:
+                    return await func(self, *args, **kwargs)
+                cache = self._response_cache
+                res, future, generation = cache._acquire(
+                    key, asyncio.get_running_loop().create_future
+                )
+                if future is None:
+                    return res
+                if generation is None:
+                    try:
+                        return copy.deepcopy(await asyncio.shield(future))
+                    except asyncio.CancelledError:
+                        if not future.cancelled():
+                            raise
+                        return await func(
+                            self, *args, **kwargs
+                        )  # the read in flight was cancelled
+                try:
+                    res = await func(self, *args, **kwargs)
+                except asyncio.CancelledError:
+                    cache._release(key, generation)
+                    future.cancel()
+                    raise
+                except BaseException as e:
+                    cache._release(key, generation)
+                    future.set_exception(e)
+                    future.exception()  # the waiting reads (if any) re-raise it
+                    raise
+                cache._release(key, generation, res)
+                future.set_result(res)
+                return copy.deepcopy(res)
+
+            return cast("_F", async_wrapper)
+
+        @functools.wraps(func)
+        def wrapper(self: GraphAPI, *args, **kwargs):
+            if (key := cache_key(self, args, kwargs)) is None:
+                return func(self, *args, **kwargs)
+            cache = self._response_cache
+            res, future, generation = cache._acquire(key, concurrent.futures.Future)
+            if future is None:
+                return res
+            if generation is None:
+                return copy.deepcopy(future.result())
+            try:
+                res = func(self, *args, **kwargs)
+            except BaseException as e:
+                cache._release(key, generation)
+                future.set_exception(e)
+                raise
+            cache._release(key, generation, res)
+            future.set_result(res)
+            return copy.deepcopy(res)
+
+        return cast("_F", wrapper)
+
+    return decorator
+
+
+_TEMPLATE_WEBHOOK_FIELDS = frozenset(
+    {
+        "message_template_status_update",
+        "message_template_quality_update",
+        "message_template_components_update",
+        "template_category_update",
+    }
+)
+_ACCOUNT_WEBHOOK_FIELDS = frozenset(
+    {
+        "account_update",
+        "business_capability_update",
+        "phone_number_name_update",
+        "phone_number_quality_update",
+    }
+)
+_INVALIDATING_EDGES: dict[str, str | None] = {
+    "": None,  # e.g. update_template, update_display_name, update_flow_metadata, delete_flow
+    "whatsapp_business_profile": "business_profile",
+    "whatsapp_commerce_settings": "commerce_settings",
+    "assets": "flow",
+    "publish": "flow",
+    "deprecate": "flow",
+}
+
+
 class GraphAPI:
     """Internal methods for the WhatsApp client. Do not use this class directly."""
 
@@ -33,20 +185,28 @@ class GraphAPI:
         token: str,
         session: httpx.Client,
         api_version: float,
+        retry_policy: utils.RetryPolicy | None = None,
+        rate_limiter: utils.RateLimiter | None = None,
+        response_cache: ResponseCache | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        scheduler: OutboundScheduler | None = None,
+        receipts: ReceiptAggregator | None = None,
+        service_windows: ServiceWindowTracker | None = None,
     ):
-        if session.headers.get("Authorization") is not None:
-            raise ValueError(
-                "You can't use the same httpx.Client for multiple WhatsApp instances!"
-            )
-        session.base_url = f"https://graph.facebook.com/v{api_version}"
-        session.headers.update(
-            {
-                "Authorization": f"Bearer {token}",
-                "User-Agent": f"PyWa/{pywa.__version__}",
-            }
-        )
+        self._base_url = f"https://graph.facebook.com/v{api_version}"
+        self._headers = {
+            "Authorization": f"Bearer {token}",
+            "User-Agent": f"PyWa/{pywa.__version__}",
+        }
         self._session = session
-        _logger.debug("GraphAPI initialized with base URL: %s", session.base_url)
+        self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._response_cache = response_cache
+        self._circuit_breaker = circuit_breaker
+        self._scheduler = scheduler
+        self._receipts = receipts
+        self._service_windows = service_windows
+        _logger.debug("GraphAPI initialized with base URL: %s", self._base_url)
 
     def __str__(self) -> str:
         return f"GraphAPI(session={self._session})"
@@ -65,13 +225,25 @@ class GraphAPI:
         """Join fields with a comma, or return None if empty."""
         return ",".join(fields) if fields else None
 
-    def _request(self, method: str, endpoint: str, **kwargs) -> dict:
+    def _request(
+        self, method: str, endpoint: str, *, recipient: str | None = None, **kwargs
+    ) -> dict:
         """
         Internal method to make a request to the WhatsApp Cloud API.
 
+        - Failed requests are retried according to the ``retry_policy`` (if any).
+        - Sent messages wait for their turn in the ``scheduler`` and are throttled by the ``rate_limiter`` (if any).
+        - Sent messages send the pending read receipt of their chat in ``receipts`` first (if any).
+        - Free-form messages to users whose customer service window is closed fail fast by ``service_windows`` (if any).
+        - Requests to failing endpoints fail fast by the ``circuit_breaker`` (if any).
+        - Writes invalidate the reads that they may have changed in the ``response_cache`` (if any).
+        - Inside a :class:`~pywa.batch.Batch`, the request is queued to the batch call.
+
         Args:
             method: The HTTP method to use.
             endpoint: The endpoint to request.
+            recipient: The recipient of a message that is sent as ``content`` (the recipient of a ``json`` message is
+             read from it).
             **kwargs: Additional arguments to pass to the request.
 
         Returns:
@@ -83,14 +255,141 @@ class GraphAPI:
         kwargs.pop(
             "log_kwargs", None
         )  # backwards compatibility for old versions of pywa
+        if (batch_call := _current_batch_call.get()) is not None and (
+            res := batch_call.intercept(method, endpoint, kwargs)
+        ) is not None:
+            self._invalidate_cached(method, endpoint, kwargs)
+            return res
+        target = self._message_key(method, endpoint, kwargs, recipient)
+        if (
+            target is not None
+            and self._service_windows is not None
+            and "json" in kwargs  # messages that are sent as content are templates
+        ):
+            self._service_windows._check(*target, kwargs["json"])
+        if (
+            target is not None
+            and self._receipts is not None
+            and (receipt := self._receipts._pop(target)) is not None
+        ):
+            self._receipts._send(receipt)  # the typing indicator must come first
+        limit = target if self._rate_limiter is not None else None
+        retry = 0
+        while True:
+            if target is not None and self._scheduler is not None:
+                self._scheduler.acquire(target[0])
+            if limit is not None and (wait := self._rate_limiter.reserve(*limit)):
+                time.sleep(wait)
+            try:
+                with self._circuit(endpoint):
+                    res = self._send_request(method, endpoint, **kwargs)
+            except (WhatsAppError, httpx.RequestError) as e:
+                if limit is not None:
+                    self._rate_limiter.feedback(*limit, error=e)
+                if (
+                    delay := self._retry_delay(e, retry, method, endpoint, kwargs)
+                ) is None:
+                    self._invalidate_cached(method, endpoint, kwargs)
+                    raise
+            else:
+                if limit is not None:
+                    self._rate_limiter.feedback(*limit)
+                self._invalidate_cached(method, endpoint, kwargs)
+                if batch_call is not None:
+                    batch_call.record(method, endpoint, res)
+                return res
+            time.sleep(delay)
+            retry += 1
+
+    @staticmethod
+    def _message_key(
+        method: str, endpoint: str, kwargs: dict, recipient: str | None = None
+    ) -> tuple[str, str] | None:
+        """Get the (phone id, recipient) of a request that sends a message, or ``None`` if it does not send one."""
+        if method.upper() != "POST" or endpoint.rsplit("/", 1)[-1] not in (
+            "messages",
+            "marketing_messages",
+        ):
+            return None
+        data = kwargs.get("json") or {}
+        if not (recipient := recipient or data.get("to") or data.get("recipient")):
+            return None  # e.g. read receipts and typing indicators
+        return endpoint.strip("/").split("/", 1)[0], str(recipient)
+
+    def _circuit(self, endpoint: str) -> contextlib.AbstractContextManager[None]:
+        """Guard a request by the circuit of its endpoint family and phone id (if there is a ``circuit_breaker``)."""
+        if self._circuit_breaker is None:
+            return contextlib.nullcontext()
+        object_id, _, edge = endpoint.strip("/").partition("/")
+        return self._circuit_breaker.guard(
+            (edge.split("/", 1)[0], object_id) if edge else ("", None)
+        )
+
+    def _retry_delay(
+        self, error: Exception, retry: int, method: str, endpoint: str, kwargs: dict
+    ) -> float | None:
+        """Get the delay before retrying the failed request, or ``None`` if it should not be retried."""
+        if self._retry_policy is None or not _is_replayable(kwargs):
+            return None
+        delay = self._retry_policy.next_delay(
+            error, retry, idempotent=method.upper() in _IDEMPOTENT_METHODS
+        )
+        if delay is not None:
+            _logger.warning(
+                "%s request to %s failed with %s, retrying in %.2f seconds (retry %d)",
+                method,
+                endpoint,
+                type(error).__name__,
+                delay,
+                retry + 1,
+            )
+        return delay
+
+    def _invalidate_cached(self, method: str, endpoint: str, kwargs: dict) -> None:
+        """Drop the cached reads that a write request may have changed."""
+        if self._response_cache is None or method.upper() in ("GET", "HEAD", "OPTIONS"):
+            return
+        object_id, _, edge = endpoint.strip("/").partition("/")
+        if edge == "message_templates" and method.upper() == "DELETE":
+            # delete_template, by ID or by name (which drops all the templates)
+            self._response_cache.invalidate(
+                "template", (kwargs.get("params") or {}).get("hsm_id")
+            )
+        elif edge in _INVALIDATING_EDGES:
+            self._response_cache.invalidate(_INVALIDATING_EDGES[edge], object_id)
+
+    def _invalidate_cached_by_update(self, field: str, value: dict) -> None:
+        """Drop the cached reads that a webhook update reports a change of."""
+        if self._response_cache is None:
+            return
+        if field in _TEMPLATE_WEBHOOK_FIELDS:
+            self._response_cache.invalidate(
+                "template", value.get("message_template_id")
+            )
+        elif field == "flows":
+            self._response_cache.invalidate("flow", value.get("flow_id"))
+        elif field in _ACCOUNT_WEBHOOK_FIELDS:
+            self._response_cache.invalidate("phone_number")
+
+    def _url(self, endpoint: str) -> str:
+        """Get the URL of the endpoint (absolute URLs are kept as they are)."""
+        if "://" in endpoint:
+            return endpoint
+        return f"{self._base_url}/{endpoint.lstrip('/')}"
+
+    def _send_request(self, method: str, endpoint: str, **kwargs) -> dict:
+        """Send a single request to the WhatsApp Cloud API (without retries)."""
         _logger.debug(
             "Making %s request to %s with kwargs: %s",
             method,
             endpoint,
             {k: v if k != "files" else "<files>" for k, v in kwargs.items()},
         )
+        kwargs["headers"] = self._headers | dict(kwargs.get("headers") or {})
         try:
-            res = self._session.request(method=method, url=endpoint, **kwargs)
+            res = self._session.request(
+                method=method, url=self._url(endpoint), **kwargs
+            )
         except (httpx.TimeoutException, httpx.ConnectError, httpx.ProxyError):
             _logger.warning(
                 "You may want to provide your own `httpx.Client` instance. e.g. `WhatsApp(session=httpx.Client(timeout=..., proxies=...))`. See https://www.python-httpx.org/api/#client for more information."
@@ -466,7 +765,7 @@ class GraphAPI:
         return self._session.stream(
             method="GET",
             url=media_url,
-            headers=self._session.headers.copy(),
+            headers=self._headers.copy(),
             follow_redirects=True,
             **httpx_kwargs,
         )
@@ -496,6 +795,24 @@ class GraphAPI:
             params=self._filter_none(phone_number_id=phone_number_id),
         )
 
+    def send_batch(self, requests: list[dict]) -> list[dict | None]:
+        """
+        Send many requests in a single batch call.
+
+        - Read more at `developers.facebook.com <https://developers.facebook.com/docs/graph-api/batch-requests>`_.
+
+        Args:
+            requests: The requests (``method``, ``relative_url`` and optional ``body``), up to 50.
+
+        Returns:
+            The responses (``code`` and ``body``), in order (``None`` for requests that timed out).
+        """
+        return self._request(
+            method="POST",
+            endpoint="/",
+            data={"batch": json.dumps(requests), "include_headers": "false"},
+        )
+
     def send_raw_request(self, method: str, endpoint: str, **kwargs) -> Any:
         """
         Send a raw request to WhatsApp Cloud API.
@@ -627,6 +944,40 @@ class GraphAPI:
             method="POST", endpoint=f"/{sender}/marketing_messages", json=body
         )
 
+    def send_message_content(
+        self,
+        sender: str,
+        recipient: str,
+        content: bytes,
+        marketing: bool = False,
+    ) -> dict:
+        """
+        Send a message whose JSON body is already serialized (e.g. by
+        :meth:`~pywa.types.templates.CompiledTemplate.render_bytes`).
+
+        Args:
+            sender: The phone id to send the message from.
+            recipient: The WhatsApp ID, BSUID or group ID that the message is sent to (as in the ``content``).
+            content: The JSON body of the request.
+            marketing: Whether to send the message via the MM Lite API.
+
+        Returns:
+            The response from the WhatsApp Cloud API.
+        """
+        endpoint = f"/{sender}/{'marketing_messages' if marketing else 'messages'}"
+        # the bodies of the batch items are form encoded
+        if _current_batch_call.get() is not None:
+            return self._request(
+                method="POST", endpoint=endpoint, json=json.loads(content)
+            )
+        return self._request(
+            method="POST",
+            endpoint=endpoint,
+            recipient=recipient,
+            content=content,
+            headers={"Content-Type": "application/json"},
+        )
+
     def create_phone_number(
         self,
         waba_id: str,
@@ -897,6 +1248,7 @@ class GraphAPI:
             json=settings,
         )
 
+    @_cached("phone_number", "phone_id")
     def get_business_phone_number(
         self,
         phone_id: str,
@@ -1073,6 +1425,7 @@ class GraphAPI:
             },
         )
 
+    @_cached("business_profile", "phone_id")
     def get_business_profile(
         self,
         phone_id: str,
@@ -1129,6 +1482,7 @@ class GraphAPI:
             method="POST", endpoint=f"/{phone_id}/whatsapp_business_profile", json=data
         )
 
+    @_cached("commerce_settings", "phone_id")
     def get_commerce_settings(
         self, phone_id: str, fields: tuple[str, ...] | None = None
     ) -> dict:
@@ -1211,6 +1565,7 @@ class GraphAPI:
             headers={"Content-Type": "application/json"},
         )
 
+    @_cached("template", "template_id")
     def get_template(
         self,
         template_id: str,
@@ -1675,6 +2030,7 @@ class GraphAPI:
             endpoint=f"/{flow_id}/deprecate",
         )
 
+    @_cached("flow", "flow_id")
     def get_flow(
         self,
         flow_id: str,
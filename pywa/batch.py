@@ -0,0 +1,309 @@
+"""Batch requests to the Graph API."""
+
+from __future__ import annotations
+
+__all__ = ["MAX_BATCH_SIZE", "Batch", "BatchResult"]
+
+import collections
+import contextvars
+import json
+import logging
+import urllib.parse
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from .errors import WhatsAppError
+
+if TYPE_CHECKING:
+    from .client import WhatsApp
+
+_logger = logging.getLogger(__name__)
+
+MAX_BATCH_SIZE = 50
+"""The maximum number of requests in a single batch call."""
+
+_T = TypeVar("_T")
+
+
+class _Deferred(BaseException):
+    """Raised by the API to stop a queued call at its request (until the batch is sent)."""
+
+
+class BatchResult(Generic[_T]):
+    """
+    The future result of a call that was queued in a :class:`Batch`.
+
+    - The result is available after the batch is executed (when the ``with`` block exits).
+    """
+
+    __slots__ = ("_done", "_exception", "_result")
+
+    def __init__(self):
+        self._done = False
+        self._result: _T | None = None
+        self._exception: BaseException | None = None
+
+    def __repr__(self) -> str:
+        if not self._done:
+            return "BatchResult(pending)"
+        if self._exception is not None:
+            return f"BatchResult(exception={self._exception!r})"
+        return f"BatchResult(result={self._result!r})"
+
+    def done(self) -> bool:
+        """Whether the batch was executed and the result is available."""
+        return self._done
+
+    def result(self) -> _T:
+        """
+        Get the result of the call.
+
+        Raises:
+            RuntimeError: If the batch was not executed yet.
+            WhatsAppError: If the request of the call failed (or any other exception that the call raised).
+        """
+        if not self._done:
+            raise RuntimeError("The batch was not executed yet")
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def exception(self) -> BaseException | None:
+        """
+        Get the exception of the call (``None`` if it succeeded).
+
+        Raises:
+            RuntimeError: If the batch was not executed yet.
+        """
+        if not self._done:
+            raise RuntimeError("The batch was not executed yet")
+        return self._exception
+
+    def _set(self, result: Any = None, exception: BaseException | None = None):
+        self._result, self._exception, self._done = result, exception, True
+
+
+class _BatchCall:
+    """A queued call, its batched request and the requests that it sent before it."""
+
+    __slots__ = (
+        "args",
+        "func",
+        "kwargs",
+        "replaying",
+        "request",
+        "response",
+        "result",
+        "sent",
+    )
+
+    def __init__(self, func: Callable, args: tuple, kwargs: dict):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.result = BatchResult()
+        self.request: dict | None = None
+        self.response: dict | WhatsAppError | None = None
+        self.sent: collections.deque[tuple[tuple[str, str], dict]] = collections.deque()
+        self.replaying = False
+
+    def intercept(self, method: str, endpoint: str, kwargs: dict) -> dict | None:
+        """
+        Called by the API before a request: record it, replay its response or let it through (``None``).
+
+        - When the call is replayed, the requests that it sent before the batched request (e.g. uploads) get their
+          recorded responses (so they are not sent again), and only the batched request gets the batch response.
+        """
+        if self.replaying:
+            if self.sent and self.sent[0][0] == _request_key(method, endpoint):
+                return self.sent.popleft()[1]
+            if self.response is None or not self._is_request(method, endpoint, kwargs):
+                return None  # a follow-up request of the call
+            response, self.response = self.response, None
+            if isinstance(response, WhatsAppError):
+                raise response
+            return response
+        if self.request is None and (item := _to_batch_item(method, endpoint, kwargs)):
+            self.request = item
+            raise _Deferred
+        return None
+
+    def _is_request(self, method: str, endpoint: str, kwargs: dict) -> bool:
+        """Whether the request is the batched request of the call (by its method and relative URL)."""
+        item = _to_batch_item(method, endpoint, kwargs)
+        return item is not None and (item["method"], item["relative_url"]) == (
+            self.request["method"],
+            self.request["relative_url"],
+        )
+
+    def record(self, method: str, endpoint: str, response: dict) -> None:
+        """Called by the API after a request that was let through: record the response to replay it."""
+        if not self.replaying and self.request is None:
+            self.sent.append((_request_key(method, endpoint), response))
+
+
+_current_call: contextvars.ContextVar[_BatchCall | None] = contextvars.ContextVar(
+    "pywa_batch_call", default=None
+)
+
+
+def _encode(value: Any) -> str:
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def _request_key(method: str, endpoint: str) -> tuple[str, str]:
+    return method.upper(), endpoint.lstrip("/")
+
+
+def _to_batch_item(method: str, endpoint: str, kwargs: dict) -> dict | None:
+    """Convert a request to a batch item, or ``None`` if it can't be batched (e.g. file uploads)."""
+    if kwargs.keys() - {"params", "json", "data"}:
+        return None
+    url = endpoint.lstrip("/")
+    if params := kwargs.get("params"):
+        url += "?" + urllib.parse.urlencode(
+            {k: _encode(v) for k, v in params.items() if v is not None}
+        )
+    item = {"method": method.upper(), "relative_url": url}
+    if body := {**(kwargs.get("data") or {}), **(kwargs.get("json") or {})}:
+        item["body"] = urllib.parse.urlencode(
+            {k: _encode(v) for k, v in body.items() if v is not None}
+        )
+    return item
+
+
+def _parse_response(response: dict | None) -> dict | WhatsAppError:
+    """Parse an item of the batch response to the response of the request, or to its error."""
+    if response is None:
+        return WhatsAppError.from_dict(
+            {"message": "The request timed out in the batch", "code": 2}
+        )
+    try:
+        body = json.loads(response.get("body") or "{}")
+    except ValueError:
+        body = {"error": {"message": response.get("body"), "code": 2}}
+    if response.get("code", 200) >= 400 or "error" in body:
+        return WhatsAppError.from_dict(
+            body.get("error") or {"message": str(body), "code": response["code"]}
+        )
+    return body
+
+
+class Batch:
+    """
+    Sends the requests of many calls in a single batch call to the Graph API.
+
+    - Calls to the methods of the client (e.g. :meth:`~pywa.client.WhatsApp.get_media_url`,
+      :meth:`~pywa.client.WhatsApp.get_template`) are queued and return a :class:`BatchResult`. When the ``with`` block
+      exits, their requests are sent in batch calls of up to ``max_size`` (50) requests, and the results are set.
+    - Failed requests set the :class:`~pywa.errors.WhatsAppError` of the request as the exception of the result.
+    - Requests that can't be batched (e.g. uploads) and follow-up requests of a call are sent separately (once).
+    - Read more at `developers.facebook.com <https://developers.facebook.com/docs/graph-api/batch-requests>`_.
+
+    Example:
+
+        .. code-block:: python
+
+            from pywa import WhatsApp
+
+            wa = WhatsApp(...)
+
+            with wa.batch() as b:
+                urls = [b.get_media_url(media_id) for media_id in media_ids]
+                template = b.get_template(template_id)
+
+            print(urls[0].result().url, template.result().name)
+
+    Args:
+        wa: The WhatsApp client.
+        max_size: The maximum number of requests in a single batch call (up to 50).
+    """
+
+    def __init__(self, wa: WhatsApp, *, max_size: int = MAX_BATCH_SIZE):
+        if not 0 < max_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"`max_size` must be between 1 and {MAX_BATCH_SIZE}")
+        self._wa = wa
+        self._max_size = max_size
+        self._calls: list[_BatchCall] = []
+
+    def __repr__(self) -> str:
+        return f"Batch(queued={len(self._calls)})"
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def __getattr__(self, name: str) -> Callable[..., BatchResult]:
+        if name.startswith("_") or not callable(func := getattr(self._wa, name)):
+            raise AttributeError(f"'{name}' can't be called in a batch")
+
+        def queue(*args, **kwargs) -> BatchResult:
+            call = _BatchCall(func, args, kwargs)
+            self._calls.append(call)
+            return call.result
+
+        return queue
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.execute()
+
+    def _chunks(self, calls: list[_BatchCall]) -> list[list[_BatchCall]]:
+        return [
+            calls[i : i + self._max_size] for i in range(0, len(calls), self._max_size)
+        ]
+
+    @staticmethod
+    def _set_responses(
+        chunk: list[_BatchCall], responses: Any, error: Exception | None
+    ) -> list[_BatchCall]:
+        """Set the responses of the batch call to the calls, and return the calls to replay."""
+        if error is None and (
+            not isinstance(responses, list) or len(responses) != len(chunk)
+        ):
+            error = ValueError("The batch response does not match the requests")
+        if error is not None:
+            for call in chunk:
+                call.result._set(exception=error)
+            return []
+        for call, response in zip(chunk, responses):
+            call.response, call.replaying = _parse_response(response), True
+        return chunk
+
+    def execute(self) -> list[BatchResult]:
+        """
+        Send the queued calls (called when the ``with`` block exits).
+
+        Returns:
+            The results of the calls, in order.
+        """
+        calls, self._calls = self._calls, []
+        deferred = [call for call in calls if self._run(call)]
+        for chunk in self._chunks(deferred):
+            _logger.debug("Sending a batch of %d requests", len(chunk))
+            try:
+                responses, error = (
+                    self._wa.api.send_batch([call.request for call in chunk]),
+                    None,
+                )
+            except Exception as e:  # noqa: BLE001
+                responses, error = None, e
+            for call in self._set_responses(chunk, responses, error):
+                self._run(call)
+        return [call.result for call in calls]
+
+    @staticmethod
+    def _run(call: _BatchCall) -> bool:
+        """Run the call, and return whether it was deferred to the batch call."""
+        token = _current_call.set(call)
+        try:
+            call.result._set(result=call.func(*call.args, **call.kwargs))
+        except _Deferred:
+            return True
+        except Exception as e:  # noqa: BLE001
+            call.result._set(exception=e)
+        finally:
+            _current_call.reset(token)
+        return False
@@ -0,0 +1,104 @@
+"""Sending messages to many recipients."""
+
+from __future__ import annotations
+
+__all__ = ["BulkProgress", "BulkResult"]
+
+import dataclasses
+import time
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .types.sent_update import SentMessage
+
+_MEDIA_PARAMS = frozenset({"image", "video", "document", "audio", "voice", "sticker"})
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class BulkResult:
+    """
+    The result of a message that was sent by :meth:`~pywa.client.WhatsApp.send_bulk`.
+
+    Attributes:
+        index: The position of the recipient in ``recipients``.
+        to: The recipient of the message.
+        sent: The sent message (``None`` if the message failed).
+        error: The error that the message failed with (``None`` if it was sent).
+        retries: The number of times the message was retried.
+    """
+
+    index: int
+    to: str | int
+    sent: SentMessage | None = None
+    error: Exception | None = None
+    retries: int = 0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the message was sent."""
+        return self.error is None
+
+
+@dataclasses.dataclass(slots=True)
+class BulkProgress:
+    """
+    The progress of :meth:`~pywa.client.WhatsApp.send_bulk` (updated after every message).
+
+    Attributes:
+        done: The number of messages that were processed.
+        sent: The number of messages that were sent.
+        failed: The number of messages that failed.
+        retries: The total number of retries.
+        started_at: The time when the sending started (``time.monotonic()``).
+    """
+
+    done: int = 0
+    sent: int = 0
+    failed: int = 0
+    retries: int = 0
+    started_at: float = dataclasses.field(default_factory=time.monotonic)
+
+    @property
+    def elapsed(self) -> float:
+        """The time since the sending started, in seconds."""
+        return time.monotonic() - self.started_at
+
+    @property
+    def rate(self) -> float:
+        """The average number of processed messages per second."""
+        return self.done / elapsed if (elapsed := self.elapsed) else 0.0
+
+    def _record(self, result: BulkResult) -> None:
+        self.done += 1
+        self.retries += result.retries
+        if result.ok:
+            self.sent += 1
+        else:
+            self.failed += 1
+
+
+def _bulk_item(index: int, item: Any) -> tuple[int, str | int, dict[str, Any]]:
+    """Split an item of ``recipients`` to the recipient and its own params."""
+    if isinstance(item, tuple):
+        to, params = item
+        return index, to, params
+    return index, item, {}
+
+
+def _bulk_items(
+    recipients: Iterable[str | int | tuple[str | int, dict[str, Any]]],
+) -> Iterator[tuple[int, str | int, dict[str, Any]]]:
+    return (_bulk_item(index, item) for index, item in enumerate(recipients))
+
+
+def _has_media(params: dict[str, Any]) -> bool:
+    """Whether the shared params have media that may be uploaded by the first message."""
+    return not _MEDIA_PARAMS.isdisjoint(params)
+
+
+def _reuse_media(params: dict[str, Any], result: BulkResult) -> dict[str, Any]:
+    """Replace the media of the shared params with the media that the first message uploaded."""
+    if (media := getattr(result.sent, "uploaded_media", None)) is None:
+        return params
+    return {k: media if k in _MEDIA_PARAMS else v for k, v in params.items()}
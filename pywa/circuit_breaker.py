@@ -0,0 +1,358 @@
+"""Failing requests fast while their endpoint of the Graph API keeps failing."""
+
+from __future__ import annotations
+
+__all__ = ["CircuitBreaker", "CircuitOpenError", "CircuitState", "CircuitStatus"]
+
+import collections
+import contextlib
+import dataclasses
+import enum
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+
+from . import errors
+
+_logger = logging.getLogger(__name__)
+
+
+class CircuitState(enum.Enum):
+    """
+    The state of a circuit of a :class:`CircuitBreaker`.
+
+    Attributes:
+        CLOSED: Requests are sent, and their failures are counted.
+        OPEN: Requests fail fast with :class:`CircuitOpenError` (the endpoint is failing).
+        HALF_OPEN: A few probe requests are sent to check whether the endpoint recovered.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised (without sending the request) when the circuit of the endpoint is open, see :class:`CircuitBreaker`.
+
+    Attributes:
+        circuit: The circuit of the request: the endpoint family (e.g. ``"messages"``) and the phone id (or the ID
+         of the object that owns the endpoint, e.g. the WABA ID of ``"message_templates"``).
+        retry_after: The time until the circuit lets a probe request through, in seconds.
+    """
+
+    def __init__(self, circuit: tuple[str, str | None], retry_after: float):
+        super().__init__(
+            f"The circuit of {circuit[0]!r} (ID: {circuit[1]}) is open, retry after {retry_after:.2f} seconds"
+        )
+        self.circuit = circuit
+        self.retry_after = retry_after
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CircuitStatus:
+    """
+    The status of a circuit of a :class:`CircuitBreaker` (returned by :meth:`CircuitBreaker.status`).
+
+    Attributes:
+        state: The state of the circuit.
+        requests: The number of requests in the window.
+        failures: The number of failed requests in the window.
+        retry_after: The time until an open circuit lets a probe request through, in seconds (``0`` if not open).
+        opened: The number of times the circuit was opened.
+    """
+
+    state: CircuitState
+    requests: int
+    failures: int
+    retry_after: float
+    opened: int
+
+    @property
+    def failure_rate(self) -> float:
+        """The failure rate in the window."""
+        return self.failures / self.requests if self.requests else 0.0
+
+
+class _Circuit:
+    """The state of a single circuit, with the outcomes of the window in time buckets."""
+
+    __slots__ = ("buckets", "opened", "opened_at", "probe_successes", "probes", "state")
+
+    def __init__(self):
+        self.state = CircuitState.CLOSED
+        self.buckets: collections.deque[list[float]] = collections.deque()
+        self.opened_at = 0.0
+        self.opened = 0
+        self.probes = 0
+        self.probe_successes = 0
+
+    def counts(self, now: float, window: float) -> tuple[int, int]:
+        while self.buckets and self.buckets[0][0] <= now - window:
+            self.buckets.popleft()
+        return (
+            int(sum(b[1] for b in self.buckets)),
+            int(sum(b[2] for b in self.buckets)),
+        )
+
+    def add(self, now: float, bucket_size: float, failed: bool) -> None:
+        if not self.buckets or self.buckets[-1][0] <= now - bucket_size:
+            self.buckets.append([now, 0, 0])
+        self.buckets[-1][1] += 1
+        self.buckets[-1][2] += failed
+
+
+class _CircuitGuard:
+    """Guards a block by a circuit (not a generator context manager, which sets the traceback of the errors that
+    pass through it, and the errors of pywa are frozen)."""
+
+    __slots__ = ("_breaker", "_key")
+
+    def __init__(self, breaker: CircuitBreaker, key: tuple[str, str | None]):
+        self._breaker = breaker
+        self._key = key
+
+    def __enter__(self) -> None:
+        self._breaker.acquire(self._key)
+
+    def __exit__(self, _, error: BaseException | None, __) -> bool:
+        self._breaker.record(self._key, error)
+        return False
+
+
+class CircuitBreaker:
+    """
+    Fails requests fast when their endpoint keeps failing, so a failing endpoint (e.g. during an incident at Meta)
+    doesn't hold all the workers of the app waiting for timeouts.
+
+    - Every endpoint family and phone id has its own circuit (e.g. ``("messages", "1234")`` for messages that are sent
+      from phone id ``1234``, ``("media", "1234")`` for its uploads and ``("", None)`` for reads of objects by ID).
+    - A circuit is **closed** while the failure rate of the requests in the last ``window`` seconds is lower than
+      ``failure_rate`` (or there were fewer than ``min_requests`` requests). Then it **opens**: requests raise
+      :class:`CircuitOpenError` without being sent, for ``open_for`` seconds.
+    - Then the circuit is **half-open**: up to ``half_open_requests`` probe requests are sent (the others fail fast).
+      If they all succeed, the circuit closes, and if one of them fails, it opens again.
+    - Failures are connection errors, timeouts, server errors (5xx) and errors that WhatsApp marks as transient.
+      Other errors (e.g. invalid parameters) mean the endpoint is up, and count as successes.
+
+    Example:
+
+        .. code-block:: python
+
+            from pywa import WhatsApp
+            from pywa.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+            breaker = CircuitBreaker(failure_rate=0.5, window=30, open_for=15)
+            wa = WhatsApp(..., circuit_breaker=breaker)
+
+            try:
+                wa.send_message(...)
+            except CircuitOpenError as e:
+                ...  # e.g. queue the message and send it after e.retry_after seconds
+
+            print(breaker.status())
+
+    Args:
+        failure_rate: The failure rate that opens a circuit (between 0 and 1).
+        min_requests: The minimum number of requests in the window to open a circuit.
+        window: The time window of the failure rate, in seconds.
+        open_for: The time that an open circuit fails requests before it lets probe requests through, in seconds.
+        half_open_requests: The number of probe requests that must succeed to close a half-open circuit.
+        on_state_change: A function that is called with the circuit, the old state and the new state when a circuit
+         changes its state (e.g. to report it to monitoring).
+    """
+
+    _BUCKETS = 10
+
+    def __init__(
+        self,
+        *,
+        failure_rate: float = 0.5,
+        min_requests: int = 20,
+        window: float = 30.0,
+        open_for: float = 30.0,
+        half_open_requests: int = 3,
+        on_state_change: Callable[
+            [tuple[str, str | None], CircuitState, CircuitState], Any
+        ]
+        | None = None,
+    ):
+        if not 0 < failure_rate <= 1:
+            raise ValueError("`failure_rate` must be between 0 and 1")
+        self.failure_rate = failure_rate
+        self.min_requests = max(min_requests, 1)
+        self.window = window
+        self.open_for = open_for
+        self.half_open_requests = max(half_open_requests, 1)
+        self.on_state_change = on_state_change
+        self._circuits: dict[tuple[str, str | None], _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        opened = sum(
+            c.state is not CircuitState.CLOSED for c in self._circuits.values()
+        )
+        return f"CircuitBreaker(circuits={len(self._circuits)}, not_closed={opened})"
+
+    @staticmethod
+    def is_failure(error: BaseException) -> bool:
+        """Whether the error means the endpoint is failing (and not, e.g., that the request is invalid)."""
+        if isinstance(error, httpx.TransportError):
+            return True
+        return isinstance(error, errors.WhatsAppError) and bool(
+            error.is_transient
+            or (error.status_code or 0) >= 500
+            or isinstance(error, errors.ServiceUnavailable)
+        )
+
+    def _set_state(
+        self,
+        key: tuple[str, str | None],
+        circuit: _Circuit,
+        state: CircuitState,
+        now: float,
+    ) -> tuple[CircuitState, CircuitState] | None:
+        if circuit.state is state:
+            return None
+        old, circuit.state = circuit.state, state
+        circuit.probes = circuit.probe_successes = 0
+        if state is CircuitState.OPEN:
+            circuit.opened_at = now
+            circuit.opened += 1
+            _logger.warning(
+                "Circuit %s is open, failing its requests for %.2f seconds",
+                key,
+                self.open_for,
+            )
+        elif state is CircuitState.CLOSED:
+            circuit.buckets.clear()
+            _logger.info("Circuit %s is closed", key)
+        return old, state
+
+    def _notify(
+        self,
+        key: tuple[str, str | None],
+        change: tuple[CircuitState, CircuitState] | None,
+    ) -> None:
+        if change is not None and self.on_state_change is not None:
+            try:
+                self.on_state_change(key, *change)
+            except Exception:
+                _logger.exception("Failed to call `on_state_change` of %s", key)
+
+    def acquire(self, key: tuple[str, str | None]) -> None:
+        """
+        Let a request of the circuit through (call :meth:`record` with its outcome).
+
+        Args:
+            key: The circuit of the request.
+
+        Raises:
+            CircuitOpenError: If the circuit is open (or half-open with all of its probes in flight).
+        """
+        if (circuit := self._circuits.get(key)) is None:
+            return  # no requests yet
+        change = None
+        with self._lock:
+            now = time.monotonic()
+            if circuit.state is CircuitState.OPEN:
+                if (retry_after := circuit.opened_at + self.open_for - now) > 0:
+                    raise CircuitOpenError(key, retry_after)
+                change = self._set_state(key, circuit, CircuitState.HALF_OPEN, now)
+            if circuit.state is CircuitState.HALF_OPEN:
+                if circuit.probes >= self.half_open_requests:
+                    raise CircuitOpenError(key, 0.0)
+                circuit.probes += 1
+        self._notify(key, change)
+
+    def record(
+        self, key: tuple[str, str | None], error: BaseException | None = None
+    ) -> None:
+        """
+        Record the outcome of a request that was let through by :meth:`acquire`.
+
+        Args:
+            key: The circuit of the request.
+            error: The error that the request failed with (``None`` if it succeeded).
+        """
+        outcome: bool | None = error is not None and self.is_failure(error)
+        if error is not None and not outcome and not isinstance(error, Exception):
+            outcome = None  # e.g. cancelled: the endpoint didn't answer either way
+        change = None
+        with self._lock:
+            now = time.monotonic()
+            if (circuit := self._circuits.get(key)) is None:
+                circuit = self._circuits[key] = _Circuit()
+            if circuit.state is CircuitState.HALF_OPEN:
+                circuit.probes = max(circuit.probes - 1, 0)
+                if outcome is True:
+                    change = self._set_state(key, circuit, CircuitState.OPEN, now)
+                elif outcome is False:
+                    circuit.probe_successes += 1
+                    if circuit.probe_successes >= self.half_open_requests:
+                        change = self._set_state(key, circuit, CircuitState.CLOSED, now)
+            elif circuit.state is CircuitState.CLOSED and outcome is not None:
+                circuit.add(now, self.window / self._BUCKETS, outcome)
+                requests, failures = circuit.counts(now, self.window)
+                if (
+                    requests >= self.min_requests
+                    and failures >= requests * self.failure_rate
+                ):
+                    change = self._set_state(key, circuit, CircuitState.OPEN, now)
+        self._notify(key, change)
+
+    def guard(
+        self, key: tuple[str, str | None]
+    ) -> contextlib.AbstractContextManager[None]:
+        """A context manager that :meth:`acquire`\\ s the circuit and :meth:`record`\\ s the outcome of the block."""
+        return _CircuitGuard(self, key)
+
+    def status(
+        self, key: tuple[str, str | None] | None = None
+    ) -> dict[tuple[str, str | None], CircuitStatus]:
+        """
+        Get the status of the circuits.
+
+        Args:
+            key: The circuit to get the status of (default: all the circuits).
+
+        Returns:
+            The status of every circuit.
+        """
+        with self._lock:
+            now = time.monotonic()
+            circuits = (
+                self._circuits.items()
+                if key is None
+                else [(key, self._circuits.get(key) or _Circuit())]
+            )
+            return {
+                k: CircuitStatus(
+                    state=c.state,
+                    requests=(counts := c.counts(now, self.window))[0],
+                    failures=counts[1],
+                    retry_after=max(c.opened_at + self.open_for - now, 0.0)
+                    if c.state is CircuitState.OPEN
+                    else 0.0,
+                    opened=c.opened,
+                )
+                for k, c in circuits
+            }
+
+    def reset(self, key: tuple[str, str | None] | None = None) -> None:
+        """
+        Close circuits and forget their failures.
+
+        Args:
+            key: The circuit to reset (default: all the circuits).
+        """
+        with self._lock:
+            if key is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(key, None)
@@ -14,7 +14,9 @@ import logging
 import os
 import pathlib
 import sys
+import tempfile
 import time
+import uuid
 from typing import TypedDict
 
 import httpx
@@ -23,6 +25,7 @@ from . import __version__ as pywa_version
 from ._logging import ENV_LOG_LEVEL, format_banner, setup_console_logging
 from .client import WhatsApp
 from .errors import SendMessageError
+from .listeners import ENV_LISTENER_BUS_DIR, ENV_LISTENER_STORE_OWNER
 
 GITHUB_REPO = "david-lev/pywa"
 GITHUB_API_BASE = "https://api.github.com/repos"
@@ -189,6 +192,15 @@ def serve_application(
                 f"The WhatsApp instance assigned to '{app_name}' in '{module_str}.py' is already configured with a {client._server_type.name} server."
             )
         client._uvicorn_workers = workers or 1
+        if (
+            (workers or 1) > 1
+            and (service_windows := client._service_windows) is not None
+            and service_windows._db is None
+        ):
+            raise PywaCLIException(
+                f"The `service_windows` of the WhatsApp instance assigned to '{app_name}' keeps the windows in the"
+                f" memory of each worker. Provide a `path` to share them between the {workers} workers."
+            )
 
     base_import_string = f"{module_str}:{app_name}"
     uvicorn_app_string = (
@@ -206,6 +218,14 @@ def serve_application(
     os.environ[ENV_LOG_LEVEL] = log_level
     setup_console_logging(log_level)
 
+    # the workers are separate processes, so listeners need a bus to get the updates that other workers receive,
+    # and share the ownership of the listeners that they save in a listener store
+    if (workers or 1) > 1:
+        os.environ.setdefault(
+            ENV_LISTENER_BUS_DIR, tempfile.mkdtemp(prefix="pywa-listeners-")
+        )
+        os.environ[ENV_LISTENER_STORE_OWNER] = uuid.uuid4().hex
+
     mode = "development" if command == "dev" else "production"
     banner_lines = [
         f"🚀  Starting Pywa in {mode} mode",
@@ -235,6 +255,7 @@ def send_messages(
     token: str,
     phone_id: str,
     verbose: bool = False,
+    concurrency: int = 1,
     **kwargs,
 ):
     if not token or not phone_id:
@@ -246,58 +267,54 @@ def send_messages(
         setup_console_logging("debug")
 
     wa = WhatsApp(phone_id=phone_id, token=token)
-    uploaded_media = None
-
-    for index, recipient in enumerate(to):
-        if index > 0 and delay > 0:
-            time.sleep(delay)
-
-        try:
-            if send_type == "text":
-                sent = wa.send_message(
-                    to=recipient,
-                    text=kwargs["text"],
-                    preview_url=kwargs.get("preview_url", False),
-                    reply_to_message_id=reply_to_message_id,
-                )
-            elif send_type == "location":
-                sent = wa.send_location(
-                    to=recipient,
-                    latitude=kwargs["latitude"],
-                    longitude=kwargs["longitude"],
-                    name=kwargs.get("name"),
-                    address=kwargs.get("address"),
-                    reply_to_message_id=reply_to_message_id,
-                )
-            else:
-                send_method = getattr(wa, f"send_{send_type}")
-
-                payload = {
-                    send_type: uploaded_media or kwargs.get("media"),
-                    "reply_to_message_id": reply_to_message_id,
-                }
-
-                for arg in ["caption", "mime_type", "filename", "is_voice"]:
-                    if arg in kwargs and kwargs[arg] is not None:
-                        payload[arg] = kwargs[arg]
-
-                sent = send_method(to=recipient, **payload)
-
-                if sent.uploaded_media:
-                    uploaded_media = sent.uploaded_media
 
+    if send_type == "text":
+        send = wa.send_message
+        params = {
+            "text": kwargs["text"],
+            "preview_url": kwargs.get("preview_url", False),
+        }
+    elif send_type == "location":
+        send = wa.send_location
+        params = {
+            "latitude": kwargs["latitude"],
+            "longitude": kwargs["longitude"],
+            "name": kwargs.get("name"),
+            "address": kwargs.get("address"),
+        }
+    else:
+        send = getattr(wa, f"send_{send_type}")
+        params = {send_type: kwargs.get("media")}
+        for arg in ["caption", "mime_type", "filename", "is_voice"]:
+            if arg in kwargs and kwargs[arg] is not None:
+                params[arg] = kwargs[arg]
+    params["reply_to_message_id"] = reply_to_message_id
+
+    if delay > 0:  # a fixed delay between the messages, so they are sent one by one
+        sends = itertools.count()
+        send_now = send
+
+        def send(**send_kwargs):
+            if next(sends) > 0:
+                time.sleep(delay)
+            return send_now(**send_kwargs)
+
+        concurrency = 1
+
+    results = wa.send_bulk(to, send=send, params=params, concurrency=concurrency)
+    for done, result in enumerate(results, start=1):
+        if result.ok:
             print(
-                f"✅ [{index + 1}/{len(to)}] Sent {send_type} to {recipient} (Msg ID: {sent.id})"
+                f"✅ [{done}/{len(to)}] Sent {send_type} to {result.to} (Msg ID: {result.sent.id})"
             )
-
-        except SendMessageError as e:
+        elif isinstance(result.error, SendMessageError):
             print(
-                f"❌ [{index + 1}/{len(to)}] Failed to send {send_type} to {recipient}: {e}"
+                f"❌ [{done}/{len(to)}] Failed to send {send_type} to {result.to}: {result.error}"
             )
-        except Exception as e:
+        else:
             raise PywaCLIException(
-                f"Unexpected error while sending {send_type} to {recipient}: {e}"
-            ) from e
+                f"Unexpected error while sending {send_type} to {result.to}: {result.error}"
+            ) from result.error
 
 
 DEFAULT_PROJECT = """from pywa_async import WhatsApp, filters, types, utils
@@ -601,6 +618,12 @@ def main() -> None:
         default=0.0,
         help="Delay in seconds between sending messages (default: 0)",
     )
+    send_common_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of messages to send at the same time (default: 1; ignored with --delay)",
+    )
     send_common_parser.add_argument(
         "--reply-to", dest="reply_to_message_id", help="Message ID to reply to"
     )
@@ -0,0 +1,319 @@
+"""Tracking the delivery of many messages (e.g. campaigns), from the status webhooks."""
+
+from __future__ import annotations
+
+__all__ = ["CampaignStats", "DeliveryIndex"]
+
+import collections
+import dataclasses
+import threading
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any, Literal
+
+from .types.message_status import MessageStatusType
+
+if TYPE_CHECKING:
+    from .client import WhatsApp
+    from .types import MessageStatus
+
+_Metric = Literal["sent", "delivered", "read", "failed"]
+
+# the progress of a message: a status only counts if it moves the message forward (webhooks may be duplicated or
+# arrive out of order, e.g. ``read`` before ``delivered``).
+_SENT, _DELIVERED, _READ, _FAILED = 1, 2, 3, 4
+_RANKS = {
+    MessageStatusType.SENT: _SENT,
+    MessageStatusType.DELIVERED: _DELIVERED,
+    MessageStatusType.READ: _READ,
+    MessageStatusType.PLAYED: _READ,
+    MessageStatusType.FAILED: _FAILED,
+}
+
+
+@dataclasses.dataclass(slots=True)
+class CampaignStats:
+    """
+    The live counters of a campaign in a :class:`DeliveryIndex`.
+
+    - A message that was read is also counted as delivered (even if its ``delivered`` status did not arrive).
+
+    Attributes:
+        campaign: The name of the campaign.
+        sent: The number of messages that were sent.
+        delivered: The number of messages that were delivered.
+        read: The number of messages that were read (or played).
+        failed: The number of messages that failed.
+        errors: The number of failed messages per error code.
+    """
+
+    campaign: str
+    sent: int = 0
+    delivered: int = 0
+    read: int = 0
+    failed: int = 0
+    errors: collections.Counter[int] = dataclasses.field(
+        default_factory=collections.Counter
+    )
+
+    def rate(self, metric: _Metric) -> float:
+        """
+        The fraction of the sent messages that reached a metric (e.g. ``stats.rate("delivered")``).
+
+        Args:
+            metric: The metric (``"delivered"``, ``"read"`` or ``"failed"``).
+
+        Returns:
+            The fraction (between 0 and 1, ``0.0`` if no messages were sent).
+        """
+        return getattr(self, metric) / self.sent if self.sent else 0.0
+
+
+@dataclasses.dataclass(slots=True)
+class _Threshold:
+    metric: _Metric
+    count: int | None
+    rate: float | None
+    min_sent: int
+    callback: Callable[[CampaignStats], Any]
+
+    def reached(self, stats: CampaignStats) -> bool:
+        if self.count is not None:
+            return getattr(stats, self.metric) >= self.count
+        return stats.sent >= self.min_sent and stats.rate(self.metric) >= self.rate
+
+
+class DeliveryIndex:
+    """
+    Joins the sent messages to their status webhooks, and keeps live counters per campaign (instead of waiting for
+    every message with :meth:`~pywa.types.sent_update.SentMessage.wait_until_delivered`, which registers a listener
+    per message).
+
+    - Link messages to a campaign by their ID (:meth:`track`, e.g. with the results of
+      :meth:`~pywa.client.WhatsApp.send_bulk`), or by their tracker (:meth:`track_tracker`, e.g. when all the
+      messages of the campaign are sent with the same ``tracker``), and pass :meth:`on_status` as the callback of a
+      :class:`~pywa.handlers.MessageStatusHandler`.
+    - Up to ``max_messages`` messages are kept (the oldest are dropped, and their later statuses are ignored).
+    - Register callbacks that are called once, when a campaign reaches a threshold, with :meth:`on_threshold`.
+    - Safe to share between threads. The counters are kept in memory, per process.
+
+    Example:
+
+        .. code-block:: python
+
+            from pywa import WhatsApp, handlers
+            from pywa.delivery import DeliveryIndex
+
+            wa = WhatsApp(...)
+            index = DeliveryIndex()
+            wa.add_handlers(handlers.MessageStatusHandler(index.on_status))
+
+            index.on_threshold(
+                "summer-sale",
+                "failed",
+                rate=0.05,
+                min_sent=100,
+                callback=lambda stats: alert(stats.errors.most_common(3)),
+            )
+            for result in wa.send_bulk(recipients=users, params={"text": "Sale!"}):
+                if result.ok:
+                    index.track("summer-sale", result.sent.id)
+
+            print(index.stats("summer-sale"))
+
+    Args:
+        max_messages: The maximum number of messages to keep.
+    """
+
+    def __init__(self, *, max_messages: int = 1_000_000):
+        self.max_messages = max_messages
+        self._lock = threading.Lock()
+        # message id -> (campaign, progress)
+        self._messages: collections.OrderedDict[str, tuple[str, int]] = (
+            collections.OrderedDict()
+        )
+        self._trackers: dict[str, str] = {}
+        self._stats: dict[str, CampaignStats] = {}
+        self._thresholds: dict[str, list[_Threshold]] = collections.defaultdict(list)
+
+    def __repr__(self) -> str:
+        return f"DeliveryIndex(messages={len(self._messages)}, campaigns={len(self._stats)})"
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def track(self, campaign: str, message_ids: str | Iterable[str]) -> None:
+        """
+        Link sent messages to a campaign (and count them as sent).
+
+        Args:
+            campaign: The name of the campaign.
+            message_ids: The ID of the sent message, or the IDs of the sent messages.
+        """
+        with self._lock:
+            for message_id in (
+                (message_ids,) if isinstance(message_ids, str) else message_ids
+            ):
+                if message_id not in self._messages:
+                    self._advance(str(message_id), campaign, _SENT, None)
+            fired = self._check(campaign)
+        self._fire(fired)
+
+    def track_tracker(self, tracker: str, campaign: str) -> None:
+        """
+        Link all the messages that are sent with a tracker to a campaign (they are counted when their first status
+        arrives).
+
+        Args:
+            tracker: The tracker of the messages (e.g. ``wa.send_message(tracker=...)``).
+            campaign: The name of the campaign.
+        """
+        with self._lock:
+            self._trackers[tracker] = campaign
+            self._stats.setdefault(campaign, CampaignStats(campaign))
+
+    def on_status(self, _: WhatsApp, status: MessageStatus) -> None:
+        """
+        Count a status of a tracked message (use it as the callback of a :class:`~pywa.handlers.MessageStatusHandler`).
+
+        Args:
+            _: The client (ignored).
+            status: The status of a message.
+        """
+        if (rank := _RANKS.get(status.status)) is None:
+            return
+        with self._lock:
+            if (known := self._messages.get(status.id)) is not None:
+                campaign = known[0]
+            elif (
+                not isinstance(status.tracker, str)
+                or (campaign := self._trackers.get(status.tracker)) is None
+            ):
+                return
+            self._advance(
+                status.id,
+                campaign,
+                rank,
+                status.error.code if status.error is not None else None,
+            )
+            fired = self._check(campaign)
+        self._fire(fired)
+
+    def stats(self, campaign: str) -> CampaignStats:
+        """
+        Get a copy of the counters of a campaign.
+
+        Args:
+            campaign: The name of the campaign.
+
+        Returns:
+            The counters (all zeros if the campaign has no messages yet).
+        """
+        with self._lock:
+            stats = self._stats.get(campaign) or CampaignStats(campaign)
+            return dataclasses.replace(stats, errors=collections.Counter(stats.errors))
+
+    def campaigns(self) -> list[str]:
+        """Get the names of the campaigns."""
+        with self._lock:
+            return list(self._stats)
+
+    def on_threshold(
+        self,
+        campaign: str,
+        metric: _Metric,
+        *,
+        callback: Callable[[CampaignStats], Any],
+        count: int | None = None,
+        rate: float | None = None,
+        min_sent: int = 1,
+    ) -> None:
+        """
+        Call a callback once, when a campaign reaches a threshold.
+
+        Args:
+            campaign: The name of the campaign.
+            metric: The counter to check (``"sent"``, ``"delivered"``, ``"read"`` or ``"failed"``).
+            callback: A function that receives a copy of the counters of the campaign (called from the thread that
+             counted the status, so it should return quickly).
+            count: Call the callback when the counter reaches this number.
+            rate: Call the callback when the fraction of the sent messages that reached the metric reaches this rate.
+            min_sent: The minimum number of sent messages before ``rate`` is checked (so the first failure is not
+             ``100%``).
+
+        Raises:
+            ValueError: If neither or both of ``count`` and ``rate`` are provided.
+        """
+        if (count is None) == (rate is None):
+            raise ValueError("Provide either `count` or `rate`.")
+        threshold = _Threshold(metric, count, rate, min_sent, callback)
+        with self._lock:
+            self._thresholds[campaign].append(threshold)
+            fired = self._check(campaign)
+        self._fire(fired)
+
+    def forget(self, campaign: str) -> None:
+        """
+        Drop a campaign: its counters, thresholds, trackers and messages.
+
+        Args:
+            campaign: The name of the campaign.
+        """
+        with self._lock:
+            self._stats.pop(campaign, None)
+            self._thresholds.pop(campaign, None)
+            self._trackers = {t: c for t, c in self._trackers.items() if c != campaign}
+            for message_id in [
+                m for m, (c, _) in self._messages.items() if c == campaign
+            ]:
+                del self._messages[message_id]
+
+    def _advance(
+        self, message_id: str, campaign: str, rank: int, error_code: int | None
+    ) -> None:
+        """Move a message forward, and count every step it passed."""
+        previous = self._messages[message_id][1] if message_id in self._messages else 0
+        if rank <= previous:
+            return
+        stats = self._stats.get(campaign)
+        if stats is None:
+            stats = self._stats[campaign] = CampaignStats(campaign)
+        if previous < _SENT:
+            stats.sent += 1
+        if rank == _FAILED:
+            stats.failed += 1
+            if error_code is not None:
+                stats.errors[error_code] += 1
+        else:
+            if previous < _DELIVERED <= rank:
+                stats.delivered += 1
+            if previous < _READ <= rank:
+                stats.read += 1
+        self._messages[message_id] = (campaign, rank)
+        self._messages.move_to_end(message_id)
+        while len(self._messages) > self.max_messages:
+            self._messages.popitem(last=False)
+
+    def _check(
+        self, campaign: str
+    ) -> list[tuple[Callable[[CampaignStats], Any], CampaignStats]]:
+        """Pop the thresholds that the campaign reached (the callbacks are called outside the lock)."""
+        if (
+            not (thresholds := self._thresholds.get(campaign))
+            or (stats := self._stats.get(campaign)) is None
+        ):
+            return []
+        reached, pending = [], []
+        for threshold in thresholds:
+            (reached if threshold.reached(stats) else pending).append(threshold)
+        if not reached:
+            return []
+        self._thresholds[campaign] = pending
+        snapshot = dataclasses.replace(stats, errors=collections.Counter(stats.errors))
+        return [(t.callback, snapshot) for t in reached]
+
+    @staticmethod
+    def _fire(
+        fired: list[tuple[Callable[[CampaignStats], Any], CampaignStats]],
+    ) -> None:
+        for callback, stats in fired:
+            callback(stats)
@@ -25,6 +25,7 @@ __all__ = [
     "audio_only",
     "auth_intl_price_eligibility_update",
     "business_primary_location_country_update",
+    "cached",
     "call_answered",
     "call_connect",
     "call_permission_accepted",
@@ -63,6 +64,8 @@ __all__ = [
     "is_command",
     "location",
     "location_in_radius",
+    "location_in_regions",
+    "location_near",
     "matches",
     "media",
     "message",
@@ -114,8 +117,12 @@ __all__ = [
     "without_wa_id",
 ]
 
+import asyncio
+import collections
 import re
-from collections.abc import Awaitable, Callable, Iterable
+import threading
+import time
+from collections.abc import Awaitable, Callable, Hashable, Iterable
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -126,7 +133,7 @@ from typing import (
 )
 
 from . import _helpers as helpers
-from . import types
+from . import types, utils
 from .errors import WhatsAppError
 from .types import base_update, chat
 from .types.others import ContactsOrigin
@@ -134,6 +141,8 @@ from .types.others import ContactsOrigin
 if TYPE_CHECKING:
     from pywa.client import WhatsApp
 
+    from .locations import LocationIndex
+
 _T_contra = TypeVar("_T_contra", contravariant=True)
 _V = TypeVar("_V")
 
@@ -314,6 +323,188 @@ false: Filter[Any] = new(lambda _, __: False, name="filters.false")
 """Filter that always returns False."""
 
 
+class CachedFilter(Filter[_T_contra]):
+    """
+    A filter that caches the results of another filter. Create it with :func:`cached`.
+
+    Attributes:
+        filter: The wrapped filter.
+    """
+
+    def __init__(
+        self,
+        fil: Filter[_T_contra],
+        *,
+        key: Callable[[_T_contra], Hashable],
+        ttl: float,
+        maxsize: int,
+    ):
+        if ttl <= 0 or maxsize <= 0:
+            raise ValueError("`ttl` and `maxsize` must be positive")
+        self.filter = fil
+        self._key = key
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._results: collections.OrderedDict[Hashable, tuple[float, bool]] = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._sync_inflight: dict[Hashable, threading.Event] = {}
+        self._async_inflight: dict[Hashable, asyncio.Future[bool]] = {}
+        # bumped by invalidations, so lookups that were in flight during them don't cache their (stale) results
+        self._generation = 0
+        self._generations: dict[Hashable, int] = {}  # of the keys in flight
+
+    def _get(self, key: Hashable) -> bool | None:
+        with self._lock:
+            try:
+                expires_at, result = self._results[key]
+            except KeyError:
+                return None
+            if expires_at <= time.monotonic():
+                del self._results[key]
+                return None
+            self._results.move_to_end(key)
+            return result
+
+    def _begin(self, key: Hashable) -> tuple[int, int]:
+        """Get the generation of a key before looking it up (called with the lock held)."""
+        return self._generation, self._generations.setdefault(key, 0)
+
+    def _end(self, key: Hashable) -> None:
+        """Forget the generation of a key after looking it up (called with the lock held)."""
+        if key not in self._sync_inflight and key not in self._async_inflight:
+            self._generations.pop(key, None)
+
+    def _set(self, key: Hashable, result: bool, generation: tuple[int, int]) -> None:
+        with self._lock:
+            if generation != (self._generation, self._generations.get(key)):
+                return  # invalidated while it was looked up
+            self._results[key] = (time.monotonic() + self._ttl, result)
+            self._results.move_to_end(key)
+            while len(self._results) > self._maxsize:
+                self._results.popitem(last=False)
+
+    def invalidate(self, key: Hashable = utils.MISSING) -> None:
+        """
+        Drop cached results, so the next check calls the wrapped filter again.
+
+        >>> is_registered.invalidate(msg.from_user.bsuid)  # after the user registers
+
+        Args:
+            key: The cache key to drop (as returned by the ``key`` function). Drops all the results if not provided.
+        """
+        with self._lock:
+            if key is utils.MISSING:
+                self._results.clear()
+                self._generation += 1
+            else:
+                self._results.pop(key, None)
+                if key in self._generations:
+                    self._generations[key] += 1
+
+    def check_sync(self, wa: WhatsApp, update: _T_contra) -> bool:
+        key = self._key(update)
+        if (result := self._get(key)) is not None:
+            return result
+        with self._lock:
+            inflight = self._sync_inflight.get(key)
+            if inflight is None:
+                self._sync_inflight[key] = threading.Event()
+                generation = self._begin(key)
+        if inflight is not None:  # another thread is checking the same key
+            inflight.wait()
+            if (result := self._get(key)) is not None:
+                return result
+            return self.filter.check_sync(wa, update)  # the other check failed
+        try:
+            result = bool(self.filter.check_sync(wa, update))
+            self._set(key, result, generation)
+            return result
+        finally:
+            with self._lock:
+                self._sync_inflight.pop(key).set()
+                self._end(key)
+
+    async def check_async(self, wa: WhatsApp, update: _T_contra) -> bool:
+        key = self._key(update)
+        if (result := self._get(key)) is not None:
+            return result
+        if (inflight := self._async_inflight.get(key)) is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():  # this task was cancelled, not the check
+                    raise
+            return await self.filter.check_async(wa, update)
+        self._async_inflight[key] = future = asyncio.get_running_loop().create_future()
+        with self._lock:
+            generation = self._begin(key)
+        try:
+            result = bool(await self.filter.check_async(wa, update))
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark as retrieved in case no one else is waiting
+            raise
+        else:
+            self._set(key, result, generation)
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._async_inflight[key]
+                self._end(key)
+
+    def has_async(self) -> bool:
+        return self.filter.has_async()
+
+    def __repr__(self) -> str:
+        return f"cached({self.filter!r})"
+
+
+def _sender_bsuid(update: Any) -> Hashable:
+    return update.from_user.bsuid
+
+
+def cached(
+    fil: Filter[_V],
+    *,
+    key: Callable[[_V], Hashable] = _sender_bsuid,
+    ttl: float = 60,
+    maxsize: int = 10_000,
+) -> CachedFilter[_V]:
+    """
+    Cache the results of an expensive filter (e.g. a database or API lookup) for a period of time.
+
+    - Results are cached per key, which is derived from the update (the sender's BSUID by default).
+    - Concurrent checks with the same key are collapsed into a single call of the wrapped filter, so a burst of
+      updates from one user triggers one lookup.
+    - Works with both sync and async filters.
+    - Use :meth:`CachedFilter.invalidate` to drop a result when the underlying data changes.
+
+    >>> is_registered = filters.cached(
+    ...     filters.new(lambda _, msg: my_db.is_user_registered(msg.from_user.bsuid)),
+    ...     ttl=300,
+    ... )
+
+    >>> @wa.on_message(~is_registered & filters.command("register"))
+    ... def register(_: WhatsApp, msg: types.Message):
+    ...     my_db.register_user(msg.from_user.bsuid)
+    ...     is_registered.invalidate(msg.from_user.bsuid)
+
+    Args:
+        fil: The filter to cache.
+        key: A function that returns the cache key of an update (default: ``update.from_user.bsuid``).
+        ttl: The time in seconds to keep a result (default: ``60``).
+        maxsize: The maximum number of results to keep; the least recently used results are dropped first
+         (default: ``10,000``).
+    """
+    return CachedFilter(fil, key=key, ttl=ttl, maxsize=maxsize)
+
+
 def webhook_fields(*fields: str) -> Filter[types.RawUpdate]:
     """
     Filter for raw updates that contain any of the specified fields.
@@ -866,6 +1057,53 @@ def location_in_radius(lat: float, lon: float, radius: float) -> Filter[types.Me
     )
 
 
+def location_in_regions(index: LocationIndex) -> Filter[types.Message]:
+    """
+    Filter for location messages that are inside at least one region of a :class:`~pywa.locations.LocationIndex`.
+
+    - Use this filter instead of combining many :func:`location_in_radius` filters (e.g. one per store).
+
+    >>> from pywa.locations import LocationIndex
+    >>> delivery_zones = LocationIndex(
+    ...     [("north", 32.09, 34.78, 5), ("south", 32.05, 34.76, 3)]
+    ... )
+    >>> location_in_regions(delivery_zones)
+
+    Args:
+        index: The index of the regions (sites that were added with a ``radius``).
+    """
+    return new(
+        lambda _, m: (
+            m.location is not None
+            and bool(index.containing(m.location.latitude, m.location.longitude))
+        ),
+        name="location_in_regions",
+    )
+
+
+def location_near(index: LocationIndex, radius: float) -> Filter[types.Message]:
+    """
+    Filter for location messages that are in a given radius of at least one site of a :class:`~pywa.locations.LocationIndex`.
+
+    >>> location_near(stores, radius=10)
+
+    Args:
+        index: The index of the sites.
+        radius: Radius in kilometers.
+    """
+    return new(
+        lambda _, m: (
+            m.location is not None
+            and bool(
+                index.nearest(
+                    m.location.latitude, m.location.longitude, max_distance=radius
+                )
+            )
+        ),
+        name="location_near",
+    )
+
+
 reaction: Filter[types.Message] = new(
     lambda _, m: m.type == types.MessageType.REACTION, name="filters.reaction"
 )
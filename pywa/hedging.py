@@ -0,0 +1,137 @@
+"""Hedging slow reads from the Graph API with a second, identical request."""
+
+from __future__ import annotations
+
+__all__ = ["HedgingPolicy", "HedgingStats"]
+
+import collections
+import dataclasses
+
+
+@dataclasses.dataclass(slots=True)
+class HedgingStats:
+    """
+    The statistics of a :class:`HedgingPolicy`.
+
+    Attributes:
+        requests: The number of requests that could be hedged.
+        hedged: The number of requests that were hedged (sent twice).
+        hedge_wins: The number of hedged requests that were answered by the second request first.
+        over_budget: The number of requests that were slow enough to hedge, but the budget was used up.
+    """
+
+    requests: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    over_budget: int = 0
+
+
+class HedgingPolicy:
+    """
+    Sends a second, identical request when a safe read is slower than usual, and uses the first response
+    (`hedged requests <https://research.google/pubs/the-tail-at-scale/>`_). Supported by :class:`pywa_async.WhatsApp`.
+
+    - Only ``GET`` requests are hedged (e.g. :meth:`~pywa_async.WhatsApp.get_media_url`), so sending them twice is safe.
+    - A request is hedged when it hasn't been answered within the ``percentile`` (p95 by default) of the recent
+      latencies of its endpoint family (at least ``min_delay``). Until ``min_samples`` latencies are observed, requests
+      of the family are not hedged.
+    - The extra load is capped by a budget: every request earns ``budget`` hedges (up to ``max_burst``), and every
+      hedge spends one. So ``budget=0.05`` means at most about 5% more requests.
+
+    Example:
+
+        .. code-block:: python
+
+            from pywa_async import WhatsApp
+            from pywa_async.hedging import HedgingPolicy
+
+            hedging = HedgingPolicy(percentile=0.95, budget=0.05)
+            wa = WhatsApp(..., hedging_policy=hedging)
+            ...
+            print(hedging.stats.hedged, hedging.stats.hedge_wins)
+
+    Args:
+        percentile: The percentile of the latencies to hedge after (between 0 and 1).
+        min_delay: The minimum time to wait before hedging, in seconds.
+        max_delay: The maximum time to wait before hedging, in seconds (``None`` for no limit).
+        budget: The hedges that every request earns (the maximum fraction of extra requests).
+        max_burst: The maximum number of hedges that can be saved up.
+        min_samples: The number of latencies of an endpoint family to observe before hedging its requests.
+        samples: The number of recent latencies to keep per endpoint family.
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 0.95,
+        min_delay: float = 0.05,
+        max_delay: float | None = None,
+        budget: float = 0.05,
+        max_burst: float = 10.0,
+        min_samples: int = 20,
+        samples: int = 200,
+    ):
+        if not 0 < percentile < 1:
+            raise ValueError("`percentile` must be between 0 and 1")
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.max_burst = max_burst
+        self.min_samples = max(min_samples, 1)
+        self.samples = max(samples, self.min_samples)
+        self.stats = HedgingStats()
+        self._latencies: dict[str, collections.deque[float]] = {}
+        self._delays: dict[str, float] = {}
+        self._credit = 0.0
+
+    def __repr__(self) -> str:
+        return f"HedgingPolicy(percentile={self.percentile}, budget={self.budget}, stats={self.stats!r})"
+
+    def delay(self, family: str) -> float | None:
+        """
+        Get the time to wait before hedging a request of the endpoint family (and count the request).
+
+        Args:
+            family: The endpoint family of the request (e.g. ``"message_templates"``, or ``""`` for reads by ID).
+
+        Returns:
+            The delay in seconds, or ``None`` if the request should not be hedged (not enough latencies yet).
+        """
+        self.stats.requests += 1
+        self._credit = min(self._credit + self.budget, self.max_burst)
+        return self._delays.get(family)
+
+    def acquire(self) -> bool:
+        """Spend a hedge from the budget (returns ``False`` if it is used up)."""
+        if self._credit < 1:
+            self.stats.over_budget += 1
+            return False
+        self._credit -= 1
+        self.stats.hedged += 1
+        return True
+
+    def observe(self, family: str, latency: float, *, hedge_won: bool = False) -> None:
+        """
+        Record the latency of a request of the endpoint family.
+
+        Args:
+            family: The endpoint family of the request.
+            latency: The time from the request until it was answered (by the request or by its hedge), in seconds.
+            hedge_won: Whether the request was answered first by its hedge.
+        """
+        if (latencies := self._latencies.get(family)) is None:
+            latencies = self._latencies[family] = collections.deque(maxlen=self.samples)
+        latencies.append(latency)
+        self.stats.hedge_wins += hedge_won
+        if len(latencies) >= self.min_samples and (
+            family not in self._delays or len(latencies) % 8 == 0
+        ):
+            ordered = sorted(latencies)
+            delay = max(
+                ordered[min(int(len(ordered) * self.percentile), len(ordered) - 1)],
+                self.min_delay,
+            )
+            self._delays[family] = (
+                delay if self.max_delay is None else min(delay, self.max_delay)
+            )
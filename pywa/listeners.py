@@ -1,16 +1,41 @@
 from __future__ import annotations
 
 __all__ = [
+    "CallbackListener",
+    "Continuation",
+    "FileListenerStore",
+    "InProcessListenerBus",
+    "ListenerBus",
     "ListenerCanceled",
     "ListenerStopped",
+    "ListenerStore",
     "ListenerTimeout",
+    "ListenersStats",
+    "MemoryListenerStore",
+    "SQLiteListenerStore",
+    "StoredListener",
     "TemplateStatusUpdateListenerIdentifier",
+    "UnixSocketListenerBus",
     "UserUpdateListenerIdentifier",
 ]
 
+import abc
+import concurrent.futures
+import contextlib
 import dataclasses
+import hashlib
+import json
+import logging
+import math
+import os
+import pathlib
+import socket
+import sqlite3
 import threading
+import time
+import uuid
 import warnings
+from collections.abc import Callable, Iterable
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 from . import utils
@@ -19,7 +44,13 @@ from .errors import PywaWarning
 if TYPE_CHECKING:
     from .client import WhatsApp
     from .filters import Filter
-    from .types.base_update import BaseUpdate, BaseUserUpdate
+    from .types.base_update import BaseUpdate, BaseUserUpdate, RawUpdate
+
+_logger = logging.getLogger(__name__)
+
+_MAX_FORWARDED_UPDATE_SIZE = 1024 * 1024
+ENV_LISTENER_BUS_DIR = "PYWA_LISTENER_BUS_DIR"
+ENV_LISTENER_STORE_OWNER = "PYWA_LISTENER_STORE_OWNER"
 
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
@@ -163,6 +194,10 @@ class Listener:
     def stop(self, reason: str | None = None) -> None:
         self.set_exception(ListenerStopped(reason))
 
+    def expire(self, timeout: float) -> None:
+        if not self.is_set():
+            self.set_exception(ListenerTimeout(timeout))
+
     def is_set(self) -> bool:
         return self.event.is_set()
 
@@ -173,6 +208,750 @@ class Listener:
         return bool(self.cancelers) and self.cancelers.check_sync(wa, update)
 
 
+class CallbackListener(Listener):
+    """
+    A listener that calls a callback when it is answered, instead of blocking a thread until then.
+
+    - Created by :meth:`~pywa.client.WhatsApp.register_next_step`.
+
+    Attributes:
+        callback: The callback to call with the update that passed the filters.
+        on_error: The callback to call with the :class:`ListenerTimeout`, :class:`ListenerCanceled` or
+         :class:`ListenerStopped` exception that ended the listener (optional).
+        continuation: The key of the :meth:`~pywa.client.WhatsApp.continuation` of the listener, if it is persisted.
+        deadline: The time (since the epoch) when the listener times out, if it has a timeout.
+    """
+
+    def __init__(
+        self,
+        wa: WhatsApp,
+        identifier: BaseListenerIdentifier,
+        filters: Filter[Any] | None,
+        cancelers: Filter[Any] | None,
+        callback: Callable[[WhatsApp, Any], Any],
+        on_error: Callable[[WhatsApp, Exception], Any] | None,
+        continuation: str | None = None,
+        deadline: float | None = None,
+    ):
+        self.filters = filters
+        self.cancelers = cancelers
+        self.callback = callback
+        self.on_error = on_error
+        self.continuation = continuation
+        self.deadline = deadline
+        self.timeout_entry: _TimerEntry | None = None
+        self._wa = wa
+        self._identifier = identifier
+        self._lock = threading.Lock()
+        self._done = False
+
+    def _finish(self) -> bool:
+        """Mark the listener as done and remove it. Returns ``False`` if it was already done."""
+        with self._lock:
+            if self._done:
+                return False
+            self._done = True
+        if self.timeout_entry is not None:
+            self._wa._listeners_timeouts.cancel(self.timeout_entry)
+        self._wa._remove_listener(identifier=self._identifier, listener=self)
+        return True
+
+    def set_result(self, result: BaseUpdate) -> None:
+        if self._finish():
+            self.callback(self._wa, result)
+
+    def set_exception(self, exception: Exception) -> None:
+        if not self._finish():
+            return
+        if self.on_error is None:
+            _logger.debug("Listener %s ended with: %s", self._identifier, exception)
+            return
+        self.on_error(self._wa, exception)
+
+    def is_set(self) -> bool:
+        return self._done
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ListenersStats:
+    """
+    A snapshot of the listeners of a :class:`~pywa.client.WhatsApp` instance.
+
+    - Returned by :attr:`~pywa.client.WhatsApp.listeners_stats`.
+
+    Attributes:
+        active: The number of listeners that are waiting for an update.
+        pending_timeouts: The number of listeners with a timeout that did not expire yet.
+        expired: The number of listeners that timed out.
+        canceled_timeouts: The number of timeouts that were canceled because the listener ended before them.
+        expiry_batches: The number of ticks in which at least one listener timed out.
+    """
+
+    active: int
+    pending_timeouts: int
+    expired: int
+    canceled_timeouts: int
+    expiry_batches: int
+
+
+class _TimerEntry:
+    __slots__ = ("bucket", "deadline", "item")
+
+    def __init__(self, item: Any, deadline: int):
+        self.item = item
+        self.deadline = deadline  # in ticks
+        self.bucket: dict[_TimerEntry, None] | None = None
+
+
+class _TimingWheel:
+    """
+    A hierarchical timing wheel (Varghese & Lauck) measured in ticks.
+
+    - Inserting and canceling a timer is O(1): a timer is an entry in one of the slots of one of the levels.
+    - Each level covers ``slots`` times the range of the level below it. When the lower level wraps around, the
+      matching slot of the level above is cascaded down, so every timer is moved at most ``levels`` times.
+    - Not thread-safe, the callers hold their own lock (or run in the event loop).
+    """
+
+    def __init__(self, *, now: int = 0, slots: int = 64, levels: int = 4):
+        self._slots = slots
+        self._levels = levels
+        self._wheels: list[list[dict[_TimerEntry, None]]] = [
+            [{} for _ in range(slots)] for _ in range(levels)
+        ]
+        self._current = now
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _place(self, entry: _TimerEntry) -> None:
+        delta = entry.deadline - self._current
+        level = 0
+        while level < self._levels - 1 and delta >= self._slots ** (level + 1):
+            level += 1
+        # timers beyond the last level wait in its farthest slot and are placed again when it cascades
+        tick = min(entry.deadline, self._current + self._slots ** (level + 1) - 1)
+        bucket = self._wheels[level][(tick // self._slots**level) % self._slots]
+        bucket[entry] = None
+        entry.bucket = bucket
+
+    def add(self, item: Any, deadline: int) -> _TimerEntry:
+        entry = _TimerEntry(item, max(deadline, self._current + 1))
+        self._place(entry)
+        self._size += 1
+        return entry
+
+    def cancel(self, entry: _TimerEntry) -> bool:
+        if entry.bucket is None:
+            return False
+        del entry.bucket[entry]
+        entry.bucket = None
+        self._size -= 1
+        return True
+
+    def advance(self, now: int) -> list[_TimerEntry]:
+        """Advance the wheel to the ``now`` tick and return the entries that expired, in one batch."""
+        expired: list[_TimerEntry] = []
+        while self._current < now:
+            if not self._size:
+                self._current = now
+                break
+            self._current += 1
+            for level in range(self._levels - 1, 0, -1):
+                if self._current % self._slots**level == 0:
+                    bucket = self._wheels[level][
+                        (self._current // self._slots**level) % self._slots
+                    ]
+                    entries = list(bucket)
+                    bucket.clear()
+                    for entry in entries:
+                        self._place(entry)
+            bucket = self._wheels[0][self._current % self._slots]
+            for entry in bucket:
+                entry.bucket = None
+                expired.append(entry)
+            self._size -= len(bucket)
+            bucket.clear()
+        return expired
+
+
+class _ListenerTimeouts:
+    """
+    Expires the timeouts of the listeners from a single background thread, using a :class:`_TimingWheel`.
+
+    - The thread wakes up once per tick only while there are pending timeouts.
+    - The thread only keeps the wheel: the listeners that expired are handed to a small pool of threads, which call
+      their ``on_error`` callbacks, so slow callbacks don't delay the other timeouts.
+    """
+
+    tick = 0.05
+    expiry_workers = 4
+
+    def __init__(self):
+        self._wheel = _TimingWheel(now=self._now())
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._pool: concurrent.futures.ThreadPoolExecutor | None = None
+        self.expired = 0
+        self.canceled = 0
+        self.batches = 0
+
+    def _now(self) -> int:
+        return int(time.monotonic() / self.tick)
+
+    def __len__(self) -> int:
+        return len(self._wheel)
+
+    def schedule(self, listener: Listener, timeout: float) -> _TimerEntry:
+        deadline = math.ceil((time.monotonic() + timeout) / self.tick)
+        with self._cond:
+            entry = self._wheel.add((listener, timeout), deadline)
+            if self._thread is None:
+                self._pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.expiry_workers,
+                    thread_name_prefix="pywa-listeners-expiry",
+                )
+                self._thread = threading.Thread(
+                    target=self._run, name="pywa-listeners-timeouts", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+        return entry
+
+    def cancel(self, entry: _TimerEntry) -> None:
+        with self._cond:
+            if self._wheel.cancel(entry):
+                self.canceled += 1
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._wheel:
+                    self._cond.wait()
+                self._cond.wait(self.tick)
+                expired = self._wheel.advance(self._now())
+            self._expire(expired)
+
+    def _expire(self, expired: list[_TimerEntry]) -> None:
+        if not expired:
+            return
+        self.expired += len(expired)
+        self.batches += 1
+        for entry in expired:
+            self._dispatch(*entry.item)
+
+    def _dispatch(self, listener: Listener, timeout: float) -> None:
+        """Expire the listener from the pool (off the thread of the wheel)."""
+        self._pool.submit(self._expire_listener, listener, timeout)
+
+    @staticmethod
+    def _expire_listener(listener: Listener, timeout: float) -> None:
+        try:
+            listener.expire(timeout)
+        except Exception:
+            _logger.exception("Exception while expiring a listener")
+
+
+def _identifier_to_key(identifier: BaseListenerIdentifier) -> str:
+    return json.dumps(
+        [type(identifier).__name__, dataclasses.asdict(identifier)],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+
+
+def _identifier_from_key(key: str) -> BaseListenerIdentifier:
+    name, fields = json.loads(key)
+    identifier_cls = next(
+        c for c in BaseListenerIdentifier.__subclasses__() if c.__name__ == name
+    )
+    return identifier_cls(**fields)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Continuation:
+    """
+    A named next step of a conversation, registered with :meth:`~pywa.client.WhatsApp.continuation`.
+
+    Attributes:
+        key: The key to pass as the ``callback`` of :meth:`~pywa.client.WhatsApp.register_next_step`.
+        callback: The callback to call with the update that passed the filters.
+        filters: The filters to apply to the update.
+        cancelers: The filters to cancel the listener.
+        on_error: The callback to call when the listener times out, is canceled or is stopped.
+    """
+
+    key: str
+    callback: Callable[[WhatsApp, Any], Any]
+    filters: Filter[Any] | None = None
+    cancelers: Filter[Any] | None = None
+    on_error: Callable[[WhatsApp, Exception], Any] | None = None
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class StoredListener:
+    """
+    A listener saved in a :class:`ListenerStore`.
+
+    - The callback, filters and cancelers are not stored: they are restored from the :class:`Continuation` with the
+      ``continuation`` key, so they must be registered (with the same key) before the listeners are restored.
+
+    Attributes:
+        identifier: The identifier of the update the listener waits for.
+        continuation: The key of the :class:`Continuation` to resume.
+        deadline: The time (since the epoch) when the listener times out (``None`` if it has no timeout).
+    """
+
+    identifier: BaseListenerIdentifier
+    continuation: str
+    deadline: float | None = None
+
+
+class ListenerStore(abc.ABC):
+    """
+    Persists the listeners registered with a :class:`Continuation`, so conversations survive restarts.
+
+    - Pass it to the client as ``listener_store``. The listeners are restored when the first update is processed
+      (or when calling :meth:`~pywa.client.WhatsApp.restore_listeners`).
+    - Implement this class to use another storage (e.g. Redis), or use :class:`MemoryListenerStore`,
+      :class:`SQLiteListenerStore` or :class:`FileListenerStore`.
+    """
+
+    @abc.abstractmethod
+    def save(self, listener: StoredListener) -> None:
+        """Save the listener (replacing the listener of the same identifier)."""
+
+    @abc.abstractmethod
+    def delete(self, identifier: BaseListenerIdentifier) -> None:
+        """Delete the listener of the identifier (if any)."""
+
+    @abc.abstractmethod
+    def get(self, identifier: BaseListenerIdentifier) -> StoredListener | None:
+        """Get the listener of the identifier."""
+
+    @abc.abstractmethod
+    def all(self) -> Iterable[StoredListener]:
+        """Get all the saved listeners."""
+
+    def claim(self) -> Iterable[StoredListener]:
+        """
+        Get the saved listeners to restore in this process (called by :meth:`~pywa.client.WhatsApp.restore_listeners`).
+
+        - By default, all the saved listeners. Stores that are shared between workers override it to give every
+          listener to a single worker.
+        """
+        return self.all()
+
+    def close(self) -> None:
+        """Release the resources of the store."""
+
+
+class MemoryListenerStore(ListenerStore):
+    """A :class:`ListenerStore` that keeps the listeners in memory (they do not survive restarts, useful for tests)."""
+
+    def __init__(self):
+        self._listeners: dict[BaseListenerIdentifier, StoredListener] = {}
+
+    def save(self, listener: StoredListener) -> None:
+        self._listeners[listener.identifier] = listener
+
+    def delete(self, identifier: BaseListenerIdentifier) -> None:
+        self._listeners.pop(identifier, None)
+
+    def get(self, identifier: BaseListenerIdentifier) -> StoredListener | None:
+        return self._listeners.get(identifier)
+
+    def all(self) -> Iterable[StoredListener]:
+        return list(self._listeners.values())
+
+
+class SQLiteListenerStore(ListenerStore):
+    """
+    A :class:`ListenerStore` that keeps the listeners in a SQLite database, indexed by their identifier.
+
+    - Safe to share between the workers of ``pywa run --workers N`` (the database is in WAL mode): every listener is
+      owned by the run that saved it, and the listeners of previous runs are restored by the first worker that
+      restores the listeners. Processes that are not started together by ``pywa run`` (e.g. by another process
+      manager) must use a separate database each.
+
+    Args:
+        path: The path of the database file (created if missing).
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self._lock = threading.Lock()
+        # the workers of the same run share the owner (set by `pywa run`), other processes are owners by themselves
+        self._owner = os.environ.get(ENV_LISTENER_STORE_OWNER) or uuid.uuid4().hex
+        self._conn = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pywa_listeners "
+            "(identifier TEXT PRIMARY KEY, continuation TEXT NOT NULL, deadline REAL, owner TEXT)"
+        )
+
+    def save(self, listener: StoredListener) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pywa_listeners VALUES (?, ?, ?, ?)",
+                (
+                    _identifier_to_key(listener.identifier),
+                    listener.continuation,
+                    listener.deadline,
+                    self._owner,
+                ),
+            )
+
+    def delete(self, identifier: BaseListenerIdentifier) -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM pywa_listeners WHERE identifier = ?",
+                (_identifier_to_key(identifier),),
+            )
+
+    def get(self, identifier: BaseListenerIdentifier) -> StoredListener | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT continuation, deadline FROM pywa_listeners WHERE identifier = ?",
+                (_identifier_to_key(identifier),),
+            ).fetchone()
+        return StoredListener(identifier, *row) if row is not None else None
+
+    def all(self) -> Iterable[StoredListener]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT identifier, continuation, deadline FROM pywa_listeners"
+            ).fetchall()
+        return [
+            StoredListener(_identifier_from_key(key), continuation, deadline)
+            for key, continuation, deadline in rows
+        ]
+
+    def claim(self) -> Iterable[StoredListener]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")  # the workers claim one at a time
+            try:
+                rows = self._conn.execute(
+                    "SELECT identifier, continuation, deadline FROM pywa_listeners WHERE owner IS NOT ?",
+                    (self._owner,),
+                ).fetchall()
+                self._conn.execute(
+                    "UPDATE pywa_listeners SET owner = ? WHERE owner IS NOT ?",
+                    (self._owner, self._owner),
+                )
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return [
+            StoredListener(_identifier_from_key(key), continuation, deadline)
+            for key, continuation, deadline in rows
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class FileListenerStore(ListenerStore):
+    """
+    A :class:`ListenerStore` that appends the changes to a JSON-lines file and keeps an index in memory.
+
+    - The file is compacted when it is loaded and whenever most of its lines are obsolete.
+    - Use a separate file for each process.
+
+    Args:
+        path: The path of the file (created if missing).
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self._path = pathlib.Path(path)
+        self._lock = threading.Lock()
+        self._listeners: dict[str, StoredListener] = {}
+        if self._path.exists():
+            with self._path.open(encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        key, continuation, deadline = json.loads(line)
+                    except ValueError:  # a partial line written during a crash
+                        continue
+                    if continuation is None:
+                        self._listeners.pop(key, None)
+                    else:
+                        self._listeners[key] = StoredListener(
+                            _identifier_from_key(key), continuation, deadline
+                        )
+        self._compact()
+
+    def _compact(self) -> None:
+        tmp = self._path.with_name(f"{self._path.name}.tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            for key, listener in self._listeners.items():
+                f.write(
+                    json.dumps([key, listener.continuation, listener.deadline]) + "\n"
+                )
+        tmp.replace(self._path)
+        self._file = self._path.open("a", encoding="utf-8")
+        self._lines = len(self._listeners)
+
+    def _append(self, key: str, continuation: str | None, deadline: float | None):
+        self._file.write(json.dumps([key, continuation, deadline]) + "\n")
+        self._file.flush()
+        self._lines += 1
+        if self._lines > 2 * len(self._listeners) + 1000:
+            self._file.close()
+            self._compact()
+
+    def save(self, listener: StoredListener) -> None:
+        key = _identifier_to_key(listener.identifier)
+        with self._lock:
+            self._listeners[key] = listener
+            self._append(key, listener.continuation, listener.deadline)
+
+    def delete(self, identifier: BaseListenerIdentifier) -> None:
+        key = _identifier_to_key(identifier)
+        with self._lock:
+            if self._listeners.pop(key, None) is not None:
+                self._append(key, None, None)
+
+    def get(self, identifier: BaseListenerIdentifier) -> StoredListener | None:
+        key = _identifier_to_key(identifier)
+        with self._lock:
+            return self._listeners.get(key)
+
+    def all(self) -> Iterable[StoredListener]:
+        with self._lock:
+            return list(self._listeners.values())
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+_ForwardedUpdateCallback = Callable[["RawUpdate"], None]
+
+
+class ListenerBus(abc.ABC):
+    """
+    Connects the listeners of the workers that serve the same app.
+
+    - When a worker receives an update that is awaited by a listener of another worker, the update is forwarded to
+      that worker, which handles it as if it received it from the webhook (the listener gets it, or the handlers if
+      the listener filters do not match).
+    - Each client registers the identifiers it listens to with a callback that handles the forwarded updates.
+    - Implement this class to use a broker (e.g. Redis), or use :class:`UnixSocketListenerBus` (the default when
+      running ``pywa run --workers N``) or :class:`InProcessListenerBus`.
+    """
+
+    @abc.abstractmethod
+    def register(
+        self, identifier: BaseListenerIdentifier, callback: _ForwardedUpdateCallback
+    ) -> None:
+        """Announce that ``callback`` handles the updates of ``identifier``."""
+
+    @abc.abstractmethod
+    def unregister(
+        self, identifier: BaseListenerIdentifier, callback: _ForwardedUpdateCallback
+    ) -> None:
+        """Remove the registration of ``identifier``, if it is still owned by ``callback``."""
+
+    @abc.abstractmethod
+    def forward(
+        self,
+        identifier: BaseListenerIdentifier,
+        update: RawUpdate,
+        callback: _ForwardedUpdateCallback,
+    ) -> bool:
+        """
+        Forward the update to the worker that registered ``identifier``.
+
+        Args:
+            identifier: The identifier of the update.
+            update: The update to forward.
+            callback: The callback of the forwarding client (the update is not forwarded to itself).
+
+        Returns:
+            Whether the update was forwarded (if not, the forwarding client should handle it).
+        """
+
+    def close(self) -> None:
+        """Release the resources of the bus."""
+
+
+class InProcessListenerBus(ListenerBus):
+    """
+    A :class:`ListenerBus` for clients that run in the same process.
+
+    - A stand-in for a real broker: share one instance between clients to forward updates between them (e.g. in tests).
+    """
+
+    def __init__(self):
+        self._owners: dict[BaseListenerIdentifier, _ForwardedUpdateCallback] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self, identifier: BaseListenerIdentifier, callback: _ForwardedUpdateCallback
+    ) -> None:
+        with self._lock:
+            self._owners[identifier] = callback
+
+    def unregister(
+        self, identifier: BaseListenerIdentifier, callback: _ForwardedUpdateCallback
+    ) -> None:
+        with self._lock:
+            if self._owners.get(identifier) == callback:
+                del self._owners[identifier]
+
+    def forward(
+        self,
+        identifier: BaseListenerIdentifier,
+        update: RawUpdate,
+        callback: _ForwardedUpdateCallback,
+    ) -> bool:
+        with self._lock:
+            owner = self._owners.get(identifier)
+        if owner is None or owner == callback:
+            return False
+        owner(
+            type(update)(
+                update.raw,
+                hmac_header=update.hmac_header,
+                update_hash=update._update_hash,
+            )
+        )
+        return True
+
+
+class UnixSocketListenerBus(ListenerBus):
+    """
+    A :class:`ListenerBus` for workers on the same machine, using Unix datagram sockets.
+
+    - The owner of each identifier is a file in ``directory`` (one stat to check an update), and updates are sent to
+      the socket of the owner worker, which is created when it registers its first listener.
+    - An update that arrives after its listener ended (e.g. timed out while the update was in flight) is handled by
+      the worker as a new update (by its handlers), so it is not lost.
+    - ``pywa run --workers N`` uses it automatically with a temporary directory shared by the workers.
+
+    Args:
+        directory: A directory shared by the workers (created if missing).
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]):
+        if not hasattr(socket, "AF_UNIX"):
+            raise RuntimeError("Unix sockets are not supported on this platform")
+        self._directory = pathlib.Path(directory)
+        (self._directory / "listeners").mkdir(parents=True, exist_ok=True)
+        self._address = str(self._directory / f"worker-{os.getpid()}-{id(self)}.sock")
+        self._callbacks: dict[str, _ForwardedUpdateCallback] = {}
+        self._fallback: _ForwardedUpdateCallback | None = None
+        self._lock = threading.Lock()
+        self._sock: socket.socket | None = None
+        self._sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+
+    def _path(self, identifier: BaseListenerIdentifier) -> pathlib.Path:
+        key = hashlib.sha256(repr(identifier).encode()).hexdigest()
+        return self._directory / "listeners" / key
+
+    def _start(self) -> None:
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._sock.bind(self._address)
+        threading.Thread(
+            target=self._receive, name="pywa-listener-bus", daemon=True
+        ).start()
+
+    def _receive(self) -> None:
+        from .types.base_update import RawUpdate
+
+        assert self._sock is not None
+        while True:
+            try:
+                data = self._sock.recv(_MAX_FORWARDED_UPDATE_SIZE)
+            except OSError:  # closed
+                return
+            header, _, raw = data.partition(b"\n")
+            try:
+                key, hmac_header, update_hash = json.loads(header)
+                if (callback := self._callbacks.get(key) or self._fallback) is None:
+                    _logger.debug("No listener for a forwarded update (key=%s)", key)
+                    continue
+                # the update is handled by the handlers if its listener ended after it was sent
+                callback(
+                    RawUpdate(raw, hmac_header=hmac_header, update_hash=update_hash)
+                )
+            except Exception:
+                _logger.exception("Exception while handling a forwarded update")
+
+    def register(
+        self, identifier: BaseListenerIdentifier, callback: _ForwardedUpdateCallback
+    ) -> None:
+        path = self._path(identifier)
+        with self._lock:
+            if self._sock is None:
+                self._start()
+            self._callbacks[path.name] = callback
+            self._fallback = callback
+        tmp = path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+        tmp.write_text(self._address)
+        tmp.replace(path)
+
+    def unregister(
+        self, identifier: BaseListenerIdentifier, callback: _ForwardedUpdateCallback
+    ) -> None:
+        path = self._path(identifier)
+        with self._lock:
+            if self._callbacks.get(path.name) != callback:
+                return
+            del self._callbacks[path.name]
+        with contextlib.suppress(OSError):
+            if path.read_text() == self._address:
+                path.unlink()
+
+    def forward(
+        self,
+        identifier: BaseListenerIdentifier,
+        update: RawUpdate,
+        callback: _ForwardedUpdateCallback,
+    ) -> bool:
+        path = self._path(identifier)
+        try:
+            address = path.read_text()
+        except OSError:
+            return False
+        if address == self._address:
+            return False
+        data = (
+            json.dumps([path.name, update.hmac_header, update._update_hash]).encode()
+            + b"\n"
+            + update.raw
+        )
+        try:
+            self._sender.sendto(data, address)
+        except (FileNotFoundError, ConnectionRefusedError):  # the worker is gone
+            with contextlib.suppress(OSError):
+                path.unlink()
+            return False
+        except OSError:
+            _logger.exception("Failed to forward an update to %s", address)
+            return False
+        return True
+
+    def close(self) -> None:
+        with self._lock:
+            for key in self._callbacks:
+                with contextlib.suppress(OSError):
+                    (self._directory / "listeners" / key).unlink()
+            self._callbacks.clear()
+            self._fallback = None
+            if self._sock is not None:
+                self._sock.close()
+                self._sock = None
+                with contextlib.suppress(OSError):
+                    os.unlink(self._address)
+        self._sender.close()
+
+
 def _warn_anyio_thread_limit(wa: WhatsApp) -> None:
     from . import server
 
@@ -263,9 +1042,9 @@ class _Listeners:
             ListenerCanceled: If the listener was canceled by a filter
             ListenerStopped: If the listener was stopped manually
         """
-        if self._uvicorn_workers > 1:
+        if self._uvicorn_workers > 1 and self._listener_bus is None:
             raise RuntimeError(
-                "Listening is not supported when running on multiple workers"
+                "Listening on multiple workers requires a `listener_bus` to forward updates between the workers"
             )
         if timeout is None:
             warnings.warn(
@@ -281,11 +1060,14 @@ class _Listeners:
             filters=filters,
             cancelers=cancelers,
         )
-        self._listeners[to] = listener
+        self._add_listener(to, listener)
+        timeout_entry = (
+            self._listeners_timeouts.schedule(listener, timeout)
+            if timeout is not None
+            else None
+        )
         try:
-            if not listener.event.wait(timeout):
-                assert timeout is not None  # `.wait(None)` never times out
-                raise ListenerTimeout(timeout) from None
+            listener.event.wait()  # the timeout is expired by `self._listeners_timeouts`
 
             if listener.exception:
                 raise listener.exception
@@ -293,8 +1075,123 @@ class _Listeners:
             assert listener.result is not None
             return cast("_UpdateT", listener.result)
         finally:
+            if timeout_entry is not None:
+                self._listeners_timeouts.cancel(timeout_entry)
             self._remove_listener(identifier=to)
 
+    def register_next_step(
+        self: WhatsApp,
+        to: BaseListenerIdentifier,
+        callback: Callable[[WhatsApp, _UpdateT], Any] | str,
+        *,
+        filters: Filter[_UpdateT] | None = None,
+        cancelers: Filter[Any] | None = None,
+        timeout: float | None = None,
+        on_error: Callable[[WhatsApp, Exception], Any] | None = None,
+    ) -> None:
+        """
+        Listen to an update without blocking: the ``callback`` is called with the update when it arrives.
+
+        - Unlike :meth:`listen`, nothing waits for the update, so a pending conversation costs no more than a dict
+          entry. Use it when many users can be in the middle of a conversation at the same time.
+        - The callback runs as part of handling the incoming update. Call this method again from the callback to wait
+          for the next step of the conversation.
+        - Timeouts are expired in the background, which also runs ``on_error`` for them.
+
+        Example:
+
+            .. code-block:: python
+
+                @wa.on_message(filters.command("register"))
+                def register(_: WhatsApp, msg: Message):
+                    sent = msg.reply("What's your name?")
+                    wa.register_next_step(
+                        to=sent.listener_identifier,
+                        callback=on_name,
+                        filters=filters.message & filters.text,
+                        timeout=300,
+                        on_error=on_error,
+                    )
+
+
+                def on_name(_: WhatsApp, msg: Message):
+                    my_db.save_name(msg.from_user.bsuid, msg.text)
+                    msg.reply(f"Nice to meet you, {msg.text}!")
+
+
+                def on_error(_: WhatsApp, error: Exception):
+                    if isinstance(error, ListenerTimeout):
+                        ...
+
+        Args:
+            to: The identifier of the update to listen to.
+            callback: The function to call with the update that passed the filters, or the key of a :meth:`continuation`
+             (the listener is then saved in the ``listener_store`` and restored after a restart).
+            filters: The filters to apply to the update, call the ``callback`` if the filters pass.
+            cancelers: The filters to cancel the listening, call ``on_error`` with :class:`ListenerCanceled` if the
+             update matches.
+            timeout: The time to wait for the update, call ``on_error`` with :class:`ListenerTimeout` if the time passes.
+            on_error: The function to call when the listener times out, is canceled or is stopped (optional).
+        """
+        if self._uvicorn_workers > 1 and self._listener_bus is None:
+            raise RuntimeError(
+                "Listening on multiple workers requires a `listener_bus` to forward updates between the workers"
+            )
+        continuation = None
+        if isinstance(callback, str):
+            continuation = callback
+            callback, filters, cancelers, on_error = self._resolve_continuation(
+                continuation, filters=filters, cancelers=cancelers, on_error=on_error
+            )
+        if timeout is None:
+            warnings.warn(
+                "Listening without a `timeout` is highly discouraged as it can lead to memory leaks if the listener is never stopped.",
+                PywaWarning,
+                stacklevel=2,
+            )
+        self._check_for_async_callback(callback)
+        if on_error is not None:
+            self._check_for_async_callback(on_error)
+        self._check_for_async_filters(filters)
+        self._check_for_async_filters(cancelers)
+
+        listener = CallbackListener(
+            wa=self,
+            identifier=to,
+            filters=filters,
+            cancelers=cancelers,
+            callback=callback,
+            on_error=on_error,
+            continuation=continuation,
+            deadline=time.time() + timeout if timeout is not None else None,
+        )
+        self._add_listener(to, listener)
+        if timeout is not None:
+            listener.timeout_entry = self._listeners_timeouts.schedule(
+                listener, timeout
+            )
+
+    @property
+    def listeners_stats(self: WhatsApp) -> ListenersStats:
+        """
+        The number of active listeners and the statistics of their timeouts.
+
+        Example:
+
+            .. code-block:: python
+
+                >>> wa.listeners_stats
+                ListenersStats(active=3, pending_timeouts=3, expired=10, canceled_timeouts=25, expiry_batches=4)
+        """
+        timeouts = self._listeners_timeouts
+        return ListenersStats(
+            active=len(self._listeners),
+            pending_timeouts=len(timeouts),
+            expired=timeouts.expired,
+            canceled_timeouts=timeouts.canceled,
+            expiry_batches=timeouts.batches,
+        )
+
     def stop_listening(
         self: WhatsApp,
         to: BaseListenerIdentifier,
@@ -319,10 +1216,183 @@ class _Listeners:
         except KeyError:
             raise ValueError("Listener does not exist") from None
         listener.stop(reason)
-        self._remove_listener(identifier=to)
+        self._remove_listener(identifier=to, listener=listener)
+
+    def _add_listener(
+        self: WhatsApp, identifier: BaseListenerIdentifier, listener: Listener
+    ) -> None:
+        """Add the listener, announce it to the other workers and persist it (if configured)."""
+        self._listeners[identifier] = listener
+        if self._listener_bus is not None:
+            self._listener_bus.register(identifier, self._on_forwarded_update)
+        if (
+            self._listener_store is not None
+            and isinstance(listener, CallbackListener)
+            and listener.continuation is not None
+        ):
+            self._listener_store.save(
+                StoredListener(identifier, listener.continuation, listener.deadline)
+            )
 
-    def _remove_listener(self: WhatsApp, identifier: BaseListenerIdentifier) -> None:
+    def _remove_listener(
+        self: WhatsApp,
+        identifier: BaseListenerIdentifier,
+        listener: Listener | None = None,
+    ) -> None:
+        """Remove the listener of the identifier (only if it is still ``listener``, when provided)."""
+        if listener is not None and self._listeners.get(identifier) is not listener:
+            return
         try:
-            del self._listeners[identifier]
+            removed = self._listeners.pop(identifier)
         except KeyError:
-            pass
+            return
+        if self._listener_bus is not None:
+            self._listener_bus.unregister(identifier, self._on_forwarded_update)
+        if (
+            self._listener_store is not None
+            and isinstance(removed, CallbackListener)
+            and removed.continuation is not None
+        ):
+            self._listener_store.delete(identifier)
+
+    def continuation(
+        self: WhatsApp,
+        key: str,
+        *,
+        filters: Filter[Any] | None = None,
+        cancelers: Filter[Any] | None = None,
+        on_error: Callable[[WhatsApp, Exception], Any] | None = None,
+    ) -> Callable[[Callable[[WhatsApp, Any], Any]], Callable[[WhatsApp, Any], Any]]:
+        """
+        Register a named next step of a conversation, to use as the ``callback`` of :meth:`register_next_step`.
+
+        - Listeners registered with a continuation key are saved in the ``listener_store`` of the client, and
+          restored (with the callback, filters and cancelers of the continuation) after a restart.
+        - The key must stay the same between deployments.
+
+        Example:
+
+            .. code-block:: python
+
+                wa = WhatsApp(..., listener_store=SQLiteListenerStore("listeners.db"))
+
+
+                @wa.continuation("ask_name", filters=filters.message & filters.text)
+                def on_name(_: WhatsApp, msg: Message):
+                    msg.reply(f"Nice to meet you, {msg.text}!")
+
+
+                @wa.on_message(filters.command("register"))
+                def register(_: WhatsApp, msg: Message):
+                    sent = msg.reply("What's your name?")
+                    wa.register_next_step(
+                        to=sent.listener_identifier, callback="ask_name", timeout=3600
+                    )
+
+        Args:
+            key: The key of the continuation.
+            filters: The filters to apply to the update, call the callback if the filters pass.
+            cancelers: The filters to cancel the listening, call ``on_error`` with :class:`ListenerCanceled` if the
+             update matches.
+            on_error: The function to call when the listener times out, is canceled or is stopped (optional).
+        """
+
+        def decorator(
+            callback: Callable[[WhatsApp, Any], Any],
+        ) -> Callable[[WhatsApp, Any], Any]:
+            if key in self._continuations:
+                raise ValueError(f"Continuation {key!r} is already registered")
+            self._continuations[key] = Continuation(
+                key=key,
+                callback=callback,
+                filters=filters,
+                cancelers=cancelers,
+                on_error=on_error,
+            )
+            return callback
+
+        return decorator
+
+    def _resolve_continuation(
+        self: WhatsApp,
+        key: str,
+        *,
+        filters: Filter[Any] | None,
+        cancelers: Filter[Any] | None,
+        on_error: Callable[[WhatsApp, Exception], Any] | None,
+    ) -> tuple[
+        Callable[[WhatsApp, Any], Any],
+        Filter[Any] | None,
+        Filter[Any] | None,
+        Callable[[WhatsApp, Exception], Any] | None,
+    ]:
+        """Get the callback, filters, cancelers and on_error of a continuation."""
+        if filters is not None or cancelers is not None or on_error is not None:
+            raise ValueError(
+                "The filters, cancelers and on_error of a continuation are set when registering it with `wa.continuation(...)`"
+            )
+        try:
+            c = self._continuations[key]
+        except KeyError:
+            raise ValueError(f"Continuation {key!r} is not registered") from None
+        return c.callback, c.filters, c.cancelers, c.on_error
+
+    def restore_listeners(self: WhatsApp) -> int:
+        """
+        Restore the listeners saved in the ``listener_store`` (called automatically when the first update is processed).
+
+        - Listeners whose deadline passed while the app was down time out right away (``on_error`` is called).
+        - Listeners of continuations that are not registered are kept in the store and skipped.
+        - With a store that is shared between workers, each listener is restored by a single worker (see
+          :meth:`~pywa.listeners.ListenerStore.claim`).
+
+        Returns:
+            The number of restored listeners.
+        """
+        self._listeners_restored = True
+        if self._listener_store is None:
+            return 0
+        restored = 0
+        now = time.time()
+        for stored in self._listener_store.claim():
+            if stored.identifier in self._listeners:
+                continue
+            if stored.continuation not in self._continuations:
+                _logger.warning(
+                    "Skipped restoring a listener of an unregistered continuation: %r",
+                    stored.continuation,
+                )
+                continue
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", PywaWarning)  # no timeout
+                self.register_next_step(
+                    to=stored.identifier,
+                    callback=stored.continuation,
+                    timeout=max(stored.deadline - now, 0)
+                    if stored.deadline is not None
+                    else None,
+                )
+            restored += 1
+        _logger.info("Restored %d listeners", restored)
+        return restored
+
+    def _forward_to_listener_bus(self: WhatsApp, update: BaseUpdate) -> bool:
+        """Forward the update to the worker that listens to it. Returns ``True`` if it was forwarded."""
+        if self._listener_bus is None or not (
+            identifiers := update.listener_identifiers
+        ):
+            return False
+        identifiers = tuple(identifiers)
+        if any(identifier in self._listeners for identifier in identifiers):
+            return False
+        raw = getattr(update, "raw", None)
+        if raw is None:
+            return False
+        return any(
+            self._listener_bus.forward(identifier, raw, self._on_forwarded_update)
+            for identifier in identifiers
+        )
+
+    def _on_forwarded_update(self: WhatsApp, update: RawUpdate) -> None:
+        """Handle an update that another worker forwarded to this one."""
+        self._call_handlers(update)
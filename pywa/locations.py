@@ -0,0 +1,292 @@
+"""A spatial index of locations, for finding the nearest sites and the regions that contain a point."""
+
+from __future__ import annotations
+
+__all__ = ["IndexedLocation", "LocationIndex"]
+
+import dataclasses
+import heapq
+import math
+from collections.abc import Hashable, Iterable
+from typing import TypeAlias
+
+_EARTH_RADIUS_KM = 6371
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class IndexedLocation:
+    """
+    A location returned from a :class:`LocationIndex` query.
+
+    Attributes:
+        key: The key the location was added with (e.g. a store ID).
+        latitude: The latitude of the location.
+        longitude: The longitude of the location.
+        radius: The radius of the region around the location in kilometers (``None`` if it was added as a point).
+        distance: The distance in kilometers between the location and the queried point.
+    """
+
+    key: Hashable
+    latitude: float
+    longitude: float
+    radius: float | None
+    distance: float
+
+
+def _to_unit_vector(lat: float, lon: float) -> tuple[float, float, float]:
+    """Project a coordinate onto the unit sphere, so euclidean distance grows with the great-circle distance."""
+    lat, lon = math.radians(lat), math.radians(lon)
+    return (
+        math.cos(lat) * math.cos(lon),
+        math.cos(lat) * math.sin(lon),
+        math.sin(lat),
+    )
+
+
+def _km_to_chord(km: float) -> float:
+    return 2 * math.sin(min(km / _EARTH_RADIUS_KM, math.pi) / 2)
+
+
+def _chord_to_km(chord: float) -> float:
+    return 2 * _EARTH_RADIUS_KM * math.asin(min(chord / 2, 1.0))
+
+
+_KDNode: TypeAlias = "tuple[int, int, _KDNode | None, _KDNode | None]"
+
+
+class LocationIndex:
+    """
+    A spatial index of locations (stores, branches, delivery zones, etc.) that answers "which is the nearest site"
+    and "which regions contain this point" without checking every site.
+
+    - Sites are kept in a KD-tree over their position on the unit sphere, so queries take ``O(log n)`` instead of
+      computing the haversine distance to each site (a few microseconds for thousands of sites).
+    - Distances are great-circle distances in kilometers, the same as :meth:`~pywa.types.others.Location.in_radius`.
+    - Use it with the :func:`~pywa.filters.location_in_regions` and :func:`~pywa.filters.location_near` filters, or
+      query it directly from a handler.
+    - The index is rebuilt lazily on the first query after sites are added. Adding sites while other threads query
+      the index is not supported.
+
+    Example:
+
+        >>> from pywa import WhatsApp, filters, types
+        >>> from pywa.locations import LocationIndex
+        >>> stores = LocationIndex(
+        ...     (store.id, store.lat, store.lon, store.delivery_radius_km)
+        ...     for store in my_db.get_stores()
+        ... )
+
+        >>> @wa.on_message(filters.location_in_regions(stores))
+        ... def on_location(_: WhatsApp, msg: types.Message):
+        ...     loc = msg.location
+        ...     store = stores.nearest(loc.latitude, loc.longitude)[0]
+        ...     msg.reply(
+        ...         f"Delivering from store {store.key} ({store.distance:.1f} km)"
+        ...     )
+
+    Args:
+        locations: Initial sites as ``(key, latitude, longitude)`` or ``(key, latitude, longitude, radius)`` tuples.
+    """
+
+    def __init__(
+        self,
+        locations: Iterable[
+            tuple[Hashable, float, float] | tuple[Hashable, float, float, float | None]
+        ] = (),
+    ):
+        self._keys: list[Hashable] = []
+        self._coords: list[tuple[float, float]] = []
+        self._radii: list[float | None] = []
+        self._points: list[tuple[float, float, float]] = []
+        self._max_radius = 0.0
+        self._tree: _KDNode | None = None
+        for location in locations:
+            self.add(*location)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"LocationIndex(locations={len(self)})"
+
+    def add(
+        self, key: Hashable, lat: float, lon: float, radius: float | None = None
+    ) -> None:
+        """
+        Add a site to the index.
+
+        Args:
+            key: The key to return for this site in query results (e.g. a store ID).
+            lat: The latitude of the site.
+            lon: The longitude of the site.
+            radius: The radius in kilometers of the region around the site (optional, required for
+             :meth:`containing`).
+        """
+        if not -90 <= lat <= 90 or not -180 <= lon <= 180:
+            raise ValueError(f"Invalid coordinates: ({lat}, {lon})")
+        if radius is not None:
+            if radius < 0:
+                raise ValueError(f"The radius must be positive, got {radius}")
+            self._max_radius = max(self._max_radius, radius)
+        self._keys.append(key)
+        self._coords.append((lat, lon))
+        self._radii.append(radius)
+        self._points.append(_to_unit_vector(lat, lon))
+        self._tree = None
+
+    def _build(self, indices: list[int], depth: int) -> _KDNode | None:
+        if not indices:
+            return None
+        axis = depth % 3
+        indices.sort(key=lambda i: self._points[i][axis])
+        mid = len(indices) // 2
+        return (
+            indices[mid],
+            axis,
+            self._build(indices[:mid], depth + 1),
+            self._build(indices[mid + 1 :], depth + 1),
+        )
+
+    def _get_tree(self) -> _KDNode | None:
+        if self._tree is None and self._points:
+            self._tree = self._build(list(range(len(self._points))), 0)
+        return self._tree
+
+    def _result(self, idx: int, chord_sq: float) -> IndexedLocation:
+        lat, lon = self._coords[idx]
+        return IndexedLocation(
+            key=self._keys[idx],
+            latitude=lat,
+            longitude=lon,
+            radius=self._radii[idx],
+            distance=_chord_to_km(math.sqrt(chord_sq)),
+        )
+
+    def _search_nearest(
+        self,
+        node: _KDNode | None,
+        target: tuple[float, float, float],
+        k: int,
+        bound_sq: float,
+        heap: list[tuple[float, int]],
+    ) -> None:
+        if node is None:
+            return
+        idx, axis, left, right = node
+        point = self._points[idx]
+        dist_sq = (
+            (point[0] - target[0]) ** 2
+            + (point[1] - target[1]) ** 2
+            + (point[2] - target[2]) ** 2
+        )
+        if dist_sq <= bound_sq:
+            if len(heap) < k:
+                heapq.heappush(heap, (-dist_sq, idx))
+            elif dist_sq < -heap[0][0]:
+                heapq.heapreplace(heap, (-dist_sq, idx))
+        diff = target[axis] - point[axis]
+        near, far = (left, right) if diff < 0 else (right, left)
+        self._search_nearest(near, target, k, bound_sq, heap)
+        if diff * diff <= (-heap[0][0] if len(heap) == k else bound_sq):
+            self._search_nearest(far, target, k, bound_sq, heap)
+
+    def _search_within(
+        self,
+        node: _KDNode | None,
+        target: tuple[float, float, float],
+        bound_sq: float,
+        found: list[tuple[float, int]],
+    ) -> None:
+        if node is None:
+            return
+        idx, axis, left, right = node
+        point = self._points[idx]
+        dist_sq = (
+            (point[0] - target[0]) ** 2
+            + (point[1] - target[1]) ** 2
+            + (point[2] - target[2]) ** 2
+        )
+        if dist_sq <= bound_sq:
+            found.append((dist_sq, idx))
+        diff = target[axis] - point[axis]
+        if diff < 0 or diff * diff <= bound_sq:
+            self._search_within(left, target, bound_sq, found)
+        if diff >= 0 or diff * diff <= bound_sq:
+            self._search_within(right, target, bound_sq, found)
+
+    def nearest(
+        self,
+        lat: float,
+        lon: float,
+        k: int = 1,
+        *,
+        max_distance: float | None = None,
+    ) -> list[IndexedLocation]:
+        """
+        Get the ``k`` nearest sites to a point, closest first.
+
+        >>> stores.nearest(32.0853, 34.7818, k=3, max_distance=20)
+
+        Args:
+            lat: The latitude of the point.
+            lon: The longitude of the point.
+            k: The maximum number of sites to return (default: ``1``).
+            max_distance: Ignore sites farther than this distance in kilometers (optional).
+
+        Returns:
+            Up to ``k`` sites, sorted by distance.
+        """
+        if k < 1:
+            raise ValueError(f"k must be at least 1, got {k}")
+        heap: list[tuple[float, int]] = []
+        self._search_nearest(
+            node=self._get_tree(),
+            target=_to_unit_vector(lat, lon),
+            k=k,
+            bound_sq=math.inf
+            if max_distance is None
+            else _km_to_chord(max_distance) ** 2,
+            heap=heap,
+        )
+        return [
+            self._result(idx, -neg_dist_sq)
+            for neg_dist_sq, idx in sorted(heap, reverse=True)
+        ]
+
+    def within(self, lat: float, lon: float, radius: float) -> list[IndexedLocation]:
+        """
+        Get all the sites in a radius of a point, closest first.
+
+        Args:
+            lat: The latitude of the point.
+            lon: The longitude of the point.
+            radius: The radius in kilometers.
+
+        Returns:
+            The sites in the radius, sorted by distance.
+        """
+        found: list[tuple[float, int]] = []
+        self._search_within(
+            node=self._get_tree(),
+            target=_to_unit_vector(lat, lon),
+            bound_sq=_km_to_chord(radius) ** 2,
+            found=found,
+        )
+        return [self._result(idx, dist_sq) for dist_sq, idx in sorted(found)]
+
+    def containing(self, lat: float, lon: float) -> list[IndexedLocation]:
+        """
+        Get the regions (sites that were added with a ``radius``) that contain a point, closest first.
+
+        Args:
+            lat: The latitude of the point.
+            lon: The longitude of the point.
+
+        Returns:
+            The regions that contain the point, sorted by distance from their center.
+        """
+        return [
+            loc
+            for loc in self.within(lat, lon, self._max_radius)
+            if loc.radius is not None and loc.distance <= loc.radius
+        ]
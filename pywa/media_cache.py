@@ -0,0 +1,246 @@
+"""Caching the IDs of uploaded media, so the same media is uploaded only once."""
+
+from __future__ import annotations
+
+__all__ = ["CachedMedia", "MediaCache", "MediaCacheStats"]
+
+import collections
+import dataclasses
+import datetime
+import pathlib
+import sqlite3
+import threading
+import time
+
+_MEDIA_LIFETIME = datetime.timedelta(days=30)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CachedMedia:
+    """
+    A media that was uploaded to a phone number, in a :class:`MediaCache`.
+
+    Attributes:
+        media_id: The ID of the uploaded media.
+        uploaded_at: The time the media was uploaded (a UNIX timestamp).
+        ttl_minutes: The TTL of the media, for `No Storage-enabled <https://developers.facebook.com/documentation/business-messaging/whatsapp/no-storage>`_ phone numbers (``None`` for the default 30 days).
+    """
+
+    media_id: str
+    uploaded_at: float
+    ttl_minutes: int | None = None
+
+    @property
+    def expires_at(self) -> float:
+        """The time the media expires (a UNIX timestamp)."""
+        return self.uploaded_at + (
+            self.ttl_minutes * 60
+            if self.ttl_minutes is not None
+            else _MEDIA_LIFETIME.total_seconds()
+        )
+
+
+@dataclasses.dataclass(slots=True)
+class MediaCacheStats:
+    """
+    The statistics of a :class:`MediaCache`.
+
+    Attributes:
+        hits: The number of uploads that were skipped, since the same content was already uploaded to the phone number.
+        misses: The number of uploads that were sent to the Graph API.
+        expired: The number of entries that were dropped since their media was about to expire.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+
+
+class MediaCache:
+    """
+    Remembers the IDs of uploaded media by their content (sha256) and phone ID, so the same content (e.g. a logo or a
+    PDF that is sent to thousands of users) is uploaded once.
+
+    - Used for media that pywa uploads: files, bytes, file-like objects and base64 strings (in ``send_image``,
+      ``send_document``, ``upload_media``, template params etc.). URLs are sent as links, and bytes generators are not
+      read twice, so they are not cached.
+    - Also remembers the file handles of template header examples (uploaded with the Resumable Upload API when
+      templates are created or updated) by their content and app ID, so the same example is uploaded once for all
+      the languages and WhatsApp Business Accounts of the app.
+    - An entry is used until ``margin`` before its media expires (30 days after the upload, or the ``ttl`` of the
+      upload), and is dropped when the media is deleted with :meth:`~pywa.client.WhatsApp.delete_media`.
+    - The entries are kept in memory (up to ``max_size``, the least recently used are dropped). Provide a ``path``
+      to also keep them in an SQLite file, so they survive restarts and are shared between processes.
+
+    Example:
+
+        .. code-block:: python
+
+            from pywa import WhatsApp
+            from pywa.media_cache import MediaCache
+
+            wa = WhatsApp(..., media_cache=MediaCache(path="media-cache.sqlite3"))
+
+            for user in users:
+                wa.send_document(to=user, document="catalog.pdf")  # uploaded once
+
+    Args:
+        max_size: The maximum number of entries to keep in memory.
+        margin: The time before the media expires to stop using it (so it doesn't expire before the message is sent).
+        path: A path to an SQLite file to keep the entries in (optional, created if missing).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 1024,
+        margin: datetime.timedelta = datetime.timedelta(hours=1),
+        path: str | pathlib.Path | None = None,
+    ):
+        self.max_size = max_size
+        self.margin = margin.total_seconds()
+        self.stats = MediaCacheStats()
+        self._entries: collections.OrderedDict[tuple[str, str], CachedMedia] = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            with self._db:
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS media (digest TEXT, phone_id TEXT, media_id TEXT, uploaded_at REAL,"
+                    " ttl_minutes INTEGER, PRIMARY KEY (digest, phone_id))"
+                )
+
+    def __repr__(self) -> str:
+        return f"MediaCache(entries={len(self._entries)}, stats={self.stats!r})"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, digest: str, phone_id: str) -> CachedMedia | None:
+        """
+        Get the media that was uploaded with the content to the phone number (and counts a hit or a miss).
+
+        Args:
+            digest: The sha256 (hex) of the content.
+            phone_id: The phone ID the media is uploaded to.
+
+        Returns:
+            The uploaded media, or ``None`` if it was not uploaded (or is about to expire).
+        """
+        key = (digest, str(phone_id))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self._db is not None:
+                row = self._db.execute(
+                    "SELECT media_id, uploaded_at, ttl_minutes FROM media WHERE digest = ? AND phone_id = ?",
+                    key,
+                ).fetchone()
+                entry = CachedMedia(*row) if row is not None else None
+            if entry is not None and entry.expires_at - self.margin <= time.time():
+                self._drop(key)
+                self.stats.expired += 1
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self._remember(key, entry)
+            self.stats.hits += 1
+            return entry
+
+    def set(
+        self,
+        digest: str,
+        phone_id: str,
+        media_id: str,
+        *,
+        ttl_minutes: int | None = None,
+    ) -> None:
+        """
+        Remember a media that was uploaded with the content to the phone number.
+
+        Args:
+            digest: The sha256 (hex) of the content.
+            phone_id: The phone ID the media was uploaded to.
+            media_id: The ID of the uploaded media.
+            ttl_minutes: The TTL of the upload (``None`` for the default 30 days).
+        """
+        key = (digest, str(phone_id))
+        entry = CachedMedia(
+            media_id=str(media_id), uploaded_at=time.time(), ttl_minutes=ttl_minutes
+        )
+        with self._lock:
+            self._remember(key, entry)
+            if self._db is not None:
+                with self._db:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO media VALUES (?, ?, ?, ?, ?)",
+                        (*key, entry.media_id, entry.uploaded_at, entry.ttl_minutes),
+                    )
+
+    def get_handle(self, digest: str, app_id: str) -> CachedMedia | None:
+        """
+        Get the file handle that was uploaded with the content by the app (and counts a hit or a miss).
+
+        Args:
+            digest: The sha256 (hex) of the content.
+            app_id: The ID of the app that uploaded the file.
+
+        Returns:
+            The uploaded file (the handle is in ``media_id``), or ``None`` if it was not uploaded (or is about to
+            expire).
+        """
+        return self.get(digest, f"app:{app_id}")
+
+    def set_handle(self, digest: str, app_id: str, handle: str) -> None:
+        """
+        Remember a file handle that was uploaded with the content by the app.
+
+        Args:
+            digest: The sha256 (hex) of the content.
+            app_id: The ID of the app that uploaded the file.
+            handle: The file handle.
+        """
+        self.set(digest, f"app:{app_id}", handle)
+
+    def discard(self, media_id: str) -> None:
+        """
+        Forget a media (e.g. after it was deleted).
+
+        Args:
+            media_id: The ID of the media.
+        """
+        with self._lock:
+            for key in [
+                k for k, e in self._entries.items() if e.media_id == str(media_id)
+            ]:
+                del self._entries[key]
+            if self._db is not None:
+                with self._db:
+                    self._db.execute(
+                        "DELETE FROM media WHERE media_id = ?", (str(media_id),)
+                    )
+
+    def clear(self) -> None:
+        """Forget all the media."""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                with self._db:
+                    self._db.execute("DELETE FROM media")
+
+    def _remember(self, key: tuple[str, str], entry: CachedMedia) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _drop(self, key: tuple[str, str]) -> None:
+        self._entries.pop(key, None)
+        if self._db is not None:
+            with self._db:
+                self._db.execute(
+                    "DELETE FROM media WHERE digest = ? AND phone_id = ?", key
+                )
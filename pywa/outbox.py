@@ -0,0 +1,419 @@
+"""A durable outbox for messages, that knows which messages were sent after a crash."""
+
+from __future__ import annotations
+
+__all__ = ["Outbox", "OutboxEntry", "OutboxStatus"]
+
+import dataclasses
+import enum
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from .bulk import BulkProgress, BulkResult
+
+if TYPE_CHECKING:
+    from .client import WhatsApp
+    from .types import MessageStatus
+    from .types.sent_update import SentMessage
+    from .utils import RateLimiter, RetryPolicy
+
+
+class OutboxStatus(enum.Enum):
+    """
+    The status of a message in an :class:`Outbox`.
+
+    Attributes:
+        PENDING: The message was recorded and was not sent yet.
+        SENDING: The message was claimed for sending. After a crash, these messages are *in doubt*: they may have
+         been sent, and they stay in this status until a status webhook of the message arrives (see
+         :meth:`Outbox.on_status`) or they are sent again with ``resend_in_doubt=True``.
+        SENT: The message was sent (the ``message_id`` is known).
+        FAILED: The message failed to send (the ``error`` is recorded).
+    """
+
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class OutboxEntry:
+    """
+    A message in an :class:`Outbox`.
+
+    Attributes:
+        key: The key of the message (also sent as its ``tracker``, so the status webhooks link back to it).
+        to: The recipient of the message.
+        method: The method of the client that sends the message (e.g. ``"send_template"``).
+        params: The keyword arguments of the method.
+        status: The status of the message.
+        message_id: The ID of the sent message (``None`` until it is sent).
+        error: The error that the message failed with (``None`` if it did not fail).
+        created_at: The time when the message was recorded (since the epoch).
+    """
+
+    key: str
+    to: str
+    method: str
+    params: dict[str, Any]
+    status: OutboxStatus
+    message_id: str | None = None
+    error: str | None = None
+    created_at: float = 0.0
+
+
+_COLUMNS = "key, recipient, method, params, status, message_id, error, created_at"
+
+
+def _entry(row: tuple) -> OutboxEntry:
+    key, to, method, params, status, message_id, error, created_at = row
+    return OutboxEntry(
+        key=key,
+        to=to,
+        method=method,
+        params=json.loads(params),
+        status=OutboxStatus(status),
+        message_id=message_id,
+        error=error,
+        created_at=created_at,
+    )
+
+
+class Outbox:
+    """
+    A durable outbox of messages in a SQLite database: every message is recorded before it is sent and marked with
+    its message ID after, so a broadcast that was interrupted (e.g. by a crash or a deploy) is resumed without sending
+    any message twice.
+
+    - Record messages with :meth:`add` (the rows are committed in batches of ``batch_size``, or by :meth:`flush`),
+      and send them with :meth:`send`, which claims a batch of pending messages (a single commit), sends them with
+      :meth:`~pywa.client.WhatsApp.send_bulk` and records their results (a single commit).
+    - The key of every message is sent as its ``tracker`` (``biz_opaque_callback_data``). Adding a key that was
+      already added is ignored, so a producer that is restarted can add the same messages again (e.g. with keys
+      such as ``"{campaign}:{user}"``).
+    - Messages that were claimed when the process crashed may have been sent, so they are not sent again by
+      default. Pass :meth:`on_status` as the callback of a
+      :class:`~pywa.handlers.MessageStatusHandler` to mark them as sent when their status webhooks arrive, and send
+      the rest again with ``resend_in_doubt=True``.
+    - The params of the messages are stored as JSON, so they must be JSON serializable (e.g. pass template params as
+      dicts, and media as URLs or media IDs).
+    - Safe to share between threads. Use a separate database for each process that sends.
+
+    Example:
+
+        .. code-block:: python
+
+            from pywa import WhatsApp, handlers
+            from pywa.outbox import Outbox
+
+            wa = WhatsApp(...)
+            outbox = Outbox("outbox.sqlite3")
+            wa.add_handlers(handlers.MessageStatusHandler(outbox.on_status))
+
+            for user in users:
+                outbox.add(
+                    to=user.phone,
+                    key=f"summer-sale:{user.id}",
+                    method="send_template",
+                    name="summer_sale",
+                    language="en_US",
+                )
+
+            for entry, result in outbox.send(wa, concurrency=16):
+                if not result.ok:
+                    print(entry.key, result.error)
+
+    Args:
+        path: The path of the database file (created if missing).
+        batch_size: The number of messages to commit (and to claim for sending) at once.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, batch_size: int = 500):
+        if batch_size < 1:
+            raise ValueError("`batch_size` must be at least 1")
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._buffer: list[tuple] = []
+        self._conn = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pywa_outbox (key TEXT PRIMARY KEY, recipient TEXT NOT NULL, "
+            "method TEXT NOT NULL, params TEXT NOT NULL, status TEXT NOT NULL, message_id TEXT, error TEXT, "
+            "created_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS pywa_outbox_status ON pywa_outbox (status)"
+        )
+
+    def __repr__(self) -> str:
+        return f"Outbox(counts={self.counts()!r})"
+
+    def add(
+        self,
+        to: str | int,
+        *,
+        key: str | None = None,
+        method: str = "send_message",
+        **params: Any,
+    ) -> str:
+        """
+        Record a message to send (it is committed with its batch, or by :meth:`flush`).
+
+        Args:
+            to: The recipient of the message.
+            key: A unique key for the message, up to 512 characters (default: a random key). Messages with a key
+             that was already added are ignored.
+            method: The method of the client to send the message with (e.g. ``"send_template"``).
+            **params: The keyword arguments of the method (must be JSON serializable).
+
+        Returns:
+            The key of the message.
+
+        Raises:
+            ValueError: If the params are not JSON serializable, or include a ``tracker`` (the key is the tracker).
+        """
+        if "tracker" in params:
+            raise ValueError(
+                "The key of an outbox message is sent as its tracker, provide `key` instead of `tracker`."
+            )
+        try:
+            encoded = json.dumps(params)
+        except TypeError as e:
+            raise ValueError(
+                f"The params of outbox messages must be JSON serializable: {e}"
+            ) from e
+        key = key or uuid.uuid4().hex
+        with self._lock:
+            self._buffer.append(
+                (
+                    key,
+                    str(to),
+                    method,
+                    encoded,
+                    OutboxStatus.PENDING.value,
+                    None,
+                    None,
+                    time.time(),
+                )
+            )
+            if len(self._buffer) >= self.batch_size:
+                self._flush()
+        return key
+
+    def flush(self) -> None:
+        """Commit the messages that were added and not committed yet."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+        with self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                f"INSERT OR IGNORE INTO pywa_outbox ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                self._buffer,
+            )
+        self._buffer.clear()
+
+    def get(self, key: str) -> OutboxEntry | None:
+        """
+        Get a message by its key.
+
+        Args:
+            key: The key of the message.
+
+        Returns:
+            The message, or ``None`` if it was not added (or not committed yet).
+        """
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM pywa_outbox WHERE key = ?", (key,)
+            ).fetchone()
+        return _entry(row) if row is not None else None
+
+    def entries(self, status: OutboxStatus | None = None) -> Iterator[OutboxEntry]:
+        """
+        Get the messages, in the order they were added.
+
+        Args:
+            status: Get only the messages with this status (e.g. ``OutboxStatus.SENDING`` for the messages that are
+             in doubt after a crash).
+
+        Returns:
+            An iterator of the messages.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM pywa_outbox"
+                + (" WHERE status = ?" if status is not None else "")
+                + " ORDER BY rowid",
+                (status.value,) if status is not None else (),
+            ).fetchall()
+        return map(_entry, rows)
+
+    def counts(self) -> dict[OutboxStatus, int]:
+        """Get the number of messages in every status."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM pywa_outbox GROUP BY status"
+            ).fetchall()
+        counts = dict.fromkeys(OutboxStatus, 0)
+        counts.update({OutboxStatus(status): count for status, count in rows})
+        return counts
+
+    def on_status(self, _: WhatsApp, status: MessageStatus) -> None:
+        """
+        Mark the message of a status webhook as sent (use it as the callback of a
+        :class:`~pywa.handlers.MessageStatusHandler`).
+
+        - Resolves the messages that are in doubt after a crash (they were sent, but their result was not recorded).
+
+        Args:
+            _: The client (ignored).
+            status: The status of a message.
+        """
+        if not isinstance(status.tracker, str):
+            return
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.execute(
+                "UPDATE pywa_outbox SET status = ?, message_id = ?, error = NULL WHERE key = ? AND status != ?",
+                (
+                    OutboxStatus.SENT.value,
+                    status.id,
+                    status.tracker,
+                    OutboxStatus.SENT.value,
+                ),
+            )
+
+    def _claim(self, limit: int, resend_in_doubt: bool) -> list[OutboxEntry]:
+        """Mark a batch of pending messages as sending, in a single commit."""
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM pywa_outbox WHERE status IN (?, ?) ORDER BY rowid LIMIT ?",
+                (
+                    OutboxStatus.PENDING.value,
+                    OutboxStatus.SENDING.value
+                    if resend_in_doubt
+                    else OutboxStatus.PENDING.value,
+                    limit,
+                ),
+            ).fetchall()
+            self._conn.executemany(
+                "UPDATE pywa_outbox SET status = ? WHERE key = ?",
+                [(OutboxStatus.SENDING.value, row[0]) for row in rows],
+            )
+        return [
+            dataclasses.replace(_entry(row), status=OutboxStatus.SENDING)
+            for row in rows
+        ]
+
+    def _record(self, results: Iterable[tuple[OutboxEntry, BulkResult]]) -> None:
+        """Record the results of sent messages, in a single commit."""
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "UPDATE pywa_outbox SET status = ?, message_id = ?, error = ? WHERE key = ?",
+                [
+                    (
+                        OutboxStatus.SENT.value,
+                        result.sent.id if result.sent is not None else None,
+                        None,
+                        entry.key,
+                    )
+                    if result.ok
+                    else (
+                        OutboxStatus.FAILED.value,
+                        None,
+                        repr(result.error),
+                        entry.key,
+                    )
+                    for entry, result in results
+                ],
+            )
+
+    @staticmethod
+    def _dispatch(wa: WhatsApp) -> Callable[..., SentMessage]:
+        def send(to: str, entry: OutboxEntry) -> SentMessage:
+            return getattr(wa, entry.method)(to=to, tracker=entry.key, **entry.params)
+
+        return send
+
+    def send(
+        self,
+        wa: WhatsApp,
+        *,
+        concurrency: int = 8,
+        limit: int | None = None,
+        resend_in_doubt: bool = False,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        on_progress: Callable[[BulkProgress], Any] | None = None,
+    ) -> Iterator[tuple[OutboxEntry, BulkResult]]:
+        """
+        Send the pending messages, in the order they were added, and record their results.
+
+        - The messages are claimed and recorded in batches of ``batch_size``. If the iteration is stopped, the
+          results of the messages that were sent are recorded, and the rest of the batch stays in doubt.
+        - The results are yielded with their messages, as soon as the messages are processed (not in the order they
+          were added).
+
+        Args:
+            wa: The client to send the messages with.
+            concurrency: The maximum number of messages to send at the same time.
+            limit: The maximum number of messages to send (default: all the pending messages).
+            resend_in_doubt: Whether to send again the messages that are in doubt (claimed by a previous run that
+             did not record their results). They may have been sent already, so resolve them with :meth:`on_status`
+             first.
+            rate_limiter: Limits the throughput of the messages (in addition to the ``rate_limiter`` of the client).
+            retry_policy: Retries failed messages (in addition to the ``retry_policy`` of the client).
+            on_progress: A callback that receives the :class:`~pywa.bulk.BulkProgress` after every message.
+
+        Returns:
+            An iterator of the messages (with the status they had when they were claimed) and their results.
+        """
+        self.flush()
+        send = self._dispatch(wa)
+        remaining = limit
+        while remaining is None or remaining > 0:
+            batch = self._claim(
+                self.batch_size
+                if remaining is None
+                else min(self.batch_size, remaining),
+                resend_in_doubt,
+            )
+            if not batch:
+                return
+            if remaining is not None:
+                remaining -= len(batch)
+            results: list[tuple[OutboxEntry, BulkResult]] = []
+            try:
+                for result in wa.send_bulk(
+                    ((entry.to, {"entry": entry}) for entry in batch),
+                    send=send,
+                    concurrency=concurrency,
+                    rate_limiter=rate_limiter,
+                    retry_policy=retry_policy,
+                    on_progress=on_progress,
+                ):
+                    results.append((batch[result.index], result))
+                    yield results[-1]
+            finally:
+                self._record(results)
+
+    def close(self) -> None:
+        """Commit the added messages and close the database."""
+        with self._lock:
+            self._flush()
+            self._conn.close()
@@ -0,0 +1,219 @@
+"""Merging the read receipts and typing indicators of every chat into a single request."""
+
+from __future__ import annotations
+
+__all__ = ["ReceiptAggregator", "ReceiptStats"]
+
+import collections
+import dataclasses
+import datetime
+import logging
+import threading
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from ._shared import _normalize_recipient
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(slots=True)
+class ReceiptStats:
+    """
+    The statistics of a :class:`ReceiptAggregator`.
+
+    Attributes:
+        received: The number of read receipts and typing indicators that were requested.
+        sent: The number of requests that were sent (every request marks the newest message of a chat as read).
+        failed: The number of requests that failed (they are logged and not retried).
+    """
+
+    received: int = 0
+    sent: int = 0
+    failed: int = 0
+
+
+class _Receipt:
+    """The newest message of a chat to mark as read (and whether to indicate typing)."""
+
+    __slots__ = ("api", "deadline", "key", "keys", "message_id", "timestamp", "typing")
+
+    def __init__(
+        self,
+        api: Any,
+        keys: tuple[tuple[str, str], ...],
+        message_id: str,
+        timestamp: datetime.datetime | None,
+        typing: bool,
+        deadline: float,
+    ):
+        self.api = api
+        self.key = keys[0]
+        self.keys = keys  # by every id of the chat (e.g. the phone number and the BSUID of the user)
+        self.message_id = message_id
+        self.timestamp = timestamp
+        self.typing = typing
+        self.deadline = deadline
+
+
+class ReceiptAggregator:
+    """
+    Merges the read receipts and typing indicators of every chat that are requested within a short window into a
+    single request, for the newest message of the chat.
+
+    - Applies to the shortcuts of the updates: ``msg.mark_as_read()`` and ``msg.indicate_typing()``. They return
+      right away, and the request is sent ``window`` seconds after the first receipt of the chat (failures are logged).
+      :meth:`~pywa.client.WhatsApp.mark_message_as_read` and :meth:`~pywa.client.WhatsApp.indicate_typing` are
+      still sent right away.
+    - Marking a message as read also marks the earlier messages of the chat as read, so only the newest message
+      (by its timestamp) is marked. If a typing indicator was requested in the window, it is sent with the read
+      receipt (a single request).
+    - A message that is sent to the chat sends its pending receipt first, so the typing indicator never shows up
+      after the reply (the chat is matched by any id of the user, and phone numbers in any format).
+    - The requests are sent from a background thread. Use :class:`pywa_async.receipts.ReceiptAggregator` with
+      :class:`pywa_async.WhatsApp`.
+
+    Example:
+
+        .. code-block:: python
+
+            from pywa import WhatsApp, types
+            from pywa.receipts import ReceiptAggregator
+
+            wa = WhatsApp(..., receipts=ReceiptAggregator(window=1.0))
+
+
+            @wa.on_message
+            def on_message(_: WhatsApp, msg: types.Message):
+                msg.mark_as_read()  # merged with the other messages of the chat
+                msg.indicate_typing()  # merged into the same request
+
+    Args:
+        window: The time to wait for more receipts of a chat before sending, in seconds.
+    """
+
+    def __init__(self, *, window: float = 1.0):
+        self.window = window
+        self.stats = ReceiptStats()
+        # (phone id, every id of the chat) -> the pending receipt of the chat
+        self._pending: dict[tuple[str, str], _Receipt] = {}
+        self._due: collections.deque[_Receipt] = collections.deque()
+        self._lock = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def __repr__(self) -> str:
+        return f"ReceiptAggregator(window={self.window}, stats={self.stats!r})"
+
+    def __len__(self) -> int:
+        return len(set(self._pending.values()))
+
+    def _take_all(self) -> list[_Receipt]:
+        """Take all the pending receipts (e.g. to flush them)."""
+        with self._lock:
+            receipts = list(dict.fromkeys(self._pending.values()))
+            self._pending.clear()
+        return receipts
+
+    def flush(self) -> None:
+        """Send all the pending receipts now (e.g. before shutting down)."""
+        for receipt in self._take_all():
+            self._send(receipt)
+
+    def _add(
+        self,
+        api: Any,
+        phone_id: str,
+        chat: str,
+        message_id: str,
+        timestamp: datetime.datetime | None,
+        typing: bool,
+        aliases: Iterable[str | None] = (),
+    ) -> None:
+        """Merge a receipt into the pending receipt of the chat (or start a window for it), by every id of the chat."""
+        phone_id = str(phone_id)
+        keys = tuple(
+            dict.fromkeys(
+                (phone_id, _normalize_recipient(user))
+                for user in (chat, *aliases)
+                if user
+            )
+        )
+        with self._lock:
+            self.stats.received += 1
+            receipt = next(
+                (r for key in keys if (r := self._pending.get(key)) is not None), None
+            )
+            if receipt is not None:
+                if (
+                    timestamp is None
+                    or receipt.timestamp is None
+                    or timestamp >= receipt.timestamp
+                ):
+                    receipt.message_id, receipt.timestamp = message_id, timestamp
+                receipt.typing = receipt.typing or typing
+                if new_keys := tuple(key for key in keys if key not in receipt.keys):
+                    receipt.keys += new_keys
+                    self._pending.update(dict.fromkeys(new_keys, receipt))
+                return
+            receipt = _Receipt(
+                api, keys, message_id, timestamp, typing, time.monotonic() + self.window
+            )
+            self._pending.update(dict.fromkeys(keys, receipt))
+            self._schedule(receipt)
+
+    def _take(self, receipt: _Receipt) -> bool:
+        """Take the receipt if it is still pending (called under the lock)."""
+        if self._pending.get(receipt.key) is not receipt:
+            return False  # already sent (by a message to the chat, or by flush)
+        for key in receipt.keys:
+            if self._pending.get(key) is receipt:
+                del self._pending[key]
+        return True
+
+    def _schedule(self, receipt: _Receipt) -> None:
+        """Send the receipt when its window ends (called under the lock)."""
+        self._due.append(receipt)  # the window is fixed, so the deadlines are in order
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="pywa-receipts", daemon=True
+            )
+            self._thread.start()
+        self._lock.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                while not self._due:
+                    self._lock.wait()
+                if (delay := self._due[0].deadline - time.monotonic()) > 0:
+                    self._lock.wait(delay)
+                    continue
+                receipt = self._due.popleft()
+                if not self._take(receipt):
+                    continue
+            self._send(receipt)
+
+    def _pop(self, key: tuple[str, str]) -> _Receipt | None:
+        """Take the pending receipt of a chat by any of its ids (before a message is sent to it)."""
+        phone_id, recipient = key
+        with self._lock:
+            receipt = self._pending.get((phone_id, _normalize_recipient(recipient)))
+            return receipt if receipt is not None and self._take(receipt) else None
+
+    def _send(self, receipt: _Receipt) -> None:
+        phone_id = receipt.key[0]
+        try:
+            if receipt.typing:
+                receipt.api.set_indicator(
+                    phone_id=phone_id, message_id=receipt.message_id, typ="text"
+                )
+            else:
+                receipt.api.mark_message_as_read(
+                    phone_id=phone_id, message_id=receipt.message_id
+                )
+        except Exception:
+            _logger.exception("Failed to mark message %s as read", receipt.message_id)
+            self.stats.failed += 1
+        else:
+            self.stats.sent += 1
@@ -0,0 +1,162 @@
+"""Caching the responses of idempotent reads from the Graph API."""
+
+from __future__ import annotations
+
+__all__ = ["ResponseCache", "ResponseCacheStats"]
+
+import collections
+import copy
+import dataclasses
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, ClassVar
+
+from . import utils
+
+
+@dataclasses.dataclass(slots=True)
+class ResponseCacheStats:
+    """
+    The statistics of a :class:`ResponseCache`.
+
+    Attributes:
+        hits: The number of reads that were answered from the cache.
+        misses: The number of reads that were sent to the Graph API.
+        collapsed: The number of reads that waited for an identical read in flight instead of sending their own.
+        invalidations: The number of entries that were dropped by writes and webhooks.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    collapsed: int = 0
+    invalidations: int = 0
+
+
+class ResponseCache:
+    """
+    Caches the responses of idempotent reads from the Graph API, so handlers can call them on every update.
+
+    - The cached reads are :meth:`~pywa.client.WhatsApp.get_business_profile`,
+      :meth:`~pywa.client.WhatsApp.get_business_phone_number`, :meth:`~pywa.client.WhatsApp.get_commerce_settings`,
+      :meth:`~pywa.client.WhatsApp.get_template` and :meth:`~pywa.client.WhatsApp.get_flow`. Every kind of read has
+      its own TTL (see :attr:`DEFAULT_TTLS`).
+    - Concurrent identical reads are collapsed into a single request: the first one is sent, and the others wait for
+      its response (single-flight).
+    - Entries are invalidated by the matching ``update_*`` and ``delete_*`` calls of the client, and by the related
+      webhooks (template status, quality, category and components updates, flow updates and account updates).
+    - Failed reads and reads inside a :meth:`~pywa.client.WhatsApp.batch` are not cached.
+    - Every worker of the app has its own cache, and a webhook invalidates the cache of the worker that receives it
+      only, so keep the TTLs short when running with many workers.
+
+    Example:
+
+        .. code-block:: python
+
+            from pywa import WhatsApp
+            from pywa.response_cache import ResponseCache
+
+            wa = WhatsApp(..., response_cache=ResponseCache(ttls={"template": 600}))
+
+    Args:
+        ttls: The TTL of every kind of read, in seconds (merged with :attr:`DEFAULT_TTLS`; ``0`` to not cache a kind).
+        max_size: The maximum number of entries to keep (the least recently used entries are dropped).
+    """
+
+    DEFAULT_TTLS: ClassVar[dict[str, float]] = {
+        "business_profile": 300.0,
+        "phone_number": 60.0,
+        "commerce_settings": 300.0,
+        "template": 60.0,
+        "flow": 60.0,
+    }
+    """The default TTL of every kind of read, in seconds."""
+
+    def __init__(self, ttls: dict[str, float] | None = None, *, max_size: int = 1024):
+        if unknown := set(ttls or ()) - self.DEFAULT_TTLS.keys():
+            raise ValueError(f"Unknown kinds of reads: {', '.join(sorted(unknown))}")
+        self.ttls = self.DEFAULT_TTLS | (ttls or {})
+        self.max_size = max_size
+        self.stats = ResponseCacheStats()
+        self._entries: collections.OrderedDict[tuple, tuple[float, Any]] = (
+            collections.OrderedDict()
+        )
+        self._inflight: dict[tuple, Any] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"ResponseCache(size={len(self._entries)}, stats={self.stats!r})"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def invalidate(self, kind: str | None = None, object_id: str | None = None) -> int:
+        """
+        Drop cached responses (and make the reads in flight not cache theirs).
+
+        Args:
+            kind: The kind of reads to drop (e.g. ``"template"``; default: all kinds).
+            object_id: The ID of the object to drop the reads of (e.g. the template ID; default: all objects).
+
+        Returns:
+            The number of entries that were dropped.
+        """
+        object_id = None if object_id is None else str(object_id)
+        with self._lock:
+            self._generation += 1
+            keys = [
+                key
+                for key in self._entries
+                if (kind is None or key[0] == kind)
+                and (object_id is None or key[1] == object_id)
+            ]
+            for key in keys:
+                del self._entries[key]
+            self.stats.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all the cached responses."""
+        self.invalidate()
+
+    def _acquire(
+        self, key: tuple, new_future: Callable[[], Any]
+    ) -> tuple[Any, Any, int | None]:
+        """
+        Get the cached response of the key, or join the read of the key that is in flight, or start it.
+
+        Returns:
+            A tuple of the cached response (or ``MISSING``), the future of the read in flight and the generation of the
+            cache if the caller should send the read (and then :meth:`_release` it), or ``None`` if it should wait.
+        """
+        with self._lock:
+            if (entry := self._entries.get(key)) is not None:
+                if entry[0] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.stats.hits += 1
+                    return copy.deepcopy(entry[1]), None, None
+                del self._entries[key]
+            if (future := self._inflight.get(key)) is not None:
+                self.stats.collapsed += 1
+                return utils.MISSING, future, None
+            future = self._inflight[key] = new_future()
+            self.stats.misses += 1
+            return utils.MISSING, future, self._generation
+
+    def _release(
+        self, key: tuple, generation: int, response: Any = utils.MISSING
+    ) -> None:
+        """Finish the read of the key, and cache its response if nothing was invalidated while it was in flight."""
+        with self._lock:
+            self._inflight.pop(key, None)
+            if (
+                response is utils.MISSING
+                or generation != self._generation
+                or not (ttl := self.ttls[key[0]])
+            ):
+                return
+            self._entries[key] = (time.monotonic() + ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
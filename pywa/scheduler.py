@@ -0,0 +1,261 @@
+"""Sharing the throughput of every phone id between priority classes of sent messages."""
+
+from __future__ import annotations
+
+__all__ = ["OutboundScheduler", "Priority", "PriorityStats", "send_priority"]
+
+import contextlib
+import contextvars
+import dataclasses
+import enum
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, ClassVar
+
+from ._shared import _TokenBucket
+
+
+class Priority(enum.IntEnum):
+    """
+    The priority class of a sent message in an :class:`OutboundScheduler` (see :func:`send_priority`).
+
+    Attributes:
+        INTERACTIVE: Replies to users that are waiting for them (the default of messages that are sent from
+         handlers).
+        TRANSACTIONAL: Messages that are expected soon, such as OTPs and order updates (the default of messages that
+         are sent elsewhere).
+        MARKETING: Bulk messages that can wait (the default of :meth:`~pywa.client.WhatsApp.send_bulk`).
+    """
+
+    INTERACTIVE = 0
+    TRANSACTIONAL = 1
+    MARKETING = 2
+
+
+_current_priority: contextvars.ContextVar[Priority | None] = contextvars.ContextVar(
+    "pywa_send_priority", default=None
+)
+
+
+class _PriorityScope:
+    """Sets the priority of the current context (not a generator context manager, which sets the traceback of the
+    errors that pass through it, and the errors of pywa are frozen)."""
+
+    __slots__ = ("_priority", "_token")
+
+    def __init__(self, priority: Priority):
+        self._priority = priority
+
+    def __enter__(self) -> None:
+        self._token = _current_priority.set(self._priority)
+
+    def __exit__(self, *_) -> None:
+        _current_priority.reset(self._token)
+
+
+def send_priority(priority: Priority) -> contextlib.AbstractContextManager[None]:
+    """
+    Send the messages of the block with a priority class (used by an :class:`OutboundScheduler`).
+
+    Example:
+
+        .. code-block:: python
+
+            from pywa.scheduler import Priority, send_priority
+
+            with send_priority(Priority.TRANSACTIONAL):
+                wa.send_message(to=user, text=f"Your code is {code}")
+
+    Args:
+        priority: The priority class of the messages.
+    """
+    return _PriorityScope(priority)
+
+
+@dataclasses.dataclass(slots=True)
+class PriorityStats:
+    """
+    The queue-time statistics of a priority class of an :class:`OutboundScheduler`.
+
+    Attributes:
+        queued: The number of messages that are waiting now.
+        sent: The number of messages that were let through.
+        total_wait: The total time that the messages waited, in seconds.
+        max_wait: The longest time that a message waited, in seconds.
+    """
+
+    queued: int = 0
+    sent: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def avg_wait(self) -> float:
+        """The average time that the messages waited, in seconds."""
+        return self.total_wait / self.sent if self.sent else 0.0
+
+
+class _Ticket:
+    """A message that waits for its turn in a lane of an :class:`OutboundScheduler`."""
+
+    __slots__ = ("cancelled", "enqueued", "event", "finish", "priority", "seq")
+
+    def __init__(
+        self, finish: float, seq: int, priority: Priority, event: Any, enqueued: float
+    ):
+        self.finish = finish
+        self.seq = seq
+        self.priority = priority
+        self.event = event
+        self.enqueued = enqueued
+        self.cancelled = False
+
+    def __lt__(self, other: _Ticket) -> bool:
+        return (self.finish, self.seq) < (other.finish, other.seq)
+
+
+class _Lane:
+    """The queue and the throughput of a phone id."""
+
+    __slots__ = ("bucket", "finish", "queue", "virtual")
+
+    def __init__(self, bucket: _TokenBucket):
+        self.bucket = bucket
+        self.queue: list[_Ticket] = []
+        self.virtual = 0.0
+        self.finish: dict[Priority, float] = {}
+
+
+class OutboundScheduler:
+    """
+    Shares the throughput of every phone id between priority classes, so replies to users don't wait behind bulk
+    messages.
+
+    - Every phone id sends up to ``rate`` messages per second (with bursts of up to ``burst`` messages). When
+      messages have to wait, they are let through by weighted fair queuing: every :class:`Priority` gets a share
+      of the throughput by its weight, and a message of a class with a higher weight goes ahead of the messages of
+      the other classes that are already waiting (without starving them).
+    - The priority class of a message is set with :func:`send_priority`. Messages that are sent from handlers are
+      :attr:`~Priority.INTERACTIVE`, messages of :meth:`~pywa.client.WhatsApp.send_bulk` are
+      :attr:`~Priority.MARKETING` (or its ``priority``, also from handlers) and the rest are
+      :attr:`~Priority.TRANSACTIONAL`.
+    - Only requests that send messages (to ``/{phone_id}/messages`` with a recipient) are scheduled. Use it with a
+      :class:`~pywa.utils.RateLimiter` to also limit the pair rate of every recipient.
+    - The queue times of every class are in :attr:`stats`.
+
+    Example:
+
+        .. code-block:: python
+
+            from pywa import WhatsApp
+            from pywa.scheduler import OutboundScheduler
+
+            wa = WhatsApp(..., scheduler=OutboundScheduler(rate=80))
+
+    Args:
+        rate: The messages per second of every phone id (Cloud API default throughput: 80).
+        burst: The number of messages that can be sent at once after an idle period (default: ``rate``).
+        weights: The weight of every priority class (merged with :attr:`DEFAULT_WEIGHTS`).
+    """
+
+    DEFAULT_WEIGHTS: ClassVar[dict[Priority, float]] = {
+        Priority.INTERACTIVE: 16.0,
+        Priority.TRANSACTIONAL: 4.0,
+        Priority.MARKETING: 1.0,
+    }
+    """The default weight of every priority class."""
+
+    def __init__(
+        self,
+        *,
+        rate: float = 80.0,
+        burst: float | None = None,
+        weights: dict[Priority, float] | None = None,
+    ):
+        if rate <= 0:
+            raise ValueError("`rate` must be positive")
+        self.weights = self.DEFAULT_WEIGHTS | (weights or {})
+        if any(weight <= 0 for weight in self.weights.values()):
+            raise ValueError("The weights must be positive")
+        self.rate = rate
+        self.burst = max(burst or rate, 1.0)
+        self.stats = {priority: PriorityStats() for priority in Priority}
+        self._lanes: dict[str, _Lane] = {}
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"OutboundScheduler(rate={self.rate}, stats={self.stats!r})"
+
+    def acquire(self, phone_id: str, priority: Priority | None = None) -> float:
+        """
+        Wait until a message from the phone id can be sent (blocking).
+
+        Args:
+            phone_id: The phone id to send the message from.
+            priority: The priority class of the message (default: the class of :func:`send_priority`, or
+             :attr:`~Priority.TRANSACTIONAL`).
+
+        Returns:
+            The time that the message waited, in seconds.
+        """
+        event = threading.Event()
+        ticket, wait = self._enqueue(phone_id, priority, event)
+        try:
+            while not event.wait(wait):
+                wait = self._dispatch(phone_id)
+        except BaseException:
+            self._cancel(ticket)
+            raise
+        return time.monotonic() - ticket.enqueued
+
+    def _enqueue(
+        self, phone_id: str, priority: Priority | None, event: Any
+    ) -> tuple[_Ticket, float | None]:
+        """Queue a message, let through the messages whose turn it is, and get the time to wait before checking."""
+        if priority is None and (priority := _current_priority.get()) is None:
+            priority = Priority.TRANSACTIONAL
+        now = time.monotonic()
+        with self._lock:
+            if (lane := self._lanes.get(phone_id)) is None:
+                lane = self._lanes[phone_id] = _Lane(
+                    _TokenBucket(self.rate, self.burst, now)
+                )
+            start = max(lane.virtual, lane.finish.get(priority, 0.0))
+            lane.finish[priority] = start + 1 / self.weights[priority]
+            ticket = _Ticket(
+                lane.finish[priority], next(self._seq), priority, event, now
+            )
+            heapq.heappush(lane.queue, ticket)
+            self.stats[priority].queued += 1
+            return ticket, self._let_through(lane, now)
+
+    def _dispatch(self, phone_id: str) -> float | None:
+        """Let through the messages whose turn it is, and get the time to wait before checking again."""
+        with self._lock:
+            return self._let_through(self._lanes[phone_id], time.monotonic())
+
+    def _let_through(self, lane: _Lane, now: float) -> float | None:
+        lane.bucket.refill(now)
+        while lane.queue and lane.bucket.tokens >= 1:
+            ticket = heapq.heappop(lane.queue)
+            if ticket.cancelled:
+                continue
+            lane.bucket.tokens -= 1
+            lane.virtual = ticket.finish
+            stats = self.stats[ticket.priority]
+            stats.queued -= 1
+            stats.sent += 1
+            stats.total_wait += (waited := now - ticket.enqueued)
+            stats.max_wait = max(stats.max_wait, waited)
+            ticket.event.set()
+        return lane.bucket.wait() if lane.queue else None
+
+    def _cancel(self, ticket: _Ticket) -> None:
+        """Drop a message that stopped waiting (e.g. a cancelled task) from its queue."""
+        with self._lock:
+            if not ticket.cancelled and not ticket.event.is_set():
+                ticket.cancelled = True
+                self.stats[ticket.priority].queued -= 1
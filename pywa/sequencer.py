@@ -0,0 +1,197 @@
+"""Sending the messages to every recipient one at a time, in the order they were sent."""
+
+from __future__ import annotations
+
+__all__ = ["RecipientSequencer", "SequencerQueueFull", "SequencerStats"]
+
+import collections
+import contextlib
+import dataclasses
+import threading
+from collections.abc import Hashable
+from typing import Any
+
+from ._shared import _normalize_recipient
+
+
+class SequencerQueueFull(Exception):
+    """
+    Raised by a :class:`RecipientSequencer` when too many messages are waiting for a recipient.
+
+    Attributes:
+        phone_id: The phone id that the message was sent from.
+        recipient: The recipient of the message.
+        pending: The number of messages that are waiting for the recipient.
+    """
+
+    def __init__(self, phone_id: str, recipient: str, pending: int):
+        super().__init__(
+            f"{pending} messages from {phone_id} to {recipient} are already waiting"
+        )
+        self.phone_id = phone_id
+        self.recipient = recipient
+        self.pending = pending
+
+
+@dataclasses.dataclass(slots=True)
+class SequencerStats:
+    """
+    The statistics of a :class:`RecipientSequencer`.
+
+    Attributes:
+        sent: The number of messages that got their turn.
+        delayed: The number of messages that waited for earlier messages to the same recipient.
+        rejected: The number of messages that were rejected because the queue of their recipient was full.
+    """
+
+    sent: int = 0
+    delayed: int = 0
+    rejected: int = 0
+
+
+class _Turn:
+    """A message that waits for the messages before it in the queue of its recipient."""
+
+    __slots__ = ("event", "key", "owner")
+
+    def __init__(self, key: tuple[str, str], event: Any, owner: Hashable):
+        self.key = key
+        self.event = event
+        self.owner = owner  # the thread (or the task) that sends the message
+
+
+class _SequenceScope:
+    """Waits for the turn of a message (blocking), and passes the turn to the next message on exit."""
+
+    __slots__ = ("_key", "_sequencer", "_turn")
+
+    def __init__(
+        self, sequencer: RecipientSequencer, phone_id: str | int, recipient: str | int
+    ):
+        self._sequencer = sequencer
+        self._key = (str(phone_id), _normalize_recipient(recipient))
+
+    def __enter__(self) -> None:
+        owner = threading.get_ident()
+        if self._sequencer._holds(self._key, owner):
+            self._turn = None  # sent as a part of the message that holds the turn
+            return
+        event = threading.Event()
+        self._turn = self._sequencer._enqueue(self._key, event, owner)
+        try:
+            event.wait()
+        except BaseException:
+            self._sequencer._release(self._turn)
+            raise
+
+    def __exit__(self, *_) -> None:
+        if self._turn is not None:
+            self._sequencer._release(self._turn)
+
+
+class RecipientSequencer:
+    """
+    Sends the messages to every recipient one at a time, in the order they were sent, while messages to different
+    recipients are sent concurrently.
+
+    - Replies that are sent with the shortcuts of the updates (e.g. ``msg.reply_text(...)``,
+      ``msg.reply_image(...)``, ``msg.react(...)``) and messages of :meth:`~pywa.client.WhatsApp.send_bulk` wait for
+      the earlier messages to the same recipient, including their uploads and retries. In
+      :class:`pywa_async.WhatsApp`, replies that are started together (e.g. with ``asyncio.gather``) are sent in the
+      order they were started.
+    - Up to ``max_pending`` messages can wait for every recipient (besides the one that is being sent). Sending
+      more raises :class:`SequencerQueueFull`.
+    - A recipient is dropped as soon as it has no messages in flight, so the memory is bounded by the recipients
+      that are being messaged.
+    - The sequencer is reentrant: a message to a recipient that is sent by the thread that holds the turn of the
+      recipient (e.g. a reply from the ``send`` function of :meth:`~pywa.client.WhatsApp.send_bulk`) is sent right
+      away, as a part of the message that holds the turn.
+
+    Example:
+
+        .. code-block:: python
+
+            from pywa import WhatsApp
+            from pywa.sequencer import RecipientSequencer
+
+            wa = WhatsApp(..., sequencer=RecipientSequencer())
+
+    Args:
+        max_pending: The maximum number of messages that can wait for every recipient.
+    """
+
+    def __init__(self, *, max_pending: int = 16):
+        self.max_pending = max_pending
+        self.stats = SequencerStats()
+        self._queues: dict[tuple[str, str], collections.deque[_Turn]] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"RecipientSequencer(recipients={len(self._queues)}, stats={self.stats!r})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._queues)
+
+    def sequence(
+        self, phone_id: str, recipient: str
+    ) -> contextlib.AbstractContextManager[None]:
+        """
+        Wait for the turn of a message (blocking), and keep it until the block exits.
+
+        Example:
+
+            .. code-block:: python
+
+                with sequencer.sequence(wa.phone_id, user):
+                    wa.send_message(to=user, text="first")
+                    wa.send_message(to=user, text="second")
+
+        Args:
+            phone_id: The phone id to send the message from.
+            recipient: The recipient of the message.
+
+        Raises:
+            SequencerQueueFull: If ``max_pending`` messages are already waiting for the recipient.
+        """
+        return _SequenceScope(self, phone_id, recipient)
+
+    def _holds(self, key: tuple[str, str], owner: Hashable) -> bool:
+        """Whether the owner (a thread or a task) holds the turn of the recipient."""
+        with self._lock:
+            queue = self._queues.get(key)
+            return queue is not None and queue[0].owner == owner
+
+    def _enqueue(
+        self, key: tuple[str, str], event: Any, owner: Hashable = None
+    ) -> _Turn:
+        """Queue a message of a recipient (the event is set when it is its turn)."""
+        with self._lock:
+            if (queue := self._queues.get(key)) is None:
+                queue = self._queues[key] = collections.deque()
+            elif len(queue) > self.max_pending:
+                self.stats.rejected += 1
+                raise SequencerQueueFull(*key, pending=len(queue) - 1)
+            turn = _Turn(key, event, owner)
+            queue.append(turn)
+            if len(queue) == 1:
+                self.stats.sent += 1
+                event.set()
+            else:
+                self.stats.delayed += 1
+            return turn
+
+    def _release(self, turn: _Turn) -> None:
+        """Pass the turn to the next message of the recipient (or drop a message that stopped waiting)."""
+        with self._lock:
+            queue = self._queues[turn.key]
+            if queue[0] is not turn:
+                queue.remove(turn)
+                return
+            queue.popleft()
+            if queue:
+                self.stats.sent += 1
+                queue[0].event.set()
+            else:
+                del self._queues[turn.key]
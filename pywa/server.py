@@ -11,7 +11,7 @@ from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 from . import _helpers as helpers
-from . import errors, handlers, utils
+from . import errors, handlers, listeners, utils
 from ._logging import (
     ENV_LOG_LEVEL,
     bind_update_logger,
@@ -20,6 +20,7 @@ from ._logging import (
     setup_console_logging,
 )
 from .errors import PywaDeprecationWarning, PywaWarning
+from .scheduler import Priority, send_priority
 from .types import AccountUpdate, MessageType, RawUpdate, UserPreferenceCategory
 from .types.base_update import (
     BaseUpdate,
@@ -97,6 +98,10 @@ class Server:
         # CLI are invoked) guarantees it's applied in the process that actually handles
         # requests, not just in a parent/reloader process that never sees any traffic.
         setup_console_logging(os.environ.get(ENV_LOG_LEVEL, "info"))
+        if self._listener_bus is None and (
+            bus_dir := os.environ.get(listeners.ENV_LISTENER_BUS_DIR)
+        ):
+            self._listener_bus = listeners.UnixSocketListenerBus(bus_dir)
         if self._server_type is not None:
             raise ValueError(
                 "When providing a custom `server` instance to the WhatsApp client, pywa assumes you will handle the webhook routes and server setup yourself. "
@@ -108,11 +113,19 @@ class Server:
                 'Starlette is required to run the built-in server. Please install it using `pip install "pywa[server]"`.'
             ) from None
 
-        if ANYIO_THREADS_LIMIT is not None:
-            thread_limit = ANYIO_THREADS_LIMIT
+        thread_limit = ANYIO_THREADS_LIMIT
+        warm_up = (
+            self._async_allowed
+            and self._api is not None
+            and (
+                self._transport_config.warm_up
+                or self._transport_config.keepalive_refresh
+            )
+        )
 
-            @contextlib.asynccontextmanager
-            async def lifespan(_: StarletteApp):
+        @contextlib.asynccontextmanager
+        async def lifespan(_: StarletteApp):
+            if thread_limit is not None:
                 from anyio.to_thread import current_default_thread_limiter
 
                 current_default_thread_limiter().total_tokens = thread_limit
@@ -120,9 +133,14 @@ class Server:
                     "Set AnyIO default thread limiter to %d threads",
                     thread_limit,
                 )
-                yield
-        else:
-            lifespan = None
+            if warm_up:
+                _logger.debug(
+                    "Warmed up %d connections to the Graph API", await self.warm_up()
+                )
+            yield
+            if warm_up and (refresh_task := self._refresh_task) is not None:
+                refresh_task.cancel()
+                self._refresh_task = None
 
         self._server, self._server_type = (
             StarletteApp(lifespan=lifespan),
@@ -379,9 +397,18 @@ class Server:
             _logger, raw_update._update_hash, self._webhook_endpoint
         )
         start = time.perf_counter()
+        forwarded = False
         handler_type: type[handlers.Handler] | None = None
         try:
             try:
+                if self._api is not None:
+                    self._api._invalidate_cached_by_update(
+                        raw_update.field, raw_update.value
+                    )
+                if self._service_windows is not None:
+                    self._service_windows._record_update(
+                        raw_update.field, raw_update.value
+                    )
                 handler_type = self._get_handler_type(raw_update)
             except (KeyError, ValueError, TypeError, IndexError):
                 log_fn = log.error if self._validate_updates else log.debug
@@ -405,14 +432,19 @@ class Server:
                 ].from_update(client=self, update=raw_update)
                 if log.isEnabledFor(logging.DEBUG):
                     log.debug("Constructed update: %s", constructed_update)
+                if self._forward_to_listener_bus(constructed_update):
+                    log.debug("Forwarded to the worker that listens to the update")
+                    forwarded = True
+                    return
                 if self._process_listener(constructed_update):
                     return
                 self._invoke_callbacks(handler_type, constructed_update)
             except Exception:
                 log.exception("Failed to construct update (field=%s)", raw_update.field)
         finally:
-            # Always call raw update handler last
-            self._call_raw_update_handler(raw_update)
+            # Always call raw update handler last (forwarded updates are handled by the listening worker)
+            if not forwarded:
+                self._call_raw_update_handler(raw_update)
             log.info(
                 "Finished processing update (handler=%s) in %.2fms",
                 handler_type.__name__ if handler_type else None,
@@ -442,7 +474,8 @@ class Server:
                 if checked_update is None:
                     continue
                 log.debug("Calling '%s'", callback_name)
-                handler._callback(self, checked_update)
+                with send_priority(Priority.INTERACTIVE):
+                    handler._callback(self, checked_update)
                 handled = True
             except StopHandling:
                 log.debug("Stopped further handling after '%s'", callback_name)
@@ -463,6 +496,8 @@ class Server:
 
     def _process_listener(self: "WhatsApp", update: BaseUpdate) -> bool:
         """Process and answer a listener if present."""
+        if not self._listeners_restored:
+            self.restore_listeners()
         if not (listener_identifiers := update.listener_identifiers):
             return False
         raw = getattr(update, "raw", None)
@@ -0,0 +1,376 @@
+"""Tracking the customer service window of every user, from the incoming messages."""
+
+from __future__ import annotations
+
+__all__ = ["ServiceWindowStats", "ServiceWindowTracker"]
+
+import dataclasses
+import datetime
+import pathlib
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from . import errors
+from ._shared import _normalize_recipient
+
+
+@dataclasses.dataclass(slots=True)
+class ServiceWindowStats:
+    """
+    The statistics of a :class:`ServiceWindowTracker`.
+
+    Attributes:
+        recorded: The number of incoming messages that were recorded.
+        blocked: The number of free-form messages that failed fast because the window of the user was closed.
+        routed: The number of messages of :meth:`~pywa.client.WhatsApp.send_message` that were sent as a template
+         instead, by the ``fallback``.
+        swept: The number of expired windows that were dropped.
+    """
+
+    recorded: int = 0
+    blocked: int = 0
+    routed: int = 0
+    swept: int = 0
+
+
+class ServiceWindowTracker:
+    """
+    Tracks the customer service window of every user: the 24 hours after the last message of the user, in which
+    free-form messages can be sent (outside of it, only templates can be sent).
+
+    - Fed by the messages that the client receives from the users (every incoming message webhook, before the
+      handlers), per phone id and user. The ids of a user in the webhooks (the phone number and the business-scoped
+      user ID) are linked to one window, and phone numbers match in any format (e.g. ``+1 (555) 123-4567``).
+    - Free-form messages (anything but templates) to a user whose window is closed fail fast with
+      :class:`~pywa.errors.ReEngagementMessage`, without a request. Provide a ``fallback`` to send a template
+      instead from :meth:`~pywa.client.WhatsApp.send_message`.
+    - A user that the tracker has no messages of is considered closed only after the tracker has been tracking for a
+      full window, so a new tracker doesn't block the users that messaged before it was created.
+    - The windows are kept compactly (the time as integer seconds, and phone numbers as integers), and the expired
+      windows are swept every ``sweep_interval``.
+    - The windows are kept in memory, per process. When the webhooks are received by many workers, provide a
+      ``path`` to keep them in an SQLite file that is shared between the processes (and survives restarts).
+      ``pywa run --workers N`` refuses to start with an in-memory tracker, which would block the users that messaged
+      the other workers.
+    - Group messages are not tracked.
+
+    Example:
+
+        .. code-block:: python
+
+            from pywa import WhatsApp
+            from pywa.service_windows import ServiceWindowTracker
+            from pywa.types.templates import TemplateLanguage
+
+            wa = WhatsApp(
+                ...,
+                service_windows=ServiceWindowTracker(
+                    fallback=lambda to, text: {
+                        "name": "follow_up",
+                        "language": TemplateLanguage.ENGLISH_US,
+                    },
+                ),
+            )
+
+    Args:
+        window: The length of the customer service window.
+        sweep_interval: The time between sweeps of the expired windows.
+        path: A path to an SQLite file to keep the windows in (optional, created if missing).
+        fallback: A function that gets the recipient and the text of a :meth:`~pywa.client.WhatsApp.send_message`
+         to a user whose window is closed, and returns the arguments of :meth:`~pywa.client.WhatsApp.send_template`
+         to send instead (or ``None`` to fail fast anyway).
+    """
+
+    def __init__(
+        self,
+        *,
+        window: datetime.timedelta = datetime.timedelta(hours=24),
+        sweep_interval: datetime.timedelta = datetime.timedelta(minutes=10),
+        path: str | pathlib.Path | None = None,
+        fallback: Callable[[str, str], dict[str, Any] | None] | None = None,
+    ):
+        self.window = int(window.total_seconds())
+        self.sweep_interval = sweep_interval.total_seconds()
+        self.fallback = fallback
+        self.stats = ServiceWindowStats()
+        # phone id -> user -> the time of the last message of the user (integer seconds)
+        self._windows: dict[str, dict[int | str, int]] = {}
+        # another id of a user -> the id that the windows of the user are kept by
+        self._aliases: dict[int | str, int | str] = {}
+        self._lock = threading.Lock()
+        self._swept_at = time.time()
+        self._started_at = int(self._swept_at)
+        self._db: sqlite3.Connection | None = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            with self._db:
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS service_windows (phone_id TEXT, user TEXT, last_at INTEGER,"
+                    " PRIMARY KEY (phone_id, user)) WITHOUT ROWID"
+                )
+                self._db.execute(
+                    "CREATE INDEX IF NOT EXISTS service_windows_last_at ON service_windows (last_at)"
+                )
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS service_window_aliases (alias TEXT PRIMARY KEY, user TEXT)"
+                    " WITHOUT ROWID"
+                )
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS service_windows_meta (key TEXT PRIMARY KEY, value INTEGER)"
+                )
+                self._db.execute(
+                    "INSERT OR IGNORE INTO service_windows_meta VALUES ('started_at', ?)",
+                    (self._started_at,),
+                )
+                (self._started_at,) = self._db.execute(
+                    "SELECT value FROM service_windows_meta WHERE key = 'started_at'"
+                ).fetchone()
+
+    def __repr__(self) -> str:
+        return f"ServiceWindowTracker(users={len(self)}, stats={self.stats!r})"
+
+    def __len__(self) -> int:
+        with self._lock:
+            if self._db is not None:
+                return self._db.execute(
+                    "SELECT COUNT(*) FROM service_windows"
+                ).fetchone()[0]
+            return sum(len(users) for users in self._windows.values())
+
+    @staticmethod
+    def _user_key(user: str | int) -> int | str:
+        """Phone numbers are kept as integers (a fraction of the size of a string), without their formatting."""
+        user = _normalize_recipient(user)
+        return int(user) if user.isdigit() and user[0] != "0" else user
+
+    def _resolve(self, key: int | str) -> int | str:
+        """Get the id that the windows of a user are kept by (called with the lock held)."""
+        if self._db is not None:
+            row = self._db.execute(
+                "SELECT user FROM service_window_aliases WHERE alias = ?", (str(key),)
+            ).fetchone()
+            return self._user_key(row[0]) if row is not None else key
+        return self._aliases.get(key, key)
+
+    def _link(self, users: Iterable[str | int]) -> int | str:
+        """Link the ids of a user to one window (merging the windows of the ids), and return the id that it is kept by."""
+        keys = list(dict.fromkeys(self._user_key(user) for user in users))
+        with self._lock:
+            resolved = [self._resolve(key) for key in keys]
+            user = next(
+                (to for key, to in zip(keys, resolved) if to != key), resolved[0]
+            )
+            for key, to in zip(keys, resolved):
+                if key != user and to != user:
+                    self._alias(key, user)
+        return user
+
+    def _alias(self, key: int | str, user: int | str) -> None:
+        """Keep the windows of ``key`` by ``user`` (called with the lock held)."""
+        if self._db is not None:
+            with self._db:
+                self._db.execute(
+                    "INSERT INTO service_windows SELECT phone_id, ?, last_at FROM service_windows WHERE user = ?"
+                    " ON CONFLICT (phone_id, user) DO UPDATE SET last_at = max(last_at, excluded.last_at)",
+                    (str(user), str(key)),
+                )
+                if self._db.execute(
+                    "DELETE FROM service_windows WHERE user = ?", (str(key),)
+                ).rowcount:
+                    self._db.execute(
+                        "UPDATE service_window_aliases SET user = ? WHERE user = ?",
+                        (str(user), str(key)),
+                    )
+                self._db.execute(
+                    "INSERT OR REPLACE INTO service_window_aliases VALUES (?, ?)",
+                    (str(key), str(user)),
+                )
+            return
+        merged = False
+        for users in self._windows.values():
+            if (at := users.pop(key, None)) is not None:
+                merged = True
+                if at > users.get(user, 0):
+                    users[user] = at
+        if merged:  # the aliases of the key, if it was kept by itself
+            for alias, to in self._aliases.items():
+                if to == key:
+                    self._aliases[alias] = user
+        self._aliases[key] = user
+
+    def record(
+        self,
+        phone_id: str | int,
+        user: str | int,
+        timestamp: datetime.datetime | float | None = None,
+    ) -> None:
+        """
+        Record a message of a user (it opens or extends the window of the user).
+
+        Args:
+            phone_id: The phone id that received the message.
+            user: The phone number or the business-scoped user ID of the user.
+            timestamp: The time of the message (default: now).
+        """
+        if isinstance(timestamp, datetime.datetime):
+            timestamp = timestamp.timestamp()
+        at = int(time.time() if timestamp is None else timestamp)
+        phone_id, key = str(phone_id), self._user_key(user)
+        with self._lock:
+            self.stats.recorded += 1
+            key = self._resolve(key)
+            if self._db is not None:
+                with self._db:
+                    self._db.execute(
+                        "INSERT INTO service_windows VALUES (?, ?, ?) ON CONFLICT (phone_id, user)"
+                        " DO UPDATE SET last_at = max(last_at, excluded.last_at)",
+                        (phone_id, str(key), at),
+                    )
+            else:
+                users = self._windows.setdefault(phone_id, {})
+                if at > users.get(key, 0):
+                    users[key] = at
+        if time.time() - self._swept_at >= self.sweep_interval:
+            self.sweep()
+
+    def last_message_at(
+        self, phone_id: str | int, user: str | int
+    ) -> datetime.datetime | None:
+        """
+        Get the time of the last message of a user (that was recorded and did not expire).
+
+        Args:
+            phone_id: The phone id that received the message.
+            user: The phone number or the business-scoped user ID of the user.
+
+        Returns:
+            The time of the message, or ``None`` if there is none.
+        """
+        if (at := self._last_at(str(phone_id), self._user_key(user))) is None:
+            return None
+        return datetime.datetime.fromtimestamp(at, datetime.timezone.utc)
+
+    def is_open(self, phone_id: str | int, user: str | int) -> bool | None:
+        """
+        Check if free-form messages can be sent to a user.
+
+        Args:
+            phone_id: The phone id to send the messages from.
+            user: The phone number or the business-scoped user ID of the user.
+
+        Returns:
+            Whether the window of the user is open, or ``None`` if it is unknown (the user did not message since
+            the tracker was created, and the tracker has been tracking for less than a window).
+        """
+        now = time.time()
+        at = self._last_at(str(phone_id), self._user_key(user))
+        if at is not None and now - at < self.window:
+            return True
+        return False if now - self._started_at >= self.window else None
+
+    def sweep(self) -> int:
+        """
+        Drop the expired windows (called every ``sweep_interval`` by :meth:`record`).
+
+        Returns:
+            The number of windows that were dropped.
+        """
+        now = time.time()
+        cutoff = int(now) - self.window
+        with self._lock:
+            self._swept_at = now
+            if self._db is not None:
+                with self._db:
+                    swept = self._db.execute(
+                        "DELETE FROM service_windows WHERE last_at <= ?", (cutoff,)
+                    ).rowcount
+                    self._db.execute(
+                        "DELETE FROM service_window_aliases WHERE user NOT IN (SELECT user FROM service_windows)"
+                    )
+            else:
+                swept = 0
+                for phone_id, users in list(self._windows.items()):
+                    kept = {user: at for user, at in users.items() if at > cutoff}
+                    swept += len(users) - len(kept)
+                    if kept:
+                        self._windows[phone_id] = (
+                            kept  # a new dict, without the space of the dropped entries
+                        )
+                    else:
+                        del self._windows[phone_id]
+                if swept:
+                    live = {user for users in self._windows.values() for user in users}
+                    self._aliases = {
+                        alias: user
+                        for alias, user in self._aliases.items()
+                        if user in live
+                    }
+            self.stats.swept += swept
+        return swept
+
+    def _last_at(self, phone_id: str, key: int | str) -> int | None:
+        with self._lock:
+            key = self._resolve(key)
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT last_at FROM service_windows WHERE phone_id = ? AND user = ?",
+                    (phone_id, str(key)),
+                ).fetchone()
+                return row[0] if row is not None else None
+            return self._windows.get(phone_id, {}).get(key)
+
+    def _record_update(self, field: str, value: dict) -> None:
+        """Record the messages of an incoming messages webhook."""
+        if (
+            field != "messages"
+            or not (messages := value.get("messages"))
+            or not (phone_id := (value.get("metadata") or {}).get("phone_number_id"))
+        ):
+            return
+        contact = (value.get("contacts") or ({},))[0]
+        for message in messages:
+            if message.get("group_id") or not message.get("timestamp"):
+                continue
+            if ids := [
+                user
+                for user in (
+                    message.get("from"),
+                    contact.get("wa_id"),
+                    contact.get("user_id"),
+                )
+                if user
+            ]:
+                self.record(phone_id, self._link(ids), int(message["timestamp"]))
+
+    def _check(self, phone_id: str, recipient: str, payload: dict) -> None:
+        """Fail fast before sending a free-form message to a user whose window is closed."""
+        if (
+            payload.get("type") == "template"
+            or payload.get("recipient_type") == "group"
+        ):
+            return
+        if self.is_open(phone_id, recipient) is False:
+            with self._lock:
+                self.stats.blocked += 1
+            raise errors.WhatsAppError.from_dict(
+                {
+                    "code": 131047,
+                    "message": "Re-engagement message",
+                    "error_data": {
+                        "details": f"The customer service window of {recipient} is closed (by the service_windows"
+                        f" tracker, the message was not sent)"
+                    },
+                }
+            )
+
+    def _route(self, phone_id: str, to: str | int, text: str) -> dict[str, Any] | None:
+        """Get the arguments of the template to send instead of a text message to a user whose window is closed."""
+        if self.fallback is None or self.is_open(phone_id, to) is not False:
+            return None
+        if (template := self.fallback(str(to), text)) is not None:
+            with self._lock:
+                self.stats.routed += 1
+        return template
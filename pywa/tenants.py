@@ -0,0 +1,184 @@
+"""Clients for many businesses (tenants) that share a single connection pool."""
+
+from __future__ import annotations
+
+__all__ = ["Tenant", "TenantClients"]
+
+import collections
+import dataclasses
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+
+from .client import WhatsApp
+from .transport import InstrumentedTransport, TransportConfig, TransportStats
+
+
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
+class Tenant:
+    """
+    The credentials of a business that the app sends messages for (e.g. a business that was onboarded with
+    `Embedded Signup <https://developers.facebook.com/docs/whatsapp/embedded-signup>`_).
+
+    Attributes:
+        token: The access token of the business.
+        phone_id: The ID of the phone number to send messages from (optional).
+        waba_id: The ID of the WhatsApp Business Account of the business (optional).
+    """
+
+    token: str
+    phone_id: str | int | None = None
+    waba_id: str | int | None = None
+
+
+class TenantClients:
+    """
+    Creates a :class:`~pywa.client.WhatsApp` client for every tenant, with all the clients sharing a single connection
+    pool (instead of a pool, and TLS handshakes, per tenant).
+
+    - The clients send the token of their tenant with every request, so they can share the pool safely.
+    - Clients are created on first use (by ``resolve``) or by :meth:`add`, and up to ``max_clients`` clients are
+      kept (the least recently used are dropped, and created again when needed).
+    - The clients are created without a server. Receive the webhooks of all the tenants with a single client (with
+      ``filter_updates=False``), and use the ``waba_id`` of the update to pick the client of the tenant.
+
+    Example:
+
+        .. code-block:: python
+
+            from pywa.tenants import Tenant, TenantClients
+            from pywa.transport import TransportConfig
+
+            clients = TenantClients(
+                resolve=lambda tenant_id: Tenant(
+                    token=db.get_token(tenant_id), phone_id=db.get_phone_id(tenant_id)
+                ),
+                transport=TransportConfig(max_connections=200),
+                api_version="23.0",
+            )
+
+            clients.get("acme").send_message(to="972123456789", text="Hello from Acme!")
+
+    Args:
+        resolve: A function that gets the :class:`Tenant` of a tenant ID that has no client yet (default: only tenants
+         that were added with :meth:`add`).
+        session: The ``httpx.Client`` to share between the clients (default: one that is created from ``transport``).
+        transport: The connection pool configuration of the shared session. Can't be used with ``session``.
+        max_clients: The maximum number of clients to keep.
+        **client_kwargs: Arguments for every client (e.g. ``api_version``, ``retry_policy``, ``rate_limiter``).
+    """
+
+    _client_cls = WhatsApp
+    _httpx_client = httpx.Client
+    _transport_cls = InstrumentedTransport
+
+    def __init__(
+        self,
+        resolve: Callable[[str], Tenant] | None = None,
+        *,
+        session: httpx.Client | None = None,
+        transport: TransportConfig | None = None,
+        max_clients: int = 10_000,
+        **client_kwargs: Any,
+    ):
+        if session is not None and transport is not None:
+            raise ValueError(
+                "The `transport` configures the session that pywa creates, so it can't be used with a custom `session`."
+            )
+        self._transport = None
+        if session is None:
+            config = transport or TransportConfig()
+            self._transport = self._transport_cls(config)
+            session = self._httpx_client(
+                transport=self._transport, timeout=config.timeout
+            )
+        self.session = session
+        self.max_clients = max_clients
+        self._resolve = resolve
+        self._client_kwargs = client_kwargs
+        self._clients: collections.OrderedDict[str, WhatsApp] = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(clients={len(self._clients)})"
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __contains__(self, tenant_id: str) -> bool:
+        return str(tenant_id) in self._clients
+
+    @property
+    def stats(self) -> TransportStats | None:
+        """The statistics of the shared connection pool (``None`` if a custom ``session`` is used)."""
+        return None if self._transport is None else self._transport.stats
+
+    def add(self, tenant_id: str, tenant: Tenant) -> WhatsApp:
+        """
+        Create the client of a tenant (or replace it, e.g. when the token of the tenant is rotated).
+
+        Args:
+            tenant_id: The ID of the tenant.
+            tenant: The credentials of the tenant.
+
+        Returns:
+            The client of the tenant.
+        """
+        client = self._client_cls(
+            phone_id=tenant.phone_id,
+            token=tenant.token,
+            waba_id=tenant.waba_id,
+            session=self.session,
+            **self._client_kwargs,
+        )
+        with self._lock:
+            self._clients[str(tenant_id)] = client
+            self._clients.move_to_end(str(tenant_id))
+            while len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+        return client
+
+    def _cached(self, tenant_id: str) -> WhatsApp | None:
+        with self._lock:
+            if (client := self._clients.get(tenant_id)) is not None:
+                self._clients.move_to_end(tenant_id)
+            return client
+
+    def get(self, tenant_id: str) -> WhatsApp:
+        """
+        Get the client of a tenant (created by ``resolve`` on first use).
+
+        Args:
+            tenant_id: The ID of the tenant.
+
+        Returns:
+            The client of the tenant.
+
+        Raises:
+            KeyError: If the tenant has no client and there is no ``resolve`` function.
+        """
+        if (client := self._cached(str(tenant_id))) is not None:
+            return client
+        if self._resolve is None:
+            raise KeyError(tenant_id)
+        return self.add(tenant_id, self._resolve(str(tenant_id)))
+
+    def remove(self, tenant_id: str) -> None:
+        """
+        Drop the client of a tenant (e.g. when the tenant is offboarded).
+
+        Args:
+            tenant_id: The ID of the tenant.
+        """
+        with self._lock:
+            self._clients.pop(str(tenant_id), None)
+
+    def close(self) -> None:
+        """Drop all the clients and close the shared session."""
+        with self._lock:
+            self._clients.clear()
+        self.session.close()
@@ -0,0 +1,738 @@
+"""
+A fake WhatsApp Cloud API for offline integration and load tests (no requests are sent to Meta).
+
+Example:
+
+    .. code-block:: python
+
+        import random
+        import httpx
+        from pywa import WhatsApp
+        from pywa.testing import FakeGraphAPI, RATE_LIMIT_HIT
+
+        # ~50ms median latency, and 1% of the sends are rate limited
+        fake = FakeGraphAPI(latency=lambda: random.lognormvariate(-3, 0.5))
+        fake.inject(RATE_LIMIT_HIT, endpoint="/messages", rate=0.01, times=None)
+
+        wa = WhatsApp(  # use httpx.AsyncClient with pywa_async
+            phone_id="1234567890",
+            token="fake",
+            session=httpx.Client(transport=fake.transport),
+        )
+        wa.send_message(to="972123456789", text="Hello")
+
+        for update in fake.pop_webhooks():  # the sent, delivered and read statuses
+            wa.webhook_update_handler(update)
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "RATE_LIMIT_HIT",
+    "SERVICE_UNAVAILABLE",
+    "SPAM_RATE_LIMIT_HIT",
+    "TOO_MANY_API_CALLS",
+    "TOO_MANY_MESSAGES",
+    "UNKNOWN_ERROR",
+    "FakeError",
+    "FakeGraphAPI",
+    "FakeTransport",
+]
+
+import asyncio
+import base64
+import collections
+import dataclasses
+import datetime
+import email.parser
+import hashlib
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import httpx
+
+
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
+class FakeError:
+    """
+    An error that the :class:`FakeGraphAPI` returns, in the format of the Graph API (so it is raised as the matching
+    :class:`~pywa.errors.WhatsAppError` subclass).
+
+    Attributes:
+        status_code: The HTTP status code of the response.
+        code: The error code (see `Error codes <https://developers.facebook.com/docs/whatsapp/cloud-api/support/error-codes>`_).
+        message: The error message.
+        type: The error type.
+        is_transient: Whether the error is transient (optional).
+        retry_after: The value of the ``Retry-After`` header, in seconds (optional).
+    """
+
+    status_code: int
+    code: int
+    message: str
+    type: str = "OAuthException"
+    is_transient: bool | None = None
+    retry_after: int | None = None
+
+    def to_response(self) -> httpx.Response:
+        """Get the response of the error."""
+        error = {
+            "message": self.message,
+            "type": self.type,
+            "code": self.code,
+            "fbtrace_id": "AfakeTraceId",
+        }
+        if self.is_transient is not None:
+            error["is_transient"] = self.is_transient
+        return httpx.Response(
+            self.status_code,
+            json={"error": error},
+            headers={"Retry-After": str(self.retry_after)}
+            if self.retry_after is not None
+            else None,
+        )
+
+
+RATE_LIMIT_HIT = FakeError(
+    status_code=400, code=130429, message="(#130429) Rate limit hit"
+)
+SPAM_RATE_LIMIT_HIT = FakeError(
+    status_code=400,
+    code=131048,
+    message="(#131048) Spam rate limit hit",
+)
+TOO_MANY_MESSAGES = FakeError(
+    status_code=400,
+    code=131056,
+    message="(#131056) (Business Account, Consumer Account) pair rate limit hit",
+)
+TOO_MANY_API_CALLS = FakeError(
+    status_code=400,
+    code=4,
+    message="(#4) Application request limit reached",
+    is_transient=True,
+)
+SERVICE_UNAVAILABLE = FakeError(
+    status_code=503,
+    code=131016,
+    message="(#131016) Service unavailable",
+    is_transient=True,
+)
+UNKNOWN_ERROR = FakeError(
+    status_code=500,
+    code=131000,
+    message="(#131000) Something went wrong",
+    is_transient=True,
+)
+_INVALID_TOKEN = FakeError(
+    status_code=401, code=190, message="Invalid OAuth access token."
+)
+
+_MEDIA_PATH = "/whatsapp_business/attachments/"
+_VERSION_PREFIX = re.compile(r"^/v\d+(?:\.\d+)?")
+
+
+@dataclasses.dataclass(slots=True)
+class _Fault:
+    error: FakeError
+    endpoint: re.Pattern | None
+    remaining: int | None
+    rate: float
+
+
+class FakeTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    An ``httpx`` transport that answers the requests by a :class:`FakeGraphAPI` (for both ``httpx.Client`` and
+    ``httpx.AsyncClient``).
+
+    Args:
+        api: The fake API to answer the requests by.
+    """
+
+    def __init__(self, api: FakeGraphAPI):
+        self.api = api
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        body = request.read()
+        if delay := self.api._latency():
+            time.sleep(delay)
+        return self.api.handle(request, body)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        if delay := self.api._latency():
+            await asyncio.sleep(delay)
+        return self.api.handle(request, body)
+
+
+class FakeGraphAPI:
+    """
+    A fake of the WhatsApp Cloud API, for integration and load tests that run on one box.
+
+    - Covers the endpoints of messages (including marketing messages, read receipts and typing indicators), media
+      (upload, get URL, download and delete), templates and flows, with pagination of the lists (``limit``,
+      ``after`` and ``before``).
+    - Answers after a configurable ``latency`` (a number of seconds, or a function that samples a distribution).
+    - Returns injected errors with the real error codes (see :meth:`inject`), e.g. :data:`RATE_LIMIT_HIT`
+      and :data:`SERVICE_UNAVAILABLE`.
+    - Generates the status webhooks (``sent``, ``delivered`` and ``read``) of every sent message (see
+      :meth:`pop_webhooks`).
+    - Use it with :attr:`transport` (``httpx.Client(transport=fake.transport)``), or serve it as an ASGI app (e.g.
+      ``uvicorn.run(fake)``).
+
+    Args:
+        latency: The time to answer every request, in seconds, or a function that returns it (default: no latency).
+        statuses: The statuses to generate webhooks for, for every sent message.
+        waba_id: The ID of the WhatsApp Business Account in the generated webhooks.
+        display_phone_number: The display phone number in the generated webhooks.
+        template_status: The status of the created templates.
+        seed: A seed for the randomness of the injected errors (for reproducible runs).
+
+    Attributes:
+        messages: The sent messages (the payloads, with the ``id`` that was returned).
+        receipts: The read receipts and typing indicators (the payloads).
+        media: The uploaded media, by ID (``(bytes, mime_type)``).
+        files: The files that were uploaded with the Resumable Upload API (e.g. template header examples), by handle.
+        templates: The created templates, by ID.
+        flows: The created flows, by ID.
+        calls: The number of requests, per endpoint (e.g. ``"POST /{phone_id}/messages"``).
+    """
+
+    transport: FakeTransport
+
+    _ROUTES = tuple(
+        (method, re.compile(pattern), handler)
+        for method, pattern, handler in (
+            ("POST", r"/(?P<phone_id>[^/]+)/(?:marketing_)?messages", "_send_message"),
+            ("POST", r"/(?P<phone_id>[^/]+)/media", "_upload_media"),
+            ("POST", r"/(?P<app_id>[^/]+)/uploads", "_create_upload_session"),
+            ("POST", r"/(?P<session_id>upload:[^/]+)", "_upload_file"),
+            ("GET", r"/(?P<waba_id>[^/]+)/message_templates", "_get_templates"),
+            ("POST", r"/(?P<waba_id>[^/]+)/message_templates", "_create_template"),
+            ("DELETE", r"/(?P<waba_id>[^/]+)/message_templates", "_delete_template"),
+            ("GET", r"/(?P<waba_id>[^/]+)/flows", "_get_flows"),
+            ("POST", r"/(?P<waba_id>[^/]+)/flows", "_create_flow"),
+            ("GET", r"/(?P<flow_id>[^/]+)/assets", "_get_flow_assets"),
+            ("POST", r"/(?P<flow_id>[^/]+)/assets", "_update_flow_json"),
+            (
+                "POST",
+                r"/(?P<flow_id>[^/]+)/(?P<action>publish|deprecate)",
+                "_set_flow_status",
+            ),
+            ("GET", r"/(?P<object_id>[^/]+)", "_get_object"),
+            ("POST", r"/(?P<object_id>[^/]+)", "_update_object"),
+            ("DELETE", r"/(?P<object_id>[^/]+)", "_delete_object"),
+        )
+    )
+
+    def __init__(
+        self,
+        *,
+        latency: float | Callable[[], float] = 0.0,
+        statuses: Iterable[str] = ("sent", "delivered", "read"),
+        waba_id: str = "1234567890",
+        display_phone_number: str = "15550000000",
+        template_status: str = "APPROVED",
+        seed: int | None = None,
+    ):
+        self.latency = latency
+        self.statuses = tuple(statuses)
+        self.waba_id = waba_id
+        self.display_phone_number = display_phone_number
+        self.template_status = template_status
+        self.messages: list[dict] = []
+        self.receipts: list[dict] = []
+        self.media: dict[str, tuple[bytes, str]] = {}
+        self.files: dict[str, bytes] = {}
+        self.templates: dict[str, dict] = {}
+        self.flows: dict[str, dict] = {}
+        self.calls: collections.Counter[str] = collections.Counter()
+        self.transport = FakeTransport(self)
+        self._webhooks: collections.deque[bytes] = collections.deque()
+        self._faults: list[_Fault] = []
+        self._ids = itertools.count(1)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"FakeGraphAPI(messages={len(self.messages)}, webhooks={len(self._webhooks)})"
+
+    def inject(
+        self,
+        error: FakeError,
+        *,
+        endpoint: str | None = None,
+        times: int | None = 1,
+        rate: float = 1.0,
+    ) -> None:
+        """
+        Return an error instead of answering requests.
+
+        Example:
+
+            >>> fake.inject(SERVICE_UNAVAILABLE, times=2)  # the next 2 requests fail
+            >>> fake.inject(
+            ...     TOO_MANY_MESSAGES, endpoint="/messages", rate=0.05, times=None
+            ... )  # 5% of the sends, forever
+
+        Args:
+            error: The error to return (e.g. :data:`RATE_LIMIT_HIT`).
+            endpoint: A regex of the paths to fail (e.g. ``"/messages$"``, default: all the paths).
+            times: The number of requests to fail (``None`` for no limit).
+            rate: The fraction of the matching requests to fail (between 0 and 1).
+        """
+        with self._lock:
+            self._faults.append(
+                _Fault(
+                    error=error,
+                    endpoint=re.compile(endpoint) if endpoint is not None else None,
+                    remaining=times,
+                    rate=rate,
+                )
+            )
+
+    def clear_errors(self) -> None:
+        """Remove all the injected errors."""
+        with self._lock:
+            self._faults.clear()
+
+    def pop_webhooks(self, limit: int | None = None) -> list[bytes]:
+        """
+        Get the pending webhooks (oldest first), e.g. to pass them to ``wa.webhook_update_handler``.
+
+        Args:
+            limit: The maximum number of webhooks to get (default: all).
+
+        Returns:
+            The bodies of the webhooks.
+        """
+        with self._lock:
+            count = len(self._webhooks) if limit is None else limit
+            return [
+                self._webhooks.popleft() for _ in range(min(count, len(self._webhooks)))
+            ]
+
+    def handle(self, request: httpx.Request, body: bytes) -> httpx.Response:
+        """
+        Answer a request (without the latency).
+
+        Args:
+            request: The request.
+            body: The body of the request.
+
+        Returns:
+            The response.
+        """
+        path = _VERSION_PREFIX.sub("", request.url.path).rstrip("/") or "/"
+        with self._lock:
+            if (error := self._pop_fault(path)) is not None:
+                return error.to_response()
+            if path.startswith(_MEDIA_PATH):
+                return self._download_media(path.removeprefix(_MEDIA_PATH))
+            if not request.headers.get("Authorization", "").startswith("Bearer "):
+                return _INVALID_TOKEN.to_response()
+            for method, pattern, handler in self._ROUTES:
+                if method == request.method and (match := pattern.fullmatch(path)):
+                    self.calls[f"{method} {_route_name(pattern)}"] += 1
+                    res = getattr(self, handler)(request, body, **match.groupdict())
+                    return (
+                        res
+                        if isinstance(res, httpx.Response)
+                        else httpx.Response(200, json=res)
+                    )
+        return FakeError(
+            status_code=400,
+            code=100,
+            type="GraphMethodException",
+            message=f"Unsupported {request.method.lower()} request.",
+        ).to_response()
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        """Serve the fake API as an ASGI app."""
+        if scope["type"] == "lifespan":
+            while (message := await receive())["type"] != "lifespan.shutdown":
+                await send({"type": "lifespan.startup.complete"})
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        host, port = scope.get("server") or ("localhost", None)
+        request = httpx.Request(
+            scope["method"],
+            httpx.URL(
+                scheme=scope.get("scheme", "http"),
+                host=host,
+                port=port,
+                path=scope["path"],
+                query=scope.get("query_string", b""),
+            ),
+            headers=[
+                (k.decode("latin-1"), v.decode("latin-1")) for k, v in scope["headers"]
+            ],
+            content=body,
+        )
+        if delay := self._latency():
+            await asyncio.sleep(delay)
+        response = self.handle(request, body)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": response.headers.raw,
+            }
+        )
+        await send({"type": "http.response.body", "body": response.content})
+
+    def _latency(self) -> float:
+        return self.latency() if callable(self.latency) else self.latency
+
+    def _pop_fault(self, path: str) -> FakeError | None:
+        for fault in self._faults:
+            if (fault.endpoint is None or fault.endpoint.search(path)) and (
+                fault.rate >= 1 or self._random.random() < fault.rate
+            ):
+                if fault.remaining is not None:
+                    fault.remaining -= 1
+                    if fault.remaining <= 0:
+                        self._faults.remove(fault)
+                return fault.error
+        return None
+
+    def _new_id(self) -> str:
+        return str(next(self._ids))
+
+    def _send_message(self, request: httpx.Request, body: bytes, phone_id: str) -> dict:
+        payload = json.loads(body)
+        if "status" in payload:  # read receipt or typing indicator
+            self.receipts.append(payload)
+            return {"success": True}
+        wamid = f"wamid.{base64.b64encode(f'fake.{self._new_id()}'.encode()).decode()}"
+        self.messages.append({**payload, "id": wamid})
+        user = payload.get("to") or payload.get("recipient")
+        for status in self.statuses:
+            self._webhooks.append(
+                self._status_webhook(phone_id, wamid, user, status, payload)
+            )
+        message = {"id": wamid}
+        if payload.get("type") == "template":
+            message["message_status"] = "accepted"
+        return {
+            "messaging_product": "whatsapp",
+            "contacts": [{"input": user, "wa_id": user}],
+            "messages": [message],
+        }
+
+    def _status_webhook(
+        self, phone_id: str, wamid: str, user: str, status: str, payload: dict
+    ) -> bytes:
+        status_value: dict[str, Any] = {
+            "id": wamid,
+            "status": status,
+            "timestamp": str(int(time.time())),
+            "recipient_id": user,
+        }
+        if "biz_opaque_callback_data" in payload:
+            status_value["biz_opaque_callback_data"] = payload[
+                "biz_opaque_callback_data"
+            ]
+        user_id = f"US.{int(hashlib.sha256(str(user).encode()).hexdigest()[:16], 16)}"
+        return json.dumps(
+            {
+                "object": "whatsapp_business_account",
+                "entry": [
+                    {
+                        "id": self.waba_id,
+                        "changes": [
+                            {
+                                "value": {
+                                    "messaging_product": "whatsapp",
+                                    "metadata": {
+                                        "display_phone_number": self.display_phone_number,
+                                        "phone_number_id": phone_id,
+                                    },
+                                    "contacts": [
+                                        {
+                                            "wa_id": user
+                                            if not str(user).startswith("US.")
+                                            else None,
+                                            "user_id": user
+                                            if str(user).startswith("US.")
+                                            else user_id,
+                                        }
+                                    ],
+                                    "statuses": [status_value],
+                                },
+                                "field": "messages",
+                            }
+                        ],
+                    }
+                ],
+            }
+        ).encode()
+
+    def _upload_media(self, request: httpx.Request, body: bytes, phone_id: str) -> dict:
+        fields = _parse_multipart(request, body)
+        media_id = self._new_id()
+        content, mime_type = fields.get("file", (b"", None))
+        self.media[media_id] = (
+            content,
+            mime_type or fields.get("type", (b"", None))[0].decode(),
+        )
+        return {"id": media_id}
+
+    def _create_upload_session(
+        self, request: httpx.Request, body: bytes, app_id: str
+    ) -> dict:
+        return {"id": f"upload:{self._new_id()}"}
+
+    def _upload_file(
+        self, request: httpx.Request, body: bytes, session_id: str
+    ) -> dict:
+        handle = f"4::{session_id.removeprefix('upload:')}"
+        self.files[handle] = body
+        return {"h": handle}
+
+    def _download_media(self, media_id: str) -> httpx.Response:
+        if (media := self.media.get(media_id)) is None:
+            return httpx.Response(404)
+        content, mime_type = media
+        return httpx.Response(200, content=content, headers={"Content-Type": mime_type})
+
+    def _get_object(
+        self, request: httpx.Request, body: bytes, object_id: str
+    ) -> dict | httpx.Response:
+        if (media := self.media.get(object_id)) is not None:
+            content, mime_type = media
+            return {
+                "messaging_product": "whatsapp",
+                "url": str(
+                    request.url.copy_with(path=f"{_MEDIA_PATH}{object_id}", query=None)
+                ),
+                "mime_type": mime_type,
+                "sha256": hashlib.sha256(content).hexdigest(),
+                "file_size": len(content),
+                "id": object_id,
+            }
+        if (template := self.templates.get(object_id)) is not None:
+            return template
+        if (flow := self.flows.get(object_id)) is not None:
+            return flow
+        return _not_found(object_id)
+
+    def _update_object(
+        self, request: httpx.Request, body: bytes, object_id: str
+    ) -> dict | httpx.Response:
+        payload = json.loads(body or b"{}")
+        if (template := self.templates.get(object_id)) is not None:
+            template.update(payload)
+            return {
+                "success": True,
+                "id": object_id,
+                "name": template["name"],
+                "category": template["category"],
+            }
+        if (flow := self.flows.get(object_id)) is not None:
+            flow.update(
+                {
+                    k: json.loads(v) if k == "categories" and isinstance(v, str) else v
+                    for k, v in payload.items()
+                }
+            )
+            return {"success": True}
+        return _not_found(object_id)
+
+    def _delete_object(
+        self, request: httpx.Request, body: bytes, object_id: str
+    ) -> dict | httpx.Response:
+        for objects in (self.media, self.flows, self.templates):
+            if objects.pop(object_id, None) is not None:
+                return {"success": True}
+        return _not_found(object_id)
+
+    def _create_template(
+        self, request: httpx.Request, body: bytes, waba_id: str
+    ) -> dict:
+        payload = json.loads(body)
+        template_id = self._new_id()
+        self.templates[template_id] = {
+            "parameter_format": "POSITIONAL",
+            "components": [],
+            **payload,
+            "id": template_id,
+            "status": self.template_status,
+        }
+        return {
+            "id": template_id,
+            "status": self.template_status,
+            "category": payload["category"],
+        }
+
+    def _get_templates(self, request: httpx.Request, body: bytes, waba_id: str) -> dict:
+        params = request.url.params
+        return _page(
+            [
+                t
+                for t in self.templates.values()
+                if all(
+                    params.get(key) is None or str(t.get(key)) in params[key].split(",")
+                    for key in ("name", "status", "category", "language")
+                )
+            ],
+            request,
+        )
+
+    def _delete_template(
+        self, request: httpx.Request, body: bytes, waba_id: str
+    ) -> dict | httpx.Response:
+        params = request.url.params
+        deleted = [
+            template_id
+            for template_id, template in self.templates.items()
+            if template_id == params.get("hsm_id")
+            or (params.get("hsm_id") is None and template["name"] == params.get("name"))
+        ]
+        if not deleted:
+            return _not_found(params.get("hsm_id") or params.get("name"))
+        for template_id in deleted:
+            del self.templates[template_id]
+        return {"success": True}
+
+    def _create_flow(self, request: httpx.Request, body: bytes, waba_id: str) -> dict:
+        payload = json.loads(body)
+        flow_id = self._new_id()
+        categories = payload.get("categories", [])
+        self.flows[flow_id] = {
+            "id": flow_id,
+            "name": payload["name"],
+            "status": "PUBLISHED" if payload.get("publish") else "DRAFT",
+            "categories": json.loads(categories)
+            if isinstance(categories, str)
+            else categories,
+            "validation_errors": [],
+            "json_version": json.loads(payload["flow_json"]).get("version")
+            if payload.get("flow_json")
+            else None,
+            "endpoint_uri": payload.get("endpoint_uri"),
+            "updated_at": datetime.datetime.now(datetime.timezone.utc).strftime(
+                "%Y-%m-%dT%H:%M:%S%z"
+            ),
+        }
+        return {"id": flow_id, "success": True, "validation_errors": []}
+
+    def _get_flows(self, request: httpx.Request, body: bytes, waba_id: str) -> dict:
+        return _page(list(self.flows.values()), request)
+
+    def _get_flow_assets(
+        self, request: httpx.Request, body: bytes, flow_id: str
+    ) -> dict | httpx.Response:
+        if flow_id not in self.flows:
+            return _not_found(flow_id)
+        return _page(
+            [
+                {
+                    "name": "flow.json",
+                    "asset_type": "FLOW_JSON",
+                    "download_url": str(
+                        request.url.copy_with(
+                            path=f"{_MEDIA_PATH}{flow_id}", query=None
+                        )
+                    ),
+                }
+            ],
+            request,
+        )
+
+    def _update_flow_json(
+        self, request: httpx.Request, body: bytes, flow_id: str
+    ) -> dict | httpx.Response:
+        if (flow := self.flows.get(flow_id)) is None:
+            return _not_found(flow_id)
+        content, _ = _parse_multipart(request, body).get("file", (b"{}", None))
+        flow["json_version"] = json.loads(content).get("version")
+        self.media[flow_id] = (content, "application/json")
+        return {"success": True, "validation_errors": []}
+
+    def _set_flow_status(
+        self, request: httpx.Request, body: bytes, flow_id: str, action: str
+    ) -> dict | httpx.Response:
+        if (flow := self.flows.get(flow_id)) is None:
+            return _not_found(flow_id)
+        flow["status"] = "PUBLISHED" if action == "publish" else "DEPRECATED"
+        return {"success": True}
+
+
+def _route_name(pattern: re.Pattern) -> str:
+    return re.sub(r"\(\?P<(\w+)>[^)]*\)", r"{\1}", pattern.pattern).replace(
+        "(?:marketing_)?", ""
+    )
+
+
+def _not_found(object_id: str | None) -> httpx.Response:
+    return FakeError(
+        status_code=400,
+        code=100,
+        type="GraphMethodException",
+        message=f"Unsupported request - Object with ID '{object_id}' does not exist.",
+    ).to_response()
+
+
+def _cursor(index: int) -> str:
+    return base64.urlsafe_b64encode(str(index).encode()).decode()
+
+
+def _page(items: list[dict], request: httpx.Request) -> dict:
+    """A page of the items by the ``limit``, ``after`` and ``before`` params of the request."""
+    params = request.url.params
+    limit = int(params.get("limit", 25))
+    if (after := params.get("after")) is not None:
+        start = int(base64.urlsafe_b64decode(after))
+    elif (before := params.get("before")) is not None:
+        start = max(int(base64.urlsafe_b64decode(before)) - limit, 0)
+    else:
+        start = 0
+    end = min(start + limit, len(items))
+    paging: dict[str, Any] = {
+        "cursors": {"before": _cursor(start), "after": _cursor(end)}
+    }
+    if end < len(items):
+        paging["next"] = str(
+            request.url.copy_remove_param("before").copy_set_param(
+                "after", _cursor(end)
+            )
+        )
+    if start > 0:
+        paging["previous"] = str(
+            request.url.copy_remove_param("after").copy_set_param(
+                "before", _cursor(start)
+            )
+        )
+    return {"data": items[start:end], "paging": paging}
+
+
+def _parse_multipart(
+    request: httpx.Request, body: bytes
+) -> dict[str, tuple[bytes, str | None]]:
+    """The fields of a ``multipart/form-data`` body, by name (``(content, content_type)``)."""
+    message = email.parser.BytesParser().parsebytes(
+        f"Content-Type: {request.headers.get('Content-Type', '')}\r\n\r\n".encode()
+        + body
+    )
+    if not message.is_multipart():
+        return {}
+    return {
+        part.get_param("name", header="content-disposition"): (
+            part.get_payload(decode=True),
+            part.get_content_type() if part.get("Content-Type") else None,
+        )
+        for part in message.get_payload()
+    }
@@ -0,0 +1,225 @@
+"""The HTTP transport to the Graph API: connection pool configuration and statistics."""
+
+from __future__ import annotations
+
+__all__ = ["InstrumentedTransport", "TransportConfig", "TransportStats"]
+
+import dataclasses
+import threading
+import time
+from typing import Any
+
+import httpx
+
+
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
+class TransportConfig:
+    """
+    How the client connects to the Graph API (when it creates its own ``session``).
+
+    - Opening a connection to ``graph.facebook.com`` costs a TCP and a TLS handshake. ``warm_up`` opens connections at
+      startup, so the first requests don't pay for them, and ``keepalive_refresh`` keeps idle connections from expiring.
+    - With :class:`pywa_async.WhatsApp`, ``warm_up`` and ``keepalive_refresh`` start with the built-in server. When
+      using a custom server, ``await wa.warm_up()`` at its startup to start them.
+    - Call ``wa.close()`` to stop the ``keepalive_refresh`` and close the connections.
+    - With ``http2``, concurrent requests are multiplexed over a single connection instead of opening a connection
+      per request.
+
+    Example:
+
+        .. code-block:: python
+
+            from pywa import WhatsApp
+            from pywa.transport import TransportConfig
+
+            wa = WhatsApp(
+                ...,
+                transport=TransportConfig(
+                    http2=True, warm_up=4, keepalive_expiry=60, keepalive_refresh=50
+                ),
+            )
+            print(wa.transport_stats)
+
+    Attributes:
+        http2: Whether to use HTTP/2 (requires `h2 <https://pypi.org/project/h2/>`_: ``pip3 install 'pywa[http2]'``).
+        max_connections: The maximum number of open connections (``None`` for no limit).
+        max_keepalive_connections: The maximum number of idle connections to keep open (``None`` for no limit).
+        keepalive_expiry: The time to keep an idle connection open, in seconds.
+        timeout: The timeout of the requests, in seconds.
+        warm_up: The number of connections to open at startup (``0`` to open them on the first requests).
+        keepalive_refresh: The interval between refreshes of the idle connections, in seconds (``None`` to let them
+         expire). Should be shorter than ``keepalive_expiry``.
+    """
+
+    http2: bool = False
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+    timeout: float | None = 5.0
+    warm_up: int = 0
+    keepalive_refresh: float | None = None
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class TransportStats:
+    """
+    The statistics of the connection pool of the client (returned by :attr:`~pywa.client.WhatsApp.transport_stats`).
+
+    - The pool wait of a request is the time from sending it until it got a connection (an idle one, a new one or, with
+      HTTP/2, a stream on an open one). A growing pool wait means the pool is saturated.
+
+    Attributes:
+        requests: The number of requests that were sent.
+        in_flight: The number of requests that are waiting for a response.
+        max_in_flight: The maximum number of requests that waited for a response at the same time.
+        connections: The number of open connections.
+        idle_connections: The number of open connections that are not in use.
+        new_connections: The number of connections that were opened.
+        total_pool_wait: The total time that requests waited for a connection, in seconds.
+        max_pool_wait: The longest time that a request waited for a connection, in seconds.
+    """
+
+    requests: int
+    in_flight: int
+    max_in_flight: int
+    connections: int
+    idle_connections: int
+    new_connections: int
+    total_pool_wait: float
+    max_pool_wait: float
+
+    @property
+    def avg_pool_wait(self) -> float:
+        """The average time that requests waited for a connection, in seconds."""
+        return self.total_pool_wait / self.requests if self.requests else 0.0
+
+
+class _TransportMetrics:
+    """The counters behind :class:`TransportStats` (shared by the sync and async transports)."""
+
+    __slots__ = (
+        "_lock",
+        "in_flight",
+        "max_in_flight",
+        "max_pool_wait",
+        "new_connections",
+        "requests",
+        "total_pool_wait",
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.new_connections = 0
+        self.total_pool_wait = 0.0
+        self.max_pool_wait = 0.0
+
+    def start(
+        self, request: httpx.Request, trace_cls: type[_RequestTrace] | None = None
+    ) -> None:
+        """Count the request and trace the time until it gets a connection."""
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        request.extensions["trace"] = (trace_cls or _RequestTrace)(
+            self, request.extensions.get("trace")
+        )
+
+    def finish(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def on_connection(self, waited: float, new: bool) -> None:
+        with self._lock:
+            self.total_pool_wait += waited
+            self.max_pool_wait = max(self.max_pool_wait, waited)
+            self.new_connections += new
+
+    def snapshot(self, pool: Any) -> TransportStats:
+        connections = list(getattr(pool, "connections", ()))
+        with self._lock:
+            return TransportStats(
+                requests=self.requests,
+                in_flight=self.in_flight,
+                max_in_flight=self.max_in_flight,
+                connections=sum(not c.is_closed() for c in connections),
+                idle_connections=sum(c.is_idle() for c in connections),
+                new_connections=self.new_connections,
+                total_pool_wait=self.total_pool_wait,
+                max_pool_wait=self.max_pool_wait,
+            )
+
+
+class _RequestTrace:
+    """An ``httpcore`` trace callback that records when the request got its connection."""
+
+    __slots__ = ("_done", "_metrics", "_next", "_started")
+
+    def __init__(self, metrics: _TransportMetrics, next_trace: Any):
+        self._metrics = metrics
+        self._next = next_trace
+        self._started = time.perf_counter()
+        self._done = False
+
+    def connected(self, new: bool = False) -> None:
+        if not self._done:
+            self._done = True
+            self._metrics.on_connection(time.perf_counter() - self._started, new)
+
+    def _record(self, name: str) -> None:
+        if name.endswith(".started") and not self._done:
+            self.connected(new=name == "connection.connect_tcp.started")
+
+    def __call__(self, name: str, info: dict) -> None:
+        self._record(name)
+        if self._next is not None:
+            self._next(name, info)
+
+
+class InstrumentedTransport(httpx.BaseTransport):
+    """
+    An ``httpx`` transport that records the statistics of its connection pool (see :class:`TransportStats`).
+
+    - Used by the client when it creates its own ``session``.
+
+    Args:
+        config: The configuration of the connection pool.
+        transport: The transport to send the requests with (default: an ``httpx.HTTPTransport`` from ``config``).
+    """
+
+    def __init__(
+        self,
+        config: TransportConfig | None = None,
+        *,
+        transport: httpx.BaseTransport | None = None,
+    ):
+        config = config or TransportConfig()
+        self._transport = transport or httpx.HTTPTransport(
+            http2=config.http2, limits=config._limits()
+        )
+        self._metrics = _TransportMetrics()
+
+    @property
+    def stats(self) -> TransportStats:
+        """The statistics of the connection pool."""
+        return self._metrics.snapshot(getattr(self._transport, "_pool", None))
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self._metrics.start(request)
+        try:
+            return self._transport.handle_request(request)
+        finally:
+            self._metrics.finish()
+
+    def close(self) -> None:
+        self._transport.close()
@@ -11,15 +11,18 @@ __all__ = [
 import abc
 import dataclasses
 import datetime
+import functools
 import json
 import pathlib
 import warnings
-from collections.abc import Awaitable, Generator, Iterable, Iterator
+from collections.abc import Awaitable, Callable, Generator, Iterable, Iterator
 from typing import (
     TYPE_CHECKING,
+    Any,
     BinaryIO,
     ClassVar,
     NoReturn,
+    TypeVar,
 )
 
 from ..errors import PywaDeprecationWarning
@@ -256,6 +259,39 @@ class BaseUpdate(abc.ABC, _HandlingFlow):
         return self._client._call_handlers(self.raw)
 
 
+_ShortcutT = TypeVar("_ShortcutT", bound=Callable[..., Any])
+
+
+def _in_order(shortcut: _ShortcutT) -> _ShortcutT:
+    """Send the message of a shortcut after the earlier messages to the same chat (by the ``sequencer`` of the client)."""
+
+    @functools.wraps(shortcut)
+    def wrapper(self: _ClientShortcuts, *args, **kwargs):
+        if self._client._sequencer is None:
+            return shortcut(self, *args, **kwargs)
+        with self._client._sequence(
+            self._internal_recipient, self._get_reply_to(kwargs.get("private", False))
+        ):
+            return shortcut(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _queue_receipt(update: _ClientShortcuts, typing: bool) -> SuccessResult:
+    """Merge the read receipt (and typing indicator) of an update into the ``receipts`` of its client."""
+    user = getattr(update, "from_user", None)
+    update._client._receipts._add(
+        api=update._client.api,
+        phone_id=update._internal_recipient,
+        chat=update._get_reply_to(),
+        message_id=update.message_id_to_reply,
+        timestamp=getattr(update, "timestamp", None),
+        typing=typing,
+        aliases=(user.wa_id, user.bsuid, user.parent_bsuid) if user else (),
+    )
+    return SuccessResult(success=True)
+
+
 class _ClientShortcuts(abc.ABC):
     """
     Shortcuts for sending messages, media, and other types of content in response to an update.
@@ -280,6 +316,7 @@ class _ClientShortcuts(abc.ABC):
         """
         return self.id
 
+    @_in_order
     def reply_text(
         self,
         text: str,
@@ -349,6 +386,7 @@ class _ClientShortcuts(abc.ABC):
 
     reply = reply_text  # alias
 
+    @_in_order
     def reply_image(
         self,
         image: str | int | Media | pathlib.Path | bytes | BinaryIO | Iterator[bytes],
@@ -408,6 +446,7 @@ class _ClientShortcuts(abc.ABC):
             tracker=tracker,
         )
 
+    @_in_order
     def reply_video(
         self,
         video: str | int | Media | pathlib.Path | bytes | BinaryIO | Iterator[bytes],
@@ -467,6 +506,7 @@ class _ClientShortcuts(abc.ABC):
             tracker=tracker,
         )
 
+    @_in_order
     def reply_document(
         self,
         document: str | int | Media | pathlib.Path | bytes | BinaryIO | Iterator[bytes],
@@ -529,6 +569,7 @@ class _ClientShortcuts(abc.ABC):
             tracker=tracker,
         )
 
+    @_in_order
     def reply_audio(
         self,
         audio: str | int | Media | pathlib.Path | bytes | BinaryIO | Iterator[bytes],
@@ -578,6 +619,7 @@ class _ClientShortcuts(abc.ABC):
             tracker=tracker,
         )
 
+    @_in_order
     def reply_voice(
         self,
         voice: str | int | Media | pathlib.Path | bytes | BinaryIO | Iterator[bytes],
@@ -624,6 +666,7 @@ class _ClientShortcuts(abc.ABC):
             tracker=tracker,
         )
 
+    @_in_order
     def reply_sticker(
         self,
         sticker: str | int | Media | pathlib.Path | bytes | BinaryIO | Iterator[bytes],
@@ -672,6 +715,7 @@ class _ClientShortcuts(abc.ABC):
             tracker=tracker,
         )
 
+    @_in_order
     def reply_location(
         self,
         latitude: float,
@@ -728,6 +772,7 @@ class _ClientShortcuts(abc.ABC):
             tracker=tracker,
         )
 
+    @_in_order
     def reply_location_request(
         self,
         text: str,
@@ -771,6 +816,7 @@ class _ClientShortcuts(abc.ABC):
             tracker=tracker,
         )
 
+    @_in_order
     def reply_contact_info_request(
         self,
         text: str,
@@ -815,6 +861,7 @@ class _ClientShortcuts(abc.ABC):
             identity_key_hash=identity_key_hash,
         )
 
+    @_in_order
     def reply_contact(
         self,
         contact: Contact | Iterable[Contact],
@@ -874,6 +921,7 @@ class _ClientShortcuts(abc.ABC):
             tracker=tracker,
         )
 
+    @_in_order
     def react(
         self,
         emoji: str,
@@ -915,6 +963,7 @@ class _ClientShortcuts(abc.ABC):
             tracker=tracker,
         )
 
+    @_in_order
     def unreact(
         self,
         *,
@@ -952,6 +1001,7 @@ class _ClientShortcuts(abc.ABC):
             tracker=tracker,
         )
 
+    @_in_order
     def reply_catalog(
         self,
         body: str,
@@ -1009,6 +1059,7 @@ class _ClientShortcuts(abc.ABC):
             tracker=tracker,
         )
 
+    @_in_order
     def reply_product(
         self,
         catalog_id: str,
@@ -1067,6 +1118,7 @@ class _ClientShortcuts(abc.ABC):
             tracker=tracker,
         )
 
+    @_in_order
     def reply_products(
         self,
         catalog_id: str,
@@ -1138,6 +1190,7 @@ class _ClientShortcuts(abc.ABC):
             tracker=tracker,
         )
 
+    @_in_order
     def reply_template(
         self,
         name: str | None = None,
@@ -1189,6 +1242,7 @@ class _ClientShortcuts(abc.ABC):
             tracker=tracker,
         )
 
+    @_in_order
     def reply_carousel(
         self,
         *,
@@ -1232,6 +1286,7 @@ class _ClientShortcuts(abc.ABC):
         Mark the message as read.
 
         - Shortcut for :py:func:`~pywa.client.WhatsApp.mark_message_as_read` with ``message_id``.
+        - With the ``receipts`` of the client, the receipt is merged with the other receipts of the chat and sent later (see :class:`~pywa.receipts.ReceiptAggregator`).
         - You can mark incoming messages as read by using the :py:func:`~pywa.types.base_update.BaseUserUpdate.mark_as_read` method or indicate typing by using the :py:func:`~pywa.types.base_update.BaseUserUpdate.indicate_typing` method on every update.
         - It's good practice to mark an incoming messages as read within 30 days of receipt. Marking a message as read will also mark earlier messages in the thread as read.
         - Read more about `Mark messages as read <https://developers.facebook.com/docs/whatsapp/cloud-api/guides/mark-message-as-read>`_.
@@ -1246,6 +1301,8 @@ class _ClientShortcuts(abc.ABC):
         Returns:
             Whether it was successful.
         """
+        if self._client._receipts is not None:
+            return _queue_receipt(self, typing=False)
         return self._client.mark_message_as_read(
             sender=self._internal_recipient, message_id=self.message_id_to_reply
         )
@@ -1255,6 +1312,7 @@ class _ClientShortcuts(abc.ABC):
         Mark the message as read and display a typing indicator so the WhatsApp user knows you are preparing a response.
 
         - Shortcut for :py:func:`~pywa.client.WhatsApp.indicate_typing` with ``message_id``.
+        - With the ``receipts`` of the client, the indicator is merged with the other receipts of the chat and sent later (see :class:`~pywa.receipts.ReceiptAggregator`).
         - The typing indicator will be dismissed once you respond, or after 25 seconds, whichever comes first. To prevent a poor user experience, only display a typing indicator if you are going to respond.
         - Read more about `Typing indicators <https://developers.facebook.com/docs/whatsapp/cloud-api/typing-indicators>`_.
 
@@ -1268,6 +1326,8 @@ class _ClientShortcuts(abc.ABC):
         Returns:
             Whether it was successful.
         """
+        if self._client._receipts is not None:
+            return _queue_receipt(self, typing=True)
         return self._client.indicate_typing(
             sender=self._internal_recipient, message_id=self.message_id_to_reply
         )
@@ -354,6 +354,9 @@ class SentMessage(_SentUpdate, _PinUnpinActions):
         """
         Wait for the message to be delivered to the recipient.
 
+        - Registers a listener for the message. To track the delivery of many messages (e.g. a campaign), use a
+          :class:`~pywa.delivery.DeliveryIndex` instead.
+
         Example:
 
             .. code-block:: python
@@ -14,6 +14,7 @@ __all__ = [
     "Carousel",
     "CarouselCard",
     "CatalogButton",
+    "CompiledTemplate",
     "ContactInfoRequestButton",
     "CopyCodeButton",
     "CopyCodeOTPButton",
@@ -57,6 +58,7 @@ __all__ = [
     "TemplateLanguage",
     "TemplateQualityUpdate",
     "TemplateRejectionReason",
+    "TemplateSlot",
     "TemplateStatus",
     "TemplateStatusUpdate",
     "TemplateUnpauseResult",
@@ -78,7 +80,7 @@ import logging
 import pathlib
 import re
 import warnings
-from collections.abc import AsyncIterator, Generator, Iterator, Sequence
+from collections.abc import AsyncIterator, Generator, Iterator, Mapping, Sequence
 from typing import (
     TYPE_CHECKING,
     BinaryIO,
@@ -4225,6 +4227,190 @@ def _validate_params(
         raise ValueError("; ".join(errors))
 
 
+class TemplateSlot:
+    """
+    A placeholder, in the params of a :class:`CompiledTemplate`, for a value that changes per recipient.
+
+    - Use slots for parameters that are sent as text (e.g. body and header text, coupon codes, URL variables and
+      quick reply callback data), not for media.
+
+    Example:
+
+        >>> body.params(name=TemplateSlot("name"), discount="25%")
+
+    Attributes:
+        name: The name of the slot (letters, digits and underscores).
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        if not re.fullmatch(r"\w+", name):
+            raise ValueError(
+                f"The name of a slot may only contain letters, digits and underscores, got {name!r}."
+            )
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"TemplateSlot({self.name!r})"
+
+    def __str__(self) -> str:
+        return f"\x00{self.name}\x00"  # found in the serialized payload by _SLOT_RE
+
+
+_SLOT_RE = re.compile(r"\\u0000(\w+)\\u0000")
+
+
+class CompiledTemplate:
+    """
+    A template message that is validated and serialized once, to send to many recipients (e.g. a campaign) with
+    :meth:`~pywa.client.WhatsApp.send_template`.
+
+    - Create it with :meth:`~pywa.client.WhatsApp.compile_template`: the params are validated against the template,
+      and their media is uploaded, only once.
+    - The values that change per recipient are :class:`TemplateSlot` placeholders in the params, and are filled into
+      the serialized payload when sending (instead of building the payload from the params for every recipient).
+
+    Example:
+
+        .. code-block:: python
+
+            from pywa.types.templates import *
+
+            compiled = wa.compile_template(
+                template=t,
+                params=[
+                    header.params(image="https://example.com/sale.jpg"),
+                    body.params(name=TemplateSlot("name"), code=TemplateSlot("code")),
+                ],
+            )
+            for customer in customers:
+                wa.send_template(
+                    to=customer.phone,
+                    template=compiled,
+                    values={"name": customer.name, "code": customer.code},
+                )
+
+    Attributes:
+        name: The name of the template.
+        language: The language of the template.
+        slots: The names of the slots to provide values for.
+    """
+
+    __slots__ = ("_literals", "_slots", "language", "name", "slots")
+
+    def __init__(
+        self,
+        name: str,
+        language: TemplateLanguage,
+        params: Sequence[BaseParams | dict] | None = None,
+    ):
+        payload: dict = {"name": name, "language": {"code": language.value}}
+        if params is not None:
+            payload["components"] = [
+                param.to_dict() if isinstance(param, BaseParams) else param
+                for param in params
+            ]
+        parts = _SLOT_RE.split(
+            json.dumps(
+                payload, ensure_ascii=False, separators=(",", ":"), default=str
+            )  # slots that the params keep as is are serialized by str() too
+        )
+        self.name = name
+        self.language = language
+        self._literals: tuple[str, ...] = tuple(parts[::2])
+        self._slots: tuple[str, ...] = tuple(parts[1::2])
+        self.slots = frozenset(self._slots)
+
+    def __repr__(self) -> str:
+        return f"CompiledTemplate(name={self.name!r}, language={self.language!r}, slots={sorted(self.slots)!r})"
+
+    def _fill(self, values: Mapping[str, object] | None) -> str:
+        values = values or {}
+        if missing := self.slots - values.keys():
+            raise ValueError(f"Missing values for slots: {', '.join(sorted(missing))}.")
+        if unexpected := values.keys() - self.slots:
+            raise ValueError(
+                f"Unexpected values for slots: {', '.join(sorted(unexpected))}."
+            )
+        if not self._slots:
+            return self._literals[0]
+        escaped = {
+            slot: json.dumps(str(value), ensure_ascii=False)[1:-1]
+            for slot, value in values.items()
+        }
+        parts = [self._literals[0]]
+        for slot, literal in zip(self._slots, self._literals[1:]):
+            parts.append(escaped[slot])
+            parts.append(literal)
+        return "".join(parts)
+
+    def render(self, values: Mapping[str, object] | None = None) -> dict:
+        """
+        Get the template object of the message (the ``template`` of the request), with the values filled in.
+
+        Args:
+            values: The values of the slots, by name.
+
+        Returns:
+            The template object.
+
+        Raises:
+            ValueError: If values are missing or unexpected.
+        """
+        return json.loads(self._fill(values))
+
+    def render_bytes(
+        self,
+        to: str | int,
+        values: Mapping[str, object] | None = None,
+        *,
+        tracker: str | CallbackData | None = None,
+        reply_to_message_id: str | None = None,
+        identity_key_hash: str | None = None,
+        message_activity_sharing: bool | None = None,
+    ) -> bytes:
+        """
+        Get the JSON body of the request that sends the template to a recipient (used by
+        :meth:`~pywa.client.WhatsApp.send_template`, or e.g. to send it with your own HTTP client, or to store it in a
+        queue).
+
+        Args:
+            to: The user phone number, WhatsApp ID, BSUID or group ID to send the message to.
+            values: The values of the slots, by name.
+            tracker: A callback data to track the message (optional).
+            reply_to_message_id: The message ID to reply to (optional).
+            identity_key_hash: The message would only be delivered if the hash value matches the customer's current
+             hash (optional).
+            message_activity_sharing: Whether to share the message activities with Meta (optional, only for the
+             ``/{phone_id}/marketing_messages`` endpoint of the MM Lite API).
+
+        Returns:
+            The body of the request to ``/{phone_id}/messages`` (or ``/{phone_id}/marketing_messages``).
+
+        Raises:
+            ValueError: If values are missing or unexpected.
+        """
+        recipient, _ = helpers.resolve_recipient(to)
+        fields = {
+            "messaging_product": "whatsapp",
+            **recipient,
+            "type": "template",
+            "context": {"message_id": reply_to_message_id}
+            if reply_to_message_id
+            else None,
+            "message_activity_sharing": message_activity_sharing,
+            "biz_opaque_callback_data": helpers.resolve_tracker_param(tracker),
+            "recipient_identity_key_hash": identity_key_hash,
+        }
+        head = json.dumps(
+            {k: v for k, v in fields.items() if v is not None},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        return f'{head[:-1]},"template":{self._fill(values)}}}'.encode()
+
+
 _TemplateDetailsType = TypeVar("_TemplateDetailsType", bound="TemplateDetails")
 
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import base64
 import dataclasses
+import email.utils
 import enum
 import functools
 import hashlib
@@ -10,12 +11,17 @@ import importlib
 import importlib.util
 import json
 import logging
+import random
+import threading
+import time
 import warnings
 from collections.abc import Callable, Iterable
-from typing import TYPE_CHECKING, Any, Protocol, TypeAlias
+from typing import TYPE_CHECKING, Any, ClassVar, Protocol, TypeAlias
 
 import httpx
 
+from . import errors
+from ._shared import _TokenBucket
 from .errors import PywaDeprecationWarning
 
 if TYPE_CHECKING:
@@ -161,6 +167,378 @@ class WebhookFields:
     remove: Iterable[str] = dataclasses.field(default_factory=tuple)
 
 
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
+class RetryRule:
+    """
+    How to retry a failed request to the WhatsApp Cloud API (see :class:`RetryPolicy`).
+
+    - The delay before retry ``n`` (starting from 0) is ``backoff * 2 ** n``, capped by ``max_backoff``. With
+      ``jitter``, the delay is a random value between 0 and that ("full jitter"), so clients that failed together do
+      not retry together.
+
+    Attributes:
+        max_retries: The maximum number of retries of a request.
+        backoff: The delay before the first retry, in seconds.
+        max_backoff: The maximum delay between retries, in seconds.
+        jitter: Whether to randomize the delays.
+        idempotent_only: Retry only requests that are safe to send twice (e.g. ``GET`` requests). Use it for errors
+         that do not tell whether the request was processed (e.g. read timeouts and server errors).
+    """
+
+    max_retries: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    idempotent_only: bool = False
+
+    def delay(self, retry: int) -> float:
+        """The delay before the ``retry`` (starting from 0), in seconds."""
+        delay = min(self.max_backoff, self.backoff * 2**retry)
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+@dataclasses.dataclass(slots=True)
+class RetryStats:
+    """
+    The statistics of a :class:`RetryPolicy` (shared by all the clients that use it).
+
+    Attributes:
+        retried_requests: The number of requests that were retried at least once.
+        retries: The total number of retries.
+        exhausted: The number of requests that failed after using all of their retries.
+        total_delay: The total time spent waiting between retries, in seconds.
+        retries_by_error: The number of retries per error class name.
+    """
+
+    retried_requests: int = 0
+    retries: int = 0
+    exhausted: int = 0
+    total_delay: float = 0.0
+    retries_by_error: dict[str, int] = dataclasses.field(default_factory=dict)
+
+
+_TRANSIENT_RULE = RetryRule(idempotent_only=True)
+
+
+class RetryPolicy:
+    """
+    Retries requests to the WhatsApp Cloud API that failed because of rate limits or transient errors.
+
+    - The rule of an error is looked up by its class (the most specific class in ``rules`` wins). A ``None`` rule
+      means the error is not retried.
+    - Errors without a rule are retried with the ``transient`` rule if WhatsApp marks them as transient
+      (``is_transient``) or if the status code is 5xx.
+    - The ``Retry-After`` header, when present, overrides the computed delay (up to ``max_retry_after``).
+    - Requests with ``POST`` or other non-idempotent methods (e.g. sending a message) are unsafe to retry: they are
+      retried only for errors that guarantee the request was not processed (rate limits, connection errors).
+    - Requests with streamed bodies (file objects or generators) are never retried.
+
+    Example:
+
+        .. code-block:: python
+
+            from pywa import WhatsApp, errors, utils
+
+            policy = utils.RetryPolicy(
+                rules={errors.RateLimitHit: utils.RetryRule(max_retries=5, backoff=2)},
+            )
+            wa = WhatsApp(..., retry_policy=policy)
+            ...
+            print(policy.stats.retries, policy.stats.total_delay)
+
+    Args:
+        rules: Rules per error class, merged over :attr:`DEFAULT_RULES`.
+        transient: The rule for transient errors without a rule.
+        max_retry_after: The maximum ``Retry-After`` value to wait, in seconds (longer values are not retried).
+    """
+
+    DEFAULT_RULES: ClassVar[dict[type[Exception], RetryRule | None]] = {
+        errors.ToManyAPICalls: RetryRule(backoff=1, max_backoff=60),
+        errors.RateLimitIssues: RetryRule(backoff=1, max_backoff=60),
+        errors.RateLimitHit: RetryRule(max_retries=5, backoff=1),
+        errors.TooManyMessages: RetryRule(backoff=6, max_backoff=60),  # pair rate limit
+        errors.ThrottlingError: None,  # messaging and spam limits are not over within seconds
+        errors.ServiceUnavailable: RetryRule(),
+        # the request was not sent
+        httpx.ConnectError: RetryRule(),
+        httpx.ConnectTimeout: RetryRule(),
+        httpx.PoolTimeout: RetryRule(),
+        # the request may have been processed
+        httpx.TimeoutException: _TRANSIENT_RULE,
+        httpx.RemoteProtocolError: _TRANSIENT_RULE,
+    }
+    """The default rules, per error class."""
+
+    def __init__(
+        self,
+        *,
+        rules: dict[type[Exception], RetryRule | None] | None = None,
+        transient: RetryRule | None = _TRANSIENT_RULE,
+        max_retry_after: float = 60.0,
+    ):
+        self.rules = self.DEFAULT_RULES | (rules or {})
+        self.transient = transient
+        self.max_retry_after = max_retry_after
+        self.stats = RetryStats()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"RetryPolicy(stats={self.stats!r})"
+
+    def rule_for(self, error: Exception) -> RetryRule | None:
+        """Get the rule of the error (``None`` if it should not be retried)."""
+        for cls in type(error).__mro__:
+            if cls in self.rules:
+                return self.rules[cls]
+        if isinstance(error, errors.WhatsAppError) and (
+            error.is_transient or (error.status_code or 0) >= 500
+        ):
+            return self.transient
+        return None
+
+    @staticmethod
+    def _retry_after(error: Exception) -> float | None:
+        response = (
+            error.raw_response if isinstance(error, errors.WhatsAppError) else None
+        )
+        if response is None or not (value := response.headers.get("Retry-After")):
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            try:
+                return max(
+                    email.utils.parsedate_to_datetime(value).timestamp() - time.time(),
+                    0.0,
+                )
+            except (TypeError, ValueError):
+                return None
+
+    def next_delay(
+        self, error: Exception, retry: int, *, idempotent: bool
+    ) -> float | None:
+        """
+        Get the delay before retrying a request that failed with ``error``, or ``None`` to raise the error.
+
+        Args:
+            error: The error of the last attempt.
+            retry: The number of retries so far.
+            idempotent: Whether the request is safe to send twice.
+        """
+        rule = self.rule_for(error)
+        if rule is None or (rule.idempotent_only and not idempotent):
+            return None
+        if retry >= rule.max_retries:
+            with self._lock:
+                self.stats.exhausted += 1
+            return None
+        delay = self._retry_after(error)
+        if delay is None:
+            delay = rule.delay(retry)
+        elif delay > self.max_retry_after:
+            return None
+        with self._lock:
+            self.stats.retries += 1
+            self.stats.retried_requests += retry == 0
+            self.stats.total_delay += delay
+            name = type(error).__name__
+            self.stats.retries_by_error[name] = (
+                self.stats.retries_by_error.get(name, 0) + 1
+            )
+        return delay
+
+
+class RateLimitExceeded(Exception):
+    """
+    Raised by a fail-fast :class:`RateLimiter` when sending a message would exceed its rate.
+
+    Attributes:
+        phone_id: The phone id that the message was sent from.
+        recipient: The recipient of the message.
+        retry_after: The time until the message can be sent, in seconds.
+    """
+
+    def __init__(self, phone_id: str, recipient: str, retry_after: float):
+        super().__init__(
+            f"Sending from {phone_id} to {recipient} is rate limited, retry after {retry_after:.2f} seconds"
+        )
+        self.phone_id = phone_id
+        self.recipient = recipient
+        self.retry_after = retry_after
+
+
+@dataclasses.dataclass(slots=True)
+class RateLimiterStats:
+    """
+    The statistics of a :class:`RateLimiter`.
+
+    Attributes:
+        acquired: The number of messages that were let through.
+        delayed: The number of messages that had to wait for their turn.
+        total_wait: The total time that messages waited, in seconds.
+        rejected: The number of messages that were rejected (fail-fast mode).
+        throttled: The number of rate limit errors that slowed down a phone id or a recipient.
+    """
+
+    acquired: int = 0
+    delayed: int = 0
+    total_wait: float = 0.0
+    rejected: int = 0
+    throttled: int = 0
+
+
+class RateLimiter:
+    """
+    Limits the throughput of sent messages on the client side, before the WhatsApp Cloud API rejects them.
+
+    - Every phone id has a token bucket of ``rate`` messages per second (with bursts of up to ``burst`` messages),
+      and every (phone id, recipient) pair has a bucket of ``pair_rate`` messages per second (with bursts of up to
+      ``pair_burst`` messages).
+    - A message that exceeds the rate waits for its turn (``time.sleep`` in :class:`pywa.WhatsApp` and
+      ``asyncio.sleep`` in :class:`pywa_async.WhatsApp`). If it would have to wait longer than ``max_wait``, a
+      :class:`RateLimitExceeded` is raised instead (use ``max_wait=0`` to fail fast).
+    - The rate adapts: a :class:`~pywa.errors.RateLimitHit` (130429) cuts the rate of the phone id by
+      ``decrease``, and every successful message adds back ``recovery`` of the configured rate. A
+      :class:`~pywa.errors.TooManyMessages` (131056) empties the bucket of the pair.
+    - Only requests that send messages (to ``/{phone_id}/messages`` with a recipient) are limited.
+
+    Example:
+
+        .. code-block:: python
+
+            from pywa import WhatsApp, utils
+
+            wa = WhatsApp(..., rate_limiter=utils.RateLimiter(rate=80))
+
+    Args:
+        rate: The messages per second of every phone id (Cloud API default throughput: 80).
+        burst: The bucket size of every phone id (default: ``rate``).
+        pair_rate: The messages per second to every recipient (Cloud API pair rate: 1 message every 6 seconds).
+        pair_burst: The bucket size of every recipient (the pair rate allows bursts of up to 45 messages).
+        max_wait: The maximum time a message may wait, in seconds (default: no limit).
+        min_rate: The lowest rate that a phone id can be cut down to.
+        decrease: The factor to multiply the rate of a phone id by on :class:`~pywa.errors.RateLimitHit`.
+        recovery: The fraction of ``rate`` to add back to a slowed-down phone id on every successful message.
+        max_pairs: The number of recipient buckets to keep before full (idle) buckets are dropped.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float = 80.0,
+        burst: float | None = None,
+        pair_rate: float = 1 / 6,
+        pair_burst: float = 45.0,
+        max_wait: float | None = None,
+        min_rate: float = 1.0,
+        decrease: float = 0.5,
+        recovery: float = 0.01,
+        max_pairs: int = 100_000,
+    ):
+        if rate <= 0 or pair_rate <= 0:
+            raise ValueError("`rate` and `pair_rate` must be positive")
+        self.rate = rate
+        self.burst = max(burst or rate, 1.0)
+        self.pair_rate = pair_rate
+        self.pair_burst = max(pair_burst, 1.0)
+        self.max_wait = max_wait
+        self.min_rate = min(min_rate, rate)
+        self.decrease = decrease
+        self.recovery = recovery
+        self.max_pairs = max_pairs
+        self.stats = RateLimiterStats()
+        self._phones: dict[str, _TokenBucket] = {}
+        self._pairs: dict[tuple[str, str], _TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"RateLimiter(rate={self.rate}, pair_rate={self.pair_rate}, stats={self.stats!r})"
+
+    def current_rate(self, phone_id: str) -> float:
+        """The current (adapted) rate of the phone id, in messages per second."""
+        bucket = self._phones.get(phone_id)
+        return self.rate if bucket is None else bucket.rate
+
+    def _bucket(
+        self, phone_id: str, recipient: str, now: float
+    ) -> tuple[_TokenBucket, _TokenBucket]:
+        if (phone := self._phones.get(phone_id)) is None:
+            phone = self._phones[phone_id] = _TokenBucket(self.rate, self.burst, now)
+        if (pair := self._pairs.get((phone_id, recipient))) is None:
+            if len(self._pairs) >= self.max_pairs:
+                self._drop_idle_pairs(now)
+            pair = self._pairs[(phone_id, recipient)] = _TokenBucket(
+                self.pair_rate, self.pair_burst, now
+            )
+        phone.refill(now)
+        pair.refill(now)
+        return phone, pair
+
+    def _drop_idle_pairs(self, now: float) -> None:
+        full = self.pair_burst / self.pair_rate
+        self._pairs = {
+            key: bucket
+            for key, bucket in self._pairs.items()
+            if now - bucket.updated < full
+        }
+
+    def reserve(self, phone_id: str, recipient: str) -> float:
+        """
+        Reserve a message from the phone id to the recipient.
+
+        Args:
+            phone_id: The phone id to send the message from.
+            recipient: The recipient of the message.
+
+        Returns:
+            The time to wait before sending the message, in seconds.
+
+        Raises:
+            RateLimitExceeded: If the message would have to wait longer than ``max_wait`` (nothing is reserved).
+        """
+        with self._lock:
+            phone, pair = self._bucket(phone_id, recipient, time.monotonic())
+            wait = max(phone.wait(), pair.wait())
+            if self.max_wait is not None and wait > self.max_wait:
+                self.stats.rejected += 1
+                raise RateLimitExceeded(phone_id, recipient, wait)
+            phone.tokens -= 1
+            pair.tokens -= 1
+            self.stats.acquired += 1
+            if wait:
+                self.stats.delayed += 1
+                self.stats.total_wait += wait
+            return wait
+
+    def feedback(
+        self, phone_id: str, recipient: str, error: Exception | None = None
+    ) -> None:
+        """
+        Adapt the rate to the result of a message that was sent after :meth:`reserve`.
+
+        Args:
+            phone_id: The phone id that the message was sent from.
+            recipient: The recipient of the message.
+            error: The error that the message failed with (``None`` if it was sent).
+        """
+        with self._lock:
+            if (phone := self._phones.get(phone_id)) is None:
+                return
+            if error is None:
+                if phone.rate < self.rate:
+                    phone.rate = min(self.rate, phone.rate + self.rate * self.recovery)
+            elif isinstance(error, errors.RateLimitHit):
+                self.stats.throttled += 1
+                phone.refill(time.monotonic())
+                phone.rate = max(self.min_rate, phone.rate * self.decrease)
+                phone.tokens = min(phone.tokens, 0.0)
+            elif isinstance(error, errors.TooManyMessages) and (
+                pair := self._pairs.get((phone_id, recipient))
+            ):
+                self.stats.throttled += 1
+                pair.tokens = min(pair.tokens, 0.0)
+
+
 FlowRequestDecryptor: TypeAlias = Callable[
     [str, str, str, str, str | None], tuple[dict, bytes, bytes]
 ]
@@ -50,10 +50,13 @@ from pywa._helpers import get_media_from_base64 as get_media_from_base64
 from pywa._helpers import get_media_from_file_like_obj as get_media_from_file_like_obj
 from pywa._helpers import get_media_from_path as get_media_from_path
 from pywa._helpers import get_media_msg as get_media_msg
+from pywa._helpers import group_comps_by_example as group_comps_by_example
 from pywa._helpers import header_format_to_media_type as header_format_to_media_type
 from pywa._helpers import is_async_callable as is_async_callable
 from pywa._helpers import is_installed as is_installed
 from pywa._helpers import logger as logger
+from pywa._helpers import media_digest as media_digest
+from pywa._helpers import media_from_cache as media_from_cache
 from pywa._helpers import media_types_default_filenames as media_types_default_filenames
 from pywa._helpers import (
     media_types_default_mime_types as media_types_default_mime_types,
@@ -323,13 +326,25 @@ async def internal_upload_media(
         or media_types_default_mime_types.get(media_type, "text/plain")
     )
     try:
+        digest = (
+            media_digest(media_info.content) if wa._media_cache is not None else None
+        )
+        if digest is not None and (cached := wa._media_cache.get(digest, phone_id)):
+            logger.debug("Using the already uploaded media %s", cached.media_id)
+            return media_from_cache(
+                media_cls=_AsyncMedia,
+                wa=wa,
+                cached=cached,
+                phone_id=phone_id,
+                filename=final_filename,
+            )
         logger.debug(
             "Uploading media to WhatsApp servers: filename=%s, mime_type=%s, length=%s",
             final_filename,
             final_mimetype,
             media_info.length,
         )
-        return _AsyncMedia(
+        media = _AsyncMedia(
             _client=wa,
             _id=(
                 await wa.api.upload_media(
@@ -347,6 +362,9 @@ async def internal_upload_media(
             filename=final_filename,
             ttl_minutes=ttl_minutes,
         )
+        if digest is not None:
+            wa._media_cache.set(digest, phone_id, media.id, ttl_minutes=ttl_minutes)
+        return media
     finally:
         try:
             if close_client and client is not None:
@@ -374,13 +392,11 @@ async def upload_template_media_components(
         *[
             _upload_comps_example(
                 wa=wa,
-                example=example,
-                comps=list(comps),
+                example=comps[0]._example,
+                comps=comps,
                 app_id=app_id,
             )
-            for example, comps in itertools.groupby(
-                not_uploaded, key=lambda x: x._example
-            )
+            for comps in group_comps_by_example(not_uploaded)
         ]
     )
 
@@ -489,22 +505,31 @@ async def internal_upload_file(
         if final_filename is None:
             raise ValueError("Could not determine a filename for the file upload.")
         final_mimetype = mime_type or media_info.mime_type or fallback_mime_type
+        resolved_app_id = resolve_arg(
+            wa=wa,
+            value=app_id,
+            method_arg="app_id",
+            client_arg="app_id",
+        )
+        digest = (
+            media_digest(media_info.content) if wa._media_cache is not None else None
+        )
+        if digest is not None and (
+            cached := wa._media_cache.get_handle(digest, resolved_app_id)
+        ):
+            logger.debug("Using the already uploaded file handle %s", cached.media_id)
+            return cached.media_id, source
         logger.debug(
             "Uploading file to Resumable Upload API: filename=%s, mime_type=%s, length=%s",
             final_filename,
             final_mimetype,
             media_info.length,
         )
-        return (
+        handle = (
             await wa.api.upload_file(
                 upload_session_id=(
                     await wa.api.create_upload_session(
-                        app_id=resolve_arg(
-                            wa=wa,
-                            value=app_id,
-                            method_arg="app_id",
-                            client_arg="app_id",
-                        ),
+                        app_id=resolved_app_id,
                         file_name=final_filename,
                         file_length=media_info.length,
                         file_type=final_mimetype,
@@ -517,7 +542,10 @@ async def internal_upload_file(
                 file_offset=0,
                 content_length=media_info.length,
             )
-        )["h"], source
+        )["h"]
+        if digest is not None:
+            wa._media_cache.set_handle(digest, resolved_app_id, handle)
+        return handle, source
 
     except Exception as e:
         raise ValueError(
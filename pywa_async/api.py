@@ -2,17 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import json
 from collections.abc import AsyncIterator
 from contextlib import _AsyncGeneratorContextManager
 from typing import TYPE_CHECKING
 
+from pywa import utils
 from pywa.api import *
 from pywa.api import (
+    _cached,
+    _current_batch_call,
     _logger,
     _UnpauseTemplateResult,
 )
 
+from .circuit_breaker import CircuitBreaker
 from .errors import WhatsAppError
+from .hedging import HedgingPolicy
+from .receipts import ReceiptAggregator
+from .response_cache import ResponseCache
+from .scheduler import OutboundScheduler
+from .service_windows import ServiceWindowTracker
 
 if TYPE_CHECKING:
     from ._helpers import GeneratorStreamer
@@ -28,23 +40,51 @@ class GraphAPIAsync(GraphAPI):
         token: str,
         session: httpx.AsyncClient,
         api_version: float,
+        retry_policy: utils.RetryPolicy | None = None,
+        rate_limiter: utils.RateLimiter | None = None,
+        response_cache: ResponseCache | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        scheduler: OutboundScheduler | None = None,
+        receipts: ReceiptAggregator | None = None,
+        service_windows: ServiceWindowTracker | None = None,
+        hedging_policy: HedgingPolicy | None = None,
     ):
         super().__init__(
             token=token,
             session=cast("httpx.Client", session),
             api_version=api_version,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            response_cache=response_cache,
+            circuit_breaker=circuit_breaker,
+            scheduler=scheduler,
+            receipts=receipts,
+            service_windows=service_windows,
         )
+        self._hedging_policy = hedging_policy
 
     def __str__(self):
         return f"GraphAPIAsync(session={self._session!r})"
 
-    async def _request(self, method: str, endpoint: str, **kwargs) -> dict:
+    async def _request(
+        self, method: str, endpoint: str, *, recipient: str | None = None, **kwargs
+    ) -> dict:
         """
         Internal method to make a request to the WhatsApp Cloud API.
 
+        - Failed requests are retried according to the ``retry_policy`` (if any).
+        - Sent messages wait for their turn in the ``scheduler`` and are throttled by the ``rate_limiter`` (if any).
+        - Sent messages send the pending read receipt of their chat in ``receipts`` first (if any).
+        - Free-form messages to users whose customer service window is closed fail fast by ``service_windows`` (if any).
+        - Requests to failing endpoints fail fast by the ``circuit_breaker`` (if any).
+        - Writes invalidate the reads that they may have changed in the ``response_cache`` (if any).
+        - Inside a :class:`~pywa.batch.Batch`, the request is queued to the batch call.
+
         Args:
             method: The HTTP method to use.
             endpoint: The endpoint to request.
+            recipient: The recipient of a message that is sent as ``content`` (the recipient of a ``json`` message is
+             read from it).
             **kwargs: Additional arguments to pass to the request.
 
         Returns:
@@ -56,14 +96,125 @@ class GraphAPIAsync(GraphAPI):
         kwargs.pop(
             "log_kwargs", None
         )  # backwards compatibility for old versions of pywa
+        if (batch_call := _current_batch_call.get()) is not None and (
+            res := batch_call.intercept(method, endpoint, kwargs)
+        ) is not None:
+            self._invalidate_cached(method, endpoint, kwargs)
+            return res
+        target = self._message_key(method, endpoint, kwargs, recipient)
+        if (
+            target is not None
+            and self._service_windows is not None
+            and "json" in kwargs  # messages that are sent as content are templates
+        ):
+            self._service_windows._check(*target, kwargs["json"])
+        if (
+            target is not None
+            and self._receipts is not None
+            and (receipt := self._receipts._pop(target)) is not None
+        ):
+            await self._receipts._send(receipt)  # the typing indicator must come first
+        limit = target if self._rate_limiter is not None else None
+        send = (
+            self._send_hedged
+            if self._hedging_policy is not None and method.upper() == "GET"
+            else self._send_request
+        )
+        retry = 0
+        while True:
+            if target is not None and self._scheduler is not None:
+                await self._schedule(target[0])
+            if limit is not None and (wait := self._rate_limiter.reserve(*limit)):
+                await asyncio.sleep(wait)
+            try:
+                with self._circuit(endpoint):
+                    res = await send(method, endpoint, **kwargs)
+            except (WhatsAppError, httpx.RequestError) as e:
+                if limit is not None:
+                    self._rate_limiter.feedback(*limit, error=e)
+                if (
+                    delay := self._retry_delay(e, retry, method, endpoint, kwargs)
+                ) is None:
+                    self._invalidate_cached(method, endpoint, kwargs)
+                    raise
+            else:
+                if limit is not None:
+                    self._rate_limiter.feedback(*limit)
+                self._invalidate_cached(method, endpoint, kwargs)
+                if batch_call is not None:
+                    batch_call.record(method, endpoint, res)
+                return res
+            await asyncio.sleep(delay)
+            retry += 1
+
+    async def _schedule(self, phone_id: str) -> None:
+        """Wait for the turn of a message in the ``scheduler``."""
+        event = asyncio.Event()
+        ticket, wait = self._scheduler._enqueue(phone_id, None, event)
+        try:
+            while not event.is_set():
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(event.wait(), wait)
+                wait = self._scheduler._dispatch(phone_id)
+        except BaseException:
+            self._scheduler._cancel(ticket)
+            raise
+
+    async def _send_hedged(self, method: str, endpoint: str, **kwargs) -> dict:
+        """Send a request, and send it again if it is slower than usual (the first response wins)."""
+        policy = self._hedging_policy
+        _, _, edge = endpoint.strip("/").partition("/")
+        family = edge.split("/", 1)[0]
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        primary = asyncio.ensure_future(self._send_request(method, endpoint, **kwargs))
+        pending = {primary}
+        try:
+            if (delay := policy.delay(family)) is not None:
+                await asyncio.wait(pending, timeout=delay)
+                if not primary.done() and policy.acquire():
+                    _logger.debug(
+                        "%s request to %s is slower than %.3f seconds, hedging",
+                        method,
+                        endpoint,
+                        delay,
+                    )
+                    pending.add(
+                        asyncio.ensure_future(
+                            self._send_request(method, endpoint, **kwargs)
+                        )
+                    )
+            while True:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        policy.observe(  # since the first request, as the caller waited
+                            family,
+                            loop.time() - started,
+                            hedge_won=task is not primary,
+                        )
+                        return task.result()
+                if not pending:  # all the requests failed
+                    return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _send_request(self, method: str, endpoint: str, **kwargs) -> dict:
+        """Send a single request to the WhatsApp Cloud API (without retries)."""
         _logger.debug(
             "Making %s request to %s with kwargs: %s",
             method,
             endpoint,
             {k: v if k != "files" else "<files>" for k, v in kwargs.items()},
         )
+        kwargs["headers"] = self._headers | dict(kwargs.get("headers") or {})
         try:
-            res = await self._session.request(method=method, url=endpoint, **kwargs)
+            res = await self._session.request(
+                method=method, url=self._url(endpoint), **kwargs
+            )
         except (httpx.TimeoutException, httpx.ConnectError, httpx.ProxyError):
             _logger.warning(
                 "You may want to provide your own `httpx.Client` instance. e.g. `WhatsApp(session=httpx.Client(timeout=..., proxies=...))`. See https://www.python-httpx.org/api/#client for more information."
@@ -442,7 +593,7 @@ class GraphAPIAsync(GraphAPI):
         return self._session.stream(
             method="GET",
             url=media_url,
-            headers=self._session.headers.copy(),
+            headers=self._headers.copy(),
             follow_redirects=True,
             **httpx_kwargs,
         )
@@ -472,6 +623,24 @@ class GraphAPIAsync(GraphAPI):
             params=self._filter_none(phone_number_id=phone_number_id),
         )
 
+    async def send_batch(self, requests: list[dict]) -> list[dict | None]:
+        """
+        Send many requests in a single batch call.
+
+        - Read more at `developers.facebook.com <https://developers.facebook.com/docs/graph-api/batch-requests>`_.
+
+        Args:
+            requests: The requests (``method``, ``relative_url`` and optional ``body``), up to 50.
+
+        Returns:
+            The responses (``code`` and ``body``), in order (``None`` for requests that timed out).
+        """
+        return await self._request(
+            method="POST",
+            endpoint="/",
+            data={"batch": json.dumps(requests), "include_headers": "false"},
+        )
+
     async def send_raw_request(self, method: str, endpoint: str, **kwargs) -> Any:
         """
         Send a raw request to WhatsApp Cloud API.
@@ -609,6 +778,40 @@ class GraphAPIAsync(GraphAPI):
             method="POST", endpoint=f"/{sender}/marketing_messages", json=body
         )
 
+    async def send_message_content(
+        self,
+        sender: str,
+        recipient: str,
+        content: bytes,
+        marketing: bool = False,
+    ) -> dict:
+        """
+        Send a message whose JSON body is already serialized (e.g. by
+        :meth:`~pywa.types.templates.CompiledTemplate.render_bytes`).
+
+        Args:
+            sender: The phone id to send the message from.
+            recipient: The WhatsApp ID, BSUID or group ID that the message is sent to (as in the ``content``).
+            content: The JSON body of the request.
+            marketing: Whether to send the message via the MM Lite API.
+
+        Returns:
+            The response from the WhatsApp Cloud API.
+        """
+        endpoint = f"/{sender}/{'marketing_messages' if marketing else 'messages'}"
+        # the bodies of the batch items are form encoded
+        if _current_batch_call.get() is not None:
+            return await self._request(
+                method="POST", endpoint=endpoint, json=json.loads(content)
+            )
+        return await self._request(
+            method="POST",
+            endpoint=endpoint,
+            recipient=recipient,
+            content=content,
+            headers={"Content-Type": "application/json"},
+        )
+
     async def create_phone_number(
         self, waba_id: str, country_code: str, phone_number: str, verified_name: str
     ) -> dict[str, str]:
@@ -872,6 +1075,7 @@ class GraphAPIAsync(GraphAPI):
             json=settings,
         )
 
+    @_cached("phone_number", "phone_id")
     async def get_business_phone_number(
         self,
         phone_id: str,
@@ -1051,6 +1255,7 @@ class GraphAPIAsync(GraphAPI):
             },
         )
 
+    @_cached("business_profile", "phone_id")
     async def get_business_profile(
         self,
         phone_id: str,
@@ -1111,6 +1316,7 @@ class GraphAPIAsync(GraphAPI):
             json=data,
         )
 
+    @_cached("commerce_settings", "phone_id")
     async def get_commerce_settings(
         self, phone_id: str, fields: tuple[str, ...] | None = None
     ) -> dict:
@@ -1193,6 +1399,7 @@ class GraphAPIAsync(GraphAPI):
             headers={"Content-Type": "application/json"},
         )
 
+    @_cached("template", "template_id")
     async def get_template(
         self,
         template_id: str,
@@ -1665,6 +1872,7 @@ class GraphAPIAsync(GraphAPI):
             endpoint=f"/{flow_id}/deprecate",
         )
 
+    @_cached("flow", "flow_id")
     async def get_flow(
         self,
         flow_id: str,
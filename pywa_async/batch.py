@@ -0,0 +1,96 @@
+"""Batch requests to the Graph API."""
+
+from __future__ import annotations
+
+import inspect
+from typing import TYPE_CHECKING
+
+from pywa.batch import *
+from pywa.batch import Batch as _Batch
+from pywa.batch import _BatchCall, _current_call, _Deferred, _logger
+
+if TYPE_CHECKING:
+    from .client import WhatsApp
+
+
+class Batch(_Batch):
+    """
+    Sends the requests of many calls in a single batch call to the Graph API.
+
+    - Calls to the methods of the client (e.g. :meth:`~pywa_async.client.WhatsApp.get_media_url`,
+      :meth:`~pywa_async.client.WhatsApp.get_template`) are queued and return a :class:`BatchResult`. When the
+      ``async with`` block exits, their requests are sent in batch calls of up to ``max_size`` (50) requests, and the
+      results are set.
+    - Failed requests set the :class:`~pywa.errors.WhatsAppError` of the request as the exception of the result.
+    - Requests that can't be batched (e.g. uploads) and follow-up requests of a call are sent separately (once).
+    - Read more at `developers.facebook.com <https://developers.facebook.com/docs/graph-api/batch-requests>`_.
+
+    Example:
+
+        .. code-block:: python
+
+            from pywa_async import WhatsApp
+
+            wa = WhatsApp(...)
+
+            async with wa.batch() as b:
+                urls = [b.get_media_url(media_id) for media_id in media_ids]
+                template = b.get_template(template_id)
+
+            print(urls[0].result().url, template.result().name)
+
+    Args:
+        wa: The WhatsApp client.
+        max_size: The maximum number of requests in a single batch call (up to 50).
+    """
+
+    _wa: WhatsApp
+
+    def __enter__(self):
+        raise TypeError("Use `async with wa.batch()` with the async client")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            await self.execute()
+
+    async def execute(self) -> list[BatchResult]:
+        """
+        Send the queued calls (called when the ``async with`` block exits).
+
+        Returns:
+            The results of the calls, in order.
+        """
+        calls, self._calls = self._calls, []
+        deferred = [call for call in calls if await self._run(call)]
+        for chunk in self._chunks(deferred):
+            _logger.debug("Sending a batch of %d requests", len(chunk))
+            try:
+                responses, error = (
+                    await self._wa.api.send_batch([call.request for call in chunk]),
+                    None,
+                )
+            except Exception as e:  # noqa: BLE001
+                responses, error = None, e
+            for call in self._set_responses(chunk, responses, error):
+                await self._run(call)
+        return [call.result for call in calls]
+
+    @staticmethod
+    async def _run(call: _BatchCall) -> bool:
+        """Run the call, and return whether it was deferred to the batch call."""
+        token = _current_call.set(call)
+        try:
+            result = call.func(*call.args, **call.kwargs)
+            call.result._set(
+                result=await result if inspect.isawaitable(result) else result
+            )
+        except _Deferred:
+            return True
+        except Exception as e:  # noqa: BLE001
+            call.result._set(exception=e)
+        finally:
+            _current_call.reset(token)
+        return False
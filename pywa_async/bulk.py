@@ -0,0 +1,23 @@
+"""Sending messages to many recipients."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from typing import Any
+
+from pywa.bulk import *
+from pywa.bulk import _bulk_item, _has_media, _reuse_media
+
+
+async def _bulk_items(
+    recipients: Iterable[str | int | tuple[str | int, dict[str, Any]]]
+    | AsyncIterable[str | int | tuple[str | int, dict[str, Any]]],
+) -> AsyncIterator[tuple[int, str | int, dict[str, Any]]]:
+    if isinstance(recipients, AsyncIterable):
+        index = 0
+        async for item in recipients:
+            yield _bulk_item(index, item)
+            index += 1
+    else:
+        for index, item in enumerate(recipients):
+            yield _bulk_item(index, item)
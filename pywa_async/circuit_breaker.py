@@ -0,0 +1 @@
+from pywa.circuit_breaker import *
@@ -4,12 +4,26 @@ from __future__ import annotations
 
 __all__ = ["WhatsApp"]
 
+import asyncio
+import contextlib
 import datetime
 import hashlib
 import json
+import logging
 import mimetypes
 import pathlib
-from collections.abc import AsyncGenerator, AsyncIterator, Iterable, Iterator, Sequence
+import weakref
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
 from types import ModuleType
 from typing import (
     Any,
@@ -33,8 +47,11 @@ from pywa.types.base_update import BaseUpdate
 from pywa.types.callback import BaseCarouselCard
 
 from . import _helpers as helpers
-from . import utils
+from . import bulk, utils
 from .api import GraphAPIAsync
+from .batch import MAX_BATCH_SIZE, Batch
+from .bulk import BulkProgress, BulkResult
+from .circuit_breaker import CircuitBreaker
 from .handlers import (
     AccountUpdateHandler,
     CallbackButtonHandler,
@@ -61,8 +78,23 @@ from .handlers import (
     TemplateStatusUpdateHandler,
     UserMarketingPreferencesHandler,
 )
-from .listeners import BaseListenerIdentifier, Listener, _AsyncListeners
+from .hedging import HedgingPolicy
+from .listeners import (
+    BaseListenerIdentifier,
+    Listener,
+    ListenerBus,
+    ListenerStore,
+    _AsyncListeners,
+    _AsyncListenerTimeouts,
+)
+from .media_cache import MediaCache
+from .receipts import ReceiptAggregator
+from .response_cache import ResponseCache
+from .scheduler import OutboundScheduler, Priority, send_priority
+from .sequencer import RecipientSequencer, SequencerQueueFull, _AsyncSequenceScope
 from .server import Server
+from .service_windows import ServiceWindowTracker
+from .transport import InstrumentedTransport, TransportConfig
 from .types import (
     AccountUpdate,
     BusinessPhoneNumber,
@@ -168,6 +200,7 @@ from .types.templates import (
     BaseOTPButton,
     BaseParams,
     Buttons,
+    CompiledTemplate,
     CreatedTemplate,
     CreatedTemplates,
     DegreesOfFreedomSpec,
@@ -189,6 +222,8 @@ from .types.templates import (
 from .types.user import User
 from .utils import FastAPI, Flask, UserIdentifier
 
+_logger = logging.getLogger(__name__)
+
 
 class WhatsApp(Server, _AsyncListeners, _WhatsApp):
     _api_cls = GraphAPIAsync
@@ -196,6 +231,9 @@ class WhatsApp(Server, _AsyncListeners, _WhatsApp):
     _usr_cls = User
     _group_participant_cls = GroupParticipant
     _httpx_client = httpx.AsyncClient
+    _transport_cls = InstrumentedTransport
+    _refresh_task: asyncio.Task | None = None
+    _listeners_timeouts_cls = _AsyncListenerTimeouts
     _async_allowed = True
     api: GraphAPIAsync  # IDE type hinting
     _listeners: dict[BaseListenerIdentifier, Listener]  # IDE type hinting
@@ -258,6 +296,19 @@ class WhatsApp(Server, _AsyncListeners, _WhatsApp):
             str | float | Literal[utils.Version.GRAPH_API]
         ) = utils.Version.GRAPH_API,
         handlers_modules: Iterable[ModuleType] | None = None,
+        listener_bus: ListenerBus | None = None,
+        listener_store: ListenerStore | None = None,
+        retry_policy: utils.RetryPolicy | None = None,
+        rate_limiter: utils.RateLimiter | None = None,
+        transport: TransportConfig | None = None,
+        response_cache: ResponseCache | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        scheduler: OutboundScheduler | None = None,
+        sequencer: RecipientSequencer | None = None,
+        receipts: ReceiptAggregator | None = None,
+        service_windows: ServiceWindowTracker | None = None,
+        media_cache: MediaCache | None = None,
+        hedging_policy: HedgingPolicy | None = None,
         user_identifier_priority: tuple[UserIdentifier, ...] = (
             UserIdentifier.BSUID,
             UserIdentifier.WA_ID,
@@ -291,7 +342,7 @@ class WhatsApp(Server, _AsyncListeners, _WhatsApp):
             phone_id: The Phone Number ID to send messages from. If you manage multiple WhatsApp bots (e.g. `Solution Partners <https://developers.facebook.com/documentation/business-messaging/whatsapp/solution-providers/overview#solution-partners>`_ or `Tech Providers <https://developers.facebook.com/documentation/business-messaging/whatsapp/solution-providers/overview#tech-providers>`_), you should leave it as ``None`` and specify the phone ID in the method calls instead.
             token: The `system <https://developers.facebook.com/documentation/business-messaging/whatsapp/get-started#step-4-create-a-system-user-and-generate-a-permanent-access-token>`_ or `business <https://developers.facebook.com/documentation/business-messaging/whatsapp/embedded-signup/onboarding-customers-as-a-tech-provider#step-1-exchange-the-token-code-for-a-business-token>`_ access token used for the WhatsApp Cloud API. If not provided, the client can still be used to handle incoming updates.
             api_version: The `Graph API version <https://developers.facebook.com/docs/graph-api/guides/versioning>`_ to use (default: the latest version supported by pywa).
-            session: The httpx client used for API requests (default: a new `httpx.Client() <https://www.python-httpx.org/api/#client>`_). Use a custom client to configure proxies, timeouts, etc. Do not use the same session for another client or make other API calls while it is being used by the WhatsApp client, as this may cause unexpected behavior.
+            session: The httpx client used for API requests (default: a new `httpx.AsyncClient() <https://www.python-httpx.org/api/#asyncclient>`_). Use a custom client to configure proxies, timeouts, etc. The token is sent with every request (and not set on the session), so the same session can be shared by many clients (see :class:`~pywa.tenants.TenantClients`).
             server: A `Flask <https://flask.palletsprojects.com>`_ or `FastAPI <https://fastapi.tiangolo.com>`_ app instance used for the webhook. Designed for cases where you want to use the same server for other routes or purposes; if you just want a simple webhook server, it's easier to leave this as ``None`` and let pywa create and manage the server for you.
             callback_url: The public server URL to register, without the endpoint. If you using static domain (e.g. ``utils.start_ngrok_tunnel(domain=...)``), you can comment this out after the first successful registration to avoid unnecessary re-registrations on every restart.
             callback_url_scope: The scope used when registering the callback URL (default: ``APP``). See `Webhook overrides <https://developers.facebook.com/documentation/business-messaging/whatsapp/webhooks/override>`_ for more information.
@@ -312,6 +363,19 @@ class WhatsApp(Server, _AsyncListeners, _WhatsApp):
             skip_duplicate_updates: Whether to skip duplicate updates. Important when using custom server that block the incoming request until the response is sent, as WhatsApp may retry sending the same update if it does not receive a timely response (default: ``True``).
             validate_updates: Whether to `validate <https://developers.facebook.com/documentation/business-messaging/whatsapp/webhooks/create-webhook-endpoint#validation-1>`_ incoming webhhoks payloads (default: ``True``; requires ``app_secret``).
             handlers_modules: Python modules from which handlers should be automatically loaded. A convenient way to organize handlers in separate files without having to import and register them manually (default: ``None``).
+            listener_bus: The bus that forwards updates between the workers of the app, so that a listener registered in one worker gets the updates received by the others (default: a :class:`~pywa.listeners.UnixSocketListenerBus` when running ``pywa run --workers N``, otherwise ``None``).
+            listener_store: The store that persists the listeners of :meth:`continuation` steps, so conversations survive restarts (default: ``None``). See :class:`~pywa.listeners.SQLiteListenerStore`.
+            retry_policy: How to retry requests that failed because of rate limits or transient errors (default: ``None``, no retries). See :class:`~pywa.utils.RetryPolicy`.
+            rate_limiter: Limits the throughput of sent messages per phone id and per recipient, before the WhatsApp Cloud API rejects them (default: ``None``). See :class:`~pywa.utils.RateLimiter`.
+            transport: The connection pool configuration of the session that pywa creates: HTTP/2, pool limits, warm-up and keepalive refresh (default: ``None``, the defaults of ``httpx``). Can't be used with a custom ``session``. See :class:`~pywa.transport.TransportConfig`.
+            response_cache: Caches the responses of reads such as :meth:`get_template` and :meth:`get_business_profile`, with TTLs, single-flight and invalidation by writes and webhooks (default: ``None``, no caching). See :class:`~pywa.response_cache.ResponseCache`.
+            circuit_breaker: Fails requests fast (with :class:`~pywa.circuit_breaker.CircuitOpenError`) while their endpoint keeps failing, per endpoint family and phone id (default: ``None``). See :class:`~pywa.circuit_breaker.CircuitBreaker`.
+            scheduler: Shares the throughput of every phone id between replies, transactional and bulk messages, so replies to users don't wait behind campaigns (default: ``None``). See :class:`~pywa.scheduler.OutboundScheduler`.
+            sequencer: Sends the replies (of the update shortcuts, e.g. ``msg.reply_text(...)``) and the bulk messages to every user one at a time, in the order they were sent, while different users are messaged concurrently (default: ``None``). See :class:`~pywa.sequencer.RecipientSequencer`.
+            receipts: Merges the read receipts and typing indicators of every chat (of the update shortcuts, e.g. ``msg.mark_as_read()``) that are requested within a short window into a single request, for the newest message (default: ``None``). See :class:`~pywa.receipts.ReceiptAggregator`.
+            service_windows: Tracks the customer service window of every user (from the incoming messages), so free-form messages to users whose window is closed fail fast, or are sent as a template instead (default: ``None``). See :class:`~pywa.service_windows.ServiceWindowTracker`.
+            media_cache: Uploads the same media (bytes, files, paths and base64) only once per phone id (and the same template header examples once per app), and reuses the media ID until it expires (default: ``None``, no caching). See :class:`~pywa.media_cache.MediaCache`.
+            hedging_policy: Sends reads such as :meth:`get_media_url` again when they are slower than usual, and uses the first response, within a budget of extra requests (default: ``None``, no hedging). See :class:`~pywa.hedging.HedgingPolicy`.
             user_identifier_priority: The priority order of user identifiers to use when replying to messages, blocking users, etc (default: ``bsuid`` > ``wa_id`` > ``parent_bsuid``).
             business_account_id: Deprecated alias for ``waba_id`` (the WhatsApp Business Account ID that owns the ``phone_id``).
         """
@@ -340,13 +404,118 @@ class WhatsApp(Server, _AsyncListeners, _WhatsApp):
             flows_response_encryptor=flows_response_encryptor,
             api_version=api_version,
             handlers_modules=handlers_modules,
+            listener_bus=listener_bus,
+            listener_store=listener_store,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            transport=transport,
+            response_cache=response_cache,
+            circuit_breaker=circuit_breaker,
+            scheduler=scheduler,
+            sequencer=sequencer,
+            receipts=receipts,
+            service_windows=service_windows,
+            media_cache=media_cache,
             user_identifier_priority=user_identifier_priority,
             business_account_id=business_account_id,
         )
+        if self._api is not None:
+            self._api._hedging_policy = hedging_policy
 
     def __repr__(self):
         return f"WhatsAppAsync(phone_id={self.phone_id!r})"
 
+    async def warm_up(self, connections: int | None = None) -> int:
+        """
+        Open connections to the Graph API ahead of the requests (or refresh idle ones), so the requests don't wait for
+        TCP and TLS handshakes.
+
+        - Called at startup when ``transport=TransportConfig(warm_up=N)`` is provided (with :class:`pywa_async.WhatsApp`,
+          when the built-in server starts; call it yourself when using a custom server).
+        - With :class:`pywa_async.WhatsApp`, the first call also starts the ``keepalive_refresh`` of the ``transport``,
+          so with a custom server, the idle connections are not refreshed until you call it.
+
+        Args:
+            connections: The number of connections to open (default: ``warm_up`` of the ``transport``, at least 1).
+
+        Returns:
+            The number of connections that were opened or refreshed.
+        """
+        if self._transport_config.keepalive_refresh and self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(
+                self._maintain_connections(weakref.ref(self))
+            )
+        connections = connections or self._transport_config.warm_up or 1
+        return sum(
+            await asyncio.gather(*(self._ping_graph_api() for _ in range(connections)))
+        )
+
+    async def _ping_graph_api(self) -> bool:
+        """Send a lightweight request to the Graph API, to open or refresh a connection."""
+        try:
+            await self.api._session.request("HEAD", self.api._url(""))
+            return True
+        # RuntimeError: the session is closed
+        except (httpx.HTTPError, RuntimeError) as e:
+            _logger.debug("Failed to warm up a connection: %r", e)
+            return False
+
+    @staticmethod
+    async def _maintain_connections(client: weakref.ReferenceType[WhatsApp]) -> None:
+        """
+        Keep the connections to the Graph API warm (runs in the background).
+
+        - The client is held by a weak reference, so it stops when the client is closed, its session is closed
+          or it is garbage collected.
+        """
+        while (wa := client()) is not None:
+            interval = wa._transport_config.keepalive_refresh
+            del wa
+            await asyncio.sleep(interval)
+            if (wa := client()) is None or wa.api._session.is_closed:
+                return
+            await wa.warm_up((stats := wa.transport_stats) and stats.idle_connections)
+            del wa
+
+    async def close(self) -> None:
+        """
+        Stop the background refresh of the connections (``keepalive_refresh`` of the ``transport``) and close the
+        session that pywa created (a custom ``session`` is left open).
+
+        Example:
+
+            >>> wa = WhatsApp(..., transport=TransportConfig(keepalive_refresh=50))
+            >>> wa.close()
+        """
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        if self._transport is not None:
+            await self.api._session.aclose()
+
+    def batch(self, *, max_size: int = MAX_BATCH_SIZE) -> Batch:
+        """
+        Queue calls to send their requests in a single batch call to the Graph API (up to 50 requests per call).
+
+        - Use the returned :class:`~pywa.batch.Batch` as a context manager: the calls are sent when the block exits.
+        - Read more at `developers.facebook.com <https://developers.facebook.com/docs/graph-api/batch-requests>`_.
+
+        Example:
+
+            >>> batch = wa.batch()
+            >>> url = batch.get_media_url(media_id="123")
+            >>> template = batch.get_template(template_id="456")
+            >>> results = await batch.execute()
+            >>> url.result().url
+
+        Args:
+            max_size: The maximum number of requests in a single batch call (up to 50).
+
+        Returns:
+            A batch to queue the calls in.
+        """
+        return Batch(self, max_size=max_size)
+
     async def send_message(
         self,
         to: str | int,
@@ -376,6 +545,7 @@ class WhatsApp(Server, _AsyncListeners, _WhatsApp):
         - You can have the WhatsApp client attempt to render a preview of the first URL in the body text string, if it contains one. URLs must begin with ``http://`` or ``https://``. If multiple URLs are in the body text string, only the first URL will be rendered. If omitted, or if unable to retrieve a link preview, a clickable link will be rendered instead.
         - See `Text messages <https://developers.facebook.com/docs/whatsapp/cloud-api/messages/text-messages>`_.
         - See `Markdown <https://faq.whatsapp.com/539178204879377>`_ for formatting text messages.
+        - With the ``service_windows`` of the client, a message to a user whose customer service window is closed is sent as the template of its ``fallback`` (see :class:`~pywa.service_windows.ServiceWindowTracker`).
 
         Example:
 
@@ -404,6 +574,13 @@ class WhatsApp(Server, _AsyncListeners, _WhatsApp):
         sender = helpers.resolve_arg(
             wa=self, value=sender, method_arg="sender", client_arg="phone_id"
         )
+        if (
+            self._service_windows is not None
+            and (template := self._service_windows._route(sender, to, text)) is not None
+        ):
+            return await self.send_template(
+                to=to, tracker=tracker, sender=sender, **template
+            )
         recipient, recipient_type = helpers.resolve_recipient(to)
         if not buttons:
             return SentMessage.from_sent_update(
@@ -1664,6 +1841,163 @@ class WhatsApp(Server, _AsyncListeners, _WhatsApp):
             interactive_type=InteractiveType.PRODUCT_LIST,
         )
 
+    async def send_bulk(
+        self,
+        recipients: Iterable[str | int | tuple[str | int, dict[str, Any]]]
+        | AsyncIterable[str | int | tuple[str | int, dict[str, Any]]],
+        *,
+        send: str | Callable[..., Awaitable[SentMessage]] = "send_message",
+        params: dict[str, Any] | None = None,
+        concurrency: int = 8,
+        rate_limiter: utils.RateLimiter | None = None,
+        retry_policy: utils.RetryPolicy | None = None,
+        on_progress: Callable[[BulkProgress], Any] | None = None,
+        priority: Priority = Priority.MARKETING,
+    ) -> AsyncIterator[BulkResult]:
+        """
+        Send a message to many recipients, concurrently.
+
+        - The recipients are consumed lazily and at most ``concurrency`` messages are in flight, so any number of
+          recipients (e.g. rows streamed from a file or a database) is sent in constant memory.
+        - The results are yielded as soon as the messages are processed (not in the order of ``recipients``; use
+          :attr:`~pywa.bulk.BulkResult.index`). Failed messages are yielded with their error instead of raising it.
+        - Media in the shared ``params`` is uploaded once, by the first message, and reused by the rest.
+        - Messages are sent from threads (:class:`pywa.WhatsApp`) or tasks (:class:`pywa_async.WhatsApp`).
+        - The messages have the ``priority`` in the ``scheduler`` of the client, also when sent from a handler (whose
+          own replies are :attr:`~pywa.scheduler.Priority.INTERACTIVE`).
+
+        Example:
+
+            >>> async for result in wa.send_bulk(
+            ...     recipients=(row["phone"] for row in rows),
+            ...     send="send_template",
+            ...     params={"template": template},
+            ...     concurrency=16,
+            ...     rate_limiter=utils.RateLimiter(rate=50),
+            ...     retry_policy=utils.RetryPolicy(),
+            ... ):
+            ...     if not result.ok:
+            ...         print(result.to, result.error)
+
+        Args:
+            recipients: The recipients, or (recipient, params) tuples to override the shared ``params`` per recipient.
+            send: The method to send with (e.g. ``"send_template"``, ``"send_image"`` or any callable that takes
+             ``to`` and returns a :class:`~pywa.types.sent_update.SentMessage`).
+            params: The keyword arguments to pass to ``send`` for every recipient.
+            concurrency: The maximum number of messages to send at the same time.
+            rate_limiter: Limits the throughput of the messages (in addition to the ``rate_limiter`` of the client).
+            retry_policy: Retries failed messages (in addition to the ``retry_policy`` of the client).
+            on_progress: A callback that receives the :class:`~pywa.bulk.BulkProgress` after every message.
+            priority: The priority class of the messages in the ``scheduler`` of the client (default:
+             :attr:`~pywa.scheduler.Priority.MARKETING`).
+
+        Returns:
+            An iterator of the results of the messages.
+        """
+        if concurrency < 1:
+            raise ValueError("`concurrency` must be at least 1")
+        send = getattr(self, send) if isinstance(send, str) else send
+        params = dict(params or {})
+        progress = BulkProgress()
+        first = bulk._has_media(params)
+
+        def done(task: asyncio.Task) -> BulkResult:
+            result = task.result()
+            progress._record(result)
+            if on_progress is not None:
+                on_progress(progress)
+            return result
+
+        pending: set[asyncio.Task] = set()
+        try:
+            async for index, to, extra in bulk._bulk_items(recipients):
+                pending.add(
+                    asyncio.create_task(
+                        self._send_bulk_message(
+                            send=send,
+                            index=index,
+                            to=to,
+                            params={**params, **extra},
+                            rate_limiter=rate_limiter,
+                            retry_policy=retry_policy,
+                            priority=priority,
+                        )
+                    )
+                )
+                if first or len(pending) >= concurrency:
+                    completed, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in completed:
+                        result = done(task)
+                        if first:
+                            params, first = bulk._reuse_media(params, result), False
+                        yield result
+            while pending:
+                completed, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in completed:
+                    yield done(task)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _send_bulk_message(
+        self,
+        send: Callable[..., Awaitable[SentMessage]],
+        index: int,
+        to: str | int,
+        params: dict[str, Any],
+        rate_limiter: utils.RateLimiter | None,
+        retry_policy: utils.RetryPolicy | None,
+        priority: Priority,
+    ) -> BulkResult:
+        """Send a message of :meth:`send_bulk`, and return its result."""
+        phone_id, recipient = str(params.get("sender") or self.phone_id), str(to)
+        try:
+            async with self._sequence(phone_id, recipient):
+                retry = 0
+                while True:
+                    try:
+                        if rate_limiter is not None and (
+                            wait := rate_limiter.reserve(phone_id, recipient)
+                        ):
+                            await asyncio.sleep(wait)
+                        with send_priority(priority):
+                            sent = await send(to=to, **params)
+                    except Exception as e:  # noqa: BLE001
+                        if rate_limiter is not None:
+                            rate_limiter.feedback(phone_id, recipient, error=e)
+                        if (
+                            retry_policy is None
+                            or (
+                                delay := retry_policy.next_delay(
+                                    e, retry, idempotent=False
+                                )
+                            )
+                            is None
+                        ):
+                            return BulkResult(
+                                index=index, to=to, error=e, retries=retry
+                            )
+                    else:
+                        if rate_limiter is not None:
+                            rate_limiter.feedback(phone_id, recipient)
+                        return BulkResult(index=index, to=to, sent=sent, retries=retry)
+                    await asyncio.sleep(delay)
+                    retry += 1
+        except SequencerQueueFull as e:
+            return BulkResult(index=index, to=to, error=e)
+
+    def _sequence(
+        self, sender: str | int | None, to: str | int
+    ) -> contextlib.AbstractAsyncContextManager[None]:
+        """Wait for the turn of a message in the ``sequencer`` (if any), and keep it until the block exits."""
+        if self._sequencer is None:
+            return contextlib.nullcontext()
+        return _AsyncSequenceScope(self._sequencer, sender or self.phone_id, to)
+
     async def mark_message_as_read(
         self,
         message_id: str,
@@ -1999,6 +2333,8 @@ class WhatsApp(Server, _AsyncListeners, _WhatsApp):
         Returns:
             Whether the media was deleted successfully.
         """
+        if self._media_cache is not None:
+            self._media_cache.discard(media_id)
         return SuccessResult.from_dict(
             await self.api.delete_media(
                 media_id=media_id,
@@ -2782,7 +3118,8 @@ class WhatsApp(Server, _AsyncListeners, _WhatsApp):
         language: TemplateLanguage | None = None,
         params: Sequence[BaseParams | dict] | None = None,
         *,
-        template: Template | None = None,
+        template: Template | CompiledTemplate | None = None,
+        values: Mapping[str, object] | None = None,
         use_mm_lite_api: bool = False,
         message_activity_sharing: bool | None = None,
         reply_to_message_id: str | None = None,
@@ -2865,8 +3202,9 @@ class WhatsApp(Server, _AsyncListeners, _WhatsApp):
             to: The user phone number, WhatsApp ID, BSUID or group ID to send the message to.
             name: The name of the template to send (optional when ``template`` is provided).
             language: The language of the template to send (optional when ``template`` is provided).
-            template: The template object to validate the parameters against (optional, if not provided, ``name`` and ``language`` must be provided).
+            template: The template object to validate the parameters against (optional, if not provided, ``name`` and ``language`` must be provided), or a :class:`~pywa.types.templates.CompiledTemplate` (see :meth:`compile_template`).
             params: The parameters to fill in the template.
+            values: The values of the slots of a ``CompiledTemplate`` template, by name.
             use_mm_lite_api: Whether to use `Marketing Messages Lite API <https://developers.facebook.com/docs/whatsapp/marketing-messages-lite-api>`_ (optional, default: False).
             message_activity_sharing: Whether to share message activities (e.g. message read) for that specific marketing message to Meta to help optimize marketing messages (optional, only if ``use_mm_lite_api`` is True).
             reply_to_message_id: The ID of the message to reply to (optional).
@@ -2878,6 +3216,31 @@ class WhatsApp(Server, _AsyncListeners, _WhatsApp):
             wa=self, value=sender, method_arg="sender", client_arg="phone_id"
         )
         recipient, recipient_type = helpers.resolve_recipient(to)
+        if isinstance(template, CompiledTemplate):
+            if params is not None:
+                raise ValueError(
+                    "The params of a `CompiledTemplate` are provided when it is compiled, provide `values` instead."
+                )
+            return SentTemplate.from_sent_update(
+                client=self,
+                update=await self.api.send_message_content(
+                    sender=sender,
+                    recipient=recipient["to"] or recipient["recipient"],
+                    content=template.render_bytes(
+                        to,
+                        values,
+                        tracker=tracker,
+                        reply_to_message_id=reply_to_message_id,
+                        identity_key_hash=identity_key_hash,
+                        message_activity_sharing=message_activity_sharing
+                        if use_mm_lite_api
+                        else None,
+                    ),
+                    marketing=use_mm_lite_api,
+                ),
+                from_phone_id=sender,
+                recipient_type=recipient_type,
+            )
         name = name or (template.name if template else None)
         language = language or (template.language if template else None)
         if not name or not language:
@@ -2909,7 +3272,35 @@ class WhatsApp(Server, _AsyncListeners, _WhatsApp):
         }
         return SentTemplate.from_sent_update(
             client=self,
-            update=await self.api.send_message(
+            update=await self._send_template_payload(
+                sender=sender,
+                recipient=recipient,
+                template_payload=template_payload,
+                use_mm_lite_api=use_mm_lite_api,
+                message_activity_sharing=message_activity_sharing,
+                reply_to_message_id=reply_to_message_id,
+                tracker=tracker,
+                identity_key_hash=identity_key_hash,
+            ),
+            from_phone_id=sender,
+            recipient_type=recipient_type,
+        )
+
+    async def _send_template_payload(
+        self,
+        *,
+        sender: str,
+        recipient: dict,
+        template_payload: dict,
+        use_mm_lite_api: bool,
+        message_activity_sharing: bool | None,
+        reply_to_message_id: str | None,
+        tracker: str | CallbackData | None,
+        identity_key_hash: str | None,
+    ) -> dict:
+        """Send the template object of a template message (by the Cloud API or the MM Lite API)."""
+        if not use_mm_lite_api:
+            return await self.api.send_message(
                 sender=sender,
                 **recipient,
                 typ="template",
@@ -2918,19 +3309,77 @@ class WhatsApp(Server, _AsyncListeners, _WhatsApp):
                 biz_opaque_callback_data=helpers.resolve_tracker_param(tracker),
                 recipient_identity_key_hash=identity_key_hash,
             )
-            if not use_mm_lite_api
-            else await self.api.send_marketing_message(
-                sender=sender,
-                **recipient,
-                template=template_payload,
-                message_activity_sharing=message_activity_sharing,
-                reply_to_message_id=reply_to_message_id,
-                biz_opaque_callback_data=helpers.resolve_tracker_param(tracker),
-                recipient_identity_key_hash=identity_key_hash,
-            ),
-            from_phone_id=sender,
-            recipient_type=recipient_type,
+        return await self.api.send_marketing_message(
+            sender=sender,
+            **recipient,
+            template=template_payload,
+            message_activity_sharing=message_activity_sharing,
+            reply_to_message_id=reply_to_message_id,
+            biz_opaque_callback_data=helpers.resolve_tracker_param(tracker),
+            recipient_identity_key_hash=identity_key_hash,
+        )
+
+    async def compile_template(
+        self,
+        template: Template | TemplateDetails | None = None,
+        params: Sequence[BaseParams | dict] | None = None,
+        *,
+        name: str | None = None,
+        language: TemplateLanguage | None = None,
+        sender: str | int | None = None,
+    ) -> CompiledTemplate:
+        """
+        Compile a template message once, to send it to many recipients (e.g. a campaign) with :meth:`send_template`.
+
+        - The params are validated against the ``template`` (if provided) and their media is uploaded, only once.
+        - Use :class:`~pywa.types.templates.TemplateSlot` placeholders in the params for the values that change per
+          recipient, and provide the ``values`` of the slots when sending.
+        - Send the compiled template from the same ``sender``, since the uploaded media belongs to it.
+
+        Example::
+
+            from pywa.types.templates import *
+
+            compiled = wa.compile_template(
+                template=t,
+                params=[body.params(name=TemplateSlot("name"), discount="25%")],
+            )
+            for customer in customers:
+                wa.send_template(
+                    to=customer.phone, template=compiled, values={"name": customer.name}
+                )
+
+        Args:
+            template: The template to validate the params against (optional, if not provided, ``name`` and
+             ``language`` must be provided).
+            params: The parameters to fill in the template, with :class:`~pywa.types.templates.TemplateSlot`
+             placeholders for the values that change per recipient.
+            name: The name of the template (optional when ``template`` is provided).
+            language: The language of the template (optional when ``template`` is provided).
+            sender: The phone ID to upload the media of the params to (optional, if not provided, the client's phone
+             ID will be used).
+
+        Returns:
+            The compiled template.
+        """
+        sender = helpers.resolve_arg(
+            wa=self, value=sender, method_arg="sender", client_arg="phone_id"
         )
+        name = name or (template.name if template else None)
+        language = language or (template.language if template else None)
+        if not name or not language:
+            raise ValueError(
+                "Either provide both `name` and `language`, or provide a `template`."
+            )
+        if template:
+            template.validate_params(params)
+        if params is not None:
+            await helpers.upload_template_media_params(
+                wa=self,
+                sender=sender,
+                params=params,
+            )
+        return CompiledTemplate(name=name, language=language, params=params)
 
     async def get_templates(
         self,
@@ -0,0 +1 @@
+from pywa.delivery import *
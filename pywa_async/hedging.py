@@ -0,0 +1 @@
+from pywa.hedging import *
@@ -1,11 +1,23 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
+import math
+import time
+import warnings
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
+from pywa.errors import PywaWarning
 from pywa.listeners import *
 from pywa.listeners import (
     BaseListenerIdentifier,
+    _ListenerTimeouts,
+    _logger,
+    _TimerEntry,
+)
+from pywa.listeners import (
+    CallbackListener as _CallbackListener,
 )
 from pywa.listeners import (
     Listener as _Listener,
@@ -13,7 +25,7 @@ from pywa.listeners import (
 from pywa.listeners import (
     ListenerCanceled as _ListenerCanceled,
 )
-from pywa.types.base_update import BaseUpdate
+from pywa.types.base_update import BaseUpdate, RawUpdate
 
 from .filters import Filter
 from .types.base_update import BaseUserUpdateAsync
@@ -59,6 +71,24 @@ class ListenerCanceled(_ListenerCanceled):
 
 _UpdateT = TypeVar("_UpdateT", bound="BaseUpdate")
 
+_background_tasks: set[asyncio.Future] = set()
+
+
+def _run_in_background(aw: Awaitable[Any] | None) -> None:
+    if aw is None:
+        return
+    task = asyncio.ensure_future(aw)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_task_done)
+
+
+def _on_background_task_done(task: asyncio.Future) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        _logger.error(
+            "Exception in a listener background task", exc_info=task.exception()
+        )
+
 
 class Listener(_Listener):
     _listener_canceled = ListenerCanceled
@@ -74,7 +104,7 @@ class Listener(_Listener):
         self.cancelers = cancelers
         self.future: asyncio.Future[BaseUpdate] = asyncio.Future()
         self.future.add_done_callback(
-            lambda _: wa._remove_listener(identifier=identifier)
+            lambda _: wa._remove_listener(identifier=identifier, listener=self)
         )
 
     def set_result(self, result: BaseUpdate) -> None:
@@ -83,6 +113,10 @@ class Listener(_Listener):
     def set_exception(self, exception: Exception) -> None:
         self.future.set_exception(exception)
 
+    def expire(self, timeout: float) -> None:
+        if not self.future.done():
+            self.future.set_exception(ListenerTimeout(timeout))
+
     def is_set(self) -> bool:
         return self.future.done()
 
@@ -93,6 +127,94 @@ class Listener(_Listener):
         return bool(self.cancelers) and await self.cancelers.check_async(wa, update)
 
 
+class CallbackListener(_CallbackListener):
+    """
+    A listener that calls a callback when it is answered, instead of waiting for it.
+
+    - Created by :meth:`~pywa_async.client.WhatsApp.register_next_step`.
+
+    Attributes:
+        callback: The callback (sync or async) to call with the update that passed the filters.
+        on_error: The callback (sync or async) to call with the :class:`ListenerTimeout`, :class:`ListenerCanceled`
+         or :class:`ListenerStopped` exception that ended the listener (optional).
+    """
+
+    _listener_canceled = ListenerCanceled
+
+    def set_result(self, result: BaseUpdate) -> Awaitable[Any] | None:
+        if self._finish():
+            res = self.callback(self._wa, result)
+            if inspect.isawaitable(res):
+                return res
+        return None
+
+    def set_exception(self, exception: Exception) -> Awaitable[Any] | None:
+        if not self._finish():
+            return None
+        if self.on_error is None:
+            _logger.debug("Listener %s ended with: %s", self._identifier, exception)
+            return None
+        res = self.on_error(self._wa, exception)
+        if inspect.isawaitable(res):
+            return res
+        return None
+
+    def cancel(self, update: BaseUpdate | None = None) -> Awaitable[Any] | None:
+        return self.set_exception(self._listener_canceled(update))
+
+    def stop(self, reason: str | None = None) -> None:
+        _run_in_background(self.set_exception(ListenerStopped(reason)))
+
+    def expire(self, timeout: float) -> None:
+        _run_in_background(self.set_exception(ListenerTimeout(timeout)))
+
+    async def apply_filters(self, wa: WhatsApp, update: BaseUpdate) -> bool:
+        return not self.filters or await self.filters.check_async(wa, update)
+
+    async def apply_cancelers(self, wa: WhatsApp, update: BaseUpdate) -> bool:
+        return bool(self.cancelers) and await self.cancelers.check_async(wa, update)
+
+
+class _AsyncListenerTimeouts(_ListenerTimeouts):
+    """
+    Expires the timeouts of the listeners from the event loop, using a :class:`_TimingWheel`.
+
+    - A single timer handle ticks the wheel, and only while there are pending timeouts.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._handle: asyncio.TimerHandle | None = None
+
+    def schedule(self, listener: Listener, timeout: float) -> _TimerEntry:
+        deadline = math.ceil((time.monotonic() + timeout) / self.tick)
+        entry = self._wheel.add((listener, timeout), deadline)
+        loop = asyncio.get_running_loop()
+        if self._handle is None or self._loop is not loop:
+            if self._handle is not None:
+                self._handle.cancel()
+            self._loop = loop
+            self._handle = loop.call_later(self.tick, self._run)
+        return entry
+
+    def cancel(self, entry: _TimerEntry) -> None:
+        if self._wheel.cancel(entry):
+            self.canceled += 1
+        if not self._wheel and self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _dispatch(self, listener: Listener, timeout: float) -> None:
+        self._expire_listener(listener, timeout)  # the callbacks run in tasks
+
+    def _run(self) -> None:
+        self._expire(self._wheel.advance(self._now()))
+        self._handle = (
+            self._loop.call_later(self.tick, self._run) if self._wheel else None
+        )
+
+
 class _AsyncListeners:
     async def listen(
         self: WhatsApp,
@@ -155,9 +277,9 @@ class _AsyncListeners:
             ListenerCanceled: If the listener was canceled by a filter
             ListenerStopped: If the listener was stopped manually
         """
-        if self._uvicorn_workers > 1:
+        if self._uvicorn_workers > 1 and self._listener_bus is None:
             raise RuntimeError(
-                "Listening is not supported when running on multiple workers"
+                "Listening on multiple workers requires a `listener_bus` to forward updates between the workers"
             )
         listener = Listener(
             wa=self,
@@ -165,11 +287,115 @@ class _AsyncListeners:
             filters=filters,
             cancelers=cancelers,
         )
-        self._listeners[to] = listener
+        self._add_listener(to, listener)
+        timeout_entry = (
+            self._listeners_timeouts.schedule(listener, timeout)
+            if timeout is not None
+            else None
+        )
         try:
-            return cast(
-                "_UpdateT", await asyncio.wait_for(listener.future, timeout=timeout)
+            # the timeout is expired by `self._listeners_timeouts`
+            return cast("_UpdateT", await listener.future)
+        finally:
+            if timeout_entry is not None:
+                self._listeners_timeouts.cancel(timeout_entry)
+
+    def register_next_step(
+        self: WhatsApp,
+        to: BaseListenerIdentifier,
+        callback: Callable[[WhatsApp, _UpdateT], Any] | str,
+        *,
+        filters: Filter[_UpdateT] | None = None,
+        cancelers: Filter[Any] | None = None,
+        timeout: float | None = None,
+        on_error: Callable[[WhatsApp, Exception], Any] | None = None,
+    ) -> None:
+        """
+        Listen to an update without blocking: the ``callback`` is called with the update when it arrives.
+
+        - Unlike :meth:`listen`, nothing waits for the update, so a pending conversation costs no more than a dict
+          entry. Use it when many users can be in the middle of a conversation at the same time.
+        - The callback runs as part of handling the incoming update. Call this method again from the callback to wait
+          for the next step of the conversation.
+        - Timeouts are expired in the background, which also runs ``on_error`` for them.
+
+        Example:
+
+            .. code-block:: python
+
+                @wa.on_message(filters.command("register"))
+                async def register(_: WhatsApp, msg: Message):
+                    sent = await msg.reply("What's your name?")
+                    wa.register_next_step(
+                        to=sent.listener_identifier,
+                        callback=on_name,
+                        filters=filters.message & filters.text,
+                        timeout=300,
+                        on_error=on_error,
+                    )
+
+
+                async def on_name(_: WhatsApp, msg: Message):
+                    my_db.save_name(msg.from_user.bsuid, msg.text)
+                    await msg.reply(f"Nice to meet you, {msg.text}!")
+
+
+                async def on_error(_: WhatsApp, error: Exception):
+                    if isinstance(error, ListenerTimeout):
+                        ...
+
+        Args:
+            to: The identifier of the update to listen to.
+            callback: The function to call with the update that passed the filters, or the key of a :meth:`continuation`
+             (the listener is then saved in the ``listener_store`` and restored after a restart).
+            filters: The filters to apply to the update, call the ``callback`` if the filters pass.
+            cancelers: The filters to cancel the listening, call ``on_error`` with :class:`ListenerCanceled` if the
+             update matches.
+            timeout: The time to wait for the update, call ``on_error`` with :class:`ListenerTimeout` if the time passes.
+            on_error: The function to call when the listener times out, is canceled or is stopped (optional).
+        """
+        if self._uvicorn_workers > 1 and self._listener_bus is None:
+            raise RuntimeError(
+                "Listening on multiple workers requires a `listener_bus` to forward updates between the workers"
+            )
+        continuation = None
+        if isinstance(callback, str):
+            continuation = callback
+            callback, filters, cancelers, on_error = self._resolve_continuation(
+                continuation, filters=filters, cancelers=cancelers, on_error=on_error
+            )
+        if timeout is None:
+            warnings.warn(
+                "Listening without a `timeout` is highly discouraged as it can lead to memory leaks if the listener is never stopped.",
+                PywaWarning,
+                stacklevel=2,
             )
-        except asyncio.TimeoutError:
-            assert timeout is not None  # `asyncio.wait_for(..., None)` never times out
-            raise ListenerTimeout(timeout) from None
+        listener = CallbackListener(
+            wa=self,
+            identifier=to,
+            filters=filters,
+            cancelers=cancelers,
+            callback=callback,
+            on_error=on_error,
+            continuation=continuation,
+            deadline=time.time() + timeout if timeout is not None else None,
+        )
+        self._add_listener(to, listener)
+        if timeout is not None:
+            listener.timeout_entry = self._listeners_timeouts.schedule(
+                listener, timeout
+            )
+
+    def _add_listener(
+        self: WhatsApp, identifier: BaseListenerIdentifier, listener: Listener
+    ) -> None:
+        """Add the listener, announce it to the other workers and persist it (if configured)."""
+        if self._listener_bus is not None:
+            self._listener_bus_loop = asyncio.get_running_loop()
+        super()._add_listener(identifier, listener)
+
+    def _on_forwarded_update(self: WhatsApp, update: RawUpdate) -> None:
+        """Handle an update that another worker forwarded to this one."""
+        self._listener_bus_loop.call_soon_threadsafe(
+            _run_in_background, self._call_handlers(update)
+        )
@@ -0,0 +1 @@
+from pywa.locations import *
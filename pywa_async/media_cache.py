@@ -0,0 +1 @@
+from pywa.media_cache import *
@@ -0,0 +1,137 @@
+"""A durable outbox for messages, that knows which messages were sent after a crash."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+from pywa.outbox import *
+from pywa.outbox import Outbox as _Outbox
+
+from .bulk import BulkProgress, BulkResult
+
+if TYPE_CHECKING:
+    from .client import WhatsApp
+    from .types.sent_update import SentMessage
+    from .utils import RateLimiter, RetryPolicy
+
+
+class Outbox(_Outbox):
+    """
+    A durable outbox of messages in a SQLite database: every message is recorded before it is sent and marked with
+    its message ID after, so a broadcast that was interrupted (e.g. by a crash or a deploy) is resumed without sending
+    any message twice.
+
+    - Record messages with :meth:`add` (the rows are committed in batches of ``batch_size``, or by :meth:`flush`),
+      and send them with :meth:`send`, which claims a batch of pending messages (a single commit), sends them with
+      :meth:`~pywa_async.client.WhatsApp.send_bulk` and records their results (a single commit).
+    - The key of every message is sent as its ``tracker`` (``biz_opaque_callback_data``). Adding a key that was
+      already added is ignored, so a producer that is restarted can add the same messages again (e.g. with keys
+      such as ``"{campaign}:{user}"``).
+    - Messages that were claimed when the process crashed may have been sent, so they are not sent again by
+      default. Pass :meth:`on_status` as the callback of a
+      :class:`~pywa_async.handlers.MessageStatusHandler` to mark them as sent when their status webhooks arrive, and
+      send the rest again with ``resend_in_doubt=True``.
+    - The params of the messages are stored as JSON, so they must be JSON serializable (e.g. pass template params as
+      dicts, and media as URLs or media IDs).
+    - Use a separate database for each process that sends.
+
+    Example:
+
+        .. code-block:: python
+
+            from pywa_async import WhatsApp, handlers
+            from pywa_async.outbox import Outbox
+
+            wa = WhatsApp(...)
+            outbox = Outbox("outbox.sqlite3")
+            wa.add_handlers(handlers.MessageStatusHandler(outbox.on_status))
+
+            for user in users:
+                outbox.add(
+                    to=user.phone,
+                    key=f"summer-sale:{user.id}",
+                    method="send_template",
+                    name="summer_sale",
+                    language="en_US",
+                )
+
+            async for entry, result in outbox.send(wa, concurrency=16):
+                if not result.ok:
+                    print(entry.key, result.error)
+
+    Args:
+        path: The path of the database file (created if missing).
+        batch_size: The number of messages to commit (and to claim for sending) at once.
+    """
+
+    @staticmethod
+    def _dispatch(wa: WhatsApp) -> Callable[..., Awaitable[SentMessage]]:
+        async def send(to: str, entry: OutboxEntry) -> SentMessage:
+            return await getattr(wa, entry.method)(
+                to=to, tracker=entry.key, **entry.params
+            )
+
+        return send
+
+    async def send(
+        self,
+        wa: WhatsApp,
+        *,
+        concurrency: int = 8,
+        limit: int | None = None,
+        resend_in_doubt: bool = False,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        on_progress: Callable[[BulkProgress], Any] | None = None,
+    ) -> AsyncIterator[tuple[OutboxEntry, BulkResult]]:
+        """
+        Send the pending messages, in the order they were added, and record their results.
+
+        - The messages are claimed and recorded in batches of ``batch_size``. If the iteration is stopped, the
+          results of the messages that were sent are recorded, and the rest of the batch stays in doubt.
+        - The results are yielded with their messages, as soon as the messages are processed (not in the order they
+          were added).
+
+        Args:
+            wa: The client to send the messages with.
+            concurrency: The maximum number of messages to send at the same time.
+            limit: The maximum number of messages to send (default: all the pending messages).
+            resend_in_doubt: Whether to send again the messages that are in doubt (claimed by a previous run that
+             did not record their results). They may have been sent already, so resolve them with :meth:`on_status`
+             first.
+            rate_limiter: Limits the throughput of the messages (in addition to the ``rate_limiter`` of the client).
+            retry_policy: Retries failed messages (in addition to the ``retry_policy`` of the client).
+            on_progress: A callback that receives the :class:`~pywa.bulk.BulkProgress` after every message.
+
+        Returns:
+            An iterator of the messages (with the status they had when they were claimed) and their results.
+        """
+        self.flush()
+        send = self._dispatch(wa)
+        remaining = limit
+        while remaining is None or remaining > 0:
+            batch = self._claim(
+                self.batch_size
+                if remaining is None
+                else min(self.batch_size, remaining),
+                resend_in_doubt,
+            )
+            if not batch:
+                return
+            if remaining is not None:
+                remaining -= len(batch)
+            results: list[tuple[OutboxEntry, BulkResult]] = []
+            try:
+                async for result in wa.send_bulk(
+                    ((entry.to, {"entry": entry}) for entry in batch),
+                    send=send,
+                    concurrency=concurrency,
+                    rate_limiter=rate_limiter,
+                    retry_policy=retry_policy,
+                    on_progress=on_progress,
+                ):
+                    results.append((batch[result.index], result))
+                    yield results[-1]
+            finally:
+                self._record(results)
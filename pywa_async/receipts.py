@@ -0,0 +1,82 @@
+"""Merging the read receipts and typing indicators of every chat into a single request."""
+
+from __future__ import annotations
+
+import asyncio
+
+from pywa.receipts import *
+from pywa.receipts import ReceiptAggregator as _ReceiptAggregator
+from pywa.receipts import _logger, _Receipt
+
+
+class ReceiptAggregator(_ReceiptAggregator):
+    """
+    Merges the read receipts and typing indicators of every chat that are requested within a short window into a
+    single request, for the newest message of the chat.
+
+    - Applies to the shortcuts of the updates: ``await msg.mark_as_read()`` and ``await msg.indicate_typing()``. They
+      return right away, and the request is sent ``window`` seconds after the first receipt of the chat (failures
+      are logged). :meth:`~pywa_async.client.WhatsApp.mark_message_as_read` and
+      :meth:`~pywa_async.client.WhatsApp.indicate_typing` are still sent right away.
+    - Marking a message as read also marks the earlier messages of the chat as read, so only the newest message
+      (by its timestamp) is marked. If a typing indicator was requested in the window, it is sent with the read
+      receipt (a single request).
+    - A message that is sent to the chat sends its pending receipt first, so the typing indicator never shows up
+      after the reply (the chat is matched by any id of the user, and phone numbers in any format).
+    - The requests are sent from tasks of the running event loop.
+
+    Example:
+
+        .. code-block:: python
+
+            from pywa_async import WhatsApp, types
+            from pywa_async.receipts import ReceiptAggregator
+
+            wa = WhatsApp(..., receipts=ReceiptAggregator(window=1.0))
+
+
+            @wa.on_message
+            async def on_message(_: WhatsApp, msg: types.Message):
+                await msg.mark_as_read()  # merged with the other messages of the chat
+                await msg.indicate_typing()  # merged into the same request
+
+    Args:
+        window: The time to wait for more receipts of a chat before sending, in seconds.
+    """
+
+    def __init__(self, *, window: float = 1.0):
+        super().__init__(window=window)
+        self._tasks: set[asyncio.Task] = set()
+
+    async def flush(self) -> None:
+        """Send all the pending receipts now (e.g. before shutting down)."""
+        for receipt in self._take_all():
+            await self._send(receipt)
+
+    def _schedule(self, receipt: _Receipt) -> None:
+        asyncio.get_running_loop().call_later(self.window, self._expire, receipt)
+
+    def _expire(self, receipt: _Receipt) -> None:
+        with self._lock:
+            if not self._take(receipt):
+                return
+        task = asyncio.create_task(self._send(receipt))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, receipt: _Receipt) -> None:
+        phone_id = receipt.key[0]
+        try:
+            if receipt.typing:
+                await receipt.api.set_indicator(
+                    phone_id=phone_id, message_id=receipt.message_id, typ="text"
+                )
+            else:
+                await receipt.api.mark_message_as_read(
+                    phone_id=phone_id, message_id=receipt.message_id
+                )
+        except Exception:  # noqa: BLE001
+            _logger.exception("Failed to mark message %s as read", receipt.message_id)
+            self.stats.failed += 1
+        else:
+            self.stats.sent += 1
@@ -0,0 +1 @@
+from pywa.response_cache import *
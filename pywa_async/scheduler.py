@@ -0,0 +1 @@
+from pywa.scheduler import *
@@ -0,0 +1,94 @@
+"""Sending the messages to every recipient one at a time, in the order they were sent."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+
+from pywa._shared import _normalize_recipient
+from pywa.sequencer import *
+from pywa.sequencer import RecipientSequencer as _RecipientSequencer
+from pywa.sequencer import _Turn
+
+
+class _AsyncSequenceScope:
+    """Waits for the turn of a message, and passes the turn to the next message on exit."""
+
+    __slots__ = ("_key", "_sequencer", "_turn")
+
+    def __init__(
+        self, sequencer: _RecipientSequencer, phone_id: str | int, recipient: str | int
+    ):
+        self._sequencer = sequencer
+        self._key = (str(phone_id), _normalize_recipient(recipient))
+
+    async def __aenter__(self) -> None:
+        owner = asyncio.current_task()
+        if self._sequencer._holds(self._key, owner):
+            self._turn = None  # sent as a part of the message that holds the turn
+            return
+        event = asyncio.Event()
+        self._turn: _Turn | None = self._sequencer._enqueue(self._key, event, owner)
+        try:
+            await event.wait()
+        except BaseException:
+            self._sequencer._release(self._turn)
+            raise
+
+    async def __aexit__(self, *_) -> None:
+        if self._turn is not None:
+            self._sequencer._release(self._turn)
+
+
+class RecipientSequencer(_RecipientSequencer):
+    """
+    Sends the messages to every recipient one at a time, in the order they were sent, while messages to different
+    recipients are sent concurrently.
+
+    - Replies that are sent with the shortcuts of the updates (e.g. ``msg.reply_text(...)``,
+      ``msg.reply_image(...)``, ``msg.react(...)``) and messages of :meth:`~pywa_async.client.WhatsApp.send_bulk`
+      wait for the earlier messages to the same recipient, including their uploads and retries. Replies that are
+      started together (e.g. with ``asyncio.gather``) are sent in the order they were started.
+    - Up to ``max_pending`` messages can wait for every recipient (besides the one that is being sent). Sending
+      more raises :class:`~pywa.sequencer.SequencerQueueFull`.
+    - A recipient is dropped as soon as it has no messages in flight, so the memory is bounded by the recipients
+      that are being messaged.
+    - The sequencer is reentrant: a message to a recipient that is sent by the task that holds the turn of the
+      recipient (e.g. a reply from the ``send`` function of :meth:`~pywa_async.client.WhatsApp.send_bulk`) is sent
+      right away, as a part of the message that holds the turn.
+
+    Example:
+
+        .. code-block:: python
+
+            from pywa_async import WhatsApp
+            from pywa_async.sequencer import RecipientSequencer
+
+            wa = WhatsApp(..., sequencer=RecipientSequencer())
+
+    Args:
+        max_pending: The maximum number of messages that can wait for every recipient.
+    """
+
+    def sequence(
+        self, phone_id: str, recipient: str
+    ) -> contextlib.AbstractAsyncContextManager[None]:
+        """
+        Wait for the turn of a message, and keep it until the block exits.
+
+        Example:
+
+            .. code-block:: python
+
+                async with sequencer.sequence(wa.phone_id, user):
+                    await wa.send_message(to=user, text="first")
+                    await wa.send_message(to=user, text="second")
+
+        Args:
+            phone_id: The phone id to send the message from.
+            recipient: The recipient of the message.
+
+        Raises:
+            SequencerQueueFull: If ``max_pending`` messages are already waiting for the recipient.
+        """
+        return _AsyncSequenceScope(self, phone_id, recipient)
@@ -1,5 +1,6 @@
 import asyncio
 import copy
+import inspect
 import logging
 import time
 import warnings
@@ -15,6 +16,7 @@ from .handlers import (
     Handler,
     RawUpdateHandler,
 )
+from .scheduler import Priority, send_priority
 from .types import (
     ContinueHandling,
     RawUpdate,
@@ -123,9 +125,18 @@ class Server:
             _logger, raw_update._update_hash, self._webhook_endpoint
         )
         start = time.perf_counter()
+        forwarded = False
         handler_type: type[Handler] | None = None
         try:
             try:
+                if self._api is not None:
+                    self._api._invalidate_cached_by_update(
+                        raw_update.field, raw_update.value
+                    )
+                if self._service_windows is not None:
+                    self._service_windows._record_update(
+                        raw_update.field, raw_update.value
+                    )
                 handler_type = self._get_handler_type(raw_update)
             except (KeyError, ValueError, TypeError, IndexError):
                 log_fn = log.error if self._validate_updates else log.debug
@@ -149,14 +160,19 @@ class Server:
                 ].from_update(client=self, update=raw_update)
                 if log.isEnabledFor(logging.DEBUG):
                     log.debug("Constructed update: %s", constructed_update)
+                if self._forward_to_listener_bus(constructed_update):
+                    log.debug("Forwarded to the worker that listens to the update")
+                    forwarded = True
+                    return
                 if await self._process_listener(constructed_update):
                     return
                 await self._invoke_callbacks(handler_type, constructed_update)
             except Exception:
                 log.exception("Failed to construct update (field=%s)", raw_update.field)
         finally:
-            # Always call raw update handler last
-            await self._call_raw_update_handler(raw_update)
+            # Always call raw update handler last (forwarded updates are handled by the listening worker)
+            if not forwarded:
+                await self._call_raw_update_handler(raw_update)
             log.info(
                 "Finished processing update (handler=%s) in %.2fms",
                 handler_type.__name__ if handler_type else None,
@@ -184,11 +200,12 @@ class Server:
                 if checked_update is None:
                     continue
                 log.debug("Calling '%s'", callback_name)
-                await handler._callback(
-                    self, checked_update
-                ) if handler._is_async_callback else handler._callback(
-                    self, checked_update
-                )
+                with send_priority(Priority.INTERACTIVE):
+                    await handler._callback(
+                        self, checked_update
+                    ) if handler._is_async_callback else handler._callback(
+                        self, checked_update
+                    )
                 handled = True
             except StopHandling:
                 log.debug("Stopped further handling after '%s'", callback_name)
@@ -209,6 +226,8 @@ class Server:
 
     async def _process_listener(self: "WhatsApp", update: BaseUpdate) -> bool:
         """Process and answer a listener if present."""
+        if not self._listeners_restored:
+            self.restore_listeners()
         if not (listener_identifiers := update.listener_identifiers):
             return False
         raw = getattr(update, "raw", None)
@@ -227,10 +246,12 @@ class Server:
 
         try:
             if await listener.apply_filters(self, update):
-                listener.set_result(update)
+                if inspect.isawaitable(res := listener.set_result(update)):
+                    await res
                 return not self._continue_handling
             elif await listener.apply_cancelers(self, update):
-                listener.cancel(update)
+                if inspect.isawaitable(res := listener.cancel(update)):
+                    await res
                 return not self._continue_handling
             else:
                 return False  # if no filters or cancelers matched, continue handling
@@ -254,9 +275,7 @@ class Server:
         loop = asyncio.new_event_loop()
         api = copy.copy(self.api)
         api._session = self._httpx_client(  # TODO: copy the session properly
-            timeout=api._session.timeout,
-            base_url=api._session.base_url,
-            headers=api._session.headers,
+            timeout=api._session.timeout
         )
 
         assert self._callback_url is not None
@@ -0,0 +1 @@
+from pywa.service_windows import *
@@ -0,0 +1,109 @@
+"""Clients for many businesses (tenants) that share a single connection pool."""
+
+from __future__ import annotations
+
+import inspect
+from collections.abc import Awaitable, Callable
+from typing import Any, cast
+
+import httpx
+
+from pywa.tenants import *
+from pywa.tenants import TenantClients as _TenantClients
+
+from .client import WhatsApp
+from .transport import InstrumentedTransport, TransportConfig
+
+
+class TenantClients(_TenantClients):
+    """
+    Creates a :class:`~pywa_async.client.WhatsApp` client for every tenant, with all the clients sharing a single
+    connection pool (instead of a pool, and TLS handshakes, per tenant).
+
+    - The clients send the token of their tenant with every request, so they can share the pool safely.
+    - Clients are created on first use (by ``resolve``) or by :meth:`add`, and up to ``max_clients`` clients are
+      kept (the least recently used are dropped, and created again when needed).
+    - The clients are created without a server. Receive the webhooks of all the tenants with a single client (with
+      ``filter_updates=False``), and use the ``waba_id`` of the update to pick the client of the tenant.
+
+    Example:
+
+        .. code-block:: python
+
+            from pywa_async.tenants import Tenant, TenantClients
+            from pywa_async.transport import TransportConfig
+
+
+            async def resolve(tenant_id: str) -> Tenant:
+                row = await db.get_tenant(tenant_id)
+                return Tenant(token=row.token, phone_id=row.phone_id)
+
+
+            clients = TenantClients(
+                resolve=resolve,
+                transport=TransportConfig(max_connections=200),
+                api_version="23.0",
+            )
+
+            await (await clients.get("acme")).send_message(
+                to="972123456789", text="Hello from Acme!"
+            )
+
+    Args:
+        resolve: A function (or an async function) that gets the :class:`Tenant` of a tenant ID that has no client yet
+         (default: only tenants that were added with :meth:`add`).
+        session: The ``httpx.AsyncClient`` to share between the clients (default: one that is created from
+         ``transport``).
+        transport: The connection pool configuration of the shared session. Can't be used with ``session``.
+        max_clients: The maximum number of clients to keep.
+        **client_kwargs: Arguments for every client (e.g. ``api_version``, ``retry_policy``, ``rate_limiter``).
+    """
+
+    _client_cls = WhatsApp
+    _httpx_client = httpx.AsyncClient
+    _transport_cls = InstrumentedTransport
+    session: httpx.AsyncClient
+
+    def __init__(
+        self,
+        resolve: Callable[[str], Tenant | Awaitable[Tenant]] | None = None,
+        *,
+        session: httpx.AsyncClient | None = None,
+        transport: TransportConfig | None = None,
+        max_clients: int = 10_000,
+        **client_kwargs: Any,
+    ):
+        super().__init__(
+            cast("Callable[[str], Tenant] | None", resolve),
+            session=cast("httpx.Client | None", session),
+            transport=transport,
+            max_clients=max_clients,
+            **client_kwargs,
+        )
+
+    async def get(self, tenant_id: str) -> WhatsApp:
+        """
+        Get the client of a tenant (created by ``resolve`` on first use).
+
+        Args:
+            tenant_id: The ID of the tenant.
+
+        Returns:
+            The client of the tenant.
+
+        Raises:
+            KeyError: If the tenant has no client and there is no ``resolve`` function.
+        """
+        if (client := self._cached(str(tenant_id))) is not None:
+            return client
+        if self._resolve is None:
+            raise KeyError(tenant_id)
+        tenant = self._resolve(str(tenant_id))
+        return self.add(
+            tenant_id, await tenant if inspect.isawaitable(tenant) else tenant
+        )
+
+    async def close(self) -> None:
+        """Drop all the clients and close the shared session."""
+        self._clients.clear()
+        await self.session.aclose()
@@ -0,0 +1,58 @@
+"""The HTTP transport to the Graph API: connection pool configuration and statistics."""
+
+from __future__ import annotations
+
+import httpx
+
+from pywa.transport import *
+from pywa.transport import _RequestTrace, _TransportMetrics
+
+
+class _AsyncRequestTrace(_RequestTrace):
+    """An async ``httpcore`` trace callback that records when the request got its connection."""
+
+    __slots__ = ()
+
+    async def __call__(self, name: str, info: dict) -> None:
+        self._record(name)
+        if self._next is not None:
+            await self._next(name, info)
+
+
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """
+    An ``httpx`` transport that records the statistics of its connection pool (see :class:`TransportStats`).
+
+    - Used by the client when it creates its own ``session``.
+
+    Args:
+        config: The configuration of the connection pool.
+        transport: The transport to send the requests with (default: an ``httpx.AsyncHTTPTransport`` from ``config``).
+    """
+
+    def __init__(
+        self,
+        config: TransportConfig | None = None,
+        *,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        config = config or TransportConfig()
+        self._transport = transport or httpx.AsyncHTTPTransport(
+            http2=config.http2, limits=config._limits()
+        )
+        self._metrics = _TransportMetrics()
+
+    @property
+    def stats(self) -> TransportStats:
+        """The statistics of the connection pool."""
+        return self._metrics.snapshot(getattr(self._transport, "_pool", None))
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._metrics.start(request, _AsyncRequestTrace)
+        try:
+            return await self._transport.handle_async_request(request)
+        finally:
+            self._metrics.finish()
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import pathlib
 from collections.abc import AsyncIterator, Callable, Iterable, Iterator
-from typing import TYPE_CHECKING, BinaryIO
+from typing import TYPE_CHECKING, Any, BinaryIO, TypeVar
 
 from pywa.types.base_update import *
+from pywa.types.base_update import _queue_receipt
 
 from .others import Contact, ProductsSection, SuccessResult
 from .user import User
@@ -43,6 +45,24 @@ if TYPE_CHECKING:
     from .templates import BaseParams, Template, TemplateLanguage
 
 
+_ShortcutT = TypeVar("_ShortcutT", bound=Callable[..., Any])
+
+
+def _in_order(shortcut: _ShortcutT) -> _ShortcutT:
+    """Send the message of a shortcut after the earlier messages to the same chat (by the ``sequencer`` of the client)."""
+
+    @functools.wraps(shortcut)
+    async def wrapper(self: _ClientShortcutsAsync, *args, **kwargs):
+        if self._client._sequencer is None:
+            return await shortcut(self, *args, **kwargs)
+        async with self._client._sequence(
+            self._internal_recipient, self._get_reply_to(kwargs.get("private", False))
+        ):
+            return await shortcut(self, *args, **kwargs)
+
+    return wrapper
+
+
 class _ClientShortcutsAsync:
     """Async Base class for all user-related update types (message, callback, etc.)."""
 
@@ -60,6 +80,7 @@ class _ClientShortcutsAsync:
     _internal_recipient: str
     _get_reply_to: Callable[..., str]
 
+    @_in_order
     async def reply_text(
         self,
         text: str,
@@ -129,6 +150,7 @@ class _ClientShortcutsAsync:
 
     reply = reply_text  # alias
 
+    @_in_order
     async def reply_image(
         self,
         image: (
@@ -197,6 +219,7 @@ class _ClientShortcutsAsync:
             tracker=tracker,
         )
 
+    @_in_order
     async def reply_video(
         self,
         video: (
@@ -265,6 +288,7 @@ class _ClientShortcutsAsync:
             tracker=tracker,
         )
 
+    @_in_order
     async def reply_document(
         self,
         document: (
@@ -336,6 +360,7 @@ class _ClientShortcutsAsync:
             tracker=tracker,
         )
 
+    @_in_order
     async def reply_audio(
         self,
         audio: (
@@ -394,6 +419,7 @@ class _ClientShortcutsAsync:
             tracker=tracker,
         )
 
+    @_in_order
     async def reply_voice(
         self,
         voice: str
@@ -447,6 +473,7 @@ class _ClientShortcutsAsync:
             tracker=tracker,
         )
 
+    @_in_order
     async def reply_sticker(
         self,
         sticker: (
@@ -504,6 +531,7 @@ class _ClientShortcutsAsync:
             tracker=tracker,
         )
 
+    @_in_order
     async def reply_location(
         self,
         latitude: float,
@@ -560,6 +588,7 @@ class _ClientShortcutsAsync:
             tracker=tracker,
         )
 
+    @_in_order
     async def reply_location_request(
         self,
         text: str,
@@ -603,6 +632,7 @@ class _ClientShortcutsAsync:
             tracker=tracker,
         )
 
+    @_in_order
     async def reply_contact_info_request(
         self,
         text: str,
@@ -647,6 +677,7 @@ class _ClientShortcutsAsync:
             identity_key_hash=identity_key_hash,
         )
 
+    @_in_order
     async def reply_contact(
         self,
         contact: Contact | Iterable[Contact],
@@ -706,6 +737,7 @@ class _ClientShortcutsAsync:
             tracker=tracker,
         )
 
+    @_in_order
     async def react(
         self,
         emoji: str,
@@ -747,6 +779,7 @@ class _ClientShortcutsAsync:
             tracker=tracker,
         )
 
+    @_in_order
     async def unreact(
         self,
         *,
@@ -784,6 +817,7 @@ class _ClientShortcutsAsync:
             tracker=tracker,
         )
 
+    @_in_order
     async def reply_catalog(
         self,
         body: str,
@@ -841,6 +875,7 @@ class _ClientShortcutsAsync:
             tracker=tracker,
         )
 
+    @_in_order
     async def reply_product(
         self,
         catalog_id: str,
@@ -899,6 +934,7 @@ class _ClientShortcutsAsync:
             tracker=tracker,
         )
 
+    @_in_order
     async def reply_products(
         self,
         catalog_id: str,
@@ -970,6 +1006,7 @@ class _ClientShortcutsAsync:
             tracker=tracker,
         )
 
+    @_in_order
     async def reply_template(
         self,
         name: str | None = None,
@@ -1021,6 +1058,7 @@ class _ClientShortcutsAsync:
             tracker=tracker,
         )
 
+    @_in_order
     async def reply_carousel(
         self,
         *,
@@ -1064,6 +1102,7 @@ class _ClientShortcutsAsync:
         Mark the message as read.
 
         - Shortcut for :py:func:`~pywa.client.WhatsApp.mark_message_as_read` with ``message_id``.
+        - With the ``receipts`` of the client, the receipt is merged with the other receipts of the chat and sent later (see :class:`~pywa.receipts.ReceiptAggregator`).
         - You can mark incoming messages as read by using the :py:func:`~pywa.types.base_update.BaseUserUpdate.mark_as_read` method or indicate typing by using the :py:func:`~pywa.types.base_update.BaseUserUpdate.indicate_typing` method on every update.
         - It's good practice to mark an incoming messages as read within 30 days of receipt. Marking a message as read will also mark earlier messages in the thread as read.
         - Read more about `Mark messages as read <https://developers.facebook.com/docs/whatsapp/cloud-api/guides/mark-message-as-read>`_.
@@ -1078,6 +1117,8 @@ class _ClientShortcutsAsync:
         Returns:
             Whether it was successful.
         """
+        if self._client._receipts is not None:
+            return _queue_receipt(self, typing=False)
         return await self._client.mark_message_as_read(
             sender=self._internal_recipient, message_id=self.message_id_to_reply
         )
@@ -1087,6 +1128,7 @@ class _ClientShortcutsAsync:
         Mark the message as read and display a typing indicator so the WhatsApp user knows you are preparing a response.
 
         - Shortcut for :py:func:`~pywa.client.WhatsApp.indicate_typing` with ``message_id``.
+        - With the ``receipts`` of the client, the indicator is merged with the other receipts of the chat and sent later (see :class:`~pywa.receipts.ReceiptAggregator`).
         - The typing indicator will be dismissed once you respond, or after 25 seconds, whichever comes first. To prevent a poor user experience, only display a typing indicator if you are going to respond.
         - Read more about `Typing indicators <https://developers.facebook.com/docs/whatsapp/cloud-api/typing-indicators>`_.
 
@@ -1100,6 +1142,8 @@ class _ClientShortcutsAsync:
         Returns:
             Whether it was successful.
         """
+        if self._client._receipts is not None:
+            return _queue_receipt(self, typing=True)
         return await self._client.indicate_typing(
             sender=self._internal_recipient, message_id=self.message_id_to_reply
         )
@@ -1,8 +1,15 @@
+import concurrent.futures
+import threading
+import time
+
 import httpx
 import pytest
 
+from pywa import errors, utils
 from pywa.api import GraphAPI, _UnpauseTemplateResult
+from pywa.circuit_breaker import CircuitBreaker, CircuitOpenError
 from pywa.errors import WhatsAppError
+from pywa.response_cache import ResponseCache
 
 TOKEN = "xyz-token"
 API_VERSION = 21.0
@@ -27,17 +34,31 @@ def req(api, mocker):
 # --- __init__ / dunder / static helpers ---------------------------------
 
 
-def test_init_sets_auth_header_and_base_url(session):
-    GraphAPI(token=TOKEN, session=session, api_version=API_VERSION)
-    assert session.headers["Authorization"] == f"Bearer {TOKEN}"
-    assert "PyWa/" in session.headers["User-Agent"]
-    assert str(session.base_url) == f"https://graph.facebook.com/v{API_VERSION}/"
+def test_init_does_not_touch_the_session(session):
+    api = GraphAPI(token=TOKEN, session=session, api_version=API_VERSION)
+    assert "Authorization" not in session.headers
+    assert api._headers["Authorization"] == f"Bearer {TOKEN}"
+    assert "PyWa/" in api._headers["User-Agent"]
+    assert api._url("/foo") == f"https://graph.facebook.com/v{API_VERSION}/foo"
+    assert api._url("https://x.test/a") == "https://x.test/a"
 
 
-def test_init_raises_on_reused_session():
-    session = httpx.Client(headers={"Authorization": "Bearer already-set"})
-    with pytest.raises(ValueError):
-        GraphAPI(token=TOKEN, session=session, api_version=API_VERSION)
+def test_shared_session_sends_the_token_of_every_api():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((str(request.url), request.headers["Authorization"]))
+        return httpx.Response(200, json={"ok": True})
+
+    session = httpx.Client(transport=httpx.MockTransport(handler))
+    api1 = GraphAPI(token="t1", session=session, api_version=API_VERSION)
+    api2 = GraphAPI(token="t2", session=session, api_version=22.0)
+    api1._request(method="GET", endpoint="/foo")
+    api2._request(method="GET", endpoint="/foo", headers={"X-Extra": "1"})
+    assert seen == [
+        (f"https://graph.facebook.com/v{API_VERSION}/foo", "Bearer t1"),
+        ("https://graph.facebook.com/v22.0/foo", "Bearer t2"),
+    ]
 
 
 def test_str_and_repr(api):
@@ -109,6 +130,309 @@ def test_request_generic_request_error_reraises(api, mocker):
         api._request(method="GET", endpoint="/foo")
 
 
+def _error(code: int, headers: dict | None = None) -> httpx.Response:
+    return httpx.Response(
+        400,
+        json={"error": {"message": "err", "type": "OAuthException", "code": code}},
+        headers=headers,
+        request=httpx.Request("GET", "https://x.test"),
+    )
+
+
+@pytest.fixture
+def retrying_api(session):
+    return GraphAPI(
+        token=TOKEN,
+        session=session,
+        api_version=API_VERSION,
+        retry_policy=utils.RetryPolicy(
+            rules={errors.RateLimitHit: utils.RetryRule(backoff=0.01, jitter=False)},
+            transient=utils.RetryRule(backoff=0.01, jitter=False, idempotent_only=True),
+        ),
+    )
+
+
+def test_request_retries_rate_limit(retrying_api, mocker):
+    request_mock = mocker.patch.object(
+        retrying_api._session,
+        "request",
+        side_effect=[_error(130429), _error(130429), _response(200, {"ok": True})],
+    )
+    sleep = mocker.patch("pywa.api.time.sleep")
+    assert retrying_api._request(method="POST", endpoint="/foo") == {"ok": True}
+    assert request_mock.call_count == 3
+    assert [c.args[0] for c in sleep.call_args_list] == [0.01, 0.02]
+    stats = retrying_api._retry_policy.stats
+    assert (stats.retried_requests, stats.retries) == (1, 2)
+    assert stats.retries_by_error == {"RateLimitHit": 2}
+
+
+def test_request_retry_honors_retry_after(retrying_api, mocker):
+    mocker.patch.object(
+        retrying_api._session,
+        "request",
+        side_effect=[
+            _error(130429, headers={"Retry-After": "3"}),
+            _response(200, {"ok": True}),
+        ],
+    )
+    sleep = mocker.patch("pywa.api.time.sleep")
+    retrying_api._request(method="POST", endpoint="/foo")
+    sleep.assert_called_once_with(3.0)
+
+
+def test_request_retries_exhausted(retrying_api, mocker):
+    request_mock = mocker.patch.object(
+        retrying_api._session, "request", return_value=_error(130429)
+    )
+    mocker.patch("pywa.api.time.sleep")
+    with pytest.raises(errors.RateLimitHit):
+        retrying_api._request(method="POST", endpoint="/foo")
+    assert request_mock.call_count == 4
+    assert retrying_api._retry_policy.stats.exhausted == 1
+
+
+def test_request_does_not_retry_spam_rate_limit(retrying_api, mocker):
+    request_mock = mocker.patch.object(
+        retrying_api._session, "request", return_value=_error(131048)
+    )
+    with pytest.raises(errors.SpamRateLimitHit):
+        retrying_api._request(method="POST", endpoint="/foo")
+    assert request_mock.call_count == 1
+
+
+@pytest.mark.parametrize("method, calls", [("GET", 2), ("POST", 1)])
+def test_request_retries_read_timeout_only_if_idempotent(
+    retrying_api, mocker, method, calls
+):
+    request_mock = mocker.patch.object(
+        retrying_api._session,
+        "request",
+        side_effect=[httpx.ReadTimeout("t"), _response(200, {"ok": True})],
+    )
+    mocker.patch("pywa.api.time.sleep")
+    if calls == 1:
+        with pytest.raises(httpx.ReadTimeout):
+            retrying_api._request(method=method, endpoint="/foo")
+    else:
+        retrying_api._request(method=method, endpoint="/foo")
+    assert request_mock.call_count == calls
+
+
+def test_request_does_not_retry_streamed_body(retrying_api, mocker, tmp_path):
+    request_mock = mocker.patch.object(
+        retrying_api._session, "request", return_value=_error(130429)
+    )
+    (path := tmp_path / "f").write_bytes(b"x")
+    with path.open("rb") as f, pytest.raises(errors.RateLimitHit):
+        retrying_api._request(
+            method="POST", endpoint="/foo", files={"file": ("f", f, "text/plain")}
+        )
+    assert request_mock.call_count == 1
+
+
+def test_request_rate_limits_sent_messages(session, mocker):
+    limiter = utils.RateLimiter(rate=1000, pair_rate=1000)
+    api = GraphAPI(
+        token=TOKEN, session=session, api_version=API_VERSION, rate_limiter=limiter
+    )
+    mocker.patch.object(
+        api._session,
+        "request",
+        side_effect=[_error(130429), _response(200, {"ok": True})],
+    )
+    reserve = mocker.spy(limiter, "reserve")
+    with pytest.raises(errors.RateLimitHit):
+        api.send_message(
+            sender="123",
+            to="972",
+            recipient=None,
+            recipient_type="individual",
+            typ="text",
+            msg={"body": "hi"},
+        )
+    assert limiter.current_rate("123") == 500
+    api.mark_message_as_read(phone_id="123", message_id="wamid")
+    reserve.assert_called_once_with("123", "972")
+
+
+def test_request_rate_limits_messages_sent_as_content(session, mocker):
+    limiter = utils.RateLimiter(rate=1000, pair_rate=1000)
+    api = GraphAPI(
+        token=TOKEN, session=session, api_version=API_VERSION, rate_limiter=limiter
+    )
+    request_mock = mocker.patch.object(
+        api._session, "request", return_value=_response(200, {"ok": True})
+    )
+    reserve = mocker.spy(limiter, "reserve")
+    api.send_message_content(sender="123", recipient="972", content=b"{}")
+    reserve.assert_called_once_with("123", "972")
+    assert request_mock.call_args.kwargs["content"] == b"{}"
+
+
+@pytest.fixture
+def cached_api(session):
+    return GraphAPI(
+        token=TOKEN,
+        session=session,
+        api_version=API_VERSION,
+        response_cache=ResponseCache(),
+    )
+
+
+def test_cached_reads(cached_api, mocker):
+    request_mock = mocker.patch.object(
+        cached_api._session,
+        "request",
+        side_effect=lambda method, url, **_: _response(200, {"id": url[-3:]}),
+    )
+    first = cached_api.get_template(template_id="t1", fields=("status",))
+    first["id"] = "mutated"
+    assert cached_api.get_template("t1", ("status",)) == {"id": "/t1"}
+    cached_api.get_template(template_id="t1")  # other fields
+    cached_api.get_business_profile(phone_id="p1")
+    cached_api.get_business_profile(phone_id="p1")
+    assert request_mock.call_count == 3
+    stats = cached_api._response_cache.stats
+    assert (stats.hits, stats.misses) == (2, 3)
+
+
+def test_cached_reads_invalidated_by_writes(cached_api, mocker):
+    request_mock = mocker.patch.object(
+        cached_api._session, "request", return_value=_response(200, {"ok": True})
+    )
+    cache = cached_api._response_cache
+    cached_api.get_template(template_id="t1")
+    cached_api.get_flow(flow_id="f1")
+    cached_api.get_business_profile(phone_id="p1")
+    cached_api.get_business_phone_number(phone_id="p1")
+    cached_api.send_message(
+        sender="p1",
+        to="972",
+        recipient=None,
+        recipient_type="individual",
+        typ="text",
+        msg={"body": "hi"},
+    )
+    assert len(cache) == 4
+    cached_api.update_template(template_id="t1", template="{}")
+    cached_api.publish_flow(flow_id="f1")
+    cached_api.update_business_profile(phone_id="p1", data={"about": "hi"})
+    assert [key[0] for key in cache._entries] == ["phone_number"]
+    cached_api.get_template(template_id="t2")
+    cached_api.delete_template(waba_id="w1", template_name="t2")
+    assert len(cache) == 1
+    assert request_mock.call_count == 10
+
+
+def test_cached_reads_invalidated_by_webhooks(cached_api, mocker):
+    mocker.patch.object(
+        cached_api._session, "request", return_value=_response(200, {"ok": True})
+    )
+    cache = cached_api._response_cache
+    for template_id in ("1", "2"):
+        cached_api.get_template(template_id=template_id)
+    cached_api.get_business_phone_number(phone_id="p1")
+    cached_api._invalidate_cached_by_update(
+        "message_template_status_update", {"message_template_id": 1, "event": "PAUSED"}
+    )
+    assert [key[1] for key in cache._entries] == ["2", "p1"]
+    cached_api._invalidate_cached_by_update("phone_number_name_update", {})
+    assert [key[1] for key in cache._entries] == ["2"]
+
+
+def test_cached_reads_are_not_cached_on_errors(cached_api, mocker):
+    request_mock = mocker.patch.object(
+        cached_api._session,
+        "request",
+        side_effect=[_error(100), _response(200, {"ok": True})],
+    )
+    with pytest.raises(errors.WhatsAppError):
+        cached_api.get_flow(flow_id="f1")
+    assert cached_api.get_flow(flow_id="f1") == {"ok": True}
+    assert request_mock.call_count == 2
+
+
+def test_cached_reads_single_flight(cached_api, mocker):
+    started, release = threading.Event(), threading.Event()
+
+    def request(method, url, **_):
+        started.set()
+        release.wait(5)
+        return _response(200, {"id": url[-3:]})
+
+    request_mock = mocker.patch.object(
+        cached_api._session, "request", side_effect=request
+    )
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [
+            pool.submit(cached_api.get_business_phone_number, "p1") for _ in range(4)
+        ]
+        started.wait(5)
+        while cached_api._response_cache.stats.collapsed < 3:
+            time.sleep(0.001)
+        release.set()
+        assert [f.result() for f in futures] == [{"id": "/p1"}] * 4
+    assert request_mock.call_count == 1
+
+
+def test_cached_reads_not_cached_without_cache(api, mocker):
+    request_mock = mocker.patch.object(
+        api._session, "request", return_value=_response(200, {"ok": True})
+    )
+    api.get_commerce_settings(phone_id="p1")
+    api.get_commerce_settings(phone_id="p1")
+    assert request_mock.call_count == 2
+
+
+def test_request_circuit_breaker_fails_fast(session, mocker):
+    breaker = CircuitBreaker(min_requests=2, open_for=60)
+    api = GraphAPI(
+        token=TOKEN,
+        session=session,
+        api_version=API_VERSION,
+        circuit_breaker=breaker,
+    )
+    request_mock = mocker.patch.object(
+        api._session, "request", side_effect=httpx.ConnectError("down")
+    )
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            api._request(method="POST", endpoint="/123/messages", json={})
+    with pytest.raises(CircuitOpenError) as e:
+        api._request(method="POST", endpoint="/123/messages", json={})
+    assert e.value.circuit == ("messages", "123")
+    assert request_mock.call_count == 2
+    with pytest.raises(httpx.ConnectError):
+        api._request(method="POST", endpoint="/456/messages", json={})
+    assert request_mock.call_count == 3
+
+
+def test_request_circuit_breaker_passes_api_errors(session, mocker):
+    breaker = CircuitBreaker(min_requests=10)
+    api = GraphAPI(
+        token=TOKEN,
+        session=session,
+        api_version=API_VERSION,
+        circuit_breaker=breaker,
+    )
+    mocker.patch.object(
+        api._session,
+        "request",
+        side_effect=[
+            _response(400, {"error": {"message": "bad", "code": 100}}),
+            _response(500, {"error": {"message": "down", "code": 2}}),
+        ],
+    )
+    with pytest.raises(errors.WhatsAppError) as e:
+        api._request(method="POST", endpoint="/123/messages", json={})
+    assert e.value.code == 100
+    with pytest.raises(errors.WhatsAppError):
+        api._request(method="POST", endpoint="/123/messages", json={})
+    status = breaker.status(("messages", "123"))[("messages", "123")]
+    assert (status.requests, status.failures) == (2, 1)
+
+
 # --- OAuth / app subscriptions ---------------------------------------------
 
 
@@ -251,7 +575,7 @@ def test_stream_media_bytes(api, mocker):
     stream_mock.assert_called_once_with(
         method="GET",
         url="https://media/1",
-        headers=api._session.headers.copy(),
+        headers=api._headers.copy(),
         follow_redirects=True,
         timeout=5,
     )
@@ -359,6 +683,19 @@ def test_send_marketing_message(api, req):
     )
 
 
+def test_send_message_content(api, req):
+    api.send_message_content(
+        sender="p1", recipient="123", content=b'{"to":"123"}', marketing=True
+    )
+    req.assert_called_once_with(
+        method="POST",
+        endpoint="/p1/marketing_messages",
+        recipient="123",
+        content=b'{"to":"123"}',
+        headers={"Content-Type": "application/json"},
+    )
+
+
 def test_mark_message_as_read(api, req):
     api.mark_message_as_read(phone_id="p1", message_id="wamid.1")
     req.assert_called_once_with(
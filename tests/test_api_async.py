@@ -1,9 +1,14 @@
+import asyncio
 from unittest.mock import AsyncMock
 
 import httpx
 import pytest
 
+from pywa import errors, utils
+from pywa.circuit_breaker import CircuitBreaker
 from pywa.errors import WhatsAppError
+from pywa.hedging import HedgingPolicy
+from pywa.response_cache import ResponseCache
 from pywa_async.api import GraphAPIAsync
 
 TOKEN = "xyz-token"
@@ -31,17 +36,26 @@ def req(api, mocker):
 # --- __init__ / dunder -----------------------------------------------------
 
 
-def test_init_sets_auth_header_and_base_url(session):
-    GraphAPIAsync(token=TOKEN, session=session, api_version=API_VERSION)
-    assert session.headers["Authorization"] == f"Bearer {TOKEN}"
-    assert "PyWa/" in session.headers["User-Agent"]
-    assert str(session.base_url) == f"https://graph.facebook.com/v{API_VERSION}/"
+def test_init_does_not_touch_the_session(session):
+    api = GraphAPIAsync(token=TOKEN, session=session, api_version=API_VERSION)
+    assert "Authorization" not in session.headers
+    assert api._headers["Authorization"] == f"Bearer {TOKEN}"
+    assert api._url("/foo") == f"https://graph.facebook.com/v{API_VERSION}/foo"
 
 
-def test_init_raises_on_reused_session():
-    session = httpx.AsyncClient(headers={"Authorization": "Bearer already-set"})
-    with pytest.raises(ValueError):
-        GraphAPIAsync(token=TOKEN, session=session, api_version=API_VERSION)
+@pytest.mark.asyncio
+async def test_shared_session_sends_the_token_of_every_api():
+    seen = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["Authorization"])
+        return httpx.Response(200, json={"ok": True})
+
+    session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    for token in ("t1", "t2"):
+        api = GraphAPIAsync(token=token, session=session, api_version=API_VERSION)
+        await api._request(method="GET", endpoint="/foo")
+    assert seen == ["Bearer t1", "Bearer t2"]
 
 
 def test_str(api):
@@ -264,7 +278,7 @@ def test_stream_media_bytes(api, mocker):
     stream_mock.assert_called_once_with(
         method="GET",
         url="https://media/1",
-        headers=api._session.headers.copy(),
+        headers=api._headers.copy(),
         follow_redirects=True,
         timeout=5,
     )
@@ -1299,3 +1313,121 @@ async def test_update_signup(api, req):
         endpoint="/signups/s1",
         json={"status": "APPROVED"},
     )
+
+
+@pytest.mark.asyncio
+async def test_request_retries_rate_limit(session, mocker):
+    api = GraphAPIAsync(
+        token=TOKEN,
+        session=session,
+        api_version=API_VERSION,
+        retry_policy=utils.RetryPolicy(
+            rules={errors.RateLimitHit: utils.RetryRule(backoff=0.01, jitter=False)}
+        ),
+    )
+    error = httpx.Response(
+        400,
+        json={"error": {"message": "err", "type": "OAuthException", "code": 130429}},
+        request=httpx.Request("POST", "https://x.test"),
+    )
+    request_mock = AsyncMock(side_effect=[error, _response(200, {"ok": True})])
+    mocker.patch.object(api._session, "request", request_mock)
+    sleep = mocker.patch("pywa_async.api.asyncio.sleep", AsyncMock())
+    assert await api._request(method="POST", endpoint="/foo") == {"ok": True}
+    assert request_mock.call_count == 2
+    sleep.assert_awaited_once_with(0.01)
+
+
+@pytest.mark.asyncio
+async def test_request_rate_limits_sent_messages(session, mocker):
+    limiter = utils.RateLimiter(rate=1, burst=1)
+    api = GraphAPIAsync(
+        token=TOKEN, session=session, api_version=API_VERSION, rate_limiter=limiter
+    )
+    mocker.patch.object(
+        api._session, "request", AsyncMock(return_value=_response(200, {"ok": True}))
+    )
+    sleep = mocker.patch("pywa_async.api.asyncio.sleep", AsyncMock())
+    for _ in range(2):
+        await api._request(
+            method="POST", endpoint="/123/messages", json={"to": "972", "type": "text"}
+        )
+    sleep.assert_awaited_once_with(pytest.approx(1, abs=0.05))
+    assert limiter.stats.delayed == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_reads_single_flight(session, mocker):
+    api = GraphAPIAsync(
+        token=TOKEN,
+        session=session,
+        api_version=API_VERSION,
+        response_cache=ResponseCache(),
+    )
+    release = asyncio.Event()
+
+    async def request(method, url, **_):
+        await release.wait()
+        return _response(200, {"id": url[-3:]})
+
+    request_mock = AsyncMock(side_effect=request)
+    mocker.patch.object(api._session, "request", request_mock)
+    reads = [asyncio.create_task(api.get_template(template_id="t1")) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    assert await asyncio.gather(*reads) == [{"id": "/t1"}] * 3
+    assert await api.get_template(template_id="t1") == {"id": "/t1"}
+    assert request_mock.call_count == 1
+    stats = api._response_cache.stats
+    assert (stats.misses, stats.collapsed, stats.hits) == (1, 2, 1)
+
+
+@pytest.mark.asyncio
+async def test_slow_reads_are_hedged(session, mocker):
+    hedging = HedgingPolicy(min_samples=2, min_delay=0.01, budget=1, max_burst=1)
+    api = GraphAPIAsync(
+        token=TOKEN, session=session, api_version=API_VERSION, hedging_policy=hedging
+    )
+    stuck = asyncio.Event()
+    calls = []
+
+    async def request(method, url, **_):
+        calls.append(method)
+        if len(calls) == 3:  # the first request of the third read never returns
+            await stuck.wait()
+        return _response(200, {"call": len(calls)})
+
+    mocker.patch.object(api._session, "request", AsyncMock(side_effect=request))
+    for _ in range(2):
+        await api._request(method="GET", endpoint="/media_id")
+    assert await api._request(method="GET", endpoint="/media_id") == {"call": 4}
+    await api._request(method="POST", endpoint="/media_id")
+    assert calls == ["GET"] * 4 + ["POST"]
+    stats = hedging.stats
+    assert (stats.requests, stats.hedged, stats.hedge_wins) == (3, 1, 1)
+    assert hedging._latencies[""][-1] >= 0.01  # since the first request, not the hedge
+
+
+@pytest.mark.asyncio
+async def test_request_circuit_breaker_passes_api_errors(session, mocker):
+    breaker = CircuitBreaker(min_requests=10)
+    api = GraphAPIAsync(
+        token=TOKEN, session=session, api_version=API_VERSION, circuit_breaker=breaker
+    )
+    mocker.patch.object(
+        api._session,
+        "request",
+        AsyncMock(
+            side_effect=[
+                _response(400, {"error": {"message": "bad", "code": 100}}),
+                _response(500, {"error": {"message": "down", "code": 2}}),
+            ]
+        ),
+    )
+    with pytest.raises(errors.WhatsAppError) as e:
+        await api._request(method="POST", endpoint="/123/messages", json={})
+    assert e.value.code == 100
+    with pytest.raises(errors.WhatsAppError):
+        await api._request(method="POST", endpoint="/123/messages", json={})
+    status = breaker.status(("messages", "123"))[("messages", "123")]
+    assert (status.requests, status.failures) == (2, 1)
@@ -357,6 +357,7 @@ def test_all_methods_are_overwritten_in_async(overrides):
         for m in {
             WhatsAppSync.upload_media,
             WhatsAppSync.stream_media,
+            WhatsAppSync.send_bulk,
             WhatsAppSync.add_handlers,
             WhatsAppSync.remove_handlers,
             WhatsAppSync.remove_callbacks,
@@ -371,6 +372,12 @@ def test_all_methods_are_overwritten_in_async(overrides):
             GraphAPISync.stream_media_bytes,
             GraphAPISync._join_fields,
             GraphAPISync._filter_none,
+            GraphAPISync._retry_delay,
+            GraphAPISync._message_key,
+            GraphAPISync._invalidate_cached,
+            GraphAPISync._invalidate_cached_by_update,
+            GraphAPISync._url,
+            GraphAPISync._circuit,
             ServerSync._delayed_register_callback_url,
             ServerSync._register_callback_url,
             ServerSync._get_handler_type,
@@ -403,6 +410,10 @@ def test_all_methods_are_overwritten_in_async(overrides):
             _HandlerDecorators.on_account_update,
             _HandlerDecorators.on_raw_update,
             ListenersSync._remove_listener,
+            ListenersSync._forward_to_listener_bus,
+            ListenersSync.continuation,
+            ListenersSync._resolve_continuation,
+            ListenersSync.restore_listeners,
             BaseUpdate.from_update,
             BaseUpdate.stop_handling,
             BaseUpdate.continue_handling,
@@ -432,6 +443,10 @@ def test_all_methods_are_overwritten_in_async(overrides):
     ]
     non_async = {
         "_register_routes",
+        "register_next_step",
+        "batch",
+        "_add_listener",
+        "_on_forwarded_update",
         "_register_flow_endpoint_callback",
         "_register_flow_callback_wrapper",
         "_api_cls",
@@ -440,8 +455,11 @@ def test_all_methods_are_overwritten_in_async(overrides):
         "_group_participant_cls",
         "_msg_status_cls",
         "_httpx_client",
+        "_transport_cls",
+        "_listeners_timeouts_cls",
         "_flow_req_cls",
         "_api_fields",
+        "_sequence",
         "is_quick_reply",
         "country_code",
     }
@@ -469,6 +487,8 @@ def test_same_signature(overrides):
         "_api_cls",
         "_usr_cls",
         "_httpx_client",
+        "_transport_cls",
+        "_listeners_timeouts_cls",
         "_flow_req_cls",
     ]
 
@@ -492,6 +512,8 @@ def test_same_signature(overrides):
             (MessageSync.reply_audio, ("audio",)),
             (MessageSync.reply_voice, ("voice",)),
             (WhatsAppSync.send_sticker, ("sticker",)),
+            (WhatsAppSync.send_bulk, ("recipients", "send")),
+            (WhatsAppSync._send_bulk_message, ("send",)),
             (MessageSync.reply_sticker, ("sticker",)),
             (WhatsAppSync.upload_media, ("media", "download_chunk_size", "dl_session")),
             (WhatsAppSync.update_business_profile, ("profile_picture",)),
@@ -533,6 +555,8 @@ def test_same_return_annotation(overrides):
     skip_methods = [
         WhatsAppSync.upload_media.__name__,
         WhatsAppSync.stream_media.__name__,
+        WhatsAppSync.send_bulk.__name__,
+        WhatsAppSync._sequence.__name__,
         GraphAPISync.stream_media_bytes.__name__,
         MediaSync.stream.__name__,
     ]
@@ -555,10 +579,13 @@ def test_same_docstring(overrides):
         "upload_media",
         "stream_media",
         "stream",
+        "send_bulk",
         "decrypt_media",
         "_api_cls",
         "_usr_cls",
         "_httpx_client",
+        "_transport_cls",
+        "_listeners_timeouts_cls",
         "_flow_req_cls",
     ]
     # class docstrings that intentionally call out the async variant (e.g. "(async)")
@@ -0,0 +1,171 @@
+import json
+import urllib.parse
+
+import httpx
+import pytest
+
+from pywa import WhatsApp, errors
+from pywa.batch import Batch
+from pywa_async import WhatsApp as WhatsAppAsync
+
+PHONE_ID = "123456789"
+
+
+def _media(media_id: str) -> dict:
+    return {
+        "id": media_id,
+        "url": f"https://media.test/{media_id}",
+        "mime_type": "image/jpeg",
+        "sha256": "abc",
+        "file_size": 1,
+    }
+
+
+class _Graph:
+    """Answers batch calls like the Graph API, and records every HTTP call."""
+
+    def __init__(self):
+        self.calls: list[httpx.Request] = []
+        self.batches: list[list[dict]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append(request)
+        form = urllib.parse.parse_qs(request.content.decode())
+        items = json.loads(form["batch"][0])
+        self.batches.append(items)
+        return httpx.Response(200, json=[self._answer(item) for item in items])
+
+    @staticmethod
+    def _answer(item: dict) -> dict | None:
+        media_id = item["relative_url"].split("?")[0]
+        if media_id == "timeout":
+            return None
+        if media_id == "missing":
+            error = {"message": "Not found", "type": "OAuthException", "code": 100}
+            return {"code": 400, "body": json.dumps({"error": error})}
+        return {"code": 200, "body": json.dumps(_media(media_id))}
+
+
+@pytest.fixture
+def graph() -> _Graph:
+    return _Graph()
+
+
+@pytest.fixture
+def wa(graph) -> WhatsApp:
+    return WhatsApp(
+        phone_id=PHONE_ID,
+        token="xyz",
+        session=httpx.Client(transport=httpx.MockTransport(graph)),
+    )
+
+
+def test_batch_sends_queued_calls_in_one_request(wa, graph):
+    with wa.batch() as b:
+        results = [b.get_media_url(media_id=str(i)) for i in range(3)]
+        assert not results[0].done()
+    assert len(graph.calls) == 1
+    assert graph.calls[0].method == "POST"
+    assert graph.batches == [
+        [{"method": "GET", "relative_url": str(i)} for i in range(3)]
+    ]
+    assert [r.result().url for r in results] == [
+        f"https://media.test/{i}" for i in range(3)
+    ]
+
+
+def test_batch_splits_by_max_size(wa, graph):
+    with wa.batch(max_size=2) as b:
+        results = [b.get_media_url(media_id=str(i)) for i in range(5)]
+    assert [len(batch) for batch in graph.batches] == [2, 2, 1]
+    assert all(r.result().id == str(i) for i, r in enumerate(results))
+
+
+def test_batch_maps_item_errors(wa):
+    with wa.batch() as b:
+        ok = b.get_media_url(media_id="1")
+        missing = b.get_media_url(media_id="missing")
+        timeout = b.get_media_url(media_id="timeout")
+    assert ok.result().id == "1"
+    assert isinstance(missing.exception(), errors.WhatsAppError)
+    assert missing.exception().code == 100
+    with pytest.raises(errors.WhatsAppError):
+        timeout.result()
+
+
+def test_batch_sends_uploads_once_and_replays_the_batched_request():
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.url.path.endswith("/media"):
+            return httpx.Response(200, json={"id": "media-1"})
+        items = json.loads(urllib.parse.parse_qs(request.content.decode())["batch"][0])
+        assert [item["relative_url"] for item in items] == [f"{PHONE_ID}/messages"]
+        assert "media-1" in items[0]["body"]
+        body = {
+            "messages": [{"id": "wamid.1"}],
+            "contacts": [{"wa_id": "972", "input": "972"}],
+        }
+        return httpx.Response(200, json=[{"code": 200, "body": json.dumps(body)}])
+
+    wa = WhatsApp(
+        phone_id=PHONE_ID,
+        token="xyz",
+        session=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    with wa.batch() as b:
+        sent = b.send_image(to="972", image=b"image", mime_type="image/png")
+    assert sent.result().id == "wamid.1"
+    assert [call.url.path.rsplit("/", 1)[-1] for call in calls] == ["media", ""]
+
+
+def test_batch_result_before_execute_raises(wa):
+    b = wa.batch()
+    result = b.get_media_url(media_id="1")
+    with pytest.raises(RuntimeError):
+        result.result()
+    assert len(b) == 1
+    assert b.execute() == [result]
+    assert len(b) == 0
+
+
+def test_batch_calls_without_requests_and_invalid_args(wa, graph):
+    with wa.batch() as b:
+        invalid = b.get_media_url()
+    assert isinstance(invalid.exception(), TypeError)
+    assert graph.calls == []
+
+
+def test_batch_not_sent_on_error(wa, graph):
+    with pytest.raises(ZeroDivisionError), wa.batch() as b:
+        b.get_media_url(media_id="1")
+        _ = 1 / 0
+    assert graph.calls == []
+
+
+def test_batch_invalid_max_size_and_private_attrs(wa):
+    with pytest.raises(ValueError):
+        Batch(wa, max_size=51)
+    with pytest.raises(AttributeError):
+        _ = wa.batch()._request
+
+
+@pytest.mark.asyncio
+async def test_async_batch(graph):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return graph(request)
+
+    wa = WhatsAppAsync(
+        phone_id=PHONE_ID,
+        token="xyz",
+        session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    async with wa.batch() as b:
+        ok = b.get_media_url(media_id="1")
+        missing = b.get_media_url(media_id="missing")
+    assert len(graph.calls) == 1
+    assert ok.result().url == "https://media.test/1"
+    assert isinstance(missing.exception(), errors.WhatsAppError)
+    with pytest.raises(TypeError), wa.batch():
+        pass
@@ -0,0 +1,173 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from pywa import WhatsApp, errors, utils
+from pywa_async import WhatsApp as WhatsAppAsync
+
+
+def _error(code: int) -> errors.WhatsAppError:
+    return errors.WhatsAppError.from_dict({"message": "err", "code": code})
+
+
+class _Sent:
+    def __init__(self, to, uploaded_media=None):
+        self.id = f"wamid.{to}"
+        self.uploaded_media = uploaded_media
+
+
+@pytest.fixture
+def wa() -> WhatsApp:
+    return WhatsApp(phone_id="123", token="xyz")
+
+
+def test_send_bulk_sends_to_all_recipients(wa):
+    calls = []
+
+    def send(to, **kwargs):
+        calls.append((to, kwargs))
+        return _Sent(to)
+
+    progress = []
+    results = list(
+        wa.send_bulk(
+            ["1", ("2", {"text": "override"}), "3"],
+            send=send,
+            params={"text": "hi"},
+            concurrency=2,
+            on_progress=lambda p: progress.append(p.done),
+        )
+    )
+    assert sorted(r.index for r in results) == [0, 1, 2]
+    assert all(r.ok and r.sent.id == f"wamid.{r.to}" for r in results)
+    assert sorted(calls) == [
+        ("1", {"text": "hi"}),
+        ("2", {"text": "override"}),
+        ("3", {"text": "hi"}),
+    ]
+    assert progress == [1, 2, 3]
+
+
+def test_send_bulk_send_by_name(wa, mocker):
+    send_mock = mocker.patch.object(
+        WhatsApp, "send_template", side_effect=lambda to, **_: _Sent(to)
+    )
+    results = list(wa.send_bulk(["1"], send="send_template", params={"template": 1}))
+    send_mock.assert_called_once_with(to="1", template=1)
+    assert results[0].ok
+
+
+def test_send_bulk_yields_errors_and_retries(wa, mocker):
+    mocker.patch("pywa.client.time.sleep")
+    attempts = {"1": 0, "2": 0}
+
+    def send(to, **_):
+        attempts[to] += 1
+        if to == "1" and attempts[to] < 3:
+            raise _error(130429)
+        if to == "2":
+            raise _error(131026)  # the message is undeliverable
+        return _Sent(to)
+
+    results = {
+        r.to: r
+        for r in wa.send_bulk(
+            ["1", "2"],
+            send=send,
+            retry_policy=utils.RetryPolicy(
+                rules={errors.RateLimitHit: utils.RetryRule(backoff=0, jitter=False)}
+            ),
+        )
+    }
+    assert results["1"].ok and results["1"].retries == 2
+    assert not results["2"].ok
+    assert isinstance(results["2"].error, errors.MessageUndeliverable)
+    assert attempts == {"1": 3, "2": 1}
+
+
+def test_send_bulk_reuses_uploaded_media(wa):
+    images = []
+
+    def send(to, image, **_):
+        images.append(image)
+        return _Sent(to, uploaded_media=None if image == "media-id" else "media-id")
+
+    results = list(
+        wa.send_bulk(
+            [str(i) for i in range(5)],
+            send=send,
+            params={"image": b"bytes"},
+            concurrency=4,
+        )
+    )
+    assert len(results) == 5
+    assert images == [b"bytes"] + ["media-id"] * 4
+
+
+def test_send_bulk_bounds_concurrency_and_consumes_lazily(wa):
+    lock = threading.Lock()
+    in_flight, max_in_flight, consumed = [0], [0], [0]
+
+    def recipients():
+        for i in range(50):
+            consumed[0] += 1
+            yield str(i)
+
+    def send(to, **_):
+        with lock:
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+        time.sleep(0.001)
+        with lock:
+            in_flight[0] -= 1
+        return _Sent(to)
+
+    results = wa.send_bulk(recipients(), send=send, concurrency=4)
+    next(results)
+    assert consumed[0] <= 4
+    results.close()
+    assert consumed[0] <= 4
+    assert len(list(wa.send_bulk(recipients(), send=send, concurrency=4))) == 50
+    assert max_in_flight[0] <= 4
+
+
+def test_send_bulk_rate_limiter(wa, mocker):
+    sleep = mocker.patch("pywa.client.time.sleep")
+    limiter = utils.RateLimiter(rate=1, burst=1)
+    list(
+        wa.send_bulk(
+            ["1", "2"], send=lambda to: _Sent(to), concurrency=1, rate_limiter=limiter
+        )
+    )
+    sleep.assert_called_once_with(pytest.approx(1, abs=0.05))
+
+
+def test_send_bulk_invalid_concurrency(wa):
+    with pytest.raises(ValueError):
+        next(wa.send_bulk(["1"], send=lambda to: _Sent(to), concurrency=0))
+
+
+@pytest.mark.asyncio
+async def test_send_bulk_async():
+    wa = WhatsAppAsync(phone_id="123", token="xyz")
+    in_flight, max_in_flight = [0], [0]
+
+    async def recipients():
+        for i in range(20):
+            yield str(i) if i != 7 else ("7", {"fail": True})
+
+    async def send(to, fail=False):
+        in_flight[0] += 1
+        max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+        await asyncio.sleep(0)
+        in_flight[0] -= 1
+        if fail:
+            raise _error(131026)
+        return _Sent(to)
+
+    results = [r async for r in wa.send_bulk(recipients(), send=send, concurrency=3)]
+    assert sorted(r.index for r in results) == list(range(20))
+    assert [r.to for r in results if not r.ok] == ["7"]
+    assert max_in_flight[0] <= 3
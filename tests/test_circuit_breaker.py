@@ -0,0 +1,78 @@
+import httpx
+import pytest
+
+from pywa.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from pywa.errors import WhatsAppError
+
+
+@pytest.fixture
+def clock(mocker):
+    now = [1000.0]
+    mocker.patch("pywa.circuit_breaker.time.monotonic", side_effect=lambda: now[0])
+    return now
+
+
+def _throttled(code: int) -> Exception:
+    return WhatsAppError.from_dict({"message": "err", "code": code})
+
+
+def _server_error() -> WhatsAppError:
+    return WhatsAppError.from_dict({"message": "err", "code": 1, "is_transient": True})
+
+
+def test_circuit_breaker_opens_half_opens_and_closes(clock):
+    changes = []
+    breaker = CircuitBreaker(
+        failure_rate=0.6,
+        min_requests=4,
+        window=10,
+        open_for=5,
+        half_open_requests=2,
+        on_state_change=lambda key, old, new: changes.append(new),
+    )
+    key = ("messages", "123")
+    for error in (None, _server_error(), _server_error(), _throttled(100)):
+        breaker.acquire(key)
+        breaker.record(key, error)
+    assert breaker.status(key)[key].state is CircuitState.CLOSED
+    breaker.acquire(key)
+    breaker.record(key, httpx.ConnectError("down"))
+    with pytest.raises(CircuitOpenError) as e:
+        breaker.acquire(key)
+    assert e.value.retry_after == pytest.approx(5)
+    breaker.acquire(("media", "123"))  # other circuits are not affected
+    clock[0] += 5
+    breaker.acquire(key)
+    breaker.acquire(key)
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire(key)  # all the probes are in flight
+    breaker.record(key)
+    breaker.record(key, _throttled(100))  # the endpoint answered
+    status = breaker.status(key)[key]
+    assert (status.state, status.requests, status.opened) == (
+        CircuitState.CLOSED,
+        0,
+        1,
+    )
+    assert changes == [
+        CircuitState.OPEN,
+        CircuitState.HALF_OPEN,
+        CircuitState.CLOSED,
+    ]
+
+
+def test_circuit_breaker_failed_probe_reopens(clock):
+    breaker = CircuitBreaker(min_requests=1, open_for=5, half_open_requests=1)
+    key = ("", None)
+    with pytest.raises(httpx.ReadTimeout), breaker.guard(key):
+        raise httpx.ReadTimeout("slow")
+    clock[0] += 5
+    with pytest.raises(KeyboardInterrupt), breaker.guard(key):
+        raise KeyboardInterrupt  # neither a success nor a failure
+    with pytest.raises(httpx.ReadTimeout), breaker.guard(key):
+        raise httpx.ReadTimeout("slow")
+    assert breaker.status()[key].state is CircuitState.OPEN
+    assert breaker.status()[key].opened == 2
+    breaker.reset()
+    with breaker.guard(key):
+        pass
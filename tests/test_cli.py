@@ -8,6 +8,7 @@ import pytest
 
 from pywa import WhatsApp, cli
 from pywa.errors import SendMessageError
+from pywa.service_windows import ServiceWindowTracker
 
 MANIFEST = [
     {
@@ -381,6 +382,30 @@ def test_serve_application_starts_uvicorn_with_resolved_app(mocker, tmp_path):
     assert fake_client._uvicorn_workers == 1
 
 
+def test_serve_application_rejects_in_memory_service_windows_on_workers(
+    mocker, tmp_path, monkeypatch
+):
+    monkeypatch.setenv(cli.ENV_LISTENER_BUS_DIR, str(tmp_path))
+    monkeypatch.setenv(
+        cli.ENV_LISTENER_STORE_OWNER, ""
+    )  # restored after the run sets it
+    target = tmp_path / "main.py"
+    target.write_text("")
+    fake_client = mocker.Mock(
+        _server=None, _server_type=None, _service_windows=ServiceWindowTracker()
+    )
+    mocker.patch("pywa.cli.discover_app_instance", return_value=("wa", fake_client))
+    run_mock = mocker.patch("uvicorn.run")
+    with pytest.raises(cli.PywaCLIException, match="Provide a `path`"):
+        cli.serve_application(command="run", path=target, workers=2)
+    fake_client._service_windows = ServiceWindowTracker(
+        path=tmp_path / "windows.sqlite3"
+    )
+    mocker.patch("pywa.cli.setup_console_logging")
+    cli.serve_application(command="run", path=target, workers=2)
+    assert run_mock.call_args.kwargs["workers"] == 2
+
+
 def test_serve_application_uses_entrypoint_directly(mocker):
     mocker.patch("pywa.cli.setup_console_logging")
     run_mock = mocker.patch("uvicorn.run")
@@ -642,7 +642,7 @@ def test_token(client):
     assert client.token == TOKEN
     client.token = "abc"
     assert client.token == "abc"
-    assert client.api._session.headers["Authorization"] == "Bearer abc"
+    assert client.api._headers["Authorization"] == "Bearer abc"
 
 
 def test_send_message(api, client):
@@ -0,0 +1,80 @@
+import types
+
+import httpx
+import pytest
+
+from pywa import WhatsApp, handlers
+from pywa.delivery import DeliveryIndex
+from pywa.errors import WhatsAppError
+from pywa.testing import FakeGraphAPI
+from pywa.types import MessageStatusType
+
+
+def _status(message_id: str, status: str, error_code: int | None = None):
+    return types.SimpleNamespace(
+        id=message_id,
+        status=MessageStatusType(status),
+        tracker=None,
+        error=WhatsAppError.from_dict({"code": error_code, "message": "err"})
+        if error_code
+        else None,
+    )
+
+
+def test_statuses_are_counted_once_and_in_order():
+    index = DeliveryIndex(max_messages=3)
+    index.track("promo", ["m1", "m2", "m3"])
+    for message_id, status in [
+        ("m1", "read"),
+        ("m1", "delivered"),
+        ("m1", "read"),
+        ("m2", "delivered"),
+        ("other", "read"),
+    ]:
+        index.on_status(None, _status(message_id, status))
+    index.on_status(None, _status("m3", "failed", error_code=131026))
+    stats = index.stats("promo")
+    assert (stats.sent, stats.delivered, stats.read, stats.failed) == (3, 2, 1, 1)
+    assert stats.errors == {131026: 1}
+    assert stats.rate("delivered") == pytest.approx(2 / 3)
+    index.track("promo", "m4")
+    assert len(index) == 3
+    index.on_status(None, _status("m1", "read"))
+    assert index.stats("promo").read == 1
+    index.forget("promo")
+    assert index.campaigns() == [] and len(index) == 0
+
+
+def test_thresholds_fire_once():
+    index = DeliveryIndex()
+    fired = []
+    index.on_threshold("promo", "failed", rate=0.5, min_sent=2, callback=fired.append)
+    index.on_threshold("promo", "sent", count=1, callback=fired.append)
+    index.track("promo", "m1")
+    assert [s.sent for s in fired] == [1]
+    index.on_status(None, _status("m1", "failed"))
+    index.track("promo", "m2")
+    index.on_status(None, _status("m2", "failed"))
+    assert [(s.sent, s.failed) for s in fired] == [(1, 0), (2, 1)]
+    with pytest.raises(ValueError):
+        index.on_threshold("promo", "read", callback=print)
+
+
+def test_messages_are_linked_by_tracker():
+    fake = FakeGraphAPI()
+    wa = WhatsApp(
+        phone_id="111",
+        token="xyz",
+        session=httpx.Client(transport=fake.transport),
+        filter_updates=False,
+    )
+    index = DeliveryIndex()
+    index.track_tracker("campaign-1", "summer")
+    wa.add_handlers(handlers.MessageStatusHandler(index.on_status))
+    for to in ("9721", "9722"):
+        wa.send_message(to=to, text="hi", tracker="campaign-1")
+    wa.send_message(to="9723", text="hi")
+    for update in fake.pop_webhooks():
+        wa.webhook_update_handler(update)
+    stats = index.stats("summer")
+    assert (stats.sent, stats.delivered, stats.read) == (2, 2, 2)
@@ -1,12 +1,17 @@
+import asyncio
 import dataclasses
+import threading
+import time
 from collections.abc import Callable
 from typing import TypeVar, cast
 
 import pytest
 
 from pywa import filters as fil
+from pywa import utils
 from pywa.errors import MediaUploadError, WhatsAppError
 from pywa.filters import Filter
+from pywa.locations import LocationIndex
 from pywa.types import (
     CallbackButton,
     CallbackSelection,
@@ -131,6 +136,22 @@ FILTERS: dict[str, dict[str, list[tuple[Callable[[_T], _T], Filter]]]] = {
                 lambda m: modify_location(m, 37.4611794, -122.2531785),
                 fil.location_in_radius(37.47, -122.25, 10),
             ),
+            (
+                lambda m: modify_location(m, 37.4611794, -122.2531785),
+                fil.location_in_regions(
+                    LocationIndex(
+                        [("far", 32.08, 34.78, 50), ("near", 37.47, -122.25, 10)]
+                    )
+                ),
+            ),
+            (
+                lambda m: modify_location(m, 37.4611794, -122.2531785),
+                fil.location_near(LocationIndex([("near", 37.47, -122.25)]), radius=10),
+            ),
+            (
+                lambda m: modify_location(m, 37.4611794, -122.2531785),
+                ~fil.location_near(LocationIndex([("far", 32.08, 34.78)]), radius=10),
+            ),
         ],
         "contacts": [
             (same, fil.contacts),
@@ -460,3 +481,145 @@ def modify_referred_product(msg: Message, product: str):
 
 def modify_status_tracker(s: MessageStatus, tracker: str):
     return dataclasses.replace(s, tracker=tracker)
+
+
+def test_cached_filter_ttl_lru_and_invalidate(mocker):
+    calls = []
+    is_even = fil.cached(
+        fil.new(lambda _, u: calls.append(u) or u % 2 == 0),
+        key=lambda u: u,
+        ttl=10,
+        maxsize=2,
+    )
+    assert is_even.check_sync(None, 2)
+    assert not is_even.check_sync(None, 3)
+    assert is_even.check_sync(None, 2)
+    assert calls == [2, 3]
+
+    is_even.check_sync(None, 4)  # evicts 3 (least recently used)
+    is_even.check_sync(None, 3)
+    assert calls == [2, 3, 4, 3]
+
+    is_even.invalidate(3)
+    is_even.check_sync(None, 3)
+    assert calls == [2, 3, 4, 3, 3]
+
+    is_even.invalidate()
+    mocker.patch("pywa.filters.time.monotonic", return_value=float("inf"))
+    is_even.check_sync(None, 3)  # expired
+    is_even.check_sync(None, 3)
+    assert calls == [2, 3, 4, 3, 3, 3, 3]
+
+
+def test_cached_filter_default_key_and_combination():
+    calls = []
+    registered = fil.cached(fil.new(lambda _, m: calls.append(m) or True))
+    for client, update_files in CLIENTS.items():
+        msg = next(f for f in update_files.items() if f[0].stem == "message")[1]["text"]
+        assert (registered & fil.true).check_sync(client, msg)
+        assert registered.check_sync(client, msg)
+    assert len(calls) == 1  # same sender in all updates
+    assert repr(registered).startswith("cached(")
+
+
+def test_cached_filter_single_flight_sync():
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow_check(_, u):
+        calls.append(u)
+        started.set()
+        release.wait(1)
+        return True
+
+    cached = fil.cached(fil.new(slow_check), key=lambda u: u)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cached.check_sync(None, "a")))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    started.wait(1)
+    time.sleep(0.05)
+    release.set()
+    for t in threads:
+        t.join()
+    assert results == [True] * 5
+    assert calls == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_cached_filter_single_flight_async():
+    calls = []
+
+    async def slow_check(_, u):
+        calls.append(u)
+        await asyncio.sleep(0.05)
+        return u == "a"
+
+    cached = fil.cached(fil.new(slow_check), key=lambda u: u)
+    assert cached.has_async()
+    results = await asyncio.gather(
+        *(cached.check_async(None, u) for u in ("a", "a", "b", "a", "b"))
+    )
+    assert results == [True, True, False, True, False]
+    assert calls == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_cached_filter_async_errors_are_not_cached():
+    calls = []
+
+    async def failing_check(_, u):
+        calls.append(u)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("db is down")
+
+    cached = fil.cached(fil.new(failing_check), key=lambda u: u)
+    results = await asyncio.gather(
+        cached.check_async(None, "a"),
+        cached.check_async(None, "a"),
+        return_exceptions=True,
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert calls == ["a"]
+    with pytest.raises(RuntimeError):
+        await cached.check_async(None, "a")
+    assert calls == ["a", "a"]
+
+
+def test_cached_filter_invalidated_during_a_lookup_sync():
+    registered = {"a": False}
+
+    def check(_, u):
+        result = registered[u]
+        registered[u] = True  # the user registers while the lookup is in flight
+        cached.invalidate(u if u == "a" else utils.MISSING)
+        return result
+
+    cached = fil.cached(fil.new(check), key=lambda u: u)
+    assert not cached.check_sync(None, "a")
+    assert cached.check_sync(None, "a")  # the stale result was not cached
+    registered["b"] = False
+    assert not cached.check_sync(None, "b")  # invalidated all
+    assert cached.check_sync(None, "b")
+    assert cached._generations == {}
+
+
+@pytest.mark.asyncio
+async def test_cached_filter_invalidated_during_a_lookup_async():
+    registered = {"a": False}
+
+    async def check(_, u):
+        result = registered[u]
+        await asyncio.sleep(0.01)
+        return result
+
+    cached = fil.cached(fil.new(check), key=lambda u: u)
+    lookup = asyncio.create_task(cached.check_async(None, "a"))
+    await asyncio.sleep(0)
+    registered["a"] = True
+    cached.invalidate("a")
+    assert not await lookup
+    assert await cached.check_async(None, "a")
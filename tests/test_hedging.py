@@ -0,0 +1,19 @@
+import pytest
+
+from pywa.hedging import HedgingPolicy
+
+
+def test_hedging_policy_delay_and_budget():
+    hedging = HedgingPolicy(
+        percentile=0.9, min_delay=0.05, min_samples=10, budget=0.5, max_burst=1
+    )
+    for latency in range(1, 11):
+        assert hedging.delay("messages") is None
+        hedging.observe("messages", latency / 10)
+    assert hedging.delay("messages") == 1.0
+    assert hedging.delay("") is None
+    assert hedging.acquire()
+    assert not hedging.acquire()
+    assert hedging.stats.over_budget == 1
+    with pytest.raises(ValueError):
+        HedgingPolicy(percentile=1)
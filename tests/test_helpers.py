@@ -418,7 +418,7 @@ def test_get_media_from_media_id_or_obj_or_url_http_error_raises():
 
 
 def test_internal_upload_media_bytes():
-    wa = mock.Mock()
+    wa = mock.Mock(_media_cache=None)
     wa.api.upload_media.return_value = {"id": "media-id-1"}
     media = helpers.internal_upload_media(
         media=b"filebytes",
@@ -439,7 +439,7 @@ def test_internal_upload_media_bytes():
 
 
 def test_internal_upload_media_unsupported_source_raises():
-    wa = mock.Mock()
+    wa = mock.Mock(_media_cache=None)
     with pytest.raises(ValueError):
         helpers.internal_upload_media(
             media="x",
@@ -457,7 +457,7 @@ def test_internal_upload_media_unsupported_source_raises():
 
 
 def test_internal_upload_file_file_handle_shortcircuits():
-    wa = mock.Mock()
+    wa = mock.Mock(_media_cache=None)
     handle, source = helpers.internal_upload_file(
         wa=wa,
         file="2:c2FtcGxl...",
@@ -472,7 +472,7 @@ def test_internal_upload_file_file_handle_shortcircuits():
 
 
 def test_internal_upload_file_bytes():
-    wa = mock.Mock()
+    wa = mock.Mock(_media_cache=None)
     wa.api.create_upload_session.return_value = {"id": "session-1"}
     wa.api.upload_file.return_value = {"h": "handle-1"}
     wa.app_id = "app-1"
@@ -495,7 +495,7 @@ def test_internal_upload_file_bytes():
 
 
 def test_internal_upload_file_wraps_errors():
-    wa = mock.Mock()
+    wa = mock.Mock(_media_cache=None)
     wa.api.create_upload_session.side_effect = RuntimeError("boom")
     wa.app_id = "app-1"
     with pytest.raises(ValueError):
@@ -513,7 +513,7 @@ def test_internal_upload_file_wraps_errors():
 
 
 def test_internal_upload_media_external_url(mocker):
-    wa = mock.Mock()
+    wa = mock.Mock(_media_cache=None)
     wa.api.upload_media.return_value = {"id": "media-id-1"}
     mocker.patch(
         "pywa._helpers.get_media_from_url",
@@ -535,7 +535,7 @@ def test_internal_upload_media_external_url(mocker):
 
 
 def test_internal_upload_media_path(tmp_path):
-    wa = mock.Mock()
+    wa = mock.Mock(_media_cache=None)
     wa.api.upload_media.return_value = {"id": "media-id-1"}
     p = tmp_path / "a.jpg"
     p.write_bytes(b"data")
@@ -554,7 +554,7 @@ def test_internal_upload_media_path(tmp_path):
 
 
 def test_internal_upload_media_file_obj():
-    wa = mock.Mock()
+    wa = mock.Mock(_media_cache=None)
     wa.api.upload_media.return_value = {"id": "media-id-1"}
     media = helpers.internal_upload_media(
         media=io.BytesIO(b"data"),
@@ -570,7 +570,7 @@ def test_internal_upload_media_file_obj():
 
 
 def test_internal_upload_media_bytes_gen():
-    wa = mock.Mock()
+    wa = mock.Mock(_media_cache=None)
     wa.api.upload_media.return_value = {"id": "media-id-1"}
     media = helpers.internal_upload_media(
         media=iter([b"a", b"b"]),
@@ -586,7 +586,7 @@ def test_internal_upload_media_bytes_gen():
 
 
 def test_internal_upload_media_base64():
-    wa = mock.Mock()
+    wa = mock.Mock(_media_cache=None)
     wa.api.upload_media.return_value = {"id": "media-id-1"}
     media = helpers.internal_upload_media(
         media="aGVsbG8=",
@@ -602,7 +602,7 @@ def test_internal_upload_media_base64():
 
 
 def test_internal_upload_media_media_obj():
-    wa = mock.Mock()
+    wa = mock.Mock(_media_cache=None)
     wa.get_media_url.return_value = mock.Mock(
         url="https://media.example/1", mime_type=None
     )
@@ -626,7 +626,7 @@ def test_internal_upload_media_media_obj():
 
 
 def test_internal_upload_file_external_url(mocker):
-    wa = mock.Mock()
+    wa = mock.Mock(_media_cache=None)
     wa.api.create_upload_session.return_value = {"id": "session-1"}
     wa.api.upload_file.return_value = {"h": "handle-1"}
     wa.app_id = "app-1"
@@ -649,7 +649,7 @@ def test_internal_upload_file_external_url(mocker):
 
 
 def test_internal_upload_file_path(tmp_path):
-    wa = mock.Mock()
+    wa = mock.Mock(_media_cache=None)
     wa.api.create_upload_session.return_value = {"id": "session-1"}
     wa.api.upload_file.return_value = {"h": "handle-1"}
     wa.app_id = "app-1"
@@ -668,7 +668,7 @@ def test_internal_upload_file_path(tmp_path):
 
 
 def test_internal_upload_file_media_obj():
-    wa = mock.Mock()
+    wa = mock.Mock(_media_cache=None)
     wa.get_media_url.return_value = mock.Mock(
         url="https://media.example/1", mime_type=None
     )
@@ -690,7 +690,7 @@ def test_internal_upload_file_media_obj():
 
 
 def test_internal_upload_file_bytes_gen():
-    wa = mock.Mock()
+    wa = mock.Mock(_media_cache=None)
     wa.api.create_upload_session.return_value = {"id": "session-1"}
     wa.api.upload_file.return_value = {"h": "handle-1"}
     wa.app_id = "app-1"
@@ -707,7 +707,7 @@ def test_internal_upload_file_bytes_gen():
 
 
 def test_internal_upload_file_base64():
-    wa = mock.Mock()
+    wa = mock.Mock(_media_cache=None)
     wa.api.create_upload_session.return_value = {"id": "session-1"}
     wa.api.upload_file.return_value = {"h": "handle-1"}
     wa.app_id = "app-1"
@@ -724,7 +724,7 @@ def test_internal_upload_file_base64():
 
 
 def test_internal_upload_file_unknown_filename_raises():
-    wa = mock.Mock()
+    wa = mock.Mock(_media_cache=None)
     with pytest.raises(ValueError):
         helpers.internal_upload_file(
             wa=wa,
@@ -762,7 +762,7 @@ async def _async_gen():
 
 
 def test_internal_upload_file_async_bytes_gen_unsupported_raises():
-    wa = mock.Mock()
+    wa = mock.Mock(_media_cache=None)
     with pytest.raises(ValueError):
         helpers.internal_upload_file(
             wa=wa,
@@ -775,7 +775,7 @@ def test_internal_upload_file_async_bytes_gen_unsupported_raises():
 
 
 def test_internal_upload_file_file_obj():
-    wa = mock.Mock()
+    wa = mock.Mock(_media_cache=None)
     wa.api.create_upload_session.return_value = {"id": "session-1"}
     wa.api.upload_file.return_value = {"h": "handle-1"}
     wa.app_id = "app-1"
@@ -792,7 +792,7 @@ def test_internal_upload_file_file_obj():
 
 
 def test_internal_upload_file_unknown_length_raises():
-    wa = mock.Mock()
+    wa = mock.Mock(_media_cache=None)
     wa.get_media_url.return_value = mock.Mock(
         url="https://media.example/1", mime_type=None
     )
@@ -1,4 +1,6 @@
 import asyncio
+import json
+import random
 import threading
 import time
 
@@ -6,12 +8,23 @@ import pytest
 
 from pywa import WhatsApp as WhatsAppSync
 from pywa import filters
+from pywa._logging import get_update_hash
 from pywa.listeners import (
+    ENV_LISTENER_STORE_OWNER,
+    FileListenerStore,
+    InProcessListenerBus,
     ListenerCanceled,
     ListenerStopped,
     ListenerTimeout,
+    MemoryListenerStore,
+    SQLiteListenerStore,
+    StoredListener,
+    TemplateStatusUpdateListenerIdentifier,
+    UnixSocketListenerBus,
     UserUpdateListenerIdentifier,
+    _TimingWheel,
 )
+from pywa.types.base_update import RawUpdate
 from pywa_async import WhatsApp as WhatsAppAsync
 
 
@@ -154,3 +167,383 @@ async def test_listener_stopped_async(wa_async: WhatsAppAsync):
             to=first_id, filters=filters.true, cancelers=filters.false, timeout=0.3
         )
     assert exc_info.value.reason == "manual"
+
+
+def test_next_step_sync(wa_sync: WhatsAppSync):
+    first_id = next(DummyUpdate().listener_identifiers)
+    steps = []
+
+    def second_step(_, update):
+        steps.append(("second", update))
+
+    def first_step(wa, update):
+        steps.append(("first", update))
+        wa.register_next_step(to=first_id, callback=second_step, timeout=1)
+
+    wa_sync.register_next_step(
+        to=first_id,
+        callback=first_step,
+        filters=filters.true,
+        cancelers=filters.false,
+        timeout=1,
+    )
+    assert wa_sync._process_listener(DummyUpdate())
+    assert first_id in wa_sync._listeners  # re-registered by the callback
+    assert wa_sync._process_listener(DummyUpdate())
+    assert [step for step, _ in steps] == ["first", "second"]
+    assert first_id not in wa_sync._listeners
+
+
+def test_next_step_timeout_and_stop_sync(wa_sync: WhatsAppSync):
+    first_id = next(DummyUpdate().listener_identifiers)
+    errors = []
+    expired = threading.Event()
+
+    def on_error(_, e):
+        errors.append(e)
+        expired.set()
+
+    wa_sync.register_next_step(
+        to=first_id, callback=lambda *_: None, timeout=0.05, on_error=on_error
+    )
+    assert expired.wait(1)
+    assert isinstance(errors.pop(), ListenerTimeout)
+    assert first_id not in wa_sync._listeners
+
+    wa_sync.register_next_step(
+        to=first_id, callback=lambda *_: None, timeout=1, on_error=on_error
+    )
+    wa_sync.stop_listening(to=first_id, reason="bye")
+    assert isinstance(errors.pop(), ListenerStopped)
+    assert first_id not in wa_sync._listeners
+
+
+def test_next_step_slow_on_error_does_not_delay_other_timeouts(wa_sync: WhatsAppSync):
+    release, expired = threading.Event(), threading.Event()
+    threads = []
+
+    def slow_on_error(*_):
+        threads.append(threading.current_thread().name)
+        release.wait(5)
+
+    for i, on_error in enumerate((slow_on_error, lambda *_: expired.set())):
+        wa_sync.register_next_step(
+            to=UserUpdateListenerIdentifier(sender=str(i), recipient="1"),
+            callback=lambda *_: None,
+            timeout=0.05 * (i + 1),
+            on_error=on_error,
+        )
+    assert expired.wait(1)
+    release.set()
+    assert threads[0].startswith("pywa-listeners-expiry")
+
+
+@pytest.mark.asyncio
+async def test_next_step_async(wa_async: WhatsAppAsync):
+    first_id = next(DummyUpdate().listener_identifiers)
+    results = []
+
+    async def callback(_, update):
+        results.append(update)
+
+    async def on_error(_, e):
+        results.append(e)
+
+    wa_async.register_next_step(
+        to=first_id, callback=callback, filters=filters.true, timeout=1
+    )
+    assert await wa_async._process_listener(DummyUpdate())
+    assert isinstance(results.pop(), DummyUpdate)
+
+    wa_async.register_next_step(
+        to=first_id,
+        callback=callback,
+        filters=filters.false,
+        cancelers=filters.true,
+        timeout=1,
+        on_error=on_error,
+    )
+    assert await wa_async._process_listener(DummyUpdate())
+    assert isinstance(results.pop(), ListenerCanceled)
+
+    wa_async.register_next_step(
+        to=first_id, callback=callback, timeout=0.01, on_error=on_error
+    )
+    await asyncio.sleep(0.3)
+    assert isinstance(results.pop(), ListenerTimeout)
+    assert first_id not in wa_async._listeners
+
+
+def test_timing_wheel_expires_on_deadline():
+    rnd = random.Random(42)
+    wheel = _TimingWheel(now=1000, slots=4, levels=3)  # 64 ticks before overflow
+    now, pending = 1000, {}
+    for i in range(500):
+        deadline = now + rnd.randint(-2, 300)
+        pending[wheel.add(i, deadline)] = max(deadline, now + 1)
+        if rnd.random() < 0.3:
+            entry = rnd.choice(list(pending))
+            assert wheel.cancel(entry)
+            assert not wheel.cancel(entry)
+            del pending[entry]
+        for _ in range(rnd.randint(0, 5)):
+            now += 1
+            for entry in wheel.advance(now):
+                assert pending.pop(entry) == now
+        assert len(wheel) == len(pending)
+
+    expired = wheel.advance(now + 10_000)  # a single batch
+    assert {pending.pop(entry) for entry in expired} and not pending
+    assert len(wheel) == 0
+
+
+def test_listeners_stats_sync(wa_sync: WhatsAppSync):
+    first_id = next(DummyUpdate().listener_identifiers)
+    with pytest.raises(ListenerTimeout):
+        wa_sync.listen(to=first_id, timeout=0.01)
+    wa_sync.register_next_step(to=first_id, callback=lambda *_: None, timeout=10)
+
+    stats = wa_sync.listeners_stats
+    assert (stats.active, stats.pending_timeouts, stats.expired) == (1, 1, 1)
+    assert stats.expiry_batches == 1
+
+    wa_sync._process_listener(DummyUpdate())
+    stats = wa_sync.listeners_stats
+    assert (stats.active, stats.pending_timeouts, stats.canceled_timeouts) == (0, 0, 1)
+
+
+@pytest.mark.asyncio
+async def test_listeners_stats_async(wa_async: WhatsAppAsync):
+    ids = [
+        UserUpdateListenerIdentifier(sender=str(i), recipient="1") for i in range(100)
+    ]
+    results = await asyncio.gather(
+        *(wa_async.listen(to=i, timeout=0.01) for i in ids), return_exceptions=True
+    )
+    assert all(isinstance(r, ListenerTimeout) for r in results)
+    stats = wa_async.listeners_stats
+    assert (stats.active, stats.pending_timeouts, stats.expired) == (0, 0, 100)
+    assert stats.expiry_batches <= 2  # expired together, not one timer each
+
+
+def _message_update() -> bytes:
+    with open("tests/data/updates/message.json", encoding="utf-8") as f:
+        return json.dumps(json.load(f)["text"]).encode()
+
+
+def _identifier_of(wa: WhatsAppSync | WhatsAppAsync, update: bytes):
+    raw = RawUpdate(update, hmac_header=None, update_hash=get_update_hash(update))
+    msg = wa._handlers_to_updates[wa._get_handler_type(raw)].from_update(
+        client=wa, update=raw
+    )
+    return next(iter(msg.listener_identifiers))
+
+
+def _workers(cls, bus_factory, n=2):
+    return [
+        cls(
+            server=None,
+            verify_token="xyz",
+            filter_updates=False,
+            skip_duplicate_updates=False,
+            listener_bus=bus,
+        )
+        for bus in (bus_factory() for _ in range(n))
+    ]
+
+
+def test_listener_bus_forwards_to_listening_worker():
+    bus = InProcessListenerBus()
+    listening, receiving = _workers(WhatsAppSync, lambda: bus)
+    update = _message_update()
+    raw_updates, messages, replies = [], [], []
+    for wa in (listening, receiving):
+        wa.on_raw_update()(lambda w, _: raw_updates.append(w))
+        wa.on_message()(lambda w, _: messages.append(w))
+
+    listening.register_next_step(
+        to=_identifier_of(listening, update),
+        callback=lambda w, msg: replies.append((w, msg.text)),
+        timeout=1,
+    )
+    receiving.webhook_update_handler(update)
+    assert replies == [(listening, "Body Text")]
+    assert raw_updates == [listening] and messages == []
+
+    receiving.webhook_update_handler(update)  # nobody listens anymore
+    assert messages == [receiving]
+
+
+def test_listener_bus_unix_sockets(tmp_path):
+    listening, receiving = _workers(
+        WhatsAppSync, lambda: UnixSocketListenerBus(tmp_path)
+    )
+    update = _message_update()
+    identifier = _identifier_of(listening, update)
+    replied = threading.Event()
+    try:
+        listening.register_next_step(
+            to=identifier, callback=lambda *_: replied.set(), timeout=1
+        )
+        assert len(list((tmp_path / "listeners").iterdir())) == 1
+        receiving.webhook_update_handler(update)
+        assert replied.wait(1)
+        assert not list((tmp_path / "listeners").iterdir())
+        assert not receiving._listener_bus.forward(
+            identifier, RawUpdate(update, hmac_header=None, update_hash="x"), print
+        )
+    finally:
+        listening._listener_bus.close()
+        receiving._listener_bus.close()
+
+
+def test_listener_bus_unix_sockets_listener_ended_in_flight(tmp_path):
+    listening, receiving = _workers(
+        WhatsAppSync, lambda: UnixSocketListenerBus(tmp_path)
+    )
+    update = _message_update()
+    identifier = _identifier_of(listening, update)
+    handled, messages = threading.Event(), []
+    for wa in (listening, receiving):
+        wa.on_message()(lambda w, _: (messages.append(w), handled.set()))
+    try:
+        listening.register_next_step(to=identifier, callback=print, timeout=1)
+        path = listening._listener_bus._path(identifier)
+        address = path.read_text()
+        listening.stop_listening(
+            to=identifier
+        )  # unregistered before the update arrives
+        path.write_text(address)  # the receiving worker still sees the old owner
+        receiving.webhook_update_handler(update)
+        assert handled.wait(1)
+        assert messages == [listening]
+    finally:
+        listening._listener_bus.close()
+        receiving._listener_bus.close()
+
+
+@pytest.mark.asyncio
+async def test_listener_bus_async():
+    bus = InProcessListenerBus()
+    listening, receiving = _workers(WhatsAppAsync, lambda: bus)
+    update = _message_update()
+
+    async def receive():
+        await asyncio.sleep(0.05)
+        await receiving.webhook_update_handler(update)
+
+    asyncio.create_task(receive())
+    msg = await listening.listen(to=_identifier_of(listening, update), timeout=1)
+    assert msg.text == "Body Text"
+    assert msg._client is listening
+
+
+def test_listening_on_multiple_workers_requires_a_bus(wa_sync: WhatsAppSync):
+    wa_sync._uvicorn_workers = 2
+    first_id = next(DummyUpdate().listener_identifiers)
+    with pytest.raises(RuntimeError):
+        wa_sync.register_next_step(to=first_id, callback=print, timeout=1)
+    wa_sync._listener_bus = InProcessListenerBus()
+    wa_sync.register_next_step(to=first_id, callback=print, timeout=1)
+    assert first_id in wa_sync._listeners
+
+
+@pytest.fixture(params=["memory", "sqlite", "file"])
+def store_factory(request, tmp_path):
+    match request.param:
+        case "memory":
+            store = MemoryListenerStore()
+            return lambda: store
+        case "sqlite":
+            return lambda: SQLiteListenerStore(tmp_path / "listeners.db")
+        case "file":
+            return lambda: FileListenerStore(tmp_path / "listeners.jsonl")
+
+
+def test_listener_store(store_factory):
+    first_id = next(DummyUpdate().listener_identifiers)
+    other_id = TemplateStatusUpdateListenerIdentifier(template_id="123")
+    store = store_factory()
+    store.save(StoredListener(first_id, "ask_name", 10.5))
+    store.save(StoredListener(other_id, "wait_for_approval"))
+    store.save(StoredListener(first_id, "ask_age", 20.5))
+    store.delete(other_id)
+    store.close()
+
+    store = store_factory()  # reopened
+    assert store.get(first_id) == StoredListener(first_id, "ask_age", 20.5)
+    assert store.get(other_id) is None
+    assert list(store.all()) == [StoredListener(first_id, "ask_age", 20.5)]
+
+
+def test_sqlite_listener_store_claimed_by_one_worker(tmp_path, monkeypatch):
+    first_id = next(DummyUpdate().listener_identifiers)
+    path = tmp_path / "listeners.db"
+    SQLiteListenerStore(path).save(
+        StoredListener(first_id, "ask_name")
+    )  # a previous run
+    monkeypatch.setenv(ENV_LISTENER_STORE_OWNER, "run")
+    first, second = SQLiteListenerStore(path), SQLiteListenerStore(path)
+    assert list(first.claim()) == [StoredListener(first_id, "ask_name")]
+    assert list(second.claim()) == []
+    other_id = TemplateStatusUpdateListenerIdentifier(template_id="123")
+    second.save(StoredListener(other_id, "wait_for_approval"))
+    assert list(first.claim()) == []  # saved by the same run
+    assert len(list(second.all())) == 2
+    monkeypatch.delenv(ENV_LISTENER_STORE_OWNER)
+    assert len(list(SQLiteListenerStore(path).claim())) == 2  # the next run
+
+
+def test_listeners_restored_after_restart(store_factory):
+    first_id = next(DummyUpdate().listener_identifiers)
+    steps = []
+
+    def new_client() -> WhatsAppSync:
+        wa = WhatsAppSync(
+            server=None, verify_token="xyz", listener_store=store_factory()
+        )
+        wa.continuation("ask_name", filters=filters.true)(
+            lambda _, update: steps.append(update)
+        )
+        return wa
+
+    wa = new_client()
+    wa.register_next_step(to=first_id, callback="ask_name", timeout=60)
+    assert wa._listener_store.get(first_id).continuation == "ask_name"
+    wa._listener_store.close()
+
+    wa = new_client()  # restarted
+    assert wa._process_listener(DummyUpdate())
+    assert len(steps) == 1
+    assert wa._listener_store.get(first_id) is None
+
+
+def test_restored_listener_past_deadline_times_out():
+    first_id = next(DummyUpdate().listener_identifiers)
+    store = MemoryListenerStore()
+    store.save(StoredListener(first_id, "ask_name", time.time() - 10))
+    errors = []
+    timed_out = threading.Event()
+
+    wa = WhatsAppSync(server=None, verify_token="xyz", listener_store=store)
+    wa.continuation(
+        "ask_name",
+        on_error=lambda _, e: (errors.append(e), timed_out.set()),
+    )(print)
+    assert wa.restore_listeners() == 1
+    assert timed_out.wait(1)
+    assert isinstance(errors[0], ListenerTimeout)
+    assert store.get(first_id) is None
+
+
+def test_continuation_errors(wa_sync: WhatsAppSync):
+    first_id = next(DummyUpdate().listener_identifiers)
+    wa_sync.continuation("ask_name")(print)
+    with pytest.raises(ValueError):
+        wa_sync.continuation("ask_name")(print)
+    with pytest.raises(ValueError):
+        wa_sync.register_next_step(to=first_id, callback="ask_age", timeout=1)
+    with pytest.raises(ValueError):
+        wa_sync.register_next_step(
+            to=first_id, callback="ask_name", filters=filters.text, timeout=1
+        )
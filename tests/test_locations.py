@@ -0,0 +1,88 @@
+import math
+import random
+
+import pytest
+
+from pywa.locations import LocationIndex
+from pywa.types.others import Location
+
+
+def _haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    lon1, lat1, lon2, lat2 = map(math.radians, [lon1, lat1, lon2, lat2])
+    return (
+        2
+        * math.asin(
+            math.sqrt(
+                math.sin((lat2 - lat1) / 2) ** 2
+                + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+            )
+        )
+        * 6371
+    )
+
+
+@pytest.fixture
+def sites() -> list[tuple[int, float, float, float]]:
+    rnd = random.Random(42)
+    return [
+        (i, rnd.uniform(-80, 80), rnd.uniform(-180, 180), rnd.uniform(1, 500))
+        for i in range(2_000)
+    ]
+
+
+def test_location_index_nearest_matches_brute_force(sites):
+    index = LocationIndex(sites)
+    rnd = random.Random(7)
+    for _ in range(50):
+        lat, lon = rnd.uniform(-80, 80), rnd.uniform(-180, 180)
+        expected = sorted(sites, key=lambda s: _haversine(lat, lon, s[1], s[2]))[:5]
+        result = index.nearest(lat, lon, k=5)
+        assert [r.key for r in result] == [s[0] for s in expected]
+        assert result[0].distance == pytest.approx(
+            _haversine(lat, lon, expected[0][1], expected[0][2])
+        )
+
+
+def test_location_index_within_and_containing_match_brute_force(sites):
+    index = LocationIndex(sites)
+    rnd = random.Random(9)
+    for _ in range(50):
+        lat, lon = rnd.uniform(-80, 80), rnd.uniform(-180, 180)
+        assert {r.key for r in index.within(lat, lon, 800)} == {
+            s[0] for s in sites if _haversine(lat, lon, s[1], s[2]) <= 800
+        }
+        assert {r.key for r in index.containing(lat, lon)} == {
+            s[0] for s in sites if _haversine(lat, lon, s[1], s[2]) <= s[3]
+        }
+
+
+def test_location_index_agrees_with_location_in_radius():
+    index = LocationIndex([("hq", 37.47, -122.25, 10)])
+    loc = Location(latitude=37.4611794, longitude=-122.2531785)
+    assert loc.in_radius(lat=37.47, lon=-122.25, radius=10)
+    assert [r.key for r in index.containing(loc.latitude, loc.longitude)] == ["hq"]
+
+
+def test_location_index_nearest_max_distance_and_empty():
+    assert LocationIndex().nearest(0, 0) == []
+    index = LocationIndex([("a", 0, 0), ("b", 0, 1)])
+    assert [r.key for r in index.nearest(0, 0.1, k=10)] == ["a", "b"]
+    assert [r.key for r in index.nearest(0, 0.1, k=10, max_distance=50)] == ["a"]
+    assert index.containing(0, 0) == []  # points without a radius are not regions
+
+
+def test_location_index_rebuilds_after_add():
+    index = LocationIndex([("a", 10, 10)])
+    assert index.nearest(0, 0)[0].key == "a"
+    index.add("b", 0, 0.01)
+    assert len(index) == 2
+    assert index.nearest(0, 0)[0].key == "b"
+
+
+def test_location_index_invalid_values_raise():
+    with pytest.raises(ValueError):
+        LocationIndex([("a", 91, 0)])
+    with pytest.raises(ValueError):
+        LocationIndex([("a", 0, 0, -1)])
+    with pytest.raises(ValueError):
+        LocationIndex().nearest(0, 0, k=0)
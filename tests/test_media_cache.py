@@ -0,0 +1,30 @@
+import datetime
+
+from pywa.media_cache import MediaCache
+
+
+def test_media_cache_lru_and_expiry(mocker):
+    now = [1000.0]
+    mocker.patch("pywa.media_cache.time.time", side_effect=lambda: now[0])
+    cache = MediaCache(max_size=2, margin=datetime.timedelta(minutes=1))
+    cache.set("a", "1", "m1", ttl_minutes=10)
+    cache.set("b", "1", "m2")
+    assert cache.get("a", "2") is None
+    assert cache.get("a", "1").media_id == "m1"
+    cache.set("c", "1", "m3")
+    assert cache.get("b", "1") is None
+    now[0] += 9 * 60
+    assert cache.get("a", "1") is None
+    assert cache.get("c", "1").media_id == "m3"
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.expired) == (2, 3, 1)
+    cache.discard("m3")
+    assert len(cache) == 0
+
+
+def test_media_cache_persists_to_sqlite(tmp_path):
+    path = tmp_path / "media.sqlite3"
+    MediaCache(path=path).set("a", "1", "m1", ttl_minutes=120)
+    cache = MediaCache(path=path)
+    assert (cache.get("a", "1").media_id, len(cache)) == ("m1", 1)
+    cache.discard("m1")
+    assert MediaCache(path=path).get("a", "1") is None
@@ -0,0 +1,91 @@
+import httpx
+import pytest
+
+from pywa import WhatsApp, handlers
+from pywa.outbox import Outbox, OutboxStatus
+from pywa.testing import SERVICE_UNAVAILABLE, FakeGraphAPI
+from pywa_async import WhatsApp as WhatsAppAsync
+from pywa_async.outbox import Outbox as AsyncOutbox
+
+
+def _client(fake: FakeGraphAPI) -> WhatsApp:
+    return WhatsApp(
+        phone_id="111",
+        token="xyz",
+        session=httpx.Client(transport=fake.transport),
+        filter_updates=False,
+    )
+
+
+def test_send_records_results_in_batches(tmp_path):
+    fake = FakeGraphAPI()
+    outbox = Outbox(tmp_path / "outbox.sqlite3", batch_size=2)
+    for user in range(3):
+        outbox.add(to=f"972{user}", key=f"promo:{user}", text="hi")
+    outbox.add(to="9720", key="promo:0", text="again")
+    fake.inject(SERVICE_UNAVAILABLE, endpoint="/messages$")
+    results = list(outbox.send(_client(fake), concurrency=1))
+    assert [(entry.key, result.ok) for entry, result in results] == [
+        ("promo:0", False),
+        ("promo:1", True),
+        ("promo:2", True),
+    ]
+    assert [m["biz_opaque_callback_data"] for m in fake.messages] == [
+        "promo:1",
+        "promo:2",
+    ]
+    assert outbox.get("promo:1").message_id == fake.messages[0]["id"]
+    assert outbox.get("promo:0").error is not None
+    assert outbox.counts()[OutboxStatus.SENT] == 2
+    assert list(outbox.send(_client(fake))) == []
+
+
+def test_resume_after_crash_does_not_send_twice(tmp_path):
+    fake = FakeGraphAPI()
+    wa = _client(fake)
+    path = tmp_path / "outbox.sqlite3"
+    outbox = Outbox(path)
+    for user in range(3):
+        outbox.add(to=f"972{user}", key=f"k{user}", text="hi")
+    outbox.flush()
+    outbox._claim(2, resend_in_doubt=False)  # the process crashes mid-batch
+    sent = wa.send_message(to="9720", text="hi", tracker="k0")  # before the crash
+    outbox.close()
+
+    outbox = Outbox(path)
+    assert [e.key for e in outbox.entries(OutboxStatus.SENDING)] == ["k0", "k1"]
+    assert [e.key for e, _ in outbox.send(wa)] == ["k2"]
+    wa.add_handlers(handlers.MessageStatusHandler(outbox.on_status))
+    for update in fake.pop_webhooks():
+        wa.webhook_update_handler(update)
+    assert outbox.get("k0").message_id == sent.id
+    assert [e.key for e, _ in outbox.send(wa, resend_in_doubt=True)] == ["k1"]
+    assert outbox.counts()[OutboxStatus.SENT] == 3
+    assert len(fake.messages) == 3
+
+
+def test_add_validates_params(tmp_path):
+    outbox = Outbox(tmp_path / "outbox.sqlite3")
+    with pytest.raises(ValueError, match="tracker"):
+        outbox.add(to="972", text="hi", tracker="t")
+    with pytest.raises(ValueError, match="JSON"):
+        outbox.add(to="972", text="hi", buttons=[object()])
+    key = outbox.add(to="972", method="send_template", name="promo", language="en")
+    assert outbox.get(key) is None
+    outbox.flush()
+    assert outbox.get(key).params == {"name": "promo", "language": "en"}
+
+
+@pytest.mark.asyncio
+async def test_async_send(tmp_path):
+    fake = FakeGraphAPI()
+    wa = WhatsAppAsync(
+        phone_id="111",
+        token="xyz",
+        session=httpx.AsyncClient(transport=fake.transport),
+    )
+    outbox = AsyncOutbox(tmp_path / "outbox.sqlite3")
+    outbox.add(to="972", key="k", text="hi")
+    results = [result async for _, result in outbox.send(wa)]
+    assert results[0].sent.id == outbox.get("k").message_id
+    assert fake.messages[0]["text"]["body"] == "hi"
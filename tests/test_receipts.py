@@ -0,0 +1,51 @@
+import datetime
+import time
+
+from pywa.receipts import ReceiptAggregator
+
+
+def test_receipt_aggregator_keeps_newest_message(mocker):
+    api = mocker.Mock()
+    receipts = ReceiptAggregator(window=0.01)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    receipts._add(api, "p", "a", "m2", now, typing=False)
+    receipts._add(api, "p", "a", "m1", now - datetime.timedelta(seconds=1), True)
+    receipts._add(api, "p", "b", "m3", now, typing=False)
+    for _ in range(100):
+        if receipts.stats.sent == 2:
+            break
+        time.sleep(0.01)
+    api.set_indicator.assert_called_once_with(phone_id="p", message_id="m2", typ="text")
+    api.mark_message_as_read.assert_called_once_with(phone_id="p", message_id="m3")
+    assert (receipts.stats.received, len(receipts)) == (3, 0)
+
+
+def test_receipt_aggregator_merges_the_ids_of_a_chat(mocker):
+    api = mocker.Mock()
+    receipts = ReceiptAggregator(window=60)
+    receipts._add(api, "p", "US.1", "m1", None, typing=False, aliases=("972", None))
+    receipts._add(api, "p", "972", "m2", None, typing=True)  # by the phone number
+    assert (len(receipts), receipts.stats.received) == (1, 2)
+    assert receipts._pop(("p", "973")) is None
+    receipt = receipts._pop(("p", "+972"))
+    assert (receipt.message_id, receipt.typing) == ("m2", True)
+    assert receipts._pop(("p", "US.1")) is None  # taken by all of its ids
+    assert len(receipts) == 0
+
+
+def test_receipt_aggregator_debounces_per_window(mocker):
+    api = mocker.Mock()
+    receipts = ReceiptAggregator(window=0.05)
+    receipts._add(api, "p", "a", "m1", None, typing=False)
+    time.sleep(0.02)
+    receipts._add(api, "p", "a", "m2", None, typing=False)  # in the same window
+    assert not api.mark_message_as_read.called
+    for _ in range(100):
+        if receipts.stats.sent:
+            break
+        time.sleep(0.01)
+    api.mark_message_as_read.assert_called_once_with(phone_id="p", message_id="m2")
+    receipts._add(api, "p", "a", "m3", None, typing=False)  # a new window
+    receipts.flush()
+    assert api.mark_message_as_read.call_args.kwargs["message_id"] == "m3"
+    assert (receipts.stats.sent, len(receipts)) == (2, 0)
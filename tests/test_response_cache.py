@@ -0,0 +1,44 @@
+import pytest
+
+from pywa import utils
+from pywa.response_cache import ResponseCache
+
+
+@pytest.fixture
+def clock(mocker):
+    now = [1000.0]
+    mocker.patch("pywa.response_cache.time.monotonic", side_effect=lambda: now[0])
+    return now
+
+
+def _read(cache: ResponseCache, key: tuple, response) -> None:
+    _, _, generation = cache._acquire(key, object)
+    cache._release(key, generation, response)
+
+
+def test_response_cache_ttl_and_lru(clock):
+    cache = ResponseCache(ttls={"template": 10, "flow": 0}, max_size=2)
+    _read(cache, ("template", "1", ()), {"id": "1"})
+    _read(cache, ("flow", "2", ()), {"id": "2"})
+    assert len(cache) == 1
+    assert cache._acquire(("template", "1", ()), object)[0] == {"id": "1"}
+    _read(cache, ("template", "3", ()), {"id": "3"})
+    _read(cache, ("template", "4", ()), {"id": "4"})
+    assert [key[1] for key in cache._entries] == ["3", "4"]
+    clock[0] += 10
+    assert cache._acquire(("template", "3", ()), object)[0] is utils.MISSING
+    with pytest.raises(ValueError):
+        ResponseCache(ttls={"media": 1})
+
+
+def test_response_cache_invalidation_while_in_flight():
+    cache = ResponseCache()
+    key = ("template", "1", ())
+    _, _, generation = cache._acquire(key, object)
+    assert cache.invalidate("template", 1) == 0
+    cache._release(key, generation, {"id": "1"})
+    assert len(cache) == 0
+    _read(cache, key, {"id": "1"})
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats.invalidations == 1
@@ -0,0 +1,54 @@
+import pytest
+
+from pywa.scheduler import OutboundScheduler, Priority, send_priority
+
+
+@pytest.fixture
+def clock(mocker):
+    now = [1000.0]
+    mocker.patch("pywa.scheduler.time.monotonic", side_effect=lambda: now[0])
+    return now
+
+
+class _Event:
+    def __init__(self):
+        self.done = False
+
+    def set(self):
+        self.done = True
+
+    def is_set(self):
+        return self.done
+
+
+def test_scheduler_interactive_goes_ahead_of_queued_bulk(clock):
+    scheduler = OutboundScheduler(rate=10, burst=1)
+    events = {name: _Event() for name in ("m1", "m2", "m3", "i1")}
+    for name in ("m1", "m2", "m3"):
+        scheduler._enqueue("p", Priority.MARKETING, events[name])
+    with send_priority(Priority.INTERACTIVE):
+        _, wait = scheduler._enqueue("p", None, events["i1"])
+    assert wait == pytest.approx(0.1)
+    assert [n for n, e in events.items() if e.done] == ["m1"]
+    clock[0] += 0.1
+    scheduler._dispatch("p")
+    assert [n for n, e in events.items() if e.done] == ["m1", "i1"]
+    clock[0] += 0.1
+    assert scheduler._dispatch("p") == pytest.approx(0.1)
+    assert events["m2"].done and not events["m3"].done
+    interactive = scheduler.stats[Priority.INTERACTIVE]
+    assert (interactive.sent, interactive.max_wait) == (1, pytest.approx(0.1))
+    marketing = scheduler.stats[Priority.MARKETING]
+    assert (marketing.queued, marketing.sent) == (1, 2)
+    assert marketing.avg_wait == pytest.approx(0.1)
+
+
+def test_scheduler_cancelled_messages_are_skipped(clock):
+    scheduler = OutboundScheduler(rate=1, burst=1)
+    scheduler._enqueue("p", Priority.TRANSACTIONAL, _Event())
+    ticket, _ = scheduler._enqueue("p", Priority.TRANSACTIONAL, _Event())
+    scheduler._cancel(ticket)
+    clock[0] += 1
+    assert scheduler._dispatch("p") is None
+    assert scheduler.stats[Priority.TRANSACTIONAL].queued == 0
+    assert scheduler.acquire("p") == 0
@@ -0,0 +1,97 @@
+import asyncio
+import threading
+
+import pytest
+
+from pywa import WhatsApp
+from pywa.sequencer import RecipientSequencer, SequencerQueueFull
+from pywa_async.sequencer import RecipientSequencer as AsyncRecipientSequencer
+
+
+class _Event:
+    def __init__(self):
+        self.done = False
+
+    def set(self):
+        self.done = True
+
+    def is_set(self):
+        return self.done
+
+
+def test_sequencer_orders_messages_per_recipient():
+    sequencer = RecipientSequencer(max_pending=1)
+    first, second, other = _Event(), _Event(), _Event()
+    turn = sequencer._enqueue(("p", "a"), first)
+    sequencer._enqueue(("p", "a"), second)
+    sequencer._enqueue(("p", "b"), other)
+    assert (first.done, second.done, other.done) == (True, False, True)
+    with pytest.raises(SequencerQueueFull) as exc:
+        sequencer._enqueue(("p", "a"), _Event())
+    assert exc.value.pending == 1
+    sequencer._release(turn)
+    assert second.done
+    assert (sequencer.stats.sent, sequencer.stats.delayed) == (3, 1)
+
+
+def test_sequencer_drops_idle_recipients():
+    sequencer = RecipientSequencer()
+    turn = sequencer._enqueue(("p", "a"), _Event())
+    waiting = sequencer._enqueue(("p", "a"), _Event())
+    sequencer._release(waiting)  # stopped waiting (e.g. a cancelled task)
+    sequencer._release(turn)
+    assert len(sequencer) == 0
+    with sequencer.sequence("p", "a"):
+        assert len(sequencer) == 1
+    assert len(sequencer) == 0
+
+
+def test_sequencer_lets_nested_messages_of_the_turn_through():
+    sequencer = RecipientSequencer()
+    with sequencer.sequence("p", "a"):
+        with sequencer.sequence("p", "a"):  # e.g. a reply from the send of send_bulk
+            assert sequencer.stats.sent == 1
+        waiting = threading.Thread(
+            target=lambda: sequencer.sequence("p", "a").__enter__()
+        )
+        waiting.start()
+        waiting.join(0.05)
+        assert waiting.is_alive()  # another thread waits for the turn
+    waiting.join(1)
+    assert not waiting.is_alive()
+
+
+def test_sequencer_normalizes_phone_numbers():
+    sequencer = RecipientSequencer()
+    wa = WhatsApp(phone_id="1234", token="xyz", sequencer=sequencer)
+    with (
+        wa._sequence(None, "+1 (555) 123-4567"),
+        sequencer.sequence("1234", 15551234567),  # the same turn
+    ):
+        assert (len(sequencer), sequencer.stats.sent) == (1, 1)
+    assert len(sequencer) == 0
+
+
+@pytest.mark.asyncio
+async def test_async_sequencer_normalizes_phone_numbers():
+    sequencer = AsyncRecipientSequencer()
+    async with sequencer.sequence("1234", "+1 555-123-4567"):
+        other = asyncio.create_task(
+            sequencer.sequence("1234", "15551234567").__aenter__()
+        )
+        await asyncio.sleep(0.01)
+        assert not other.done()  # waits for the turn of the same recipient
+    await asyncio.wait_for(other, 1)
+    assert sequencer.stats.delayed == 1
+
+
+@pytest.mark.asyncio
+async def test_async_sequencer_lets_nested_messages_of_the_turn_through():
+    sequencer = AsyncRecipientSequencer()
+    async with sequencer.sequence("p", "a"):
+        async with sequencer.sequence("p", "a"):
+            assert sequencer.stats.sent == 1
+        other = asyncio.create_task(sequencer.sequence("p", "a").__aenter__())
+        await asyncio.sleep(0.01)
+        assert not other.done()  # another task waits for the turn
+    await asyncio.wait_for(other, 1)
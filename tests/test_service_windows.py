@@ -0,0 +1,73 @@
+import datetime
+
+import pytest
+
+from pywa.errors import ReEngagementMessage
+from pywa.service_windows import ServiceWindowTracker
+
+
+@pytest.fixture
+def wall_clock(mocker):
+    now = [1_700_000_000.0]
+    mocker.patch("pywa.service_windows.time.time", side_effect=lambda: now[0])
+    return now
+
+
+def test_service_window_tracker(wall_clock):
+    tracker = ServiceWindowTracker(sweep_interval=datetime.timedelta(hours=1))
+    tracker._record_update(
+        "messages",
+        {
+            "metadata": {"phone_number_id": "p"},
+            "contacts": [{"wa_id": "972", "user_id": "US.1"}],
+            "messages": [{"from": "972", "timestamp": str(int(wall_clock[0]))}],
+        },
+    )
+    assert tracker.is_open("p", "+972") and tracker.is_open("p", "US.1")
+    assert tracker._windows == {"p": {972: 1_700_000_000}}
+    assert tracker._aliases == {"US.1": 972}
+    assert tracker.is_open("p", "973") is None  # tracking for less than a window
+    wall_clock[0] += 24 * 60 * 60
+    assert tracker.is_open("p", "972") is False
+    assert tracker.is_open("p", "973") is False
+    tracker.record("p", "973")  # sweeps the expired windows
+    assert (len(tracker), tracker.stats.swept, tracker._aliases) == (1, 1, {})
+    with pytest.raises(ReEngagementMessage):
+        tracker._check("p", "972", {"type": "text"})
+    tracker._check("p", "972", {"type": "template"})
+    assert tracker.stats.blocked == 1
+
+
+@pytest.mark.parametrize("path", [None, "windows.sqlite3"])
+def test_service_window_tracker_links_the_ids_of_a_user(wall_clock, tmp_path, path):
+    tracker = ServiceWindowTracker(path=path and tmp_path / path)
+    # a message before the ids were linked
+    tracker.record("p", "US.1", wall_clock[0] - 60)
+    update = {
+        "metadata": {"phone_number_id": "p"},
+        "contacts": [{"wa_id": "15551234567", "user_id": "US.1"}],
+        "messages": [{"from": "15551234567", "timestamp": str(int(wall_clock[0]))}],
+    }
+    tracker._record_update("messages", update)
+    assert len(tracker) == 1
+    wall_clock[0] += 60
+    update["contacts"] = [{"user_id": "US.1"}]
+    update["messages"] = [{"from": "US.1", "timestamp": str(int(wall_clock[0]))}]
+    tracker._record_update("messages", update)
+    for user in ("+1 (555) 123-4567", "1-555-123-4567", 15551234567, "US.1"):
+        assert tracker.last_message_at("p", user).timestamp() == wall_clock[0]
+    assert tracker.last_message_at("p", "+1 (555) 123-4568") is None
+
+
+def test_service_window_tracker_shared_file(wall_clock, tmp_path):
+    path = tmp_path / "windows.sqlite3"
+    first = ServiceWindowTracker(path=path)
+    wall_clock[0] += 60
+    second = ServiceWindowTracker(path=path)
+    first.record("p", "972", wall_clock[0] - 10)
+    assert second.last_message_at("p", 972).timestamp() == wall_clock[0] - 10
+    wall_clock[0] += 24 * 60 * 60 - 60
+    assert second.is_open("p", "973") is False  # tracking since the first one
+    wall_clock[0] += 60
+    assert second.sweep() == 1
+    assert len(first) == 0
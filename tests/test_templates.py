@@ -1121,3 +1121,131 @@ def test_url_button_comp():
             url="https://example.com",
             example="https://example.com?ref=wa&utm=123",
         )
+
+
+def test_compiled_template_fills_slots():
+    params = [
+        BodyText.params(name=TemplateSlot("name"), discount="25%"),
+        CopyCodeButton.params(coupon_code=TemplateSlot("code"), index=0),
+        URLButton.params(url_variable=f"?ref={TemplateSlot('ref')}", index=1),
+    ]
+    compiled = CompiledTemplate(
+        name="promo", language=TemplateLanguage.ENGLISH_US, params=params
+    )
+    assert compiled.slots == {"name", "code", "ref"}
+    values = {"name": 'Dana "D"', "code": "SAVE25", "ref": "sms"}
+    expected = {
+        "name": "promo",
+        "language": {"code": "en_US"},
+        "components": [
+            BodyText.params(name='Dana "D"', discount="25%").to_dict(),
+            CopyCodeButton.params(coupon_code="SAVE25", index=0).to_dict(),
+            URLButton.params(url_variable="?ref=sms", index=1).to_dict(),
+        ],
+    }
+    assert compiled.render(values) == expected
+    assert json.loads(compiled.render_bytes("972123456789", values, tracker="t")) == {
+        "messaging_product": "whatsapp",
+        "recipient_type": "individual",
+        "to": "972123456789",
+        "type": "template",
+        "biz_opaque_callback_data": "t",
+        "template": expected,
+    }
+    assert json.loads(
+        compiled.render_bytes(
+            "972123456789",
+            values,
+            reply_to_message_id="wamid.1",
+            identity_key_hash="hash",
+            message_activity_sharing=True,
+        )
+    ) == {
+        "messaging_product": "whatsapp",
+        "recipient_type": "individual",
+        "to": "972123456789",
+        "type": "template",
+        "context": {"message_id": "wamid.1"},
+        "message_activity_sharing": True,
+        "recipient_identity_key_hash": "hash",
+        "template": expected,
+    }
+    with pytest.raises(ValueError, match="Missing values for slots: ref"):
+        compiled.render({"name": "a", "code": "b"})
+    with pytest.raises(ValueError, match="Unexpected"):
+        compiled.render({**values, "other": 1})
+    with pytest.raises(ValueError):
+        TemplateSlot("not a name")
+
+
+def test_compile_and_send_template():
+    import httpx
+
+    from pywa import WhatsApp
+    from pywa.testing import FakeGraphAPI
+
+    fake = FakeGraphAPI()
+    wa = WhatsApp(
+        phone_id="111", token="xyz", session=httpx.Client(transport=fake.transport)
+    )
+    template = Template(
+        name="promo",
+        language=TemplateLanguage.ENGLISH_US,
+        category=TemplateCategory.MARKETING,
+        components=[body := BodyText("Hi {{name}}", name="John")],
+    )
+    with pytest.raises(ValueError):
+        wa.compile_template(template=template, params=[])
+    compiled = wa.compile_template(
+        template=template, params=[body.params(name=TemplateSlot("name"))]
+    )
+    for name in ("Dana", "Noa"):
+        wa.send_template(to="972", template=compiled, values={"name": name})
+    assert [m["template"]["components"][0]["parameters"] for m in fake.messages] == [
+        [{"type": "text", "text": "Dana", "parameter_name": "name"}],
+        [{"type": "text", "text": "Noa", "parameter_name": "name"}],
+    ]
+    with pytest.raises(ValueError):
+        wa.send_template(to="972", template=compiled, params=[])
+
+
+def test_send_compiled_template_sends_rendered_bytes():
+    import httpx
+
+    from pywa import WhatsApp
+
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200,
+            json={
+                "contacts": [{"input": "972", "wa_id": "972"}],
+                "messages": [{"id": "wamid"}],
+            },
+        )
+
+    wa = WhatsApp(
+        phone_id="111",
+        token="xyz",
+        session=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    compiled = CompiledTemplate(
+        name="promo",
+        language=TemplateLanguage.ENGLISH_US,
+        params=[BodyText.params(name=TemplateSlot("name"))],
+    )
+    wa.send_template(
+        to="972",
+        template=compiled,
+        values={"name": "Dana"},
+        reply_to_message_id="wamid.1",
+        use_mm_lite_api=True,
+    )
+    (request,) = requests
+    assert request.url.path.endswith("/111/marketing_messages")
+    assert request.headers["Content-Type"] == "application/json"
+    assert request.content == compiled.render_bytes(
+        "972", {"name": "Dana"}, reply_to_message_id="wamid.1"
+    )
@@ -0,0 +1,87 @@
+import httpx
+import pytest
+
+from pywa.tenants import Tenant, TenantClients
+from pywa.transport import TransportConfig
+from pywa_async.tenants import TenantClients as AsyncTenantClients
+
+
+def _sent(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "messaging_product": "whatsapp",
+            "contacts": [{"input": "972", "wa_id": "972"}],
+            "messages": [{"id": f"wamid.{request.headers['Authorization']}"}],
+        },
+    )
+
+
+def test_clients_share_the_session_with_their_own_tokens():
+    tokens = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        tokens.append((request.url.path, request.headers["Authorization"]))
+        return _sent(request)
+
+    resolved = []
+
+    def resolve(tenant_id: str) -> Tenant:
+        resolved.append(tenant_id)
+        return Tenant(token=f"token-{tenant_id}", phone_id=f"phone-{tenant_id}")
+
+    clients = TenantClients(
+        resolve,
+        session=httpx.Client(transport=httpx.MockTransport(handler)),
+        api_version="23.0",
+    )
+    for tenant_id in ("a", "b", "a"):
+        clients.get(tenant_id).send_message(to="972", text="hi")
+    assert tokens == [
+        ("/v23.0/phone-a/messages", "Bearer token-a"),
+        ("/v23.0/phone-b/messages", "Bearer token-b"),
+        ("/v23.0/phone-a/messages", "Bearer token-a"),
+    ]
+    assert resolved == ["a", "b"]
+    assert clients.get("a").api._session is clients.get("b").api._session
+    assert "a" in clients and len(clients) == 2
+
+
+def test_add_replaces_and_drops_least_recently_used():
+    clients = TenantClients(max_clients=2)
+    assert clients.stats.requests == 0
+    with pytest.raises(KeyError):
+        clients.get("a")
+    old = clients.add("a", Tenant(token="t1"))
+    assert clients.add("a", Tenant(token="t2")).token == "t2"
+    assert clients.get("a") is not old
+    clients.add("b", Tenant(token="t"))
+    clients.get("a")
+    clients.add("c", Tenant(token="t"))
+    assert "b" not in clients and len(clients) == 2
+    clients.remove("a")
+    assert "a" not in clients
+    clients.close()
+
+
+def test_session_and_transport_are_exclusive():
+    with pytest.raises(ValueError):
+        TenantClients(session=httpx.Client(), transport=TransportConfig())
+
+
+@pytest.mark.asyncio
+async def test_async_clients_with_async_resolve():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return _sent(request)
+
+    async def resolve(tenant_id: str) -> Tenant:
+        return Tenant(token=f"token-{tenant_id}", phone_id="123")
+
+    clients = AsyncTenantClients(
+        resolve, session=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    sent = await (await clients.get("a")).send_message(to="972", text="hi")
+    assert sent.id == "wamid.Bearer token-a"
+    assert await clients.get("a") is await clients.get("a")
+    await clients.close()
+    assert len(clients) == 0
@@ -0,0 +1,298 @@
+import asyncio
+
+import httpx
+import pytest
+
+from pywa import WhatsApp, errors, handlers, utils
+from pywa.media_cache import MediaCache
+from pywa.receipts import ReceiptAggregator
+from pywa.scheduler import OutboundScheduler, Priority
+from pywa.service_windows import ServiceWindowTracker
+from pywa.testing import (
+    RATE_LIMIT_HIT,
+    SERVICE_UNAVAILABLE,
+    FakeGraphAPI,
+)
+from pywa.types import Pagination
+from pywa.types.flows import FlowCategory
+from pywa.types.templates import (
+    BodyText,
+    Carousel,
+    CarouselCard,
+    HeaderImage,
+    Template,
+    TemplateCategory,
+    TemplateLanguage,
+)
+from pywa_async import WhatsApp as WhatsAppAsync
+from pywa_async import handlers as handlers_async
+from pywa_async.receipts import ReceiptAggregator as AsyncReceiptAggregator
+from pywa_async.sequencer import RecipientSequencer as AsyncRecipientSequencer
+
+
+def _client(fake: FakeGraphAPI, **kwargs) -> WhatsApp:
+    return WhatsApp(
+        phone_id="111",
+        token="xyz",
+        waba_id="222",
+        session=httpx.Client(transport=fake.transport),
+        filter_updates=False,
+        **kwargs,
+    )
+
+
+def test_send_message_generates_status_webhooks():
+    fake = FakeGraphAPI()
+    wa = _client(fake)
+    statuses = []
+    wa.add_handlers(
+        handlers.MessageStatusHandler(
+            lambda _, s: statuses.append((s.id, s.status.value, s.tracker))
+        )
+    )
+    sent = wa.send_message(to="972123456789", text="hi", tracker="campaign-1")
+    wa.mark_message_as_read(message_id=sent.id)
+    assert fake.messages == [
+        {**fake.messages[0], "id": sent.id, "to": "972123456789", "type": "text"}
+    ]
+    assert len(fake.pop_webhooks(limit=1)) == 1
+    for update in fake.pop_webhooks():
+        wa.webhook_update_handler(update)
+    assert statuses == [
+        (sent.id, "delivered", "campaign-1"),
+        (sent.id, "read", "campaign-1"),
+    ]
+    assert fake.calls["POST /{phone_id}/messages"] == 2
+
+
+def test_media_upload_url_and_download():
+    fake = FakeGraphAPI()
+    wa = _client(fake)
+    media = wa.upload_media(media=b"png-bytes", mime_type="image/png", filename="a.png")
+    url = wa.get_media_url(media.id)
+    assert (url.mime_type, url.file_size) == ("image/png", 9)
+    assert wa.api._session.get(url.url).content == b"png-bytes"
+    assert wa.delete_media(media.id)
+    with pytest.raises(errors.WhatsAppError):
+        wa.get_media_url(media.id)
+
+
+def test_templates_and_flows_pagination():
+    fake = FakeGraphAPI()
+    wa = _client(fake)
+    for i in range(5):
+        wa.create_flow(name=f"flow-{i}", categories=[FlowCategory.OTHER])
+    page = wa.get_flows(pagination=Pagination(limit=2))
+    assert [f.name for f in page] == ["flow-0", "flow-1"]
+    assert [f.name for f in page.next().next()] == ["flow-4"]
+    flow_id = page[0].id
+    assert wa.publish_flow(flow_id)
+    assert fake.flows[flow_id]["status"] == "PUBLISHED"
+
+    created = wa.api.create_template(
+        waba_id="222",
+        template={"name": "promo", "language": "en_US", "category": "MARKETING"},
+    )
+    assert created["status"] == "APPROVED"
+    assert wa.get_template(created["id"]).name == "promo"
+    assert wa.delete_template(template_name="promo")
+    assert fake.templates == {}
+
+
+def test_injected_errors_are_retried():
+    fake = FakeGraphAPI(seed=1)
+    fake.inject(SERVICE_UNAVAILABLE, endpoint="/messages$", times=2)
+    wa = _client(
+        fake,
+        retry_policy=utils.RetryPolicy(
+            rules={errors.WhatsAppError: utils.RetryRule(backoff=0, jitter=False)}
+        ),
+    )
+    wa.send_message(to="972", text="hi")
+    assert len(fake.messages) == 1
+    fake.inject(RATE_LIMIT_HIT, times=None)
+    with pytest.raises(errors.RateLimitHit):
+        _client(fake).send_message(to="972", text="hi")
+    fake.clear_errors()
+    _client(fake).send_message(to="972", text="hi")
+
+
+def test_rejects_requests_without_token():
+    fake = FakeGraphAPI()
+    res = httpx.Client(transport=fake.transport).get(
+        "https://graph.facebook.com/v23.0/123"
+    )
+    assert res.status_code == 401
+    assert res.json()["error"]["code"] == 190
+
+
+@pytest.mark.asyncio
+async def test_async_client_via_asgi_app():
+    fake = FakeGraphAPI(latency=0.001)
+    wa = WhatsAppAsync(
+        phone_id="111",
+        token="xyz",
+        session=httpx.AsyncClient(transport=httpx.ASGITransport(app=fake)),
+    )
+    sent = await wa.send_message(to="972", text="hi")
+    assert fake.messages[0]["id"] == sent.id
+    assert len(fake.pop_webhooks()) == 3
+
+
+def test_media_cache_uploads_same_content_once(tmp_path):
+    fake = FakeGraphAPI()
+    wa = _client(fake, media_cache=MediaCache())
+    path = tmp_path / "logo.png"
+    path.write_bytes(b"png-bytes")
+    first = wa.upload_media(media=path)
+    assert wa.send_image(to="972", image=path.read_bytes())
+    assert wa.upload_media(media=path).id == first.id
+    assert fake.calls["POST /{phone_id}/media"] == 1
+    wa.delete_media(first.id)
+    assert wa.upload_media(media=path).id != first.id
+
+
+def test_template_header_examples_are_uploaded_once():
+    fake = FakeGraphAPI()
+    wa = _client(fake, app_id="333", media_cache=MediaCache())
+    for language in (TemplateLanguage.ENGLISH_US, TemplateLanguage.HEBREW):
+        wa.create_template(
+            Template(
+                name="promo",
+                language=language,
+                category=TemplateCategory.MARKETING,
+                components=[
+                    Carousel(
+                        cards=[
+                            CarouselCard(
+                                components=[HeaderImage(example=image), BodyText("Hi")]
+                            )
+                            for image in (b"a", b"b", b"a")
+                        ]
+                    )
+                ],
+            )
+        )
+    assert sorted(fake.files.values()) == [b"a", b"b"]
+    assert fake.calls["POST /{app_id}/uploads"] == 2
+
+
+def test_scheduler_priority_classes():
+    fake = FakeGraphAPI()
+    scheduler = OutboundScheduler()
+    wa = _client(fake, scheduler=scheduler)
+
+    def on_status(w, s):
+        w.send_message(to=s.from_user.wa_id, text="thanks")
+        list(w.send_bulk(["4"], params={"text": "sale"}))  # not a reply
+
+    wa.add_handlers(handlers.MessageStatusHandler(on_status))
+    wa.send_message(to="972", text="hi")
+    assert len(list(wa.send_bulk(["1", "2"], params={"text": "sale"}))) == 2
+    list(
+        wa.send_bulk(["3"], params={"text": "receipt"}, priority=Priority.TRANSACTIONAL)
+    )
+    wa.webhook_update_handler(fake.pop_webhooks(limit=1)[0])
+    assert {p.name: s.sent for p, s in scheduler.stats.items()} == {
+        "INTERACTIVE": 1,
+        "TRANSACTIONAL": 2,
+        "MARKETING": 3,
+    }
+
+
+@pytest.mark.asyncio
+async def test_sequencer_keeps_concurrent_replies_in_order():
+    fake = FakeGraphAPI(latency=0.01)
+    wa = WhatsAppAsync(
+        phone_id="111",
+        token="xyz",
+        session=httpx.AsyncClient(transport=httpx.ASGITransport(app=fake)),
+        sequencer=AsyncRecipientSequencer(),
+        filter_updates=False,
+    )
+
+    async def reply(_, status):
+        await asyncio.gather(
+            status.reply_text("1"),
+            status.reply_image(image=b"png-bytes", mime_type="image/png"),
+            status.reply_text("3"),
+        )
+
+    await wa.send_message(to="972", text="hi")
+    wa.add_handlers(handlers_async.MessageStatusHandler(reply))
+    await wa.webhook_update_handler(fake.pop_webhooks(limit=1)[0])
+    assert [m["type"] for m in fake.messages[1:]] == ["text", "image", "text"]
+    assert fake.messages[-1]["text"]["body"] == "3"
+    assert len(wa._sequencer) == 0
+
+
+def test_receipts_are_merged_per_chat():
+    fake = FakeGraphAPI(statuses=("sent",))
+    receipts = ReceiptAggregator(window=60)
+    wa = _client(fake, receipts=receipts)
+
+    def on_status(_, status):
+        statuses.append(status)
+        status.mark_as_read()
+        if status.id == sent[1].id:
+            status.indicate_typing()
+
+    wa.add_handlers(handlers.MessageStatusHandler(on_status))
+    statuses, sent = [], [wa.send_message(to="972", text=str(i)) for i in range(3)]
+    for update in fake.pop_webhooks():
+        wa.webhook_update_handler(update)
+    assert (fake.receipts, len(receipts)) == ([], 1)
+    wa.send_message(to="+972", text="reply")  # the receipt goes first
+    assert fake.receipts == [
+        {
+            "messaging_product": "whatsapp",
+            "status": "read",
+            "message_id": sent[2].id,
+            "typing_indicator": {"type": "text"},
+        }
+    ]
+    assert (receipts.stats.received, receipts.stats.sent) == (4, 1)
+
+
+@pytest.mark.asyncio
+async def test_async_receipts_are_sent_after_the_window():
+    fake = FakeGraphAPI(statuses=("sent",))
+    wa = WhatsAppAsync(
+        phone_id="111",
+        token="xyz",
+        session=httpx.AsyncClient(transport=fake.transport),
+        receipts=AsyncReceiptAggregator(window=0.01),
+        filter_updates=False,
+    )
+
+    async def on_status(_, status):
+        await status.mark_as_read()
+
+    wa.add_handlers(handlers_async.MessageStatusHandler(on_status))
+    for i in range(2):
+        await wa.send_message(to="972", text=str(i))
+    for update in fake.pop_webhooks():
+        await wa.webhook_update_handler(update)
+    await asyncio.sleep(0.1)
+    assert [r["message_id"] for r in fake.receipts] == [fake.messages[-1]["id"]]
+
+
+def test_service_windows_fail_fast_or_route_to_template(mocker):
+    mocker.patch("pywa.service_windows.time.time", return_value=1_700_000_000.0)
+    fake = FakeGraphAPI()
+    windows = ServiceWindowTracker(
+        fallback=lambda to, text: (
+            {"name": "follow_up", "language": TemplateLanguage.ENGLISH_US}
+            if to == "973"
+            else None
+        )
+    )
+    windows._started_at -= 24 * 60 * 60  # tracking for a full window
+    wa = _client(fake, service_windows=windows)
+    windows.record("111", "972")
+    wa.send_message(to="972", text="hi")
+    with pytest.raises(errors.ReEngagementMessage):
+        wa.send_image(to="974", image="https://example.com/a.png")
+    assert wa.send_message(to="973", text="hi").id == fake.messages[-1]["id"]
+    assert [m["type"] for m in fake.messages] == ["text", "template"]
+    assert (windows.stats.blocked, windows.stats.routed) == (1, 1)
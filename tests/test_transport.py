@@ -0,0 +1,172 @@
+import asyncio
+import gc
+import http.server
+import threading
+import time
+import weakref
+
+import httpx
+import pytest
+
+from pywa import WhatsApp
+from pywa.transport import InstrumentedTransport, TransportConfig
+from pywa_async import WhatsApp as WhatsAppAsync
+from pywa_async.transport import InstrumentedTransport as AsyncInstrumentedTransport
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def _reply(self, body: bytes = b"{}") -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    do_GET = do_HEAD = _reply
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_stats_reuse_keepalive_connections(server_url):
+    transport = InstrumentedTransport(TransportConfig(max_keepalive_connections=2))
+    with httpx.Client(transport=transport, base_url=server_url) as client:
+        for _ in range(3):
+            client.get("")
+        stats = transport.stats
+    assert stats.requests == 3
+    assert stats.in_flight == 0
+    assert stats.max_in_flight == 1
+    assert stats.new_connections == 1
+    assert (stats.connections, stats.idle_connections) == (1, 1)
+    assert stats.max_pool_wait >= stats.avg_pool_wait > 0
+
+
+def test_stats_chain_user_trace(server_url):
+    events = []
+    transport = InstrumentedTransport()
+    with httpx.Client(transport=transport, base_url=server_url) as client:
+        client.get("", extensions={"trace": lambda name, info: events.append(name)})
+    assert "connection.connect_tcp.started" in events
+    assert transport.stats.new_connections == 1
+
+
+def test_stats_with_custom_transport():
+    transport = InstrumentedTransport(
+        transport=httpx.MockTransport(lambda _: httpx.Response(200))
+    )
+    httpx.Client(transport=transport).get("https://graph.facebook.com")
+    stats = transport.stats
+    assert (stats.requests, stats.connections, stats.new_connections) == (1, 0, 0)
+
+
+def test_client_transport_config():
+    wa = WhatsApp(token="xyz", transport=TransportConfig(timeout=12, max_connections=7))
+    assert wa.api._session.timeout == httpx.Timeout(12)
+    assert wa.api._session._transport is wa._transport
+    assert wa.transport_stats.requests == 0
+    assert WhatsApp(token="xyz", session=httpx.Client()).transport_stats is None
+    with pytest.raises(ValueError):
+        WhatsApp(token="xyz", session=httpx.Client(), transport=TransportConfig())
+
+
+def test_warm_up_opens_connections(server_url):
+    wa = WhatsApp(token="xyz")
+    wa.api._base_url = server_url.rstrip("/")
+    assert wa.warm_up(3) == 3
+    assert wa.transport_stats.new_connections >= 2
+    assert wa.transport_stats.idle_connections == wa.transport_stats.connections
+
+
+def test_warm_up_ignores_connection_errors():
+    wa = WhatsApp(token="xyz")
+    wa.api._base_url = "http://127.0.0.1:1"
+    assert wa.warm_up(2) == 0
+
+
+def _start_client(server_url: str, **kwargs) -> tuple[WhatsApp, threading.Thread]:
+    running = set(threading.enumerate())
+    wa = WhatsApp(token="xyz", transport=TransportConfig(**kwargs))
+    wa.api._base_url = server_url.rstrip("/")
+    (thread,) = (
+        t
+        for t in threading.enumerate()
+        if t.name == "pywa-connections" and t not in running
+    )
+    return wa, thread
+
+
+def test_keepalive_refresh_stops_on_close(server_url):
+    wa, thread = _start_client(server_url, keepalive_refresh=0.01)
+    wa.close()
+    thread.join(1)
+    assert not thread.is_alive()
+    assert wa.api._session.is_closed
+    assert wa.warm_up() == 0
+
+
+def test_keepalive_refresh_stops_on_closed_session(server_url):
+    wa, thread = _start_client(server_url, keepalive_refresh=0.01)
+    wa.api._session.close()
+    thread.join(1)
+    assert not thread.is_alive()
+
+
+def test_keepalive_refresh_does_not_keep_the_client_alive(server_url):
+    wa, thread = _start_client(server_url, warm_up=1, keepalive_refresh=60)
+    client = weakref.ref(wa)
+    del wa
+    for _ in range(100):  # the thread holds the client while it warms up
+        gc.collect()
+        if client() is None:
+            break
+        time.sleep(0.01)
+    assert client() is None
+    thread.join(1)
+    assert not thread.is_alive()
+
+
+def test_close_leaves_custom_session_open():
+    session = httpx.Client()
+    WhatsApp(token="xyz", session=session).close()
+    assert not session.is_closed
+
+
+@pytest.mark.asyncio
+async def test_async_keepalive_refresh_stops_on_close(server_url):
+    wa = WhatsAppAsync(token="xyz", transport=TransportConfig(keepalive_refresh=0.01))
+    wa.api._base_url = server_url.rstrip("/")
+    assert await wa.warm_up() == 1
+    refresh_task = wa._refresh_task
+    await wa.close()
+    with pytest.raises(asyncio.CancelledError):
+        await refresh_task
+    assert wa._refresh_task is None
+    assert wa.api._session.is_closed
+    assert await wa.warm_up() == 0
+    await wa._refresh_task
+
+
+@pytest.mark.asyncio
+async def test_async_warm_up_and_stats(server_url):
+    wa = WhatsAppAsync(token="xyz", transport=TransportConfig(warm_up=2))
+    assert isinstance(wa._transport, AsyncInstrumentedTransport)
+    wa.api._base_url = server_url.rstrip("/")
+    assert await wa.warm_up() == 2
+    stats = wa.transport_stats
+    assert stats.requests == 2
+    assert stats.new_connections == stats.connections == 2
+    await wa.api._session.aclose()
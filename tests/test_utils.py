@@ -0,0 +1,72 @@
+import pytest
+
+from pywa import utils
+from pywa.errors import WhatsAppError
+
+
+@pytest.fixture
+def clock(mocker):
+    now = [1000.0]
+    mocker.patch("pywa.utils.time.monotonic", side_effect=lambda: now[0])
+    return now
+
+
+def _throttled(code: int) -> Exception:
+    return WhatsAppError.from_dict({"message": "err", "code": code})
+
+
+def test_rate_limiter_phone_bucket(clock):
+    limiter = utils.RateLimiter(rate=10, burst=2, pair_rate=1000, pair_burst=1000)
+    assert [limiter.reserve("p", str(i)) for i in range(4)] == pytest.approx(
+        [0, 0, 0.1, 0.2]
+    )
+    clock[0] += 0.31
+    assert limiter.reserve("p", "x") == 0
+    assert limiter.reserve("other", "x") == 0
+    assert limiter.stats.delayed == 2
+
+
+def test_rate_limiter_pair_bucket(clock):
+    limiter = utils.RateLimiter(rate=1000, pair_rate=1 / 6, pair_burst=1)
+    assert limiter.reserve("p", "a") == 0
+    assert limiter.reserve("p", "b") == 0
+    assert limiter.reserve("p", "a") == pytest.approx(6)
+
+
+def test_rate_limiter_fail_fast(clock):
+    limiter = utils.RateLimiter(rate=1, burst=1, max_wait=0)
+    limiter.reserve("p", "a")
+    with pytest.raises(utils.RateLimitExceeded) as exc:
+        limiter.reserve("p", "b")
+    assert exc.value.retry_after == pytest.approx(1)
+    clock[0] += 1
+    assert limiter.reserve("p", "b") == 0  # the rejected message did not reserve
+    assert limiter.stats.rejected == 1
+
+
+def test_rate_limiter_adapts_to_errors(clock):
+    limiter = utils.RateLimiter(
+        rate=80, pair_rate=1, pair_burst=10, min_rate=10, recovery=0.25
+    )
+    limiter.reserve("p", "a")
+    limiter.feedback("p", "a", error=_throttled(130429))
+    assert limiter.current_rate("p") == 40
+    for _ in range(3):
+        limiter.feedback("p", "a", error=_throttled(130429))
+    assert limiter.current_rate("p") == 10
+    assert limiter.reserve("p", "b") == pytest.approx(0.1)
+    for _ in range(4):
+        limiter.feedback("p", "b")
+    assert limiter.current_rate("p") == 80
+    limiter.feedback("p", "a", error=_throttled(131056))
+    assert limiter.reserve("p", "a") == pytest.approx(1)
+    assert limiter.stats.throttled == 5
+
+
+def test_rate_limiter_drops_idle_pairs(clock):
+    limiter = utils.RateLimiter(rate=1000, pair_rate=1, pair_burst=2, max_pairs=2)
+    limiter.reserve("p", "a")
+    limiter.reserve("p", "b")
+    clock[0] += 2
+    limiter.reserve("p", "c")
+    assert set(limiter._pairs) == {("p", "c")}
@@ -0,0 +1,107 @@
+"""
+Benchmark of the connection pool of the client against a local stand-in for the Graph API, which delays every new
+connection to simulate the TCP and TLS handshakes to ``graph.facebook.com``.
+
+Compares the latency of a burst of concurrent requests on a cold pool and on a pool that was warmed up with
+``WhatsApp.warm_up()``, and prints the pool statistics of each run.
+
+Run via:
+    python -m tests.transport_benchmark [--handshake 0.1] [--concurrency 16] [--requests 64]
+"""
+
+import argparse
+import concurrent.futures
+import http.server
+import socketserver
+import statistics
+import threading
+import time
+
+from pywa import WhatsApp
+from pywa.transport import TransportConfig
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    handshake = 0.1
+
+    def setup(self) -> None:
+        time.sleep(self.handshake)  # once per connection
+        super().setup()
+
+    def _reply(self) -> None:
+        body = b'{"messages": [{"id": "wamid.1"}]}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    do_GET = do_HEAD = do_POST = _reply
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class _Server(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def _run(url: str, *, warm_up: int, concurrency: int, requests: int) -> None:
+    wa = WhatsApp(
+        token="xyz",
+        transport=TransportConfig(
+            max_connections=concurrency, max_keepalive_connections=concurrency
+        ),
+    )
+    wa.api._base_url = url
+    if warm_up:
+        wa.warm_up(warm_up)
+
+    def request(_) -> float:
+        started = time.perf_counter()
+        wa.api._session.get(wa.api._url(""))
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = sorted(pool.map(request, range(requests)))
+    elapsed = time.perf_counter() - started
+    stats = wa.transport_stats
+    print(
+        f"{'warm' if warm_up else 'cold'}: total={elapsed * 1000:.0f}ms"
+        f" p50={statistics.median(latencies) * 1000:.1f}ms"
+        f" p95={latencies[int(len(latencies) * 0.95) - 1] * 1000:.1f}ms"
+        f" max={latencies[-1] * 1000:.1f}ms"
+    )
+    print(f"      {stats} avg_pool_wait={stats.avg_pool_wait * 1000:.1f}ms")
+    wa.api._session.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--handshake", type=float, default=0.1)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=64)
+    args = parser.parse_args()
+
+    _Handler.handshake = args.handshake
+    server = _Server(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}"
+    try:
+        for warm_up in (0, args.concurrency):
+            _run(
+                url,
+                warm_up=warm_up,
+                concurrency=args.concurrency,
+                requests=args.requests,
+            )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()